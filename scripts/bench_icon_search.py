@@ -0,0 +1,67 @@
+"""Compare ppt_search_icons' index against the original linear scan.
+
+Uses the cached Google Fonts metadata when present (see utils.icon_cache),
+otherwise ~3,000 synthetic icons. No network access.
+
+Usage: python scripts/bench_icon_search.py [repeats]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from utils.icon_cache import IconCache  # noqa: E402
+from utils.icon_index import IconIndex, linear_search  # noqa: E402
+
+QUERIES = ["home", "arrow forward", "chart", "settings", "a", "person add", "calendar month"]
+
+
+def load_icons() -> tuple:
+    try:
+        return IconCache(offline=True).get_metadata(), "cached metadata"
+    except RuntimeError:
+        pass
+    rng = random.Random(0)
+    words = [w for q in QUERIES for w in q.split()] + [
+        "bolt", "cloud", "upload", "star", "check", "circle", "group", "edit", "delete",
+        "search", "filter", "lock", "mail", "phone", "map", "camera", "music", "play",
+    ]
+    icons = [
+        {
+            "name": "_".join(rng.sample(words, rng.randint(1, 3))),
+            "tags": rng.sample(words, rng.randint(0, 8)),
+            "categories": rng.sample(["action", "navigation", "social", "file"], 1),
+            "popularity": rng.randint(0, 20000),
+        }
+        for _ in range(3000)
+    ]
+    return icons, "synthetic"
+
+
+def timed(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    icons, source = load_icons()
+    start = time.perf_counter()
+    index = IconIndex(icons)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(icons)} icons ({source}); index built in {build_ms:.1f} ms\n")
+    print(f"{'query':<18}{'linear ms':>12}{'index ms':>12}{'speedup':>10}")
+    for q in QUERIES:
+        assert index.search(q, 20)["icons"] == linear_search(icons, q, 20), q
+        lin = timed(lambda: linear_search(icons, q, 20), repeats)
+        idx = timed(lambda: index.search(q, 20), repeats)
+        print(f"{q:<18}{lin:>12.3f}{idx:>12.3f}{lin / idx:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
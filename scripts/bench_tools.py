@@ -0,0 +1,272 @@
+"""Benchmark representative agent workloads through the real tool functions.
+
+Runs the tool coroutines (the same ones the MCP server registers) on the COM
+worker thread against utils.fake_ppt, so no PowerPoint is needed. Scenarios
+run in order on one deck:
+
+  build_deck    add N slides with titles, bullets, accent shapes, tables, charts
+  restyle       list shapes per slide and restyle every text shape (batch)
+  extract_text  ppt_get_all_text cold, then again from the markdown cache
+  typography    ppt_check_typography with fix=true
+  previews      ppt_get_slides_preview for every slide (cache off)
+
+Per scenario the report gives wall time, simulated COM time (the latency
+model's total), COM gets/sets/calls made against the fake, tool calls and
+peak Python memory (tracemalloc, which also slows the run; --no-memory turns
+it off). COM counts do not depend on the machine, so they are the most
+reliable regression signal; wall time is compared with a looser threshold.
+
+Usage:
+  python scripts/bench_tools.py [--slides 30] [--sleep] [--json out.json]
+                                [--baseline old.json] [--threshold 0.25]
+
+With --baseline, exits with status 1 when a scenario's COM round trips grow
+by more than 5% or its wall time / peak memory by more than --threshold.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# Keep caches away from the user's real cache directory.
+os.environ["PPT_MCP_CACHE_DIR"] = tempfile.mkdtemp(prefix="ppt_bench_cache_")
+os.environ.setdefault("PPT_PREVIEW_DISK_CACHE_MB", "0")
+
+from utils.fake_ppt import FakeApplication, Latency, attach, install_pywin32_shims  # noqa: E402
+
+install_pywin32_shims()
+
+from utils.com_wrapper import ppt  # noqa: E402
+from utils.perf_stats import instrument, perf_stats  # noqa: E402
+from ppt_com import batch_apply, charts, preview, shapes, slides, tables, text  # noqa: E402
+
+COM_COUNT_THRESHOLD = 0.05
+
+BULLETS = [
+    "Revenue grew in every region this quarter",
+    "Churn fell for the third quarter in a row",
+    "Hiring is on plan for engineering and sales",
+    "Two launches moved to next quarter",
+]
+
+
+def _nested_errors(value) -> list:
+    """Error messages of per-item entries, e.g. batch operations that failed."""
+    if isinstance(value, dict):
+        found = [str(value["error"])] if "error" in value else []
+        return found + [e for v in value.values() for e in _nested_errors(v)]
+    if isinstance(value, list):
+        return [e for v in value for e in _nested_errors(v)]
+    return []
+
+
+class Runner:
+    """Calls tools the way the server does: instrumented, JSON results checked.
+
+    A result with a failed item (such as one operation of a batch) counts as
+    a failure, so a scenario cannot pass by timing an error path.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, fn, model, name: str, **params):
+        self.calls += 1
+        result = await instrument(fn, name)(model(**params))
+        if isinstance(result, list):
+            result = result[0]
+        if result.startswith('{"error"'):
+            raise RuntimeError(f"{name} failed: {json.loads(result)['error']}")
+        if not result.startswith("{"):
+            return result
+        data = json.loads(result)
+        errors = _nested_errors(data)
+        if errors:
+            raise RuntimeError(f"{name} failed for {len(errors)} item(s): {errors[0]}")
+        return data
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+async def build_deck(run: Runner, n_slides: int) -> None:
+    await run(slides.add_slide, slides.AddSlideInput, "ppt_add_slide", layout_name="title")
+    await run(text.set_text, text.SetTextInput, "ppt_set_text",
+              slide_index=1, shape_name_or_index=1, text="Quarterly Business Review")
+    for i in range(2, n_slides + 1):
+        kind = "table" if i % 5 == 0 else "chart" if i % 7 == 0 else "bullets"
+        layout = "title_only" if kind != "bullets" else "text"
+        await run(slides.add_slide, slides.AddSlideInput, "ppt_add_slide", layout_name=layout)
+        await run(text.set_text, text.SetTextInput, "ppt_set_text",
+                  slide_index=i, shape_name_or_index=1, text=f"Section {i}: results and next steps")
+        if kind == "bullets":
+            await run(text.set_text, text.SetTextInput, "ppt_set_text",
+                      slide_index=i, shape_name_or_index=2, text="\n".join(BULLETS))
+        elif kind == "table":
+            added = await run(tables.add_table, tables.AddTableInput, "ppt_add_table",
+                              slide_index=i, rows=5, cols=4, top=150)
+            data = [["Region", "Q1", "Q2", "Q3"]] + [[f"R{r}", "10", "12", "15"] for r in range(1, 5)]
+            await run(tables.set_table_data, tables.SetTableDataInput, "ppt_set_table_data",
+                      slide_index=i, shape_name_or_index=added["shape_name"], data=data, bold_first_row=True)
+        else:
+            added = await run(charts.add_chart, charts.AddChartInput, "ppt_add_chart",
+                              slide_index=i, top=150)
+            await run(charts.set_chart_data, charts.SetChartDataInput, "ppt_set_chart_data",
+                      slide_index=i, shape_name_or_index=added["shape_name"],
+                      categories=["Q1", "Q2", "Q3", "Q4"],
+                      series=[{"name": "Revenue", "values": [10, 12, 15, 18]},
+                              {"name": "Cost", "values": [8, 9, 9, 11]}])
+        await run(shapes.add_textbox, shapes.AddTextboxInput, "ppt_add_textbox",
+                  slide_index=i, left=660, top=470, width=240, height=40,
+                  text="Source: internal finance data", font_size=12)
+
+
+async def restyle(run: Runner, n_slides: int) -> None:
+    for i in range(1, n_slides + 1):
+        listed = await run(shapes.list_shapes, shapes.ListShapesInput, "ppt_list_shapes", slide_index=i)
+        names = [s["name"] for s in listed["shapes"] if s["has_text"]]
+        await run(batch_apply.batch_apply_formatting, batch_apply.BatchApplyFormattingInput,
+                  "ppt_batch_apply_formatting", slide_index=i, shapes=names,
+                  operations=[{"tool": "format_text",
+                               "params": {"font_name": "Segoe UI", "color": "#1F2937"}}])
+
+
+async def extract_text(run: Runner, n_slides: int) -> None:
+    await run(text.get_all_text, text.GetAllTextInput, "ppt_get_all_text")
+    await run(text.get_all_text, text.GetAllTextInput, "ppt_get_all_text")
+
+
+async def typography(run: Runner, n_slides: int) -> None:
+    await run(text.check_typography, text.CheckTypographyInput, "ppt_check_typography", fix=True)
+
+
+async def previews(run: Runner, n_slides: int) -> None:
+    await run(preview.get_slides_preview, preview.GetSlidesPreviewInput, "ppt_get_slides_preview",
+              layout="images", use_cache=False)
+
+
+SCENARIOS = [
+    ("build_deck", build_deck),
+    ("restyle", restyle),
+    ("extract_text", extract_text),
+    ("typography", typography),
+    ("previews", previews),
+]
+
+
+# ---------------------------------------------------------------------------
+# Measurement and reporting
+# ---------------------------------------------------------------------------
+def measure(app: FakeApplication, name: str, scenario, n_slides: int, memory: bool) -> dict:
+    run = Runner()
+    app.reset_counters()
+    perf_stats.reset()
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        asyncio.run(scenario(run, n_slides))
+    finally:
+        wall = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if memory else None
+        if memory:
+            tracemalloc.stop()
+    counters = dict(app.counters)
+    snap = perf_stats.snapshot(sort_by="com_ms_total", top=5)
+    return {
+        "wall_ms": round(wall * 1000, 1),
+        "simulated_com_ms": round(app.simulated_s * 1000, 1),
+        "com_gets": counters["get"],
+        "com_sets": counters["set"],
+        "com_calls": counters["call"],
+        "com_round_trips": sum(counters.values()),
+        "tool_calls": run.calls,
+        "peak_kb": round(peak / 1024) if peak is not None else None,
+        "top_tools": [
+            {"tool": r["tool"], "calls": r["calls"], "com_ms_total": r["com_ms_total"]}
+            for r in snap["tools"]
+        ],
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Lines describing regressions of results against baseline."""
+    problems = []
+    checks = [("com_round_trips", COM_COUNT_THRESHOLD), ("wall_ms", threshold), ("peak_kb", threshold)]
+    for name, now in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        for key, limit in checks:
+            old, new = before.get(key), now.get(key)
+            if old and new is not None and new > old * (1 + limit):
+                problems.append(f"{name}: {key} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--slides", type=int, default=30, help="deck size (default 30)")
+    parser.add_argument("--sleep", action="store_true",
+                        help="actually sleep for the modelled COM latency")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak memory")
+    parser.add_argument("--json", metavar="PATH", help="write results to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against an earlier --json file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed wall time / memory growth vs. baseline (default 0.25)")
+    args = parser.parse_args()
+
+    latency = Latency.cross_process(sleep=args.sleep)
+    app = FakeApplication(latency)
+    app.Presentations.Add()
+    attach(app)
+    ppt.start()
+    try:
+        scenarios = {
+            name: measure(app, name, fn, args.slides, not args.no_memory) for name, fn in SCENARIOS
+        }
+    finally:
+        ppt.stop()
+
+    results = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "slides": args.slides,
+        "latency": {"get": latency.get, "set": latency.set, "call": latency.call,
+                    "slow": latency.slow, "sleep": latency.sleep},
+        "scenarios": scenarios,
+    }
+
+    print(f"{args.slides} slides, latency sleep={'on' if args.sleep else 'off'}\n")
+    print(f"{'scenario':<14}{'wall ms':>10}{'sim COM ms':>12}{'gets':>8}{'sets':>8}"
+          f"{'calls':>8}{'tools':>7}{'peak KB':>9}")
+    for name, r in scenarios.items():
+        print(f"{name:<14}{r['wall_ms']:>10.1f}{r['simulated_com_ms']:>12.1f}{r['com_gets']:>8}"
+              f"{r['com_sets']:>8}{r['com_calls']:>8}{r['tool_calls']:>7}{r['peak_kb'] or '-':>9}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        problems = compare(results, baseline, args.threshold)
+        print("\nRegressions vs. baseline:" if problems else "\nNo regressions vs. baseline.")
+        for line in problems:
+            print(f"  {line}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
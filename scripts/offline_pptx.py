@@ -0,0 +1,87 @@
+"""Read or edit closed .pptx files in bulk, without PowerPoint.
+
+Command-line front end to utils.ooxml for pipelines (search indexing,
+nightly report decks, font clean-up). Runs on any OS; files are processed
+in parallel worker processes.
+
+Usage:
+  python scripts/offline_pptx.py read get_all_text "decks/**/*.pptx" [--json out.json]
+  python scripts/offline_pptx.py replace "decks/*.pptx" --find 2025 --replace 2026 --out-dir edited/
+  python scripts/offline_pptx.py set-font "decks/*.pptx" --font "Segoe UI" --fareast "Meiryo" --in-place
+
+Exits with status 1 when any file failed.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from utils import ooxml  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    read = sub.add_parser("read", help="run a read operation")
+    read.add_argument("operation", choices=ooxml.READ_OPERATIONS)
+    read.add_argument("files", nargs="+", help="paths or glob patterns")
+    read.add_argument("--slides", type=int, nargs="+", help="1-based slide indices")
+    read.add_argument("--json", metavar="PATH", help="write results to PATH instead of stdout")
+
+    edit_args = argparse.ArgumentParser(add_help=False)
+    edit_args.add_argument("files", nargs="+", help="paths or glob patterns")
+    edit_args.add_argument("--slides", type=int, nargs="+", help="1-based slide indices")
+    edit_args.add_argument("--notes", action="store_true", help="also edit speaker notes")
+    dest = edit_args.add_mutually_exclusive_group(required=True)
+    dest.add_argument("--out-dir", help="write edited copies to this directory")
+    dest.add_argument("--in-place", action="store_true", help="overwrite the files")
+
+    replace = sub.add_parser("replace", parents=[edit_args], help="find and replace text")
+    replace.add_argument("--find", required=True)
+    replace.add_argument("--replace", default="")
+    replace.add_argument("--ignore-case", action="store_true")
+
+    font = sub.add_parser("set-font", parents=[edit_args], help="set fonts on every run")
+    font.add_argument("--font", help="Latin font name")
+    font.add_argument("--fareast", help="East Asian font name")
+    font.add_argument("--size", type=float, help="font size in points")
+
+    args = parser.parse_args()
+    paths = ooxml.expand_paths(args.files)
+    if not paths:
+        print("No files match.", file=sys.stderr)
+        return 1
+
+    if args.command == "read":
+        results = ooxml.run_batch(ooxml.read_file, paths, args.workers,
+                                  operation=args.operation, slide_indices=args.slides)
+    else:
+        if args.command == "replace":
+            op = {"op": "replace_text", "find": args.find, "replace": args.replace,
+                  "match_case": not args.ignore_case}
+        else:
+            op = {"op": "set_font", "font_name": args.font, "font_name_fareast": args.fareast,
+                  "font_size": args.size}
+        results = ooxml.run_batch(ooxml.edit_file, paths, args.workers, operations=[op],
+                                  output_dir=args.out_dir, slide_indices=args.slides,
+                                  include_notes=args.notes)
+
+    output = json.dumps(results, ensure_ascii=False, indent=1)
+    if getattr(args, "json", None):
+        Path(args.json).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+    failed = [r for r in results if "error" in r]
+    for r in failed:
+        print(f"FAILED {r['path']}: {r['error']}", file=sys.stderr)
+    print(f"{len(results) - len(failed)} of {len(results)} files succeeded", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
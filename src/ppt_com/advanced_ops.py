@@ -9,16 +9,19 @@ import json
 import logging
 import os
 import tempfile
-import time
 import urllib.error
-import urllib.request
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Literal, Optional, Union
 
+from mcp.server.fastmcp import Context
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from utils.com_wrapper import ppt
 from utils.navigation import goto_slide
 from utils.color import hex_to_int, int_to_hex
+from utils.http_fetch import fetch_url, run_io
+from utils.icon_cache import icon_cache
+from utils.progress import Progress
 from ppt_com.constants import (
     msoTrue, msoFalse,
     msoShapeRectangle,
@@ -28,48 +31,34 @@ from ppt_com.constants import (
     ppSelectionNone, ppSelectionSlides, ppSelectionShapes, ppSelectionText,
     PICTURE_COLOR_TYPE_MAP, PICTURE_COLOR_TYPE_NAMES,
 )
+from ppt_com import font_normalize
+from ppt_com.font_normalize import FontStats
 from ppt_com.shapes import SHAPE_NAME_MAP
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Icon metadata cache (lazy-loaded on first search)
+# Icon metadata (persistent disk cache, see utils.icon_cache)
 # ---------------------------------------------------------------------------
-_icon_cache = None        # list of icon dicts
-_icon_cache_time = 0.0    # timestamp of last fetch
-_ICON_CACHE_TTL = 86400   # 24 hours
-
-_ICON_METADATA_URL = "https://fonts.google.com/metadata/icons"
+_ICON_SVG_BASE = "https://cdn.jsdelivr.net/npm/@material-symbols/svg-400@0.31.3"
 
 
 def _fetch_icon_metadata():
-    """Fetch and cache the Material Symbols icon metadata from Google Fonts.
+    """Return the Material Symbols icon metadata list.
 
-    The first line of the response is `)]}'` (XSS protection) and must be
-    stripped before parsing as JSON.  The parsed icons list is cached for
-    24 hours to avoid repeated network calls.
+    Served from the on-disk cache and revalidated against Google Fonts
+    after 24 hours (conditional GET), so server restarts don't re-download it.
     """
-    global _icon_cache, _icon_cache_time
-
-    now = time.time()
-    if _icon_cache is not None and (now - _icon_cache_time) < _ICON_CACHE_TTL:
-        return _icon_cache
-
-    resp = urllib.request.urlopen(_ICON_METADATA_URL)
-    raw = resp.read().decode("utf-8")
+    return icon_cache.get_metadata()
 
-    # Strip XSS protection prefix  )]}'
-    first_nl = raw.index("\n")
-    json_str = raw[first_nl + 1:]
-    data = json.loads(json_str)
 
-    _icon_cache = data.get("icons", [])
-    _icon_cache_time = now
-    logger.info("Fetched %d icons from Google Fonts metadata", len(_icon_cache))
-    return _icon_cache
+def _icon_svg_url(icon_name: str, style: str, filled: bool) -> str:
+    """Build the pinned CDN URL for an icon (-fill suffix for the filled variant)."""
+    file_name = f"{icon_name}-fill" if filled else icon_name
+    return f"{_ICON_SVG_BASE}/{style}/{file_name}.svg"
 
 
-def _search_icons(query: str, max_results: int = 20):
+def _search_icons(query: str, max_results: int = 20, fuzzy: bool = False) -> dict:
     """Search Material Symbols icons by keyword.
 
     Scoring:
@@ -82,61 +71,14 @@ def _search_icons(query: str, max_results: int = 20):
     - Query word found in a category: +5
     - Popularity bonus (normalized to 0-10 range)
 
-    Returns a sorted list of dicts with name, tags, categories, score.
-    """
-    icons = _fetch_icon_metadata()
-    query_lower = query.lower().strip()
-    query_words = query_lower.split()
-
-    results = []
-    for icon in icons:
-        name = icon.get("name", "")
-        tags = [t.lower() for t in icon.get("tags", [])]
-        categories = [c.lower() for c in icon.get("categories", [])]
-        popularity = icon.get("popularity", 0)
-
-        score = 0
-
-        # Exact name match (query == name)
-        if name == query_lower:
-            score += 100
-        # Full query string in name (e.g. "arrow_forward" contains "arrow forward" as "arrow_forward")
-        elif query_lower.replace(" ", "_") == name:
-            score += 90
-        # Full query in name
-        elif query_lower in name:
-            score += 50
-
-        # Bonus: all query words found in name
-        if len(query_words) > 1 and all(w in name for w in query_words):
-            score += 40
-
-        # Per-word scoring
-        for word in query_words:
-            if word in name:
-                score += 30
-            for tag in tags:
-                if word == tag:
-                    score += 20
-                elif word in tag:
-                    score += 10
-            for cat in categories:
-                if word in cat:
-                    score += 5
-
-        if score > 0:
-            # Small popularity bonus (normalized)
-            score += min(popularity / 1000, 10)
-            results.append({
-                "name": name,
-                "categories": icon.get("categories", []),
-                "tags": icon.get("tags", [])[:8],  # limit tags for readability
-                "popularity": popularity,
-                "score": round(score, 2),
-            })
+    Answered from the precomputed index (utils.icon_index). With fuzzy=True,
+    a query word that matches nothing is replaced by close vocabulary terms
+    at half weight.
 
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:max_results]
+    Returns a dict with "icons" (sorted list of dicts with name, tags,
+    categories, score) and "fuzzy" (word -> substituted terms).
+    """
+    return icon_cache.get_index().search(query, max_results, fuzzy=fuzzy)
 
 
 # ---------------------------------------------------------------------------
@@ -234,6 +176,18 @@ class SetDefaultFontsInput(BaseModel):
         default=True,
         description="If true (default), also apply fonts to all existing text in the presentation. If false, only update the theme fonts for new text.",
     )
+    include_notes: bool = Field(
+        default=True,
+        description="With apply_to_existing, also normalize the speaker notes",
+    )
+    include_masters: bool = Field(
+        default=True,
+        description="With apply_to_existing, also normalize slide master and layout placeholders",
+    )
+    dry_run: bool = Field(
+        default=False,
+        description="Only report which fonts would change (before/after statistics); write nothing",
+    )
 
 
 # --- Picture Crop ---
@@ -523,6 +477,37 @@ class SearchIconsInput(BaseModel):
         default=20, ge=1, le=100,
         description="Maximum number of results to return (default: 20)",
     )
+    fuzzy: bool = Field(
+        default=True,
+        description=(
+            "If a query word matches no icon at all (e.g. a typo like 'calender'), "
+            "fall back to the closest known names/tags at reduced score."
+        ),
+    )
+
+
+# --- Prewarm Icons ---
+class PrewarmIconsInput(BaseModel):
+    """Input for pre-downloading icons into the persistent icon cache."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    icon_names: Optional[List[str]] = Field(
+        default=None,
+        description="Icon names to cache (e.g. ['check_circle', 'bolt']).",
+    )
+    top_popular: int = Field(
+        default=0, ge=0, le=3000,
+        description="Also cache the N most popular icons (0 = none).",
+    )
+    styles: List[Literal["outlined", "rounded", "sharp"]] = Field(
+        default_factory=lambda: ["outlined"],
+        min_length=1,
+        description="Icon styles to cache",
+    )
+    include_filled: bool = Field(
+        default=False,
+        description="Also cache the filled variant of each icon",
+    )
 
 
 # ===========================================================================
@@ -613,15 +598,36 @@ def _list_fonts_impl():
 # ---------------------------------------------------------------------------
 # Set Default Fonts
 # ---------------------------------------------------------------------------
-def _set_default_fonts_impl(latin, east_asian, apply_to_existing):
+def _set_theme_fonts_impl(latin, east_asian, dry_run=False):
+    """Update theme fonts of all designs/slide masters (affects new text).
+
+    Only font slots whose name differs are written.
+    """
     app = ppt._get_app_impl()
     pres = ppt._get_pres_impl()
 
     if not latin and not east_asian:
         raise ValueError("At least one of 'latin' or 'east_asian' must be provided")
 
+    # msoThemeLatin = 1, msoThemeEastAsian = 3
+    slots = [(script, name) for script, name in ((1, latin), (3, east_asian)) if name]
+
+    replaced = {"latin": set(), "east_asian": set()}
+
+    def _update(font_scheme):
+        changed = 0
+        for script, name in slots:
+            for font in (font_scheme.MajorFont(script), font_scheme.MinorFont(script)):
+                old = font.Name
+                if old != name:
+                    if not dry_run:
+                        font.Name = name
+                    replaced["latin" if script == 1 else "east_asian"].add(old)
+                    changed += 1
+        return changed
+
     theme_updated = False
-    # Step 1: Update theme fonts for all designs/slide masters (affects new text).
+    theme_fonts_changed = 0
     # pres.Designs is the correct collection for multiple slide masters in COM.
     # Fall back to pres.SlideMaster (singular) if Designs is unavailable.
     try:
@@ -636,78 +642,46 @@ def _set_default_fonts_impl(latin, east_asian, apply_to_existing):
         if designs and count > 0:
             for m in range(1, count + 1):
                 try:
-                    font_scheme = designs(m).SlideMaster.Theme.ThemeFontScheme
-                    # msoThemeLatin = 1, msoThemeEastAsian = 3
-                    if latin:
-                        font_scheme.MajorFont(1).Name = latin
-                        font_scheme.MinorFont(1).Name = latin
-                    if east_asian:
-                        font_scheme.MajorFont(3).Name = east_asian
-                        font_scheme.MinorFont(3).Name = east_asian
+                    theme_fonts_changed += _update(designs(m).SlideMaster.Theme.ThemeFontScheme)
                     masters_updated += 1
                 except Exception as e:
                     logger.warning("Failed to update theme fonts for design %d: %s", m, e)
         else:
             # Fallback: single slide master
-            font_scheme = pres.SlideMaster.Theme.ThemeFontScheme
-            if latin:
-                font_scheme.MajorFont(1).Name = latin
-                font_scheme.MinorFont(1).Name = latin
-            if east_asian:
-                font_scheme.MajorFont(3).Name = east_asian
-                font_scheme.MinorFont(3).Name = east_asian
+            theme_fonts_changed += _update(pres.SlideMaster.Theme.ThemeFontScheme)
             masters_updated = 1
 
         theme_updated = masters_updated > 0
     except Exception as e:
         logger.warning("Failed to update theme fonts: %s", e)
 
-    # Step 2: Apply to existing text (including shapes inside groups)
-    def _apply_to_shape(shape):
-        """Recursively apply fonts to a shape and any grouped children."""
-        try:
-            if shape.HasTextFrame:
-                font = shape.TextFrame.TextRange.Font
-                if latin:
-                    font.Name = latin
-                if east_asian:
-                    font.NameFarEast = east_asian
-                return 1
-        except Exception:
-            pass
-        # Recurse into group members
-        updated = 0
-        try:
-            for k in range(1, shape.GroupItems.Count + 1):
-                updated += _apply_to_shape(shape.GroupItems(k))
-        except Exception:
-            pass
-        return updated
-
-    slides_processed = 0
-    shapes_updated = 0
-    if apply_to_existing:
-        for i in range(1, pres.Slides.Count + 1):
-            slide = pres.Slides(i)
-            slides_processed += 1
-            for j in range(1, slide.Shapes.Count + 1):
-                try:
-                    shapes_updated += _apply_to_shape(slide.Shapes(j))
-                except Exception:
-                    pass
-
-    result = {"success": True, "theme_updated": theme_updated}
+    result = {"success": True, "theme_updated": theme_updated,
+              "theme_fonts_changed": theme_fonts_changed}
     if latin:
         result["latin"] = latin
     if east_asian:
         result["east_asian"] = east_asian
-    if apply_to_existing:
-        result["slides_processed"] = slides_processed
-        result["shapes_updated"] = shapes_updated
-
+    if dry_run:
+        result["dry_run"] = True
+        result["theme_fonts_replaced"] = {k: sorted(v) for k, v in replaced.items() if v}
     return result
 
 
+def _normalize_master_fonts_impl(latin, east_asian, dry_run=False, theme_fonts=None):
+    return font_normalize.normalize_masters(
+        ppt._get_pres_impl(), latin, east_asian, dry_run, theme_fonts,
+    )
+
+
+def _apply_fonts_to_slides_impl(latin, east_asian, slide_indices, progress=None,
+                                include_notes=True, dry_run=False, theme_fonts=None):
+    """Set fonts on the existing text of slide_indices, writing only what differs."""
+    return font_normalize.normalize_slides(
+        ppt._get_pres_impl(), slide_indices, latin, east_asian,
+        include_notes, dry_run, progress, theme_fonts,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Picture Crop
 # ---------------------------------------------------------------------------
@@ -1029,63 +1003,69 @@ def _copy_animation_impl(slide_index, source_shape, target_shape):
 # ---------------------------------------------------------------------------
 # Add Picture from URL
 # ---------------------------------------------------------------------------
-def _add_picture_from_url_impl(slide_index, url, left, top, width, height, svg_color, fit):
-    app = ppt._get_app_impl()
-    goto_slide(app, slide_index)
-    pres = ppt._get_pres_impl()
-    slide = pres.Slides(slide_index)
+def _remove_quietly(path):
+    """Delete a temp file; PowerPoint may still hold it if a step timed out."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
-    # Download the image
-    resp = urllib.request.urlopen(url)
-    content_type = resp.headers.get("Content-Type", "")
-    is_svg = url.lower().endswith(".svg") or "svg" in content_type
+
+def _download_picture(url, svg_color):
+    """Fetch stage (I/O pool, no COM): download url into a temp file.
+
+    Returns the temp file path; the caller owns (and must remove) it.
+    """
+    data, content_type = fetch_url(url)
+    is_svg = url.lower().split("?")[0].endswith(".svg") or "svg" in content_type
 
     if is_svg:
-        svg_text = resp.read().decode("utf-8")
+        svg_text = data.decode("utf-8")
         if svg_color:
             svg_text = svg_text.replace("currentColor", svg_color)
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".svg")
-        os.close(tmp_fd)
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            f.write(svg_text)
+        data = svg_text.encode("utf-8")
+        suffix = ".svg"
     else:
-        data = resp.read()
         suffix = os.path.splitext(url.split("?")[0])[-1] or ".png"
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix=suffix)
-        os.close(tmp_fd)
-        with open(tmp_path, "wb") as f:
-            f.write(data)
+    tmp_fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(tmp_fd, "wb") as f:
+        f.write(data)
+    return tmp_path
 
-    try:
-        abs_tmp = os.path.abspath(tmp_path)
 
-        if fit and width is not None and height is not None:
-            # Auto-size first, then fit to area
-            # AddPicture(FileName, LinkToFile, SaveWithDocument, Left, Top, Width, Height)
-            pic = slide.Shapes.AddPicture(abs_tmp, 0, -1, left, top, -1, -1)
-            pic.LockAspectRatio = -1  # msoTrue
-            scale = min(width / pic.Width, height / pic.Height)
-            new_w = pic.Width * scale
-            new_h = pic.Height * scale
-            pic.Width = new_w
-            pic.Left = left + (width - new_w) / 2
-            pic.Top = top + (height - new_h) / 2
-        else:
-            w = width if width is not None else -1
-            h = height if height is not None else -1
-            pic = slide.Shapes.AddPicture(abs_tmp, 0, -1, left, top, w, h)
+def _add_picture_from_url_impl(slide_index, url, tmp_path, left, top, width, height, fit):
+    """COM stage: insert the already-downloaded file at tmp_path."""
+    app = ppt._get_app_impl()
+    goto_slide(app, slide_index)
+    pres = ppt._get_pres_impl()
+    slide = pres.Slides(slide_index)
 
-        return {
-            "success": True,
-            "shape_name": pic.Name,
-            "shape_index": pic.ZOrderPosition,
-            "width": round(pic.Width, 2),
-            "height": round(pic.Height, 2),
-            "source_url": url,
-        }
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+    abs_tmp = os.path.abspath(tmp_path)
+
+    if fit and width is not None and height is not None:
+        # Auto-size first, then fit to area
+        # AddPicture(FileName, LinkToFile, SaveWithDocument, Left, Top, Width, Height)
+        pic = slide.Shapes.AddPicture(abs_tmp, 0, -1, left, top, -1, -1)
+        pic.LockAspectRatio = -1  # msoTrue
+        scale = min(width / pic.Width, height / pic.Height)
+        new_w = pic.Width * scale
+        new_h = pic.Height * scale
+        pic.Width = new_w
+        pic.Left = left + (width - new_w) / 2
+        pic.Top = top + (height - new_h) / 2
+    else:
+        w = width if width is not None else -1
+        h = height if height is not None else -1
+        pic = slide.Shapes.AddPicture(abs_tmp, 0, -1, left, top, w, h)
+
+    return {
+        "success": True,
+        "shape_name": pic.Name,
+        "shape_index": pic.ZOrderPosition,
+        "width": round(pic.Width, 2),
+        "height": round(pic.Height, 2),
+        "source_url": url,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -1268,23 +1248,14 @@ def _set_default_shape_style_impl(
     return json.dumps({"success": True})
 
 
-def _add_svg_icon_impl(slide_index, icon_name, left, top, width, height, color, style, filled):
-    app = ppt._get_app_impl()
-    goto_slide(app, slide_index)
-    pres = ppt._get_pres_impl()
-    slide = pres.Slides(slide_index)
-
-    # Resolve theme color name to hex
-    hex_color = _resolve_color(pres, color)
-
-    # Build CDN URL (append -fill suffix for filled variant)
-    base = "https://cdn.jsdelivr.net/npm/@material-symbols/svg-400@0.31.3"
-    file_name = f"{icon_name}-fill" if filled else icon_name
-    svg_url = f"{base}/{style}/{file_name}.svg"
+def _fetch_icon_svg(icon_name, style, filled):
+    """Fetch stage (I/O pool, no COM): return (svg_text, svg_url).
 
-    # Download SVG
+    Cached SVGs are a file read; only a miss touches the CDN.
+    """
+    svg_url = _icon_svg_url(icon_name, style, filled)
     try:
-        resp = urllib.request.urlopen(svg_url)
+        return icon_cache.get_svg(svg_url), svg_url
     except urllib.error.HTTPError as e:
         if e.code == 404:
             raise ValueError(
@@ -1293,7 +1264,17 @@ def _add_svg_icon_impl(slide_index, icon_name, left, top, width, height, color,
                 f"URL: {svg_url}"
             ) from None
         raise
-    svg_text = resp.read().decode("utf-8")
+
+
+def _add_svg_icon_impl(slide_index, icon_name, svg_text, svg_url, left, top, width, height, color):
+    """COM stage: color and insert the already-fetched SVG."""
+    app = ppt._get_app_impl()
+    goto_slide(app, slide_index)
+    pres = ppt._get_pres_impl()
+    slide = pres.Slides(slide_index)
+
+    # Resolve theme color name to hex
+    hex_color = _resolve_color(pres, color)
 
     # Apply color: replace currentColor and inject fill on <svg> tag
     svg_text = svg_text.replace("currentColor", hex_color)
@@ -1359,7 +1340,7 @@ def _lock_aspect_ratio_impl(slide_index, shape_name_or_index, locked):
 # ===========================================================================
 
 # --- Tags ---
-def set_tag(params: SetTagInput) -> str:
+async def set_tag(params: SetTagInput) -> str:
     """Set a tag (key-value pair) on a shape, slide, or presentation.
 
     Args:
@@ -1369,7 +1350,7 @@ def set_tag(params: SetTagInput) -> str:
         JSON confirming the tag was set.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_tag_impl,
             params.slide_index, params.shape_name_or_index,
             params.tag_name, params.tag_value, params.target_type,
@@ -1379,7 +1360,7 @@ def set_tag(params: SetTagInput) -> str:
         return json.dumps({"error": f"Failed to set tag: {str(e)}"})
 
 
-def get_tags(params: GetTagsInput) -> str:
+async def get_tags(params: GetTagsInput) -> str:
     """Get all tags from a shape, slide, or presentation.
 
     Args:
@@ -1389,7 +1370,7 @@ def get_tags(params: GetTagsInput) -> str:
         JSON with tag count and name-value pairs.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_tags_impl,
             params.slide_index, params.shape_name_or_index, params.target_type,
         )
@@ -1399,7 +1380,7 @@ def get_tags(params: GetTagsInput) -> str:
 
 
 # --- Fonts ---
-def replace_font(params: ReplaceFontInput) -> str:
+async def replace_font(params: ReplaceFontInput) -> str:
     """Replace a font throughout the active presentation.
 
     Args:
@@ -1409,7 +1390,7 @@ def replace_font(params: ReplaceFontInput) -> str:
         JSON confirming the font replacement.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _replace_font_impl,
             params.original_font, params.replacement_font,
         )
@@ -1418,21 +1399,21 @@ def replace_font(params: ReplaceFontInput) -> str:
         return json.dumps({"error": f"Failed to replace font: {str(e)}"})
 
 
-def list_fonts() -> str:
+async def list_fonts() -> str:
     """List all fonts used in the active presentation.
 
     Returns:
         JSON with font count and names.
     """
     try:
-        result = ppt.execute(_list_fonts_impl)
+        result = await ppt.execute_async(_list_fonts_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to list fonts: {str(e)}"})
 
 
 # --- Set Default Fonts ---
-def set_default_fonts(params: SetDefaultFontsInput) -> str:
+async def set_default_fonts(params: SetDefaultFontsInput, ctx: Optional[Context] = None) -> str:
     """Set default fonts for the entire presentation.
 
     Args:
@@ -1442,17 +1423,39 @@ def set_default_fonts(params: SetDefaultFontsInput) -> str:
         JSON with theme update status and number of shapes updated.
     """
     try:
-        result = ppt.execute(
-            _set_default_fonts_impl,
-            params.latin, params.east_asian, params.apply_to_existing,
+        # Theme fonts and masters first, then existing text in chunks of slides.
+        result = await ppt.execute_async(
+            _set_theme_fonts_impl, params.latin, params.east_asian, params.dry_run,
         )
+        if params.apply_to_existing:
+            # A dry run leaves the theme as it is: text in the theme fonts
+            # being replaced would follow the theme, so it is not counted.
+            theme_fonts = result.get("theme_fonts_replaced")
+            stats = FontStats()
+            if params.include_masters:
+                stats.add(await ppt.execute_async(
+                    _normalize_master_fonts_impl, params.latin, params.east_asian, params.dry_run,
+                    theme_fonts,
+                ))
+            total = await ppt.execute_async(lambda: ppt._get_pres_impl().Slides.Count)
+            progress = Progress(ctx)
+            parts = await progress.execute_chunked(
+                _apply_fonts_to_slides_impl, list(range(1, total + 1)),
+                latin=params.latin, east_asian=params.east_asian,
+                include_notes=params.include_notes, dry_run=params.dry_run,
+                theme_fonts=theme_fonts,
+            )
+            for part in parts:
+                stats.add(part)
+            result.update(stats.as_dict())
+            result.update(progress.partial())
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to set default fonts: {str(e)}"})
 
 
 # --- Picture Crop ---
-def crop_picture(params: CropPictureInput) -> str:
+async def crop_picture(params: CropPictureInput) -> str:
     """Crop a picture shape.
 
     Supports three modes:
@@ -1470,7 +1473,7 @@ def crop_picture(params: CropPictureInput) -> str:
         JSON with shape dimensions, crop values, and active crop_shape.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _crop_picture_impl,
             params.slide_index, params.shape_name_or_index,
             params.crop_left, params.crop_right,
@@ -1532,7 +1535,7 @@ def _set_picture_format_impl(slide_index, shape_name_or_index, brightness,
     return result
 
 
-def set_picture_format(params: SetPictureFormatInput) -> str:
+async def set_picture_format(params: SetPictureFormatInput) -> str:
     """Set picture format properties (brightness, contrast, color type, transparency).
 
     Args:
@@ -1542,7 +1545,7 @@ def set_picture_format(params: SetPictureFormatInput) -> str:
         JSON with current picture format properties after applying changes.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_picture_format_impl,
             params.slide_index, params.shape_name_or_index,
             params.brightness, params.contrast, params.color_type,
@@ -1554,7 +1557,7 @@ def set_picture_format(params: SetPictureFormatInput) -> str:
 
 
 # --- Shape Export ---
-def export_shape(params: ExportShapeInput) -> str:
+async def export_shape(params: ExportShapeInput) -> str:
     """Export a shape as an image file.
 
     Args:
@@ -1570,7 +1573,7 @@ def export_shape(params: ExportShapeInput) -> str:
                 "error": f"Unknown format '{params.format}'. "
                 f"Use one of: {', '.join(SHAPE_FORMAT_MAP.keys())}"
             })
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _export_shape_impl,
             params.slide_index, params.shape_name_or_index,
             params.file_path, SHAPE_FORMAT_MAP[fmt_key],
@@ -1582,7 +1585,7 @@ def export_shape(params: ExportShapeInput) -> str:
 
 
 # --- Slide Hidden ---
-def set_slide_hidden(params: SetSlideHiddenInput) -> str:
+async def set_slide_hidden(params: SetSlideHiddenInput) -> str:
     """Set a slide as hidden or visible in the slideshow.
 
     Args:
@@ -1592,7 +1595,7 @@ def set_slide_hidden(params: SetSlideHiddenInput) -> str:
         JSON confirming the hidden state.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_slide_hidden_impl,
             params.slide_index, params.hidden,
         )
@@ -1602,7 +1605,7 @@ def set_slide_hidden(params: SetSlideHiddenInput) -> str:
 
 
 # --- Select Shapes ---
-def select_shapes(params: SelectShapesInput) -> str:
+async def select_shapes(params: SelectShapesInput) -> str:
     """Select multiple shapes on a slide.
 
     Args:
@@ -1614,7 +1617,7 @@ def select_shapes(params: SelectShapesInput) -> str:
     try:
         if not params.shape_names:
             return json.dumps({"error": "shape_names list must not be empty"})
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _select_shapes_impl,
             params.slide_index, params.shape_names,
         )
@@ -1624,21 +1627,21 @@ def select_shapes(params: SelectShapesInput) -> str:
 
 
 # --- Get Selection ---
-def get_selection() -> str:
+async def get_selection() -> str:
     """Get the current selection in the active window.
 
     Returns:
         JSON with selection type and details.
     """
     try:
-        result = ppt.execute(_get_selection_impl)
+        result = await ppt.execute_async(_get_selection_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to get selection: {str(e)}"})
 
 
 # --- View ---
-def set_view(params: SetViewInput) -> str:
+async def set_view(params: SetViewInput) -> str:
     """Set the PowerPoint view type and/or zoom level.
 
     Args:
@@ -1648,7 +1651,7 @@ def set_view(params: SetViewInput) -> str:
         JSON with current view type and zoom after setting.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_view_impl,
             params.view_type, params.zoom,
         )
@@ -1658,7 +1661,7 @@ def set_view(params: SetViewInput) -> str:
 
 
 # --- Copy Animation ---
-def copy_animation(params: CopyAnimationInput) -> str:
+async def copy_animation(params: CopyAnimationInput) -> str:
     """Copy animation from one shape to another on the same slide.
 
     Args:
@@ -1668,7 +1671,7 @@ def copy_animation(params: CopyAnimationInput) -> str:
         JSON confirming the animation was copied.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _copy_animation_impl,
             params.slide_index, params.source_shape, params.target_shape,
         )
@@ -1678,7 +1681,7 @@ def copy_animation(params: CopyAnimationInput) -> str:
 
 
 # --- Add Picture from URL ---
-def add_picture_from_url(params: AddPictureFromUrlInput) -> str:
+async def add_picture_from_url(params: AddPictureFromUrlInput) -> str:
     """Add a picture to a slide by downloading from a URL.
 
     Args:
@@ -1688,19 +1691,24 @@ def add_picture_from_url(params: AddPictureFromUrlInput) -> str:
         JSON with shape name, dimensions, and source URL.
     """
     try:
-        result = ppt.execute(
-            _add_picture_from_url_impl,
-            params.slide_index, params.url,
-            params.left, params.top, params.width, params.height,
-            params.svg_color, params.fit,
-        )
+        # Download on the I/O pool first so the COM thread only runs AddPicture.
+        tmp_path = await run_io(_download_picture, params.url, params.svg_color)
+        try:
+            result = await ppt.execute_async(
+                _add_picture_from_url_impl,
+                params.slide_index, params.url, tmp_path,
+                params.left, params.top, params.width, params.height,
+                params.fit,
+            )
+        finally:
+            _remove_quietly(tmp_path)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to add picture from URL: {str(e)}"})
 
 
 # --- Add SVG Icon ---
-def add_svg_icon(params: AddSvgIconInput) -> str:
+async def add_svg_icon(params: AddSvgIconInput) -> str:
     """Add a Material Symbols icon as SVG image to a slide.
 
     Args:
@@ -1710,11 +1718,14 @@ def add_svg_icon(params: AddSvgIconInput) -> str:
         JSON with shape name, dimensions, icon name, and source URL.
     """
     try:
-        result = ppt.execute(
+        svg_text, svg_url = await run_io(
+            _fetch_icon_svg, params.icon_name, params.style, params.filled,
+        )
+        result = await ppt.execute_async(
             _add_svg_icon_impl,
-            params.slide_index, params.icon_name,
+            params.slide_index, params.icon_name, svg_text, svg_url,
             params.left, params.top, params.width, params.height,
-            params.color, params.style, params.filled,
+            params.color,
         )
         return json.dumps(result)
     except Exception as e:
@@ -1722,7 +1733,7 @@ def add_svg_icon(params: AddSvgIconInput) -> str:
 
 
 # --- Lock Aspect Ratio ---
-def lock_aspect_ratio(params: LockAspectRatioInput) -> str:
+async def lock_aspect_ratio(params: LockAspectRatioInput) -> str:
     """Lock or unlock the aspect ratio of a shape.
 
     Args:
@@ -1732,7 +1743,7 @@ def lock_aspect_ratio(params: LockAspectRatioInput) -> str:
         JSON confirming the aspect ratio lock state.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _lock_aspect_ratio_impl,
             params.slide_index, params.shape_name_or_index, params.locked,
         )
@@ -1742,10 +1753,12 @@ def lock_aspect_ratio(params: LockAspectRatioInput) -> str:
 
 
 # --- Search Icons ---
-def search_icons(params: SearchIconsInput) -> str:
+async def search_icons(params: SearchIconsInput) -> str:
     """Search Material Symbols icons by keyword.
 
-    Fetches icon metadata from Google Fonts on first call (cached for 24h).
+    Icon metadata is served from the persistent disk cache and revalidated
+    against Google Fonts every 24h. Runs on the I/O pool: the first search
+    (or a revalidation) may download the metadata.
 
     Args:
         params: Search query and max results.
@@ -1754,17 +1767,87 @@ def search_icons(params: SearchIconsInput) -> str:
         JSON with matching icons (name, categories, tags, popularity, score).
     """
     try:
-        results = _search_icons(params.query, params.max_results)
-        return json.dumps({
+        found = await run_io(_search_icons, params.query, params.max_results, params.fuzzy)
+        response = {
             "success": True,
             "query": params.query,
-            "count": len(results),
-            "icons": results,
-        })
+            "count": len(found["icons"]),
+            "icons": found["icons"],
+        }
+        if found["fuzzy"]:
+            response["fuzzy_matches"] = found["fuzzy"]
+        return json.dumps(response)
     except Exception as e:
         return json.dumps({"error": f"Failed to search icons: {str(e)}"})
 
 
+# --- Prewarm Icons ---
+_PREWARM_WORKERS = 8
+
+
+def _prewarm_icons(icon_names, top_popular, styles, include_filled) -> dict:
+    """Download metadata and the requested SVGs into the disk cache (no COM)."""
+    icons = _fetch_icon_metadata()
+    names = list(dict.fromkeys(icon_names or []))
+    if top_popular:
+        by_popularity = sorted(icons, key=lambda i: i.get("popularity", 0), reverse=True)
+        names.extend(
+            i["name"] for i in by_popularity[:top_popular] if i.get("name") not in names
+        )
+    variants = [False, True] if include_filled else [False]
+    urls = [
+        _icon_svg_url(name, style, filled)
+        for name in names for style in styles for filled in variants
+    ]
+
+    already = {u for u in urls if icon_cache.cached_svg(u) is not None}
+    missing = [u for u in urls if u not in already]
+    failed = []
+
+    def _fetch(url):
+        try:
+            icon_cache.get_svg(url)
+        except Exception as e:
+            failed.append({"url": url, "error": str(e)})
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=_PREWARM_WORKERS) as pool:
+            list(pool.map(_fetch, missing))
+
+    return {
+        "success": True,
+        "metadata_icons": len(icons),
+        "requested": len(urls),
+        "already_cached": len(already),
+        "downloaded": len(missing) - len(failed),
+        "failed": failed,
+        "cache": icon_cache.stats(),
+    }
+
+
+async def prewarm_icons(params: PrewarmIconsInput) -> str:
+    """Fill the persistent icon cache so later insertions need no network.
+
+    Runs on a worker thread — it never touches PowerPoint, so it neither
+    occupies the COM thread nor blocks the event loop.
+
+    Args:
+        params: Icon names and/or top-N popular icons, styles, filled flag.
+
+    Returns:
+        JSON with counts of cached/downloaded/failed SVGs and cache stats.
+    """
+    try:
+        result = await run_io(
+            _prewarm_icons,
+            params.icon_names, params.top_popular,
+            params.styles, params.include_filled,
+        )
+        return json.dumps(result)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to prewarm icons: {str(e)}"})
+
+
 # ===========================================================================
 # Tool registration
 # ===========================================================================
@@ -1790,7 +1873,7 @@ def register_tools(mcp):
         For shape targets, provide slide_index and shape_name_or_index.
         For slide targets, provide slide_index.
         """
-        return set_tag(params)
+        return await set_tag(params)
 
     @mcp.tool(
         name="ppt_get_tags",
@@ -1808,7 +1891,7 @@ def register_tools(mcp):
         Returns a dictionary of tag name-value pairs.
         Set target_type to 'shape' (default), 'slide', or 'presentation'.
         """
-        return get_tags(params)
+        return await get_tags(params)
 
     # --- Fonts ---
     @mcp.tool(
@@ -1827,7 +1910,7 @@ def register_tools(mcp):
         Replaces every instance of original_font with replacement_font
         across all slides, shapes, and text ranges.
         """
-        return replace_font(params)
+        return await replace_font(params)
 
     @mcp.tool(
         name="ppt_list_fonts",
@@ -1844,7 +1927,7 @@ def register_tools(mcp):
 
         Returns the names of all fonts embedded or referenced in the presentation.
         """
-        return list_fonts()
+        return await list_fonts()
 
     @mcp.tool(
         name="ppt_set_default_fonts",
@@ -1856,7 +1939,7 @@ def register_tools(mcp):
             "openWorldHint": False,
         },
     )
-    async def tool_set_default_fonts(params: SetDefaultFontsInput) -> str:
+    async def tool_set_default_fonts(params: SetDefaultFontsInput, ctx: Optional[Context] = None) -> str:
         """Set default fonts for the entire presentation (Latin and East Asian separately).
 
         Updates theme fonts so new text uses the specified fonts.
@@ -1864,8 +1947,20 @@ def register_tools(mcp):
         Use 'latin' for alphabet/number fonts (e.g. 'Segoe UI') and
         'east_asian' for Japanese/Chinese/Korean fonts (e.g. 'Meiryo').
         At least one of latin or east_asian must be provided.
+
+        Existing text covers text boxes (also in groups), table cells,
+        SmartArt nodes, speaker notes and master / layout placeholders. Only
+        text whose font actually differs is written, so re-running on a
+        normalized deck writes nothing. The result reports
+        `text_ranges_checked`, `already_correct`, `property_writes`,
+        `changed_by_location` and per-font `fonts_before` / `fonts_after`
+        counts; `dry_run=true` reports them without writing.
+
+        Existing text is updated slide by slide with progress notifications;
+        if that runs out of time the result has `partial: true` and
+        `slides_done` (calling again finishes the rest).
         """
-        return set_default_fonts(params)
+        return await set_default_fonts(params, ctx)
 
     # --- Picture Crop ---
     @mcp.tool(
@@ -1897,7 +1992,7 @@ def register_tools(mcp):
 
         Returns current crop values and the active crop_shape integer after applying.
         """
-        return crop_picture(params)
+        return await crop_picture(params)
 
     # --- Picture Format ---
     @mcp.tool(
@@ -1921,7 +2016,7 @@ def register_tools(mcp):
         transparent_color: '#RRGGBB' hex — sets the color-key and enables transparency.
         transparent_background: explicitly enable/disable color-key transparency.
         """
-        return set_picture_format(params)
+        return await set_picture_format(params)
 
     # --- Shape Export ---
     @mcp.tool(
@@ -1940,7 +2035,7 @@ def register_tools(mcp):
         Supports formats: 'png', 'jpg', 'gif', 'bmp', 'wmf', 'emf'.
         Optionally specify width and height in pixels.
         """
-        return export_shape(params)
+        return await export_shape(params)
 
     # --- Slide Hidden ---
     @mcp.tool(
@@ -1959,7 +2054,7 @@ def register_tools(mcp):
         Hidden slides are skipped during slideshow playback but remain
         in the presentation. Set hidden=true to hide, hidden=false to show.
         """
-        return set_slide_hidden(params)
+        return await set_slide_hidden(params)
 
     # --- Select Shapes ---
     @mcp.tool(
@@ -1979,7 +2074,7 @@ def register_tools(mcp):
         The first shape replaces any existing selection; remaining shapes
         are added to the selection.
         """
-        return select_shapes(params)
+        return await select_shapes(params)
 
     # --- Get Selection ---
     @mcp.tool(
@@ -1999,7 +2094,7 @@ def register_tools(mcp):
         For shapes, returns the list of selected shape names.
         For text, returns the selected text content.
         """
-        return get_selection()
+        return await get_selection()
 
     # --- View ---
     @mcp.tool(
@@ -2019,7 +2114,7 @@ def register_tools(mcp):
         'notes_master', 'outline', 'slide_sorter', 'title_master', 'reading'.
         Zoom range: 10-400. Returns current view_type and zoom after setting.
         """
-        return set_view(params)
+        return await set_view(params)
 
     # --- Copy Animation ---
     @mcp.tool(
@@ -2038,7 +2133,7 @@ def register_tools(mcp):
         Uses PickupAnimation/ApplyAnimation to transfer all animation
         settings from the source shape to the target shape.
         """
-        return copy_animation(params)
+        return await copy_animation(params)
 
     # --- Add Picture from URL ---
     @mcp.tool(
@@ -2061,7 +2156,7 @@ def register_tools(mcp):
         aspect ratio and centered. If width/height are not specified,
         the original image dimensions are used.
         """
-        return add_picture_from_url(params)
+        return await add_picture_from_url(params)
 
     # --- Add SVG Icon ---
     @mcp.tool(
@@ -2083,7 +2178,7 @@ def register_tools(mcp):
         the filled variant. Color accepts '#RRGGBB' or theme names like
         'accent1'. Use ppt_search_icons to find icon names by keyword.
         """
-        return add_svg_icon(params)
+        return await add_svg_icon(params)
 
     # --- Lock Aspect Ratio ---
     @mcp.tool(
@@ -2102,7 +2197,7 @@ def register_tools(mcp):
         When locked, resizing the shape maintains its proportions.
         Set locked=true to lock, locked=false to unlock.
         """
-        return lock_aspect_ratio(params)
+        return await lock_aspect_ratio(params)
 
     # --- Search Icons ---
     @mcp.tool(
@@ -2123,10 +2218,32 @@ def register_tools(mcp):
         name, categories, sample tags, and popularity score.
         Use the returned icon name with ppt_add_svg_icon to insert it
         into a slide. Supports multi-word queries (e.g. 'arrow forward',
-        'chart graph'). The metadata is fetched on first call and cached
-        for 24 hours.
+        'chart graph'). The metadata is kept in a persistent disk cache
+        and revalidated every 24 hours.
+        """
+        return await search_icons(params)
+
+    # --- Prewarm Icons ---
+    @mcp.tool(
+        name="ppt_prewarm_icons",
+        annotations={
+            "title": "Prewarm Icon Cache",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": True,
+        },
+    )
+    async def tool_prewarm_icons(params: PrewarmIconsInput) -> str:
+        """Download icons into the persistent cache ahead of time.
+
+        Cached icons are inserted by ppt_add_svg_icon with a file read and
+        no network access. Pass icon_names (e.g. from ppt_search_icons),
+        and/or top_popular=N to cache the N most popular icons. Also fetches
+        the icon metadata used by ppt_search_icons. Useful before working
+        offline (PPT_ICON_OFFLINE=true) or before a long deck-building run.
         """
-        return search_icons(params)
+        return await prewarm_icons(params)
 
     # --- Default Shape Style ---
     @mcp.tool(
@@ -2174,12 +2291,12 @@ def register_tools(mcp):
         globally. It resets when the presentation is closed.
         """
         if params.slide_index is not None:
-            return ppt.execute(
+            return await ppt.execute_async(
                 _set_default_shape_style_from_shape_impl,
                 params.slide_index,
                 params.shape_name_or_index,
             )
-        return ppt.execute(
+        return await ppt.execute_async(
             _set_default_shape_style_impl,
             params.fill_type,
             params.fill_color,
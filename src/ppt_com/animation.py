@@ -1010,7 +1010,7 @@ def _update_animation_impl(
 # ---------------------------------------------------------------------------
 # MCP tool functions (sync wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def set_slide_transition(params: SetSlideTransitionInput) -> str:
+async def set_slide_transition(params: SetSlideTransitionInput) -> str:
     """Set the transition effect for a slide.
 
     Args:
@@ -1020,7 +1020,7 @@ def set_slide_transition(params: SetSlideTransitionInput) -> str:
         JSON confirming the transition was set.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_slide_transition_impl,
             params.slide_index, params.effect, params.duration,
             params.advance_on_click, params.advance_on_time, params.advance_time,
@@ -1030,7 +1030,7 @@ def set_slide_transition(params: SetSlideTransitionInput) -> str:
         return json.dumps({"error": f"Failed to set slide transition: {str(e)}"})
 
 
-def add_animation(params: AddAnimationInput) -> str:
+async def add_animation(params: AddAnimationInput) -> str:
     """Add an animation effect to a shape.
 
     Args:
@@ -1040,7 +1040,7 @@ def add_animation(params: AddAnimationInput) -> str:
         JSON with shape name, effect, and animation index.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_animation_impl,
             params.slide_index, params.shape_name_or_index,
             params.effect, params.trigger, params.duration, params.delay,
@@ -1056,7 +1056,7 @@ def add_animation(params: AddAnimationInput) -> str:
         return json.dumps({"error": f"Failed to add animation: {str(e)}"})
 
 
-def list_animations(params: ListAnimationsInput) -> str:
+async def list_animations(params: ListAnimationsInput) -> str:
     """List all animations in the main sequence of a slide.
 
     Args:
@@ -1066,7 +1066,7 @@ def list_animations(params: ListAnimationsInput) -> str:
         JSON with animation count and details for each animation.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _list_animations_impl,
             params.slide_index,
         )
@@ -1075,7 +1075,7 @@ def list_animations(params: ListAnimationsInput) -> str:
         return json.dumps({"error": f"Failed to list animations: {str(e)}"})
 
 
-def remove_animation(params: RemoveAnimationInput) -> str:
+async def remove_animation(params: RemoveAnimationInput) -> str:
     """Remove a single animation from a slide's main or interactive sequence.
 
     Args:
@@ -1085,7 +1085,7 @@ def remove_animation(params: RemoveAnimationInput) -> str:
         JSON confirming removal and remaining count.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _remove_animation_impl,
             params.slide_index, params.animation_index, params.sequence_index,
         )
@@ -1094,7 +1094,7 @@ def remove_animation(params: RemoveAnimationInput) -> str:
         return json.dumps({"error": f"Failed to remove animation: {str(e)}"})
 
 
-def clear_animations(params: ClearAnimationsInput) -> str:
+async def clear_animations(params: ClearAnimationsInput) -> str:
     """Clear all animations from a slide.
 
     Args:
@@ -1104,7 +1104,7 @@ def clear_animations(params: ClearAnimationsInput) -> str:
         JSON confirming how many animations were cleared.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _clear_animations_impl,
             params.slide_index, params.clear_transitions,
         )
@@ -1113,7 +1113,7 @@ def clear_animations(params: ClearAnimationsInput) -> str:
         return json.dumps({"error": f"Failed to clear animations: {str(e)}"})
 
 
-def update_animation(params: UpdateAnimationInput) -> str:
+async def update_animation(params: UpdateAnimationInput) -> str:
     """Update an existing animation in the main or interactive sequence.
 
     Args:
@@ -1123,7 +1123,7 @@ def update_animation(params: UpdateAnimationInput) -> str:
         JSON with the updated animation state.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _update_animation_impl,
             params.slide_index, params.animation_index, params.sequence_index,
             params.effect, params.trigger, params.duration,
@@ -1163,7 +1163,7 @@ def register_tools(mcp):
         or a PpEntryEffect integer. Optionally set duration, advance-on-click,
         and auto-advance timing.
         """
-        return set_slide_transition(params)
+        return await set_slide_transition(params)
 
     @mcp.tool(
         name="ppt_add_animation",
@@ -1198,7 +1198,7 @@ def register_tools(mcp):
         For interactive sequences (click a shape to trigger animation on another),
         set trigger='on_shape_click' and trigger_shape to the clickable shape.
         """
-        return add_animation(params)
+        return await add_animation(params)
 
     @mcp.tool(
         name="ppt_list_animations",
@@ -1217,7 +1217,7 @@ def register_tools(mcp):
         trigger type, and duration. Interactive sequences include the
         trigger shape name and sequence index.
         """
-        return list_animations(params)
+        return await list_animations(params)
 
     @mcp.tool(
         name="ppt_remove_animation",
@@ -1237,7 +1237,7 @@ def register_tools(mcp):
         For interactive sequences, provide sequence_index to target a specific
         interactive sequence instead of the main sequence.
         """
-        return remove_animation(params)
+        return await remove_animation(params)
 
     @mcp.tool(
         name="ppt_clear_animations",
@@ -1255,7 +1255,7 @@ def register_tools(mcp):
         Optionally also clears the slide transition effect by setting
         clear_transitions=true.
         """
-        return clear_animations(params)
+        return await clear_animations(params)
 
     @mcp.tool(
         name="ppt_update_animation",
@@ -1283,4 +1283,4 @@ def register_tools(mcp):
         interactive sequence instead of the main sequence.
         Use ppt_list_animations first to find the correct animation index.
         """
-        return update_animation(params)
+        return await update_animation(params)
@@ -2,11 +2,17 @@
 
 import json
 import logging
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from utils import http_fetch
+from utils.busy_retry import busy_stats
 from utils.com_wrapper import ppt, handle_com_error
+from utils.icon_cache import icon_cache
+from utils.perf_stats import perf_stats
+from utils.preview_cache import preview_cache
+from utils.smartart_catalog import smartart_catalogs
 from ppt_com.constants import WINDOW_STATE_NAMES, ppSelectionNone, ppSelectionSlides, ppSelectionShapes, ppSelectionText
 
 logger = logging.getLogger(__name__)
@@ -47,6 +53,31 @@ class SetWindowStateInput(BaseModel):
     )
 
 
+class GetPerformanceStatsInput(BaseModel):
+    """Input for reading the per-tool performance counters."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    sort_by: Literal[
+        "wall_ms_total", "com_ms_total", "queue_wait_ms_total",
+        "calls", "busy_retries", "com_round_trips",
+    ] = Field(
+        default="wall_ms_total",
+        description="Counter to rank tools by (descending)",
+    )
+    top: Optional[int] = Field(
+        default=None, ge=1,
+        description="Return only the first N tools (default: all)",
+    )
+    include_caches: bool = Field(
+        default=True,
+        description="Include handle, preview, icon, Markdown, SmartArt and HTTP cache counters",
+    )
+    reset: bool = Field(
+        default=False,
+        description="Clear the per-tool and busy-retry counters after reading them",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Implementation functions (run on COM thread via ppt.execute)
 # ---------------------------------------------------------------------------
@@ -78,6 +109,7 @@ def _get_app_info_impl() -> dict:
             info["active_presentation"] = ppt._get_pres_impl().Name
         except Exception:
             pass
+    info["handle_cache"] = ppt.get_handle_cache_stats()
     return info
 
 
@@ -161,10 +193,26 @@ def _set_window_state_impl(window_state: str) -> dict:
     }
 
 
+def _cache_stats() -> dict:
+    caches = {
+        "handle_cache": ppt.get_handle_cache_stats(),
+        "preview_cache": preview_cache.stats(),
+        "icon_cache": icon_cache.stats(),
+        "smartart_catalog": smartart_catalogs.stats(),
+        "http": http_fetch.stats(),
+    }
+    try:
+        from ppt_com.text import markdown_cache_stats
+        caches["markdown_cache"] = markdown_cache_stats()
+    except ImportError:
+        pass
+    return caches
+
+
 # ---------------------------------------------------------------------------
 # MCP tool functions (async wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def connect_to_powerpoint(params: ConnectInput) -> str:
+async def connect_to_powerpoint(params: ConnectInput) -> str:
     """Connect to a running PowerPoint instance or launch a new one.
 
     Attempts to connect to an already-running PowerPoint via GetActiveObject.
@@ -181,29 +229,30 @@ def connect_to_powerpoint(params: ConnectInput) -> str:
         str: JSON with connection status, PowerPoint version, and presentation count
     """
     try:
-        result = ppt.execute(_connect_impl, params.visible)
+        result = await ppt.execute_async(_connect_impl, params.visible)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to connect to PowerPoint: {str(e)}"})
 
 
-def get_app_info() -> str:
+async def get_app_info() -> str:
     """Get information about the connected PowerPoint application.
 
     Returns the PowerPoint version, visibility, window state, number of
-    open presentations, and the name of the active presentation.
+    open presentations, the name of the active presentation, and the
+    resolved-handle cache counters (lookups avoided, window activations).
 
     Returns:
         str: JSON with application info including version, window state, and active presentation
     """
     try:
-        result = ppt.execute(_get_app_info_impl)
+        result = await ppt.execute_async(_get_app_info_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to get app info: {str(e)}"})
 
 
-def get_active_window_info() -> str:
+async def get_active_window_info() -> str:
     """Get detailed info about the active PowerPoint window and current selection.
 
     Returns the window caption, view type, current slide index, and details
@@ -213,13 +262,13 @@ def get_active_window_info() -> str:
         str: JSON with window caption, active slide index, selection type, and selected items
     """
     try:
-        result = ppt.execute(_get_active_window_info_impl)
+        result = await ppt.execute_async(_get_active_window_info_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to get window info: {str(e)}"})
 
 
-def list_presentations() -> str:
+async def list_presentations() -> str:
     """List all currently open presentations in PowerPoint.
 
     Returns name, path, slide count, read-only status, and save status
@@ -229,13 +278,13 @@ def list_presentations() -> str:
         str: JSON array of presentation objects with their properties
     """
     try:
-        result = ppt.execute(_list_presentations_impl)
+        result = await ppt.execute_async(_list_presentations_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to list presentations: {str(e)}"})
 
 
-def set_window_state(params: SetWindowStateInput) -> str:
+async def set_window_state(params: SetWindowStateInput) -> str:
     """Set the PowerPoint application window state.
 
     Controls whether the PowerPoint window is maximized, minimized, or
@@ -250,7 +299,40 @@ def set_window_state(params: SetWindowStateInput) -> str:
         str: JSON with success status and the applied window state
     """
     try:
-        result = ppt.execute(_set_window_state_impl, params.window_state)
+        result = await ppt.execute_async(_set_window_state_impl, params.window_state)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to set window state: {str(e)}"})
+
+
+async def get_performance_stats(params: GetPerformanceStatsInput) -> str:
+    """Report where tool time goes, per tool name.
+
+    Reads in-process counters only; it does not touch PowerPoint, so it also
+    works while the COM thread is busy. Times are in milliseconds.
+
+    Args:
+        params (GetPerformanceStatsInput): Report options:
+            - sort_by (str): Counter to rank tools by
+            - top (Optional[int]): Limit the number of tools returned
+            - include_caches (bool): Add cache hit/miss counters
+            - reset (bool): Clear the per-tool and busy-retry counters afterwards
+
+    Returns:
+        str: JSON with per-tool calls, errors, wall / queue-wait / COM times,
+            busy retries and (when PPT_PERF_COUNT_COM is on) COM gets, sets
+            and calls, plus totals, COM queue lane counters, busy-retry
+            counters and optional cache counters
+    """
+    try:
+        result = perf_stats.snapshot(params.sort_by, params.top)
+        result["com_queue"] = ppt.get_queue_stats()
+        result["busy"] = busy_stats.stats()
+        if params.include_caches:
+            result["caches"] = _cache_stats()
+        if params.reset:
+            perf_stats.reset()
+            busy_stats.reset()
+        return json.dumps(result, default=str)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to get performance stats: {str(e)}"})
@@ -179,7 +179,7 @@ def _dispatch_op(slide_index, shape_name_or_index, tool_name, params):
             slide_index, shape_name_or_index,
             m.font_name, m.font_name_fareast,
             m.font_size, m.bold, m.italic, m.underline,
-            m.color, m.font_color_theme,
+            m.color, m.font_color_theme, m.highlight_color,
         )
 
     else:
@@ -233,7 +233,7 @@ def _batch_apply_impl(slide_index, shapes, operations):
 # Tool function
 # ---------------------------------------------------------------------------
 
-def batch_apply_formatting(params: BatchApplyFormattingInput) -> str:
+async def batch_apply_formatting(params: BatchApplyFormattingInput) -> str:
     """Apply formatting operations to multiple shapes at once.
 
     Applies one or more formatting operations (set_fill, set_line,
@@ -255,7 +255,7 @@ def batch_apply_formatting(params: BatchApplyFormattingInput) -> str:
     try:
         # Serialize operations to dicts for COM thread
         ops = [{"tool": op.tool, "params": op.params} for op in params.operations]
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _batch_apply_impl,
             params.slide_index,
             list(params.shapes),
@@ -276,4 +276,4 @@ def register_tools(mcp):
         annotations={"readOnlyHint": False},
     )
     async def tool_batch_apply_formatting(params: BatchApplyFormattingInput) -> str:
-        return batch_apply_formatting(params)
+        return await batch_apply_formatting(params)
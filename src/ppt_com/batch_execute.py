@@ -0,0 +1,299 @@
+"""Run a script of heterogeneous tool calls in a single COM-thread hop.
+
+An agent building one slide typically issues dozens of tool calls, each
+paying the MCP round trip, the queue hop to the COM thread, presentation
+resolution and slide navigation. ppt_execute_batch runs an ordered list of
+registered tools inside ONE COM task instead: execute_async runs inline on the
+COM thread, the resolved presentation is reused between steps, repeated
+navigation to the same slide is skipped and the window is frozen once for the
+whole script.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import re
+import time
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from utils.com_wrapper import ppt
+from utils.navigation import coalesce_navigation
+from utils.redraw import FrozenRedraw
+
+logger = logging.getLogger(__name__)
+
+_BATCH_TOOL_NAME = "ppt_execute_batch"
+# Tools that never need the COM thread (file-based, with their own worker
+# threads, or background job handling); inside a batch they would only hold
+# it up.
+_OFFLINE_TOOL_NAMES = frozenset({
+    "ppt_offline_read", "ppt_offline_edit",
+    "ppt_batch_export", "ppt_get_batch_export_status",
+    "ppt_start_job", "ppt_get_job", "ppt_cancel_job",
+})
+# "$<step id>" or "$<step id>.<key>[.<key>...]" — a whole-string reference to
+# an earlier step's result.
+_REF_RE = re.compile(r"^\$([A-Za-z0-9_-]+)((?:\.[A-Za-z0-9_]+)*)$")
+
+_mcp = None
+_registry: Optional[dict] = None
+
+
+# ---------------------------------------------------------------------------
+# Input models
+# ---------------------------------------------------------------------------
+class BatchStep(BaseModel):
+    """One tool call inside a batch."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    tool: str = Field(
+        ...,
+        description="Tool name, with or without the 'ppt_' prefix (e.g. 'add_shape').",
+    )
+    params: dict = Field(
+        default_factory=dict,
+        description="The tool's parameters, exactly as they would be passed to the tool.",
+    )
+    id: Optional[str] = Field(
+        default=None,
+        pattern=r"^[A-Za-z0-9_-]+$",
+        description=(
+            "Optional step id for references. Defaults to the 1-based step "
+            "number. Later steps can use '$<id>.<key>' as a parameter value."
+        ),
+    )
+
+
+class ExecuteBatchInput(BaseModel):
+    """Input for running several tool calls in one COM-thread hop."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    operations: List[BatchStep] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Ordered list of tool calls to run",
+    )
+    stop_on_error: bool = Field(
+        default=True,
+        description="Stop at the first failing step (remaining steps are skipped)",
+    )
+    single_undo_entry: bool = Field(
+        default=True,
+        description="Group all changes into one undo entry (one Ctrl+Z undoes the batch)",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tool registry
+# ---------------------------------------------------------------------------
+def _normalize_tool_name(name: str) -> str:
+    name = name.strip()
+    return name if name.startswith("ppt_") else f"ppt_{name}"
+
+
+def _tool_registry() -> dict:
+    """Map tool name -> (async tool function, input model or None).
+
+    Built lazily from the FastMCP tool manager so every tool registered by any
+    module is available. Tools that do not return JSON text (e.g. the slide
+    preview image), the offline file tools and the batch tool itself are
+    excluded.
+    """
+    global _registry
+    if _registry is None:
+        registry = {}
+        for tool in _mcp._tool_manager.list_tools():
+            if tool.name == _BATCH_TOOL_NAME or tool.name in _OFFLINE_TOOL_NAMES or not tool.is_async:
+                continue
+            sig = inspect.signature(tool.fn)
+            if sig.return_annotation is not str:
+                continue
+            model = None
+            for param in sig.parameters.values():
+                ann = param.annotation
+                if inspect.isclass(ann) and issubclass(ann, BaseModel):
+                    model = ann
+            registry[tool.name] = (tool.fn, model)
+        _registry = registry
+    return _registry
+
+
+def _resolve_refs(value: Any, outputs: dict) -> Any:
+    """Replace '$<id>.<key>' strings with values from earlier step results."""
+    if isinstance(value, dict):
+        return {k: _resolve_refs(v, outputs) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(v, outputs) for v in value]
+    if not isinstance(value, str):
+        return value
+    m = _REF_RE.match(value)
+    if not m:
+        return value
+    step_id, path = m.group(1), m.group(2)
+    if step_id not in outputs:
+        raise ValueError(f"Reference '{value}': no earlier step with id '{step_id}'")
+    resolved = outputs[step_id]
+    for key in filter(None, path.split(".")):
+        if not isinstance(resolved, dict) or key not in resolved:
+            raise ValueError(f"Reference '{value}': step '{step_id}' result has no '{key}'")
+        resolved = resolved[key]
+    return resolved
+
+
+async def _call_tool(fn, model, params: dict) -> str:
+    if model is None:
+        if params:
+            raise ValueError("This tool takes no parameters")
+        return await fn()
+    return await fn(model.model_validate(params))
+
+
+# ---------------------------------------------------------------------------
+# Implementation (runs on COM thread)
+# ---------------------------------------------------------------------------
+def _execute_batch_impl(steps: list, stop_on_error: bool, single_undo_entry: bool) -> dict:
+    registry = _tool_registry()
+    app = ppt._get_app_impl()
+    if single_undo_entry:
+        try:
+            app.StartNewUndoEntry()
+        except Exception:
+            logger.debug("StartNewUndoEntry failed; batch will span several undo entries")
+
+    # Tool coroutines complete without suspending (execute_async runs inline
+    # on this thread); the private loop only drives them.
+    loop = asyncio.new_event_loop()
+    outputs = {}
+    results = []
+    failed = 0
+    batch_start = time.perf_counter()
+    try:
+        with FrozenRedraw(), coalesce_navigation():
+            for i, step in enumerate(steps, 1):
+                name = step["tool"]
+                step_id = step["id"] or str(i)
+                entry = {"step": i, "id": step_id, "tool": name}
+                t0 = time.perf_counter()
+                try:
+                    fn, model = registry[name]
+                    params = _resolve_refs(step["params"], outputs)
+                    raw = loop.run_until_complete(_call_tool(fn, model, params))
+                    try:
+                        result = json.loads(raw)
+                    except (TypeError, ValueError):
+                        result = raw  # e.g. ppt_get_all_text returns Markdown
+                    if isinstance(result, dict) and "error" in result:
+                        entry["status"] = "error"
+                        entry["error"] = result["error"]
+                    else:
+                        entry["status"] = "success"
+                        entry["result"] = result
+                        outputs[step_id] = result
+                except Exception as e:
+                    entry["status"] = "error"
+                    entry["error"] = str(e)
+                entry["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+                results.append(entry)
+                if entry["status"] == "error":
+                    failed += 1
+                    if stop_on_error:
+                        break
+    finally:
+        loop.close()
+
+    response = {
+        "success": failed == 0 and len(results) == len(steps),
+        "steps_total": len(steps),
+        "steps_run": len(results),
+        "steps_failed": failed,
+        "elapsed_ms": round((time.perf_counter() - batch_start) * 1000, 2),
+        "results": results,
+    }
+    if len(results) < len(steps):
+        response["stopped_at_step"] = len(results)
+    return response
+
+
+# ---------------------------------------------------------------------------
+# Tool function
+# ---------------------------------------------------------------------------
+async def execute_batch(params: ExecuteBatchInput) -> str:
+    """Run an ordered list of tool calls in a single COM-thread hop.
+
+    Tool names are checked before anything runs, so a typo fails the whole
+    batch without side effects. Parameters are validated per step (after
+    references are resolved) with the tool's own input model.
+
+    Args:
+        params: Operations, stop_on_error and single_undo_entry flags.
+
+    Returns:
+        JSON with per-step status, result and elapsed_ms, plus totals.
+    """
+    try:
+        registry = _tool_registry()
+        steps = []
+        unknown = []
+        for op in params.operations:
+            name = _normalize_tool_name(op.tool)
+            if name not in registry:
+                unknown.append(op.tool)
+            steps.append({"tool": name, "params": op.params, "id": op.id})
+        if unknown:
+            return json.dumps({
+                "error": f"Unknown or unsupported tools in batch: {unknown}",
+            })
+        ids = [s["id"] for s in steps if s["id"]]
+        if len(ids) != len(set(ids)):
+            return json.dumps({"error": "Step ids must be unique within a batch"})
+
+        result = await ppt.execute_async(
+            _execute_batch_impl, steps, params.stop_on_error, params.single_undo_entry,
+        )
+        return json.dumps(result)
+    except Exception as e:
+        return json.dumps({"error": f"Batch execution failed: {str(e)}"})
+
+
+# ---------------------------------------------------------------------------
+# Registration
+# ---------------------------------------------------------------------------
+def register_tools(mcp):
+    """Register the batch execution tool. Call after all other modules."""
+    global _mcp, _registry
+    _mcp = mcp
+    _registry = None
+
+    @mcp.tool(
+        name="ppt_execute_batch",
+        annotations={
+            "title": "Execute Batch of Tool Calls",
+            "readOnlyHint": False,
+            "destructiveHint": True,
+            "idempotentHint": False,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_execute_batch(params: ExecuteBatchInput) -> str:
+        """Run many tool calls in one round trip — e.g. build a whole slide at once.
+
+        Each operation is {"tool": "<name>", "params": {...}, "id": "<optional>"}.
+        "tool" is any ppt_* tool name (the 'ppt_' prefix may be omitted) and
+        "params" are exactly that tool's parameters.
+
+        Reference earlier results with '$<id>.<key>' as a whole parameter
+        value, e.g. add a shape with id "card", then style it with
+        {"tool": "set_fill", "params": {"slide_index": 2,
+        "shape_name_or_index": "$card.shape_name", "color": "#1E3A5F"}}.
+        Steps without an id are referenced by their 1-based number ('$1.shape_name').
+
+        Returns per-step status, result and elapsed_ms. By default the batch
+        stops at the first error and all changes form a single undo entry.
+        The whole batch shares one COM timeout (30 seconds by default) — split
+        very large scripts into several batches.
+        """
+        return await execute_batch(params)
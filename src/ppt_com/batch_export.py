@@ -0,0 +1,428 @@
+"""Batch export tools: many decks through a pool of PowerPoint worker threads.
+
+Each worker thread enters its own STA apartment, connects to PowerPoint and
+takes files from a shared queue: open with WithWindow=False, export every
+requested format, close. A file that fails is recorded in the manifest and
+the worker moves on (reconnecting, in case PowerPoint went away).
+
+PowerPoint is a single out-of-process server whose object model runs on
+one UI thread, so its rendering is serialized; several workers keep a call
+always queued (opening the next file while another exports) rather than
+exporting truly in parallel. The regular COM thread stays free for the
+other tools meanwhile.
+
+Progress is kept per file on the ExportJob and written to manifest.json in
+the output directory after every file. A caller that waits for the job
+(wait=true) also gets an MCP progress notification per finished file.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Literal, Optional
+
+from mcp.server.fastmcp import Context
+from pydantic import BaseModel, Field, ConfigDict
+
+from ppt_com.constants import msoFalse, msoTrue, ppSaveAsPDF
+from utils import ooxml
+from utils.busy_retry import TIMEOUT_S, register_message_filter, revoke_message_filter
+from utils.progress import Progress
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("pdf", "png", "jpg")
+MANIFEST_NAME = "manifest.json"
+MAX_WORKERS = 8
+
+_IMAGE_FILTERS = {"png": "PNG", "jpg": "JPG"}
+# Workers compete with each other and with the main COM thread, so let the
+# message filter wait up to the full busy timeout before a call fails.
+_FILTER_BUDGET_MS = int(TIMEOUT_S * 1000)
+
+
+def default_workers() -> int:
+    try:
+        value = int(os.environ.get("PPT_EXPORT_WORKERS", "2"))
+    except ValueError:
+        value = 2
+    return max(1, min(value, MAX_WORKERS))
+
+
+def _dispatch_app():
+    import win32com.client
+
+    return win32com.client.Dispatch("PowerPoint.Application")
+
+
+def _same_path(a: str, b: str) -> bool:
+    return os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b))
+
+
+def _find_open(app, path: str):
+    """The presentation already open from path, if any (left open afterwards)."""
+    presentations = app.Presentations
+    for i in range(1, presentations.Count + 1):
+        pres = presentations(i)
+        if _same_path(str(pres.FullName), path):
+            return pres
+    return None
+
+
+def export_file(app, path: str, output_dir: str, formats: List[str],
+                width: Optional[int] = None, height: Optional[int] = None) -> List[str]:
+    """Export one deck in every format; returns the written files.
+
+    PDFs go to <output_dir>/<stem>.pdf, slide images to
+    <output_dir>/<stem>/Slide<n>.<fmt>.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    pres = _find_open(app, path)
+    opened = pres is None
+    if opened:
+        pres = app.Presentations.Open(path, ReadOnly=msoTrue, Untitled=msoFalse,
+                                      WithWindow=msoFalse)
+    outputs = []
+    try:
+        for fmt in formats:
+            if fmt == "pdf":
+                target = os.path.join(output_dir, f"{stem}.pdf")
+                pres.SaveAs(target, ppSaveAsPDF)
+                outputs.append(target)
+                continue
+            image_dir = os.path.join(output_dir, stem)
+            os.makedirs(image_dir, exist_ok=True)
+            slides = pres.Slides
+            for i in range(1, slides.Count + 1):
+                target = os.path.join(image_dir, f"Slide{i}.{fmt}")
+                # Slide.Export positional args: FileName, FilterName, ScaleWidth, ScaleHeight
+                if width is not None and height is not None:
+                    slides(i).Export(target, _IMAGE_FILTERS[fmt], width, height)
+                elif width is not None:
+                    slides(i).Export(target, _IMAGE_FILTERS[fmt], width)
+                else:
+                    slides(i).Export(target, _IMAGE_FILTERS[fmt])
+                outputs.append(target)
+    finally:
+        if opened:
+            pres.Close()
+    return outputs
+
+
+class ExportJob:
+    """One batch: the file queue, per-file progress and the manifest."""
+
+    def __init__(self, job_id: str, paths: List[str], output_dir: str, formats: List[str],
+                 width: Optional[int] = None, height: Optional[int] = None,
+                 progress: Optional[Progress] = None):
+        self.job_id = job_id
+        self.output_dir = output_dir
+        self.formats = list(formats)
+        self.width = width
+        self.height = height
+        self.manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self.workers = 0
+        self.entries = [{"path": p, "status": "pending"} for p in paths]
+        self._queue = deque(range(len(paths)))
+        self._lock = threading.Lock()
+        self._manifest_lock = threading.Lock()
+        self._done = threading.Event()
+        self._active = 0
+        self._progress = progress
+        if progress is not None:
+            progress.total = len(paths)
+
+    # -- worker side --------------------------------------------------------
+    def _next(self, worker: int) -> Optional[int]:
+        with self._lock:
+            if not self._queue:
+                return None
+            index = self._queue.popleft()
+            self.entries[index].update(status="running", worker=worker)
+            return index
+
+    def _finish(self, index: int, outputs=None, error: Optional[str] = None,
+                elapsed_s: float = 0.0) -> None:
+        with self._lock:
+            entry = self.entries[index]
+            entry["elapsed_ms"] = round(elapsed_s * 1000, 1)
+            if error is None:
+                entry.update(status="done", outputs=outputs)
+            else:
+                entry.update(status="failed", error=error)
+            if self._progress is not None:
+                self._progress.advance()
+        self.write_manifest()
+
+    def _worker_exited(self) -> None:
+        with self._lock:
+            self._active -= 1
+            last = self._active == 0
+            if last:
+                self.finished = time.time()
+        if last:
+            self.write_manifest()
+            self._done.set()
+
+    # -- caller side ----------------------------------------------------------
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def snapshot(self, include_files: bool = True) -> dict:
+        with self._lock:
+            counts = {"pending": 0, "running": 0, "done": 0, "failed": 0}
+            for entry in self.entries:
+                counts[entry["status"]] += 1
+            end = self.finished or time.time()
+            result = {
+                "job_id": self.job_id,
+                "status": "finished" if self.finished else "running",
+                "output_dir": self.output_dir,
+                "manifest_path": self.manifest_path,
+                "formats": self.formats,
+                "workers": self.workers,
+                "files_count": len(self.entries),
+                **counts,
+                "elapsed_s": round(end - self.created, 2),
+            }
+            if include_files:
+                result["files"] = [dict(e) for e in self.entries]
+        return result
+
+    def write_manifest(self) -> None:
+        """Rewrite manifest.json atomically, so readers never see half a file."""
+        data = self.snapshot()
+        with self._manifest_lock:
+            tmp = self.manifest_path + ".tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=1)
+                os.replace(tmp, self.manifest_path)
+            except OSError as exc:
+                logger.warning("Could not write %s: %s", self.manifest_path, exc)
+
+
+def _run_worker(job: ExportJob, worker: int, app_factory: Callable) -> None:
+    import pythoncom
+
+    pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+    message_filter = register_message_filter(_FILTER_BUDGET_MS)
+    app = None
+    try:
+        while True:
+            index = job._next(worker)
+            if index is None:
+                break
+            path = job.entries[index]["path"]
+            start = time.perf_counter()
+            try:
+                if app is None:
+                    app = app_factory()
+                outputs = export_file(app, path, job.output_dir, job.formats,
+                                      job.width, job.height)
+            except Exception as exc:
+                app = None  # reconnect for the next file
+                logger.warning("Batch export %s: %s failed: %s", job.job_id, path, exc)
+                job._finish(index, error=str(exc), elapsed_s=time.perf_counter() - start)
+            else:
+                logger.info("Batch export %s: %s done", job.job_id, path)
+                job._finish(index, outputs=outputs, elapsed_s=time.perf_counter() - start)
+    finally:
+        app = None
+        revoke_message_filter(message_filter)
+        pythoncom.CoUninitialize()
+        job._worker_exited()
+
+
+class ExportPool:
+    """Starts batch export jobs and keeps them for status queries."""
+
+    def __init__(self, app_factory: Callable = _dispatch_app):
+        self._app_factory = app_factory
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, paths: List[str], output_dir: str, formats: List[str],
+               workers: Optional[int] = None, width: Optional[int] = None,
+               height: Optional[int] = None, progress: Optional[Progress] = None) -> ExportJob:
+        """Start exporting paths on worker threads; returns at once.
+
+        progress, if given, is advanced as each file finishes.
+        """
+        if not paths:
+            raise ValueError("No files to export")
+        unknown = [f for f in formats if f not in EXPORT_FORMATS]
+        if unknown or not formats:
+            raise ValueError(f"Unknown formats {unknown}. Supported: {list(EXPORT_FORMATS)}")
+        stems = [os.path.splitext(os.path.basename(p))[0].lower() for p in paths]
+        duplicates = sorted({s for s in stems if stems.count(s) > 1})
+        if duplicates:
+            raise ValueError(f"Several files are named {duplicates[0]!r}; their exports "
+                             "would overwrite each other in output_dir")
+        os.makedirs(output_dir, exist_ok=True)
+
+        with self._lock:
+            job_id = f"export-{next(self._ids)}"
+        job = ExportJob(job_id, paths, output_dir, formats, width, height, progress)
+        count = max(1, min(workers or default_workers(), MAX_WORKERS, len(paths)))
+        job.workers = job._active = count
+        with self._lock:
+            self._jobs[job_id] = job
+        job.write_manifest()
+        for worker in range(1, count + 1):
+            threading.Thread(
+                target=_run_worker, args=(job, worker, self._app_factory),
+                name=f"ppt-export-{job_id}-{worker}", daemon=True,
+            ).start()
+        logger.info("Batch export %s: %d files, %d workers", job_id, len(paths), count)
+        return job
+
+    def get(self, job_id: str) -> ExportJob:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown export job '{job_id}'")
+        return job
+
+
+# Global singleton instance
+export_pool = ExportPool()
+
+
+# ---------------------------------------------------------------------------
+# Pydantic input models
+# ---------------------------------------------------------------------------
+class BatchExportInput(BaseModel):
+    """Input for exporting many presentation files."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    files: List[str] = Field(
+        ..., min_length=1,
+        description="Paths or glob patterns of presentation files (e.g. 'C:/reports/**/*.pptx')",
+    )
+    output_dir: str = Field(
+        ...,
+        description=(
+            "Directory for the exports (created if needed): '<name>.pdf' and "
+            "'<name>/Slide<n>.<fmt>' per file, plus manifest.json"
+        ),
+    )
+    formats: List[Literal[EXPORT_FORMATS]] = Field(
+        default=["pdf"], min_length=1, description="Any of 'pdf', 'png', 'jpg'",
+    )
+    width: Optional[int] = Field(default=None, ge=1, description="Image width in pixels")
+    height: Optional[int] = Field(default=None, ge=1, description="Image height in pixels")
+    workers: Optional[int] = Field(
+        default=None, ge=1, le=MAX_WORKERS,
+        description="PowerPoint worker threads (default PPT_EXPORT_WORKERS or 2)",
+    )
+    wait: bool = Field(
+        default=False,
+        description=(
+            "Wait until every file is exported and return the full manifest. "
+            "By default the job runs in the background; poll ppt_get_batch_export_status."
+        ),
+    )
+
+
+class BatchExportStatusInput(BaseModel):
+    """Input for querying a batch export job."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    job_id: str = Field(..., description="Job id returned by ppt_batch_export")
+    include_files: bool = Field(
+        default=True, description="Include the per-file entries (status, outputs, error)",
+    )
+
+
+# ---------------------------------------------------------------------------
+# MCP tool functions
+# ---------------------------------------------------------------------------
+async def batch_export(params: BatchExportInput, ctx: Optional[Context] = None) -> str:
+    """Start exporting many presentation files."""
+    try:
+        paths = ooxml.expand_paths(params.files)
+        if not paths:
+            return json.dumps({"error": f"No files match {params.files}"})
+        missing = [p for p in paths if not os.path.isfile(p)]
+        if missing:
+            return json.dumps({"error": f"File not found: {missing[0]}"})
+        # Notifications are only sent while the call is still open.
+        progress = Progress(ctx, label="file") if params.wait else None
+        job = export_pool.submit(
+            paths, os.path.abspath(params.output_dir), list(dict.fromkeys(params.formats)),
+            params.workers, params.width, params.height, progress,
+        )
+        if params.wait:
+            await asyncio.to_thread(job.wait)
+            return json.dumps(job.snapshot(), ensure_ascii=False)
+        return json.dumps(job.snapshot(include_files=False), ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to start batch export: {str(e)}"})
+
+
+async def get_batch_export_status(params: BatchExportStatusInput) -> str:
+    """Progress and per-file results of a batch export job."""
+    try:
+        job = export_pool.get(params.job_id)
+        return json.dumps(job.snapshot(params.include_files), ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to get export status: {str(e)}"})
+
+
+# ---------------------------------------------------------------------------
+# Tool registration
+# ---------------------------------------------------------------------------
+def register_tools(mcp):
+    """Register batch export tools with the MCP server."""
+
+    @mcp.tool(
+        name="ppt_batch_export",
+        annotations={
+            "title": "Batch Export Files",
+            "readOnlyHint": False,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_batch_export(params: BatchExportInput, ctx: Optional[Context] = None) -> str:
+        """Export many presentation files to PDF and/or slide images.
+
+        Each file is opened without a window on PowerPoint worker threads,
+        exported and closed; decks already open are exported and left open.
+        Runs in the background and returns a job_id at once (set wait=true to
+        block until done, with a progress notification per file). A file that fails gets an 'error' entry and the
+        others continue. Progress is written to manifest.json in output_dir.
+        """
+        return await batch_export(params, ctx)
+
+    @mcp.tool(
+        name="ppt_get_batch_export_status",
+        annotations={
+            "title": "Get Batch Export Status",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_get_batch_export_status(params: BatchExportStatusInput) -> str:
+        """Get the progress of a ppt_batch_export job.
+
+        Returns counts of pending, running, done and failed files and, per
+        file, its status, output files, error and elapsed time.
+        """
+        return await get_batch_export_status(params)
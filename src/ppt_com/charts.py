@@ -14,7 +14,7 @@ import logging
 from typing import Literal, Optional, Union
 
 import pythoncom
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from utils.com_wrapper import ppt
 from utils.color import hex_to_int, int_to_hex
@@ -110,6 +110,31 @@ class SetChartDataInput(BaseModel):
     )
 
 
+class SetChartsDataInput(BaseModel):
+    """Input for setting the data of several charts in one call."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    charts: list[SetChartDataInput] = Field(
+        ..., min_length=1, max_length=200,
+        description=(
+            "One entry per chart, each with slide_index, shape_name_or_index, "
+            "categories and series (same fields as ppt_set_chart_data)"
+        ),
+    )
+
+    @model_validator(mode="after")
+    def _no_duplicate_charts(self):
+        seen = set()
+        for c in self.charts:
+            key = (c.slide_index, c.shape_name_or_index)
+            if key in seen:
+                raise ValueError(
+                    f"Chart {c.shape_name_or_index!r} on slide {c.slide_index} is listed more than once"
+                )
+            seen.add(key)
+        return self
+
+
 class GetChartDataInput(BaseModel):
     """Input for reading chart data from the Excel workbook."""
     model_config = ConfigDict(str_strip_whitespace=True)
@@ -118,6 +143,14 @@ class GetChartDataInput(BaseModel):
     shape_name_or_index: Union[str, int] = Field(
         ..., description="Chart shape name (str) or 1-based index (int). Prefer name — indices shift when shapes are added/removed"
     )
+    source: Literal["series", "sheet"] = Field(
+        default="series",
+        description=(
+            "'series' (default): read plotted values from the chart without opening Excel. "
+            "'sheet': read the embedded worksheet's used range in one call "
+            "(includes cells that are not plotted)"
+        ),
+    )
 
 
 class FormatChartInput(BaseModel):
@@ -389,30 +422,45 @@ def _add_chart_impl(slide_index, chart_type, left, top, width, height):
     }
 
 
-def _set_chart_data_impl(slide_index, shape_name_or_index, categories, series):
-    app = ppt._get_app_impl()
-    goto_slide(app, slide_index)
-    pres = ppt._get_pres_impl()
-    slide = pres.Slides(slide_index)
-    shape = _get_chart_shape(slide, shape_name_or_index)
-    chart = shape.Chart
+# Rows per Range.Value assignment. One assignment marshals the whole block
+# as a single SAFEARRAY; very long series are split so no single
+# cross-process call carries an unbounded payload.
+_WRITE_CHUNK_ROWS = 5000
+
+
+def _chart_data_block(categories, series) -> list:
+    """Build the sheet layout as rows: a header row, then one row per category.
 
+    Column A holds category labels, columns B.. one series each. Ragged
+    series are padded with None (empty cells).
+    """
+    n_rows = max([len(categories)] + [len(s["values"]) for s in series])
+    block = [tuple([None] + [s["name"] for s in series])]
+    for i in range(n_rows):
+        row = [categories[i] if i < len(categories) else None]
+        for s in series:
+            row.append(s["values"][i] if i < len(s["values"]) else None)
+        block.append(tuple(row))
+    return block
+
+
+def _write_block(ws, block, first_row=1):
+    """Write rows to the sheet with one Range.Value assignment per chunk."""
+    n_cols = len(block[0])
+    for offset in range(0, len(block), _WRITE_CHUNK_ROWS):
+        chunk = block[offset:offset + _WRITE_CHUNK_ROWS]
+        top = first_row + offset
+        ws.Range(ws.Cells(top, 1), ws.Cells(top + len(chunk) - 1, n_cols)).Value = tuple(chunk)
+
+
+def _write_chart_data(chart, categories, series):
+    """Replace a chart's data through its embedded workbook (opened once)."""
     chart.ChartData.Activate()
     wb = chart.ChartData.Workbook
     try:
         ws = wb.Worksheets(1)
         ws.Cells.Clear()
-
-        # Write categories in column A starting at row 2
-        for i, cat in enumerate(categories):
-            ws.Cells(i + 2, 1).Value = cat
-
-        # Write series headers (row 1) and values (rows 2+)
-        for s_idx, s in enumerate(series):
-            col = s_idx + 2  # columns B, C, D, ...
-            ws.Cells(1, col).Value = s["name"]
-            for i, val in enumerate(s["values"]):
-                ws.Cells(i + 2, col).Value = val
+        _write_block(ws, _chart_data_block(categories, series))
 
         # Set the chart's source data range.
         # chart.SetSourceData() has a pywin32 VT_BYREF bug on the PlotBy
@@ -430,6 +478,15 @@ def _set_chart_data_impl(slide_index, shape_name_or_index, categories, series):
     finally:
         wb.Close(False)
 
+
+def _set_chart_data_impl(slide_index, shape_name_or_index, categories, series):
+    app = ppt._get_app_impl()
+    goto_slide(app, slide_index)
+    pres = ppt._get_pres_impl()
+    slide = pres.Slides(slide_index)
+    shape = _get_chart_shape(slide, shape_name_or_index)
+    _write_chart_data(shape.Chart, categories, series)
+
     return {
         "success": True,
         "shape_name": shape.Name,
@@ -438,14 +495,92 @@ def _set_chart_data_impl(slide_index, shape_name_or_index, categories, series):
     }
 
 
-def _get_chart_data_impl(slide_index, shape_name_or_index):
+def _set_charts_data_impl(updates):
+    """Write data to several charts in one COM hop.
+
+    Slides are visited in order (each navigated to once) and each chart's
+    workbook is opened and closed exactly once. A failing chart is reported
+    without aborting the rest.
+    """
+    app = ppt._get_app_impl()
+    pres = ppt._get_pres_impl()
+    results = []
+    current_slide = None
+    for n, u in sorted(enumerate(updates), key=lambda item: item[1]["slide_index"]):
+        entry = {"slide_index": u["slide_index"], "chart": u["shape_name_or_index"]}
+        try:
+            if u["slide_index"] > pres.Slides.Count:
+                raise ValueError(
+                    f"slide_index {u['slide_index']} out of range (1-{pres.Slides.Count})"
+                )
+            if u["slide_index"] != current_slide:
+                goto_slide(app, u["slide_index"])
+                current_slide = u["slide_index"]
+            shape = _get_chart_shape(pres.Slides(u["slide_index"]), u["shape_name_or_index"])
+            _write_chart_data(shape.Chart, u["categories"], u["series"])
+            entry.update({
+                "success": True,
+                "shape_name": shape.Name,
+                "categories_count": len(u["categories"]),
+                "series_count": len(u["series"]),
+            })
+        except Exception as e:
+            entry.update({"success": False, "error": str(e)})
+        results.append((n, entry))
+
+    results = [entry for _, entry in sorted(results, key=lambda item: item[0])]
+    return {
+        "success": all(r["success"] for r in results),
+        "updated": sum(1 for r in results if r["success"]),
+        "failed": sum(1 for r in results if not r["success"]),
+        "charts": results,
+    }
+
+
+def _read_chart_sheet(chart):
+    """Read the chart's plotted block from its workbook in one Range.Value call."""
+    chart.ChartData.Activate()
+    wb = chart.ChartData.Workbook
+    try:
+        ws = wb.Worksheets(1)
+        rows = ws.UsedRange.Value
+    finally:
+        wb.Close(False)
+    if not isinstance(rows, tuple):
+        rows = ((rows,),)  # single cell comes back as a scalar
+    rows = [list(r) for r in rows]
+    if not rows:
+        return [], []
+    header, body = rows[0], rows[1:]
+    categories = [("" if r[0] is None else str(r[0])) for r in body]
+    series_list = [
+        {"name": "" if header[c] is None else str(header[c]),
+         "values": [r[c] for r in body]}
+        for c in range(1, len(header))
+    ]
+    return categories, series_list
+
+
+def _get_chart_data_impl(slide_index, shape_name_or_index, source="series"):
     app = ppt._get_app_impl()
     pres = ppt._get_pres_impl()
     slide = pres.Slides(slide_index)
     shape = _get_chart_shape(slide, shape_name_or_index)
     chart = shape.Chart
 
-    # Read data directly from SeriesCollection (avoids opening Excel workbook)
+    if source == "sheet":
+        goto_slide(app, slide_index)
+        categories, series_list = _read_chart_sheet(chart)
+        return {
+            "success": True,
+            "shape_name": shape.Name,
+            "source": "sheet",
+            "categories": categories,
+            "series": series_list,
+        }
+
+    # Read data directly from SeriesCollection (avoids opening Excel workbook).
+    # Values and XValues each come back as one array per series.
     categories = []
     series_list = []
     sc_count = chart.SeriesCollection().Count
@@ -795,7 +930,7 @@ def _change_chart_type_impl(slide_index, shape_name_or_index, chart_type):
 # ---------------------------------------------------------------------------
 # MCP tool functions (sync wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def add_chart(params: AddChartInput) -> str:
+async def add_chart(params: AddChartInput) -> str:
     """Add a chart to a slide.
 
     Args:
@@ -805,7 +940,7 @@ def add_chart(params: AddChartInput) -> str:
         JSON with shape name, index, and chart type.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_chart_impl,
             params.slide_index, params.chart_type,
             params.left, params.top, params.width, params.height,
@@ -815,7 +950,7 @@ def add_chart(params: AddChartInput) -> str:
         return json.dumps({"error": f"Failed to add chart: {str(e)}"})
 
 
-def set_chart_data(params: SetChartDataInput) -> str:
+async def set_chart_data(params: SetChartDataInput) -> str:
     """Set chart data by writing to the underlying Excel workbook.
 
     Args:
@@ -825,7 +960,7 @@ def set_chart_data(params: SetChartDataInput) -> str:
         JSON with categories count and series count.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_chart_data_impl,
             params.slide_index, params.shape_name_or_index,
             params.categories, params.series,
@@ -835,7 +970,26 @@ def set_chart_data(params: SetChartDataInput) -> str:
         return json.dumps({"error": f"Failed to set chart data: {str(e)}"})
 
 
-def get_chart_data(params: GetChartDataInput) -> str:
+async def set_charts_data(params: SetChartsDataInput) -> str:
+    """Set the data of several charts in one COM round trip.
+
+    Args:
+        params: List of per-chart updates.
+
+    Returns:
+        JSON with per-chart results and updated/failed counts.
+    """
+    try:
+        result = await ppt.execute_async(
+            _set_charts_data_impl,
+            [c.model_dump() for c in params.charts],
+        )
+        return json.dumps(result)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to set chart data: {str(e)}"})
+
+
+async def get_chart_data(params: GetChartDataInput) -> str:
     """Read chart data from the underlying Excel workbook.
 
     Args:
@@ -845,16 +999,16 @@ def get_chart_data(params: GetChartDataInput) -> str:
         JSON with categories list and series list (name + values).
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_chart_data_impl,
-            params.slide_index, params.shape_name_or_index,
+            params.slide_index, params.shape_name_or_index, params.source,
         )
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to get chart data: {str(e)}"})
 
 
-def format_chart(params: FormatChartInput) -> str:
+async def format_chart(params: FormatChartInput) -> str:
     """Format chart properties such as title, legend, and style.
 
     Args:
@@ -864,7 +1018,7 @@ def format_chart(params: FormatChartInput) -> str:
         JSON confirming the formatting changes.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _format_chart_impl,
             params.slide_index, params.shape_name_or_index,
             params.title, params.has_legend,
@@ -878,7 +1032,7 @@ def format_chart(params: FormatChartInput) -> str:
         return json.dumps({"error": f"Failed to format chart: {str(e)}"})
 
 
-def format_chart_axis(params: FormatChartAxisInput) -> str:
+async def format_chart_axis(params: FormatChartAxisInput) -> str:
     """Format axis properties: scale, ticks, labels, axis title.
 
     Args:
@@ -888,7 +1042,7 @@ def format_chart_axis(params: FormatChartAxisInput) -> str:
         JSON listing which properties were applied.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _format_chart_axis_impl,
             params.slide_index, params.shape_name_or_index, params.axis,
             params.title,
@@ -904,7 +1058,7 @@ def format_chart_axis(params: FormatChartAxisInput) -> str:
         return json.dumps({"error": f"Failed to format chart axis: {str(e)}"})
 
 
-def set_chart_series(params: SetChartSeriesInput) -> str:
+async def set_chart_series(params: SetChartSeriesInput) -> str:
     """Format an individual chart series (color, data labels, line weight).
 
     Args:
@@ -914,7 +1068,7 @@ def set_chart_series(params: SetChartSeriesInput) -> str:
         JSON confirming the series formatting.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_chart_series_impl,
             params.slide_index, params.shape_name_or_index,
             params.series_index, params.color,
@@ -925,7 +1079,7 @@ def set_chart_series(params: SetChartSeriesInput) -> str:
         return json.dumps({"error": f"Failed to set chart series: {str(e)}"})
 
 
-def change_chart_type(params: ChangeChartTypeInput) -> str:
+async def change_chart_type(params: ChangeChartTypeInput) -> str:
     """Change the chart type of an existing chart.
 
     Args:
@@ -935,7 +1089,7 @@ def change_chart_type(params: ChangeChartTypeInput) -> str:
         JSON confirming the type change.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _change_chart_type_impl,
             params.slide_index, params.shape_name_or_index,
             params.chart_type,
@@ -970,7 +1124,7 @@ def register_tools(mcp):
         line_markers, pie_exploded). You can also pass an XlChartType integer.
         All positions and sizes are in points (72 points = 1 inch).
         """
-        return add_chart(params)
+        return await add_chart(params)
 
     @mcp.tool(
         name="ppt_set_chart_data",
@@ -990,7 +1144,27 @@ def register_tools(mcp):
         number of categories.
         Example series: [{"name": "Revenue", "values": [100, 200, 150, 300]}]
         """
-        return set_chart_data(params)
+        return await set_chart_data(params)
+
+    @mcp.tool(
+        name="ppt_set_charts_data",
+        annotations={
+            "title": "Set Data for Multiple Charts",
+            "readOnlyHint": False,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_set_charts_data(params: SetChartsDataInput) -> str:
+        """Set data for many charts in one call.
+
+        Each entry takes the same fields as ppt_set_chart_data. Every chart's
+        workbook is opened once and written with a single block write, so
+        refreshing a dashboard deck costs one call instead of one per chart.
+        A chart that fails is reported in `charts` without stopping the rest.
+        """
+        return await set_charts_data(params)
 
     @mcp.tool(
         name="ppt_get_chart_data",
@@ -1007,8 +1181,9 @@ def register_tools(mcp):
 
         Returns the category labels and all series (name + values).
         Identify the chart by shape name or 1-based shape index.
+        source='sheet' reads the worksheet block instead of the plotted series.
         """
-        return get_chart_data(params)
+        return await get_chart_data(params)
 
     @mcp.tool(
         name="ppt_format_chart",
@@ -1034,7 +1209,7 @@ def register_tools(mcp):
         Control chart title position via title_position preset ('top', 'bottom',
         'center') or explicit title_top/title_left coordinates in points.
         """
-        return format_chart(params)
+        return await format_chart(params)
 
     @mcp.tool(
         name="ppt_format_chart_axis",
@@ -1064,7 +1239,7 @@ def register_tools(mcp):
         `min_scale` / `max_scale` / `major_unit` / `minor_unit` / `log_scale`
         are value-axis only. `log_base` requires `log_scale=true`.
         """
-        return format_chart_axis(params)
+        return await format_chart_axis(params)
 
     @mcp.tool(
         name="ppt_set_chart_series",
@@ -1083,7 +1258,7 @@ def register_tools(mcp):
         line weight (in points, for line/scatter charts).
         Series are 1-based indexed.
         """
-        return set_chart_series(params)
+        return await set_chart_series(params)
 
     @mcp.tool(
         name="ppt_change_chart_type",
@@ -1101,4 +1276,4 @@ def register_tools(mcp):
         Accepts a friendly name (e.g. 'bar', 'line', 'pie') or XlChartType integer.
         The chart data is preserved when changing types.
         """
-        return change_chart_type(params)
+        return await change_chart_type(params)
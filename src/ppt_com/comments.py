@@ -135,10 +135,10 @@ def _delete_comment_impl(slide_index, comment_index) -> dict:
 # ---------------------------------------------------------------------------
 # MCP tool functions
 # ---------------------------------------------------------------------------
-def add_comment(params: AddCommentInput) -> str:
+async def add_comment(params: AddCommentInput) -> str:
     """Add a comment to a slide."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_comment_impl,
             params.slide_index, params.text, params.author,
             params.author_initials, params.left, params.top,
@@ -148,10 +148,10 @@ def add_comment(params: AddCommentInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def list_comments(params: ListCommentsInput) -> str:
+async def list_comments(params: ListCommentsInput) -> str:
     """List all comments on a slide."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _list_comments_impl,
             params.slide_index,
         )
@@ -160,10 +160,10 @@ def list_comments(params: ListCommentsInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def delete_comment(params: DeleteCommentInput) -> str:
+async def delete_comment(params: DeleteCommentInput) -> str:
     """Delete a comment from a slide."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _delete_comment_impl,
             params.slide_index, params.comment_index,
         )
@@ -194,7 +194,7 @@ def register_tools(mcp):
         Provide text, author name, and optional position.
         Uses Add2 for modern PowerPoint, falls back to Add for older versions.
         """
-        return add_comment(params)
+        return await add_comment(params)
 
     @mcp.tool(
         name="ppt_list_comments",
@@ -211,7 +211,7 @@ def register_tools(mcp):
 
         Returns index, author, text, datetime, and position for each comment.
         """
-        return list_comments(params)
+        return await list_comments(params)
 
     @mcp.tool(
         name="ppt_delete_comment",
@@ -228,4 +228,4 @@ def register_tools(mcp):
 
         Use ppt_list_comments to find the comment index first.
         """
-        return delete_comment(params)
+        return await delete_comment(params)
@@ -456,7 +456,7 @@ def _format_connector_impl(slide_index, shape_name_or_index,
 # ---------------------------------------------------------------------------
 # MCP tool functions (async wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def add_connector(params: AddConnectorInput) -> str:
+async def add_connector(params: AddConnectorInput) -> str:
     """Add a connector between two shapes.
 
     Args:
@@ -466,7 +466,7 @@ def add_connector(params: AddConnectorInput) -> str:
         JSON with connector shape name and type.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_connector_impl,
             params.slide_index, params.connector_type,
             params.begin_shape, params.begin_site,
@@ -477,7 +477,7 @@ def add_connector(params: AddConnectorInput) -> str:
         return json.dumps({"error": f"Failed to add connector: {str(e)}"})
 
 
-def format_connector(params: FormatConnectorInput) -> str:
+async def format_connector(params: FormatConnectorInput) -> str:
     """Format a connector's line properties.
 
     Args:
@@ -487,7 +487,7 @@ def format_connector(params: FormatConnectorInput) -> str:
         JSON confirming the format update.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _format_connector_impl,
             params.slide_index, params.shape_name_or_index,
             params.color, params.weight, params.dash_style,
@@ -525,7 +525,7 @@ def register_tools(mcp):
         Connection sites can be specified as 1-based indices or direction
         names: 'top', 'bottom', 'left', 'right'.
         """
-        return add_connector(params)
+        return await add_connector(params)
 
     @mcp.tool(
         name="ppt_format_connector",
@@ -546,4 +546,4 @@ def register_tools(mcp):
         ('top', 'bottom', 'left', 'right').
         Identify the connector by shape name or 1-based shape index.
         """
-        return format_connector(params)
+        return await format_connector(params)
@@ -196,7 +196,7 @@ def _execute_mso_impl(command_name, check_enabled):
 # ---------------------------------------------------------------------------
 # MCP tool functions (return JSON strings)
 # ---------------------------------------------------------------------------
-def undo(params: UndoInput) -> str:
+async def undo(params: UndoInput) -> str:
     """Undo recent actions in PowerPoint.
 
     Args:
@@ -206,13 +206,13 @@ def undo(params: UndoInput) -> str:
         JSON with success status and number of actions undone.
     """
     try:
-        result = ppt.execute(_undo_impl, params.times)
+        result = await ppt.execute_async(_undo_impl, params.times)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to undo: {str(e)}"})
 
 
-def redo(params: RedoInput) -> str:
+async def redo(params: RedoInput) -> str:
     """Redo recently undone actions in PowerPoint.
 
     Args:
@@ -222,13 +222,13 @@ def redo(params: RedoInput) -> str:
         JSON with success status and number of actions redone.
     """
     try:
-        result = ppt.execute(_redo_impl, params.times)
+        result = await ppt.execute_async(_redo_impl, params.times)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to redo: {str(e)}"})
 
 
-def copy_shape_to_slide(params: CopyShapeToSlideInput) -> str:
+async def copy_shape_to_slide(params: CopyShapeToSlideInput) -> str:
     """Copy a shape from one slide to another.
 
     Args:
@@ -238,7 +238,7 @@ def copy_shape_to_slide(params: CopyShapeToSlideInput) -> str:
         JSON with new shape name and destination slide index.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _copy_shape_to_slide_impl,
             params.src_slide_index, params.shape_name_or_index,
             params.dst_slide_index,
@@ -248,7 +248,7 @@ def copy_shape_to_slide(params: CopyShapeToSlideInput) -> str:
         return json.dumps({"error": f"Failed to copy shape to slide: {str(e)}"})
 
 
-def copy_formatting(params: CopyFormattingInput) -> str:
+async def copy_formatting(params: CopyFormattingInput) -> str:
     """Copy formatting from one shape to other shapes.
 
     Args:
@@ -258,7 +258,7 @@ def copy_formatting(params: CopyFormattingInput) -> str:
         JSON with source name and list of shapes formatting was applied to.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _copy_formatting_impl,
             params.slide_index, params.source_shape, params.target_shapes,
         )
@@ -267,20 +267,20 @@ def copy_formatting(params: CopyFormattingInput) -> str:
         return json.dumps({"error": f"Failed to copy formatting: {str(e)}"})
 
 
-def start_undo_entry() -> str:
+async def start_undo_entry() -> str:
     """Start a new undo entry in PowerPoint.
 
     Returns:
         JSON with success status.
     """
     try:
-        result = ppt.execute(_start_undo_entry_impl)
+        result = await ppt.execute_async(_start_undo_entry_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to start undo entry: {str(e)}"})
 
 
-def execute_mso(params: ExecuteMsoInput) -> str:
+async def execute_mso(params: ExecuteMsoInput) -> str:
     """Execute an MSO command in PowerPoint.
 
     Args:
@@ -290,7 +290,7 @@ def execute_mso(params: ExecuteMsoInput) -> str:
         JSON with success status and command name.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _execute_mso_impl,
             params.command_name, params.check_enabled,
         )
@@ -321,7 +321,7 @@ def register_tools(mcp):
         Performs one or more undo operations. Stops early if no more
         actions can be undone. Returns the number of actions actually undone.
         """
-        return undo(params)
+        return await undo(params)
 
     @mcp.tool(
         name="ppt_redo",
@@ -339,7 +339,7 @@ def register_tools(mcp):
         Performs one or more redo operations. Stops early if no more
         actions can be redone. Returns the number of actions actually redone.
         """
-        return redo(params)
+        return await redo(params)
 
     @mcp.tool(
         name="ppt_copy_shape_to_slide",
@@ -358,7 +358,7 @@ def register_tools(mcp):
         slide. The original shape remains on the source slide.
         Identify the shape by name (string) or 1-based index (int).
         """
-        return copy_shape_to_slide(params)
+        return await copy_shape_to_slide(params)
 
     @mcp.tool(
         name="ppt_copy_formatting",
@@ -377,7 +377,7 @@ def register_tools(mcp):
         formatting from the source shape to each target shape on the same slide.
         Identify shapes by name (string) or 1-based index (int).
         """
-        return copy_formatting(params)
+        return await copy_formatting(params)
 
     @mcp.tool(
         name="ppt_start_undo_entry",
@@ -396,7 +396,7 @@ def register_tools(mcp):
         changes can be undone with a single Ctrl+Z. Useful for grouping
         multiple tool calls into one undoable action.
         """
-        return start_undo_entry()
+        return await start_undo_entry()
 
     @mcp.tool(
         name="ppt_execute_mso",
@@ -422,4 +422,4 @@ def register_tools(mcp):
         Set check_enabled=false to skip the enabled check (may raise
         a COM error if the command is not available).
         """
-        return execute_mso(params)
+        return await execute_mso(params)
@@ -177,10 +177,10 @@ def _set_soft_edge_impl(slide_index, shape_name_or_index, radius) -> dict:
 # ---------------------------------------------------------------------------
 # MCP tool functions
 # ---------------------------------------------------------------------------
-def set_glow(params: SetGlowInput) -> str:
+async def set_glow(params: SetGlowInput) -> str:
     """Set glow effect on a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_glow_impl,
             params.slide_index, params.shape_name_or_index, params.radius,
             params.color, params.transparency,
@@ -190,10 +190,10 @@ def set_glow(params: SetGlowInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def set_reflection(params: SetReflectionInput) -> str:
+async def set_reflection(params: SetReflectionInput) -> str:
     """Set reflection effect on a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_reflection_impl,
             params.slide_index, params.shape_name_or_index,
             params.reflection_type, params.blur, params.offset,
@@ -204,10 +204,10 @@ def set_reflection(params: SetReflectionInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def set_soft_edge(params: SetSoftEdgeInput) -> str:
+async def set_soft_edge(params: SetSoftEdgeInput) -> str:
     """Set soft edge effect on a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_soft_edge_impl,
             params.slide_index, params.shape_name_or_index, params.radius,
         )
@@ -238,7 +238,7 @@ def register_tools(mcp):
         Configure radius, color, and transparency.
         Set radius=0 to remove the glow effect.
         """
-        return set_glow(params)
+        return await set_glow(params)
 
     @mcp.tool(
         name="ppt_set_reflection",
@@ -256,7 +256,7 @@ def register_tools(mcp):
         Configure reflection type (0=none, 1-9=presets), blur, offset,
         size, and transparency.
         """
-        return set_reflection(params)
+        return await set_reflection(params)
 
     @mcp.tool(
         name="ppt_set_soft_edge",
@@ -274,4 +274,4 @@ def register_tools(mcp):
         Configure the soft edge radius in points.
         Set radius=0 to remove the soft edge effect.
         """
-        return set_soft_edge(params)
+        return await set_soft_edge(params)
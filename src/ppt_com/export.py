@@ -9,17 +9,23 @@ import ctypes.wintypes
 import json
 import logging
 import os
+import re
 import shutil
 import struct
 import tempfile
 from typing import List, Optional
 
 import pythoncom
+from mcp.server.fastmcp import Context
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
+from utils import ooxml
 from utils.com_wrapper import ppt
+from utils.progress import Progress, tracked
 from ppt_com.constants import (
     ppFixedFormatTypePDF,
+    ppSaveAsOpenXMLPresentation,
+    ppSaveAsOpenXMLPresentationMacroEnabled,
     ppSaveAsPDF,
     ppSaveAsPNG,
     ppSaveAsJPG,
@@ -57,6 +63,35 @@ class ExportPDFInput(BaseModel):
         default=None,
         description="1-based ending slide index for partial export.",
     )
+    slide_ranges: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Slide ranges such as '2-4' or '7'. Each range is written to its own "
+            "PDF named '<file>_slides_<range>.pdf' next to file_path (a single "
+            "range goes to file_path itself), unless combine is true."
+        ),
+    )
+    combine: bool = Field(
+        default=False,
+        description="Write all slide_ranges into one PDF at file_path (slides in presentation order).",
+    )
+    per_section: bool = Field(
+        default=False,
+        description="Write one PDF per section, named '<file>_<NN>_<section name>.pdf'.",
+    )
+
+    @model_validator(mode="after")
+    def validate_range_options(self):
+        legacy = self.slide_range_start is not None or self.slide_range_end is not None
+        chosen = sum([legacy, self.slide_ranges is not None, self.per_section])
+        if chosen > 1:
+            raise ValueError(
+                "Use only one of slide_range_start/slide_range_end, slide_ranges "
+                "and per_section."
+            )
+        if self.combine and self.slide_ranges is None:
+            raise ValueError("combine requires slide_ranges")
+        return self
 
 
 class ExportImagesInput(BaseModel):
@@ -77,11 +112,11 @@ class ExportImagesInput(BaseModel):
     )
     width: Optional[int] = Field(
         default=None,
-        description="Image width in pixels (for single slide export).",
+        description="Image width in pixels.",
     )
     height: Optional[int] = Field(
         default=None,
-        description="Image height in pixels (for single slide export).",
+        description="Image height in pixels.",
     )
     file_name: Optional[str] = Field(
         default=None,
@@ -150,37 +185,116 @@ def _export_pdf_all_slides(pres, abs_path: str) -> None:
     )
 
 
-def _export_pdf_slide_range(app, pres, abs_path: str, start: int, end: int) -> None:
-    """Export a slide range to PDF by creating a temporary copy.
+_RANGE_RE = re.compile(r"^\s*(\d+)\s*(?:-\s*(\d+)\s*)?$")
+
+
+def _parse_slide_ranges(ranges: List[str], total: int) -> list:
+    """['2-4', '7'] -> [('2-4', [2, 3, 4]), ('7', [7])], checked against total."""
+    parsed = []
+    for text in ranges:
+        m = _RANGE_RE.match(text)
+        if not m:
+            raise ValueError(f"Invalid slide range {text!r}. Use 'N' or 'N-M'.")
+        start = int(m.group(1))
+        end = int(m.group(2) or start)
+        if not 1 <= start <= end <= total:
+            raise ValueError(f"Slide range {text!r} out of range (1-{total})")
+        label = f"{start}-{end}" if end != start else str(start)
+        parsed.append((label, list(range(start, end + 1))))
+    return parsed
+
+
+def _section_ranges(pres) -> list:
+    """[(section name, slide indices)] for every non-empty section."""
+    sp = pres.SectionProperties
+    sections = []
+    for i in range(1, sp.Count + 1):
+        count = sp.SlidesCount(i)
+        if count:
+            first = sp.FirstSlide(i)
+            sections.append((sp.Name(i), list(range(first, first + count))))
+    if not sections:
+        raise ValueError("The presentation has no sections")
+    return sections
+
+
+def _part_path(abs_path: str, suffix: str) -> str:
+    """'<dir>/<stem>_<suffix>.pdf' with characters Windows rejects replaced."""
+    stem, ext = os.path.splitext(abs_path)
+    safe = re.sub(r'[\\/:*?"<>|\s]+', "_", suffix).strip("_") or "part"
+    return f"{stem}_{safe}{ext or '.pdf'}"
+
+
+def _saved_source(pres) -> Optional[str]:
+    """The deck's own file, when it is saved, local and OOXML; else None."""
+    try:
+        if not pres.Saved:
+            return None
+        path = pres.FullName
+    except Exception:
+        return None
+    if not path.lower().endswith(ooxml.SUPPORTED_EXTENSIONS) or not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "rb"):
+            return path
+    except OSError:
+        return None
+
+
+def _copy_extension(pres) -> str:
+    """Extension for a temporary copy of the deck: .pptm keeps its macros.
 
-    pywin32 cannot marshal the PrintRange COM object through InvokeTypes,
-    so we work around this by saving a copy, deleting unwanted slides,
-    and exporting the trimmed copy as PDF.
+    PowerPoint refuses to open a package whose main content type does not
+    match its extension, so copies of a .pptm deck must be .pptm too.
     """
-    tmp_file = os.path.join(tempfile.gettempdir(), 'ppt_export_temp.pptx')
     try:
-        pres.SaveCopyAs(tmp_file)
-        tmp_pres = app.Presentations.Open(tmp_file, WithWindow=False)
-        try:
-            total = tmp_pres.Slides.Count
-            # Delete slides after the range (high to low to avoid reindexing)
-            for i in range(total, end, -1):
-                tmp_pres.Slides(i).Delete()
-            # Delete slides before the range
-            for i in range(start - 1, 0, -1):
-                tmp_pres.Slides(i).Delete()
-            tmp_pres.SaveAs(abs_path, ppSaveAsPDF)
-        finally:
-            tmp_pres.Close()
+        if pres.FullName.lower().endswith(".pptm"):
+            return ".pptm"
+    except Exception:
+        pass
+    return ".pptx"
+
+
+def _export_pdf_parts(app, pres, parts: list) -> None:
+    """Export [(abs_path, slide indices)] as PDFs from trimmed copies.
+
+    pywin32 cannot marshal the PrintRange COM object through InvokeTypes, so
+    each PDF comes from a copy of the deck that holds only its slides. The
+    copy is trimmed at the file level (utils.ooxml.extract_slides) rather
+    than by deleting slides over COM, so parts only the other slides use
+    (video, images, charts) are never copied. A saved deck is read straight
+    from its file; one with unsaved changes is saved to a temporary copy
+    first. Every export gets its own temporary directory, so concurrent
+    exports do not collide.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="ppt_export_")
+    try:
+        ext = _copy_extension(pres)
+        source = _saved_source(pres)
+        if source is None:
+            source = os.path.join(tmp_dir, f"source{ext}")
+            fmt = ppSaveAsOpenXMLPresentationMacroEnabled if ext == ".pptm" else ppSaveAsOpenXMLPresentation
+            pres.SaveCopyAs(source, fmt)
+        for n, (abs_path, slides) in enumerate(parts, 1):
+            trimmed = os.path.join(tmp_dir, f"part{n}{ext}")
+            ooxml.extract_slides(source, trimmed, slides)
+            tmp_pres = app.Presentations.Open(trimmed, ReadOnly=True, WithWindow=False)
+            try:
+                tmp_pres.SaveAs(abs_path, ppSaveAsPDF)
+            finally:
+                tmp_pres.Close()
     finally:
-        if os.path.exists(tmp_file):
-            os.remove(tmp_file)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
 def _export_pdf_impl(
     file_path: str,
     slide_range_start: Optional[int],
     slide_range_end: Optional[int],
+    slide_ranges: Optional[List[str]] = None,
+    combine: bool = False,
+    per_section: bool = False,
 ) -> dict:
     app = ppt._get_app_impl()
     if app.Presentations.Count == 0:
@@ -198,8 +312,9 @@ def _export_pdf_impl(
     if out_dir and not os.path.exists(out_dir):
         os.makedirs(out_dir, exist_ok=True)
 
+    total = pres.Slides.Count
+    parts = None  # [(abs_path, label, slide indices)]
     if slide_range_start is not None and slide_range_end is not None:
-        total = pres.Slides.Count
         if slide_range_start < 1 or slide_range_start > total:
             raise ValueError(
                 f"slide_range_start {slide_range_start} out of range (1-{total})"
@@ -209,16 +324,37 @@ def _export_pdf_impl(
                 f"slide_range_end {slide_range_end} out of range "
                 f"({slide_range_start}-{total})"
             )
-        _export_pdf_slide_range(app, pres, abs_path, slide_range_start, slide_range_end)
-    else:
+        parts = [(abs_path, f"{slide_range_start}-{slide_range_end}",
+                  list(range(slide_range_start, slide_range_end + 1)))]
+    elif slide_ranges is not None:
+        ranges = _parse_slide_ranges(slide_ranges, total)
+        if combine:
+            slides = sorted({i for _, indices in ranges for i in indices})
+            parts = [(abs_path, ",".join(label for label, _ in ranges), slides)]
+        elif len(ranges) == 1:
+            parts = [(abs_path, ranges[0][0], ranges[0][1])]
+        else:
+            parts = [(_part_path(abs_path, f"slides_{label}"), label, indices)
+                     for label, indices in ranges]
+    elif per_section:
+        parts = [(_part_path(abs_path, f"{n:02d}_{name}"), name, indices)
+                 for n, (name, indices) in enumerate(_section_ranges(pres), 1)]
+
+    if parts is None:
         _export_pdf_all_slides(pres, abs_path)
+        files = [{"file_path": abs_path, "slides": f"1-{total}", "slide_count": total}]
+    else:
+        _export_pdf_parts(app, pres, [(path, indices) for path, _, indices in parts])
+        files = [{"file_path": path, "slides": label, "slide_count": len(indices)}
+                 for path, label, indices in parts]
 
     return {
         "success": True,
         "file_path": abs_path,
         "slide_range_start": slide_range_start,
         "slide_range_end": slide_range_end,
-        "total_slides": pres.Slides.Count,
+        "total_slides": total,
+        "files": files,
     }
 
 
@@ -229,6 +365,7 @@ def _export_images_impl(
     width: Optional[int],
     height: Optional[int],
     file_name: Optional[str],
+    progress: Optional[Progress] = None,
 ) -> dict:
     app = ppt._get_app_impl()
     if app.Presentations.Count == 0:
@@ -284,27 +421,56 @@ def _export_images_impl(
             "files": [abs_file_path],
         }
     else:
-        # Export all slides - SaveAs creates a folder with individual images
-        abs_dir = os.path.abspath(output_dir)
-        pres.SaveAs(abs_dir, IMAGE_FORMAT_MAP[fmt_key])
-
-        # Collect exported files
-        exported_files = []
-        if os.path.isdir(abs_dir):
-            for f in sorted(os.listdir(abs_dir)):
-                if f.lower().endswith(f".{fmt_key}"):
-                    exported_files.append(os.path.join(abs_dir, f))
-
+        total = pres.Slides.Count
+        exported_files = _export_slide_images_impl(
+            output_dir, fmt_key, width, height, range(1, total + 1), progress,
+        )
         return {
             "success": True,
-            "output_dir": abs_dir,
+            "output_dir": os.path.abspath(output_dir),
             "format": fmt_key,
-            "total_slides": pres.Slides.Count,
+            "total_slides": total,
             "files_count": len(exported_files),
             "files": exported_files,
         }
 
 
+def _export_slide_count_impl() -> int:
+    app = ppt._get_app_impl()
+    if app.Presentations.Count == 0:
+        raise RuntimeError(
+            "No presentation is open. "
+            "Use ppt_create_presentation or ppt_open_presentation first."
+        )
+    return ppt._get_pres_impl().Slides.Count
+
+
+def _export_slide_images_impl(output_dir, fmt_key, width, height, slide_indices,
+                              progress=None) -> list:
+    """Export slides one by one as <output_dir>/Slide<n>.<fmt>; returns the files.
+
+    Per-slide Slide.Export (rather than one SaveAs into a folder) lets the
+    work be chunked, report progress and stop between slides.
+    """
+    pres = ppt._get_pres_impl()
+    filter_name = IMAGE_FILTER_MAP[fmt_key]
+    abs_dir = os.path.abspath(output_dir)
+    os.makedirs(abs_dir, exist_ok=True)
+
+    exported_files = []
+    slides = pres.Slides
+    for i in tracked(slide_indices, progress):
+        abs_file_path = os.path.join(abs_dir, f"Slide{i}.{fmt_key}")
+        if width is not None and height is not None:
+            slides(i).Export(abs_file_path, filter_name, width, height)
+        elif width is not None:
+            slides(i).Export(abs_file_path, filter_name, width)
+        else:
+            slides(i).Export(abs_file_path, filter_name)
+        exported_files.append(abs_file_path)
+    return exported_files
+
+
 # ---------------------------------------------------------------------------
 # Clipboard helpers (Windows only)
 # ---------------------------------------------------------------------------
@@ -595,41 +761,66 @@ def _copy_to_clipboard_impl(
 # ---------------------------------------------------------------------------
 # MCP tool functions (return JSON strings)
 # ---------------------------------------------------------------------------
-def export_pdf(params: ExportPDFInput) -> str:
+async def export_pdf(params: ExportPDFInput) -> str:
     """Export the active presentation to PDF."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _export_pdf_impl,
             params.file_path,
             params.slide_range_start,
             params.slide_range_end,
+            params.slide_ranges,
+            params.combine,
+            params.per_section,
         )
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def export_images(params: ExportImagesInput) -> str:
+async def export_images(params: ExportImagesInput, ctx: Optional[Context] = None) -> str:
     """Export slides as images (PNG or JPG)."""
     try:
-        result = ppt.execute(
-            _export_images_impl,
-            params.output_dir,
-            params.format,
-            params.slide_index,
-            params.width,
-            params.height,
-            params.file_name,
+        fmt_key = params.format.lower().strip()
+        if params.slide_index is not None or fmt_key not in IMAGE_FORMAT_MAP:
+            result = await ppt.execute_async(
+                _export_images_impl,
+                params.output_dir,
+                params.format,
+                params.slide_index,
+                params.width,
+                params.height,
+                params.file_name,
+            )
+            return json.dumps(result)
+
+        # All slides: one COM job per chunk of slides
+        total = await ppt.execute_async(_export_slide_count_impl)
+        progress = Progress(ctx)
+        parts = await progress.execute_chunked(
+            _export_slide_images_impl, list(range(1, total + 1)),
+            output_dir=params.output_dir, fmt_key=fmt_key,
+            width=params.width, height=params.height,
         )
+        files = [f for part in parts for f in part]
+        result = {
+            "success": True,
+            "output_dir": os.path.abspath(params.output_dir),
+            "format": fmt_key,
+            "total_slides": total,
+            "files_count": len(files),
+            "files": files,
+            **progress.partial(),
+        }
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def copy_to_clipboard(params: CopyToClipboardInput) -> str:
+async def copy_to_clipboard(params: CopyToClipboardInput) -> str:
     """Copy slides as PNG images to the clipboard."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _copy_to_clipboard_impl,
             params.slide_indices,
             params.width,
@@ -660,9 +851,11 @@ def register_tools(mcp):
         """Export the active presentation to a PDF file.
 
         Optionally export a specific range of slides by providing
-        slide_range_start and slide_range_end.
+        slide_range_start and slide_range_end, several ranges at once with
+        slide_ranges (one PDF each, or one PDF with combine=true), or one
+        PDF per section with per_section=true.
         """
-        return export_pdf(params)
+        return await export_pdf(params)
 
     @mcp.tool(
         name="ppt_export_images",
@@ -674,14 +867,16 @@ def register_tools(mcp):
             "openWorldHint": True,
         },
     )
-    async def tool_export_images(params: ExportImagesInput) -> str:
+    async def tool_export_images(params: ExportImagesInput, ctx: Optional[Context] = None) -> str:
         """Export slides as images (PNG or JPG).
 
-        Export all slides to a directory, or a single slide by index.
-        For single slide export, optionally specify width and height in pixels.
-        For all slides, PowerPoint creates a folder of individual images.
+        Export all slides to a directory (as Slide<n>.<format>), or a single
+        slide by index. Optionally specify width and height in pixels.
+        Exporting all slides sends per-slide progress notifications; if it
+        runs out of time the result lists the files written so far with
+        `partial: true` and `slides_done`.
         """
-        return export_images(params)
+        return await export_images(params, ctx)
 
     @mcp.tool(
         name="ppt_copy_to_clipboard",
@@ -701,4 +896,4 @@ def register_tools(mcp):
         Single slide is placed as a bitmap (paste directly as image).
         Multiple slides are placed as file drop (paste inserts all images).
         """
-        return copy_to_clipboard(params)
+        return await copy_to_clipboard(params)
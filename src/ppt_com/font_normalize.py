@@ -0,0 +1,229 @@
+"""Minimal-write font normalization (used by ppt_set_default_fonts).
+
+Setting Font.Name on a text range makes PowerPoint lay the shape out again
+even when the name does not change, so writing every text frame of a large
+deck costs thousands of needless relayouts. The engine works in two passes
+over a set of slides (or the masters):
+
+1. Inventory. Every text range is collected: text frames (also inside
+   groups), table cells, SmartArt nodes, speaker notes and master / layout
+   placeholders. Each is read once at range level. Only a range whose font
+   is mixed (COM returns "") is read run by run, for the statistics.
+2. Apply. Only ranges whose Latin or East Asian font differs from the
+   target are written, and only the property that differs — one write per
+   range, which covers all its runs — with window painting frozen.
+
+FontStats carries the before/after font counts and the write counts; stats
+of several chunks are combined with add().
+"""
+
+import logging
+from collections import Counter
+from typing import Iterable, Optional
+
+from utils.progress import Progress, tracked
+from utils.redraw import FrozenRedraw
+from ppt_com.constants import msoGroup
+
+logger = logging.getLogger(__name__)
+
+_PROPS = (("Name", "latin"), ("NameFarEast", "east_asian"))
+
+
+class FontStats:
+    """Counts from one normalization pass; text ranges are the unit.
+
+    A uniformly formatted range counts once per font; a mixed range counts
+    once per run.
+    """
+
+    def __init__(self):
+        self.slides = 0
+        self.ranges = 0
+        self.changed = 0
+        self.writes = 0
+        self.changed_by_location = Counter()
+        self.before = {key: Counter() for _, key in _PROPS}
+        self.after = {key: Counter() for _, key in _PROPS}
+
+    def add(self, other: "FontStats") -> "FontStats":
+        self.slides += other.slides
+        self.ranges += other.ranges
+        self.changed += other.changed
+        self.writes += other.writes
+        self.changed_by_location.update(other.changed_by_location)
+        for _, key in _PROPS:
+            self.before[key].update(other.before[key])
+            self.after[key].update(other.after[key])
+        return self
+
+    def as_dict(self) -> dict:
+        return {
+            "slides_processed": self.slides,
+            "shapes_updated": self.changed,
+            "text_ranges_checked": self.ranges,
+            "already_correct": self.ranges - self.changed,
+            "property_writes": self.writes,
+            "changed_by_location": dict(self.changed_by_location),
+            "fonts_before": {k: dict(c.most_common()) for k, c in self.before.items()},
+            "fonts_after": {k: dict(c.most_common()) for k, c in self.after.items()},
+        }
+
+
+# ---------------------------------------------------------------------------
+# Inventory
+# ---------------------------------------------------------------------------
+def _collect(shape, location: str, ranges: list) -> None:
+    """Append (text range, location) for every text range inside shape."""
+    try:
+        if shape.Type == msoGroup:
+            items = shape.GroupItems
+            for k in range(1, items.Count + 1):
+                _collect(items(k), location, ranges)
+            return
+        if shape.HasTable:
+            table = shape.Table
+            for r in range(1, table.Rows.Count + 1):
+                for c in range(1, table.Columns.Count + 1):
+                    ranges.append((table.Cell(r, c).Shape.TextFrame.TextRange, "tables"))
+            return
+        if shape.HasSmartArt:
+            nodes = shape.SmartArt.AllNodes
+            for i in range(1, nodes.Count + 1):
+                ranges.append((nodes(i).TextFrame2.TextRange, "smartart"))
+            return
+        if shape.HasTextFrame:
+            ranges.append((shape.TextFrame.TextRange, location))
+    except Exception:
+        logger.debug("Skipping shape while collecting text ranges", exc_info=True)
+
+
+def _collect_shapes(shapes, location: str, ranges: list) -> None:
+    for i in range(1, shapes.Count + 1):
+        _collect(shapes(i), location, ranges)
+
+
+def _run_fonts(text_range) -> Optional[list]:
+    """[(Name, NameFarEast)] per run, or None when runs cannot be listed."""
+    try:
+        fonts = []
+        for i in range(1, text_range.Runs().Count + 1):
+            font = text_range.Runs(i).Font
+            fonts.append((font.Name, font.NameFarEast))
+        return fonts
+    except Exception:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Plan and apply
+# ---------------------------------------------------------------------------
+def _normalize(ranges: list, targets: dict, stats: FontStats, dry_run: bool,
+               theme_fonts: Optional[dict] = None) -> None:
+    """Read every range once, then write only what differs.
+
+    theme_fonts ({"latin": [...], "east_asian": [...]}) lists the theme
+    fonts a dry run leaves unchanged that a real run replaces first. A range
+    shown in one of them would follow the theme, so it is not counted as a
+    write (as in a real run); fonts_after shows it with the target font. A
+    range set explicitly to the same name cannot be told apart, so the dry
+    run may slightly undercount such writes.
+    """
+    follows_theme = {prop: set((theme_fonts or {}).get(key, ())) for prop, key in _PROPS}
+    writes = []
+    for text_range, location in ranges:
+        try:
+            font = text_range.Font
+            current = {prop: getattr(font, prop) for prop, _ in _PROPS}
+        except Exception:
+            logger.debug("Cannot read fonts of a %s text range", location, exc_info=True)
+            continue
+        stats.ranges += 1
+        runs = None
+        if any(value == "" for value in current.values()):
+            runs = _run_fonts(text_range)
+        resolved = {prop: value for prop, value in targets.items() if current[prop] != value}
+        changes = {prop: value for prop, value in resolved.items()
+                   if current[prop] not in follows_theme[prop]}
+
+        for index, (prop, key) in enumerate(_PROPS):
+            if current[prop] != "":
+                seen = [current[prop]]
+            elif runs is not None:
+                seen = [run[index] for run in runs]
+            else:
+                seen = ["(mixed)"]
+            stats.before[key].update(seen)
+            stats.after[key].update([resolved[prop]] * len(seen) if prop in resolved else seen)
+
+        if changes:
+            writes.append((font, changes, location))
+
+    stats.changed += len(writes)
+    for _, changes, location in writes:
+        stats.writes += len(changes)
+        stats.changed_by_location[location] += 1
+    if dry_run or not writes:
+        return
+    with FrozenRedraw():
+        for font, changes, location in writes:
+            try:
+                for prop, value in changes.items():
+                    setattr(font, prop, value)
+            except Exception:
+                logger.warning("Failed to set fonts on a %s text range", location, exc_info=True)
+
+
+def _targets(latin: Optional[str], east_asian: Optional[str]) -> dict:
+    targets = {}
+    if latin:
+        targets["Name"] = latin
+    if east_asian:
+        targets["NameFarEast"] = east_asian
+    return targets
+
+
+def normalize_slides(pres, slide_indices: Iterable[int], latin: Optional[str],
+                     east_asian: Optional[str], include_notes: bool = True,
+                     dry_run: bool = False, progress: Optional[Progress] = None,
+                     theme_fonts: Optional[dict] = None) -> FontStats:
+    """Normalize fonts of slide_indices (and their notes). Runs on the COM thread."""
+    stats = FontStats()
+    ranges = []
+    for index in tracked(slide_indices, progress):
+        slide = pres.Slides(index)
+        stats.slides += 1
+        _collect_shapes(slide.Shapes, "slides", ranges)
+        if include_notes:
+            try:
+                _collect_shapes(slide.NotesPage.Shapes, "notes", ranges)
+            except Exception:
+                logger.debug("No notes page for slide %d", index, exc_info=True)
+    _normalize(ranges, _targets(latin, east_asian), stats, dry_run, theme_fonts)
+    return stats
+
+
+def normalize_masters(pres, latin: Optional[str], east_asian: Optional[str],
+                      dry_run: bool = False, theme_fonts: Optional[dict] = None) -> FontStats:
+    """Normalize fonts of every slide master and its layouts."""
+    masters = []
+    try:
+        designs = pres.Designs
+        masters = [designs(i).SlideMaster for i in range(1, designs.Count + 1)]
+    except Exception:
+        logger.debug("Designs unavailable; using the single slide master", exc_info=True)
+    if not masters:
+        masters = [pres.SlideMaster]
+
+    ranges = []
+    for master in masters:
+        _collect_shapes(master.Shapes, "masters", ranges)
+        try:
+            layouts = master.CustomLayouts
+            for j in range(1, layouts.Count + 1):
+                _collect_shapes(layouts(j).Shapes, "masters", ranges)
+        except Exception:
+            logger.debug("Cannot read the layouts of a slide master", exc_info=True)
+    stats = FontStats()
+    _normalize(ranges, _targets(latin, east_asian), stats, dry_run, theme_fonts)
+    return stats
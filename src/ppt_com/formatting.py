@@ -246,10 +246,10 @@ def _set_shadow_impl(slide_index, shape_name_or_index,
 # ---------------------------------------------------------------------------
 # MCP tool functions
 # ---------------------------------------------------------------------------
-def set_fill(params: SetFillInput) -> str:
+async def set_fill(params: SetFillInput) -> str:
     """Set shape fill (solid, gradient, or none)."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_fill_impl,
             params.slide_index, params.shape_name_or_index, params.fill_type,
             params.color, params.gradient_color1, params.gradient_color2,
@@ -260,10 +260,10 @@ def set_fill(params: SetFillInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def set_line(params: SetLineInput) -> str:
+async def set_line(params: SetLineInput) -> str:
     """Set shape border/line properties."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_line_impl,
             params.slide_index, params.shape_name_or_index,
             params.color, params.weight, params.dash_style,
@@ -274,10 +274,10 @@ def set_line(params: SetLineInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def set_shadow(params: SetShadowInput) -> str:
+async def set_shadow(params: SetShadowInput) -> str:
     """Set shadow effect on a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_shadow_impl,
             params.slide_index, params.shape_name_or_index,
             params.visible, params.blur, params.offset_x, params.offset_y,
@@ -311,7 +311,7 @@ def register_tools(mcp):
         For solid fills, provide a color hex. For gradients, provide
         gradient_color1, gradient_color2, and gradient_style.
         """
-        return set_fill(params)
+        return await set_fill(params)
 
     @mcp.tool(
         name="ppt_set_line",
@@ -328,7 +328,7 @@ def register_tools(mcp):
 
         Configure color, weight, dash style, visibility, and transparency.
         """
-        return set_line(params)
+        return await set_line(params)
 
     @mcp.tool(
         name="ppt_set_shadow",
@@ -346,4 +346,4 @@ def register_tools(mcp):
         Configure blur, offset, color, and transparency.
         Set visible=false to remove the shadow.
         """
-        return set_shadow(params)
+        return await set_shadow(params)
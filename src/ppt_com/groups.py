@@ -171,7 +171,7 @@ def _get_group_items_impl(slide_index, shape_name_or_index):
 # ---------------------------------------------------------------------------
 # MCP tool functions (async wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def group_shapes(params: GroupShapesInput) -> str:
+async def group_shapes(params: GroupShapesInput) -> str:
     """Group multiple shapes into a single group shape.
 
     Args:
@@ -181,7 +181,7 @@ def group_shapes(params: GroupShapesInput) -> str:
         JSON with group name and shape index.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _group_shapes_impl,
             params.slide_index, params.shape_names,
         )
@@ -190,7 +190,7 @@ def group_shapes(params: GroupShapesInput) -> str:
         return json.dumps({"error": f"Failed to group shapes: {str(e)}"})
 
 
-def ungroup_shapes(params: UngroupShapesInput) -> str:
+async def ungroup_shapes(params: UngroupShapesInput) -> str:
     """Ungroup a group shape into its individual shapes.
 
     Args:
@@ -200,7 +200,7 @@ def ungroup_shapes(params: UngroupShapesInput) -> str:
         JSON with ungrouped count and shape names.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _ungroup_shapes_impl,
             params.slide_index, params.shape_name_or_index,
         )
@@ -209,7 +209,7 @@ def ungroup_shapes(params: UngroupShapesInput) -> str:
         return json.dumps({"error": f"Failed to ungroup shapes: {str(e)}"})
 
 
-def get_group_items(params: GetGroupItemsInput) -> str:
+async def get_group_items(params: GetGroupItemsInput) -> str:
     """Get information about all items within a group shape.
 
     Args:
@@ -219,7 +219,7 @@ def get_group_items(params: GetGroupItemsInput) -> str:
         JSON with group name and list of item details.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_group_items_impl,
             params.slide_index, params.shape_name_or_index,
         )
@@ -250,7 +250,7 @@ def register_tools(mcp):
         Provide at least 2 shape names to combine into a group.
         The individual shapes are replaced by a single group shape.
         """
-        return group_shapes(params)
+        return await group_shapes(params)
 
     @mcp.tool(
         name="ppt_ungroup_shapes",
@@ -268,7 +268,7 @@ def register_tools(mcp):
         The group shape is removed and its child shapes become
         independent shapes on the slide.
         """
-        return ungroup_shapes(params)
+        return await ungroup_shapes(params)
 
     @mcp.tool(
         name="ppt_get_group_items",
@@ -286,4 +286,4 @@ def register_tools(mcp):
         Returns name, type, position, and size for each item in the group.
         Identify the group by shape name or 1-based shape index.
         """
-        return get_group_items(params)
+        return await get_group_items(params)
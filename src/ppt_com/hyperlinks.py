@@ -188,7 +188,7 @@ def _remove_hyperlink_impl(slide_index, shape_name_or_index, action_on):
 # ---------------------------------------------------------------------------
 # MCP tool functions (async wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def add_hyperlink(params: AddHyperlinkInput) -> str:
+async def add_hyperlink(params: AddHyperlinkInput) -> str:
     """Add a hyperlink to a shape.
 
     Args:
@@ -198,7 +198,7 @@ def add_hyperlink(params: AddHyperlinkInput) -> str:
         JSON with shape name and hyperlink address.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_hyperlink_impl,
             params.slide_index, params.shape_name_or_index,
             params.address, params.sub_address, params.screen_tip,
@@ -209,7 +209,7 @@ def add_hyperlink(params: AddHyperlinkInput) -> str:
         return json.dumps({"error": f"Failed to add hyperlink: {str(e)}"})
 
 
-def get_hyperlinks(params: GetHyperlinksInput) -> str:
+async def get_hyperlinks(params: GetHyperlinksInput) -> str:
     """Get all hyperlinks on a slide.
 
     Args:
@@ -219,7 +219,7 @@ def get_hyperlinks(params: GetHyperlinksInput) -> str:
         JSON with hyperlinks count and list of hyperlink details.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_hyperlinks_impl,
             params.slide_index,
         )
@@ -228,7 +228,7 @@ def get_hyperlinks(params: GetHyperlinksInput) -> str:
         return json.dumps({"error": f"Failed to get hyperlinks: {str(e)}"})
 
 
-def remove_hyperlink(params: RemoveHyperlinkInput) -> str:
+async def remove_hyperlink(params: RemoveHyperlinkInput) -> str:
     """Remove a hyperlink from a shape.
 
     Args:
@@ -238,7 +238,7 @@ def remove_hyperlink(params: RemoveHyperlinkInput) -> str:
         JSON confirming the hyperlink removal.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _remove_hyperlink_impl,
             params.slide_index, params.shape_name_or_index,
             params.action_on,
@@ -271,7 +271,7 @@ def register_tools(mcp):
         Set action_on to 'click' (default) or 'mouseover' for the trigger type.
         For slide links, use sub_address like '3,,' to link to slide 3.
         """
-        return add_hyperlink(params)
+        return await add_hyperlink(params)
 
     @mcp.tool(
         name="ppt_get_hyperlinks",
@@ -288,7 +288,7 @@ def register_tools(mcp):
 
         Returns address, sub-address, and type for each hyperlink found on the slide.
         """
-        return get_hyperlinks(params)
+        return await get_hyperlinks(params)
 
     @mcp.tool(
         name="ppt_remove_hyperlink",
@@ -306,4 +306,4 @@ def register_tools(mcp):
         Clears the click or mouseover action on the specified shape.
         Set action_on to 'click' (default) or 'mouseover' to choose which to remove.
         """
-        return remove_hyperlink(params)
+        return await remove_hyperlink(params)
@@ -0,0 +1,257 @@
+"""Background jobs: run a long tool call and poll it through a handle.
+
+ppt_start_job runs a tool call (any tool ppt_execute_batch can run) as a
+background task on the server and returns a job id at once, so a 200-slide
+export or a whole-deck restyle is not bound to one request's timeout. The
+progress notifications the tool sends are recorded on the job;
+ppt_get_job reports status, progress and, once finished, the result
+(optionally waiting a few seconds first). ppt_cancel_job stops the job at
+the next slide. Jobs outlive the request that started them, so a client
+that timed out or reconnected resumes by polling the same id.
+
+Finished jobs are kept for JOB_TTL_S seconds (at most MAX_JOBS of them).
+"""
+
+import asyncio
+import inspect
+import itertools
+import json
+import logging
+import time
+from typing import Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from ppt_com import batch_execute
+
+logger = logging.getLogger(__name__)
+
+JOB_TTL_S = 600.0
+MAX_JOBS = 50
+
+_jobs: dict = {}
+_ids = itertools.count(1)
+
+
+class _JobContext:
+    """Stands in for the request Context: records progress on the job."""
+
+    def __init__(self, job: "_Job"):
+        self._job = job
+
+    async def report_progress(self, progress, total=None, message=None) -> None:
+        self._job.progress = {"done": progress, "total": total, "message": message}
+
+
+class _Job:
+    def __init__(self, job_id: str, tool: str):
+        self.job_id = job_id
+        self.tool = tool
+        self.status = "running"
+        self.progress: Optional[dict] = None
+        self.result = None
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self.finished: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def snapshot(self, include_result: bool = True) -> dict:
+        end = self.finished or time.time()
+        info = {
+            "job_id": self.job_id,
+            "tool": self.tool,
+            "status": self.status,
+            "elapsed_s": round(end - self.created, 2),
+        }
+        if self.progress is not None:
+            info["progress"] = self.progress
+        if self.error is not None:
+            info["error"] = self.error
+        if include_result and self.status == "done":
+            info["result"] = self.result
+        return info
+
+
+# ---------------------------------------------------------------------------
+# Pydantic input models
+# ---------------------------------------------------------------------------
+class StartJobInput(BaseModel):
+    """Input for starting a tool call as a background job."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    tool: str = Field(
+        ..., description="Tool name, with or without the 'ppt_' prefix (e.g. 'export_images')",
+    )
+    params: dict = Field(
+        default_factory=dict,
+        description="The tool's parameters, exactly as they would be passed to the tool.",
+    )
+
+
+class GetJobInput(BaseModel):
+    """Input for polling a background job."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    job_id: str = Field(..., description="Job id returned by ppt_start_job")
+    wait_s: float = Field(
+        default=0, ge=0, le=60,
+        description="Wait up to this many seconds for the job to finish before answering",
+    )
+
+
+class CancelJobInput(BaseModel):
+    """Input for cancelling a background job."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    job_id: str = Field(..., description="Job id returned by ppt_start_job")
+
+
+# ---------------------------------------------------------------------------
+# Job handling
+# ---------------------------------------------------------------------------
+def _prune() -> None:
+    now = time.time()
+    finished = sorted((j for j in _jobs.values() if j.finished), key=lambda j: j.finished)
+    for job in finished:
+        if now - job.finished > JOB_TTL_S or len(_jobs) > MAX_JOBS:
+            del _jobs[job.job_id]
+
+
+def _get(job_id: str) -> _Job:
+    job = _jobs.get(job_id)
+    if job is None:
+        raise ValueError(f"Unknown or expired job '{job_id}'")
+    return job
+
+
+async def _run(job: _Job, fn, model, params: dict) -> None:
+    try:
+        kwargs = {}
+        if "ctx" in inspect.signature(fn).parameters:
+            kwargs["ctx"] = _JobContext(job)
+        if model is None:
+            raw = await fn(**kwargs)
+        else:
+            raw = await fn(model.model_validate(params), **kwargs)
+        try:
+            result = json.loads(raw)
+        except (TypeError, ValueError):
+            result = raw  # e.g. ppt_get_all_text returns Markdown
+        if isinstance(result, dict) and "error" in result:
+            job.status, job.error = "failed", str(result["error"])
+        else:
+            job.status, job.result = "done", result
+    except asyncio.CancelledError:
+        job.status = "cancelled"
+    except Exception as e:
+        job.status, job.error = "failed", str(e)
+    finally:
+        job.finished = time.time()
+        logger.info("Job %s (%s) %s after %.1fs", job.job_id, job.tool, job.status,
+                    job.finished - job.created)
+
+
+async def start_job(params: StartJobInput) -> str:
+    """Start a tool call in the background and return its job id."""
+    try:
+        name = batch_execute._normalize_tool_name(params.tool)
+        registry = batch_execute._tool_registry()
+        if name not in registry:
+            return json.dumps({"error": f"Unknown tool '{params.tool}' (or it cannot run as a job)"})
+        fn, model = registry[name]
+        if model is not None:
+            model.model_validate(params.params)  # report bad params now, not on first poll
+        _prune()
+        job = _Job(f"job-{next(_ids)}", name)
+        job.task = asyncio.create_task(_run(job, fn, model, params.params))
+        _jobs[job.job_id] = job
+        return json.dumps(job.snapshot())
+    except Exception as e:
+        return json.dumps({"error": f"Failed to start job: {str(e)}"})
+
+
+async def get_job(params: GetJobInput) -> str:
+    """Status, progress and result of a background job."""
+    try:
+        job = _get(params.job_id)
+        if params.wait_s and job.finished is None:
+            await asyncio.wait({job.task}, timeout=params.wait_s)
+        return json.dumps(job.snapshot(), ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to get job: {str(e)}"})
+
+
+async def cancel_job(params: CancelJobInput) -> str:
+    """Cancel a running background job."""
+    try:
+        job = _get(params.job_id)
+        if job.finished is None:
+            job.task.cancel()
+            await asyncio.wait({job.task}, timeout=5)
+        return json.dumps(job.snapshot(include_result=False))
+    except Exception as e:
+        return json.dumps({"error": f"Failed to cancel job: {str(e)}"})
+
+
+# ---------------------------------------------------------------------------
+# Tool registration
+# ---------------------------------------------------------------------------
+def register_tools(mcp):
+    """Register background job tools with the MCP server."""
+
+    @mcp.tool(
+        name="ppt_start_job",
+        annotations={
+            "title": "Start Background Job",
+            "readOnlyHint": False,
+            "destructiveHint": True,
+            "idempotentHint": False,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_start_job(params: StartJobInput) -> str:
+        """Run a long tool call in the background and return a job id at once.
+
+        Use for operations that may outlast a request (exporting hundreds of
+        slides, restyling every shape, typography fixes on a large deck).
+        "tool" is any ppt_* tool name and "params" are that tool's
+        parameters. Poll with ppt_get_job; stop with ppt_cancel_job.
+        """
+        return await start_job(params)
+
+    @mcp.tool(
+        name="ppt_get_job",
+        annotations={
+            "title": "Get Background Job",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_get_job(params: GetJobInput) -> str:
+        """Get the status of a ppt_start_job job: running, done, failed or cancelled.
+
+        Includes progress (done/total slides) while running and the tool's
+        result once done. Set wait_s to wait for completion before answering.
+        Finished jobs are kept for 10 minutes.
+        """
+        return await get_job(params)
+
+    @mcp.tool(
+        name="ppt_cancel_job",
+        annotations={
+            "title": "Cancel Background Job",
+            "readOnlyHint": False,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_cancel_job(params: CancelJobInput) -> str:
+        """Cancel a running ppt_start_job job.
+
+        Whole-deck tools stop at the next slide; changes made up to then
+        are kept.
+        """
+        return await cancel_job(params)
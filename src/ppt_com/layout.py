@@ -542,7 +542,7 @@ def _merge_shapes_impl(slide_index, shape_names, merge_type, primary_shape):
 # ---------------------------------------------------------------------------
 # MCP tool functions (sync wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def align_shapes(params: AlignShapesInput) -> str:
+async def align_shapes(params: AlignShapesInput) -> str:
     """Align multiple shapes on a slide.
 
     Args:
@@ -552,7 +552,7 @@ def align_shapes(params: AlignShapesInput) -> str:
         JSON confirming the alignment operation.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _align_shapes_impl,
             params.slide_index, params.shape_names,
             params.align_to, params.relative_to_slide,
@@ -562,7 +562,7 @@ def align_shapes(params: AlignShapesInput) -> str:
         return json.dumps({"error": f"Failed to align shapes: {str(e)}"})
 
 
-def distribute_shapes(params: DistributeShapesInput) -> str:
+async def distribute_shapes(params: DistributeShapesInput) -> str:
     """Distribute shapes evenly on a slide.
 
     Args:
@@ -572,7 +572,7 @@ def distribute_shapes(params: DistributeShapesInput) -> str:
         JSON confirming the distribution operation.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _distribute_shapes_impl,
             params.slide_index, params.shape_names,
             params.direction, params.relative_to_slide,
@@ -582,7 +582,7 @@ def distribute_shapes(params: DistributeShapesInput) -> str:
         return json.dumps({"error": f"Failed to distribute shapes: {str(e)}"})
 
 
-def get_slide_size(params: GetSlideSizeInput) -> str:
+async def get_slide_size(params: GetSlideSizeInput) -> str:
     """Get the current slide size of the active presentation.
 
     Args:
@@ -592,13 +592,13 @@ def get_slide_size(params: GetSlideSizeInput) -> str:
         JSON with slide dimensions in points and inches.
     """
     try:
-        result = ppt.execute(_get_slide_size_impl)
+        result = await ppt.execute_async(_get_slide_size_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to get slide size: {str(e)}"})
 
 
-def set_slide_size(params: SetSlideSizeInput) -> str:
+async def set_slide_size(params: SetSlideSizeInput) -> str:
     """Set the slide size of the active presentation.
 
     Args:
@@ -608,7 +608,7 @@ def set_slide_size(params: SetSlideSizeInput) -> str:
         JSON with the resulting slide dimensions.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_slide_size_impl,
             params.width, params.height,
             params.preset, params.orientation,
@@ -618,7 +618,7 @@ def set_slide_size(params: SetSlideSizeInput) -> str:
         return json.dumps({"error": f"Failed to set slide size: {str(e)}"})
 
 
-def set_slide_background(params: SetSlideBackgroundInput) -> str:
+async def set_slide_background(params: SetSlideBackgroundInput) -> str:
     """Set the background of a specific slide.
 
     Args:
@@ -628,7 +628,7 @@ def set_slide_background(params: SetSlideBackgroundInput) -> str:
         JSON confirming the background change.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_slide_background_impl,
             params.slide_index, params.fill_type,
             params.color, params.gradient_color1,
@@ -641,7 +641,7 @@ def set_slide_background(params: SetSlideBackgroundInput) -> str:
         return json.dumps({"error": f"Failed to set slide background: {str(e)}"})
 
 
-def flip_shape(params: FlipShapeInput) -> str:
+async def flip_shape(params: FlipShapeInput) -> str:
     """Flip a shape horizontally or vertically.
 
     Args:
@@ -651,7 +651,7 @@ def flip_shape(params: FlipShapeInput) -> str:
         JSON with the resulting flip state.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _flip_shape_impl,
             params.slide_index, params.shape_name_or_index,
             params.direction,
@@ -661,7 +661,7 @@ def flip_shape(params: FlipShapeInput) -> str:
         return json.dumps({"error": f"Failed to flip shape: {str(e)}"})
 
 
-def merge_shapes(params: MergeShapesInput) -> str:
+async def merge_shapes(params: MergeShapesInput) -> str:
     """Merge shapes using a Boolean operation.
 
     Args:
@@ -671,7 +671,7 @@ def merge_shapes(params: MergeShapesInput) -> str:
         JSON confirming the merge operation.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _merge_shapes_impl,
             params.slide_index, params.shape_names,
             params.merge_type, params.primary_shape,
@@ -705,7 +705,7 @@ def register_tools(mcp):
         Set relative_to_slide=true to align relative to the slide boundaries.
         Align options: left, center, right, top, middle, bottom.
         """
-        return align_shapes(params)
+        return await align_shapes(params)
 
     @mcp.tool(
         name="ppt_distribute_shapes",
@@ -724,7 +724,7 @@ def register_tools(mcp):
         Provide at least 3 shape names.
         Set relative_to_slide=true to distribute relative to the slide edges.
         """
-        return distribute_shapes(params)
+        return await distribute_shapes(params)
 
     @mcp.tool(
         name="ppt_get_slide_size",
@@ -742,7 +742,7 @@ def register_tools(mcp):
         Returns width and height in both points and inches,
         along with the slide size preset name and orientation.
         """
-        return get_slide_size(params)
+        return await get_slide_size(params)
 
     @mcp.tool(
         name="ppt_set_slide_size",
@@ -761,7 +761,7 @@ def register_tools(mcp):
         or specify exact width/height in points (72 points = 1 inch).
         Preset is applied first, then width/height, then orientation.
         """
-        return set_slide_size(params)
+        return await set_slide_size(params)
 
     @mcp.tool(
         name="ppt_set_slide_background",
@@ -782,7 +782,7 @@ def register_tools(mcp):
         Colors use '#RRGGBB' format.
         Use slide_indices to apply the same background to multiple slides at once.
         """
-        return set_slide_background(params)
+        return await set_slide_background(params)
 
     @mcp.tool(
         name="ppt_flip_shape",
@@ -801,7 +801,7 @@ def register_tools(mcp):
         Direction: 'horizontal' mirrors left-right, 'vertical' mirrors top-bottom.
         Returns the resulting flip state.
         """
-        return flip_shape(params)
+        return await flip_shape(params)
 
     @mcp.tool(
         name="ppt_merge_shapes",
@@ -822,4 +822,4 @@ def register_tools(mcp):
         (split at intersections).
         Optionally specify primary_shape to control which shape's formatting is kept.
         """
-        return merge_shapes(params)
+        return await merge_shapes(params)
@@ -215,7 +215,7 @@ def _set_media_settings_impl(
 # ---------------------------------------------------------------------------
 # MCP tool functions (sync wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def add_video(params: AddVideoInput) -> str:
+async def add_video(params: AddVideoInput) -> str:
     """Add a video to a slide.
 
     Args:
@@ -225,7 +225,7 @@ def add_video(params: AddVideoInput) -> str:
         JSON with shape name and resolved file path.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_video_impl,
             params.slide_index, params.file_path,
             params.left, params.top, params.width, params.height,
@@ -236,7 +236,7 @@ def add_video(params: AddVideoInput) -> str:
         return json.dumps({"error": f"Failed to add video: {str(e)}"})
 
 
-def add_audio(params: AddAudioInput) -> str:
+async def add_audio(params: AddAudioInput) -> str:
     """Add an audio file to a slide.
 
     Args:
@@ -246,7 +246,7 @@ def add_audio(params: AddAudioInput) -> str:
         JSON with shape name and resolved file path.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_audio_impl,
             params.slide_index, params.file_path,
             params.left, params.top, params.width, params.height,
@@ -257,7 +257,7 @@ def add_audio(params: AddAudioInput) -> str:
         return json.dumps({"error": f"Failed to add audio: {str(e)}"})
 
 
-def set_media_settings(params: SetMediaSettingsInput) -> str:
+async def set_media_settings(params: SetMediaSettingsInput) -> str:
     """Configure media playback settings.
 
     Args:
@@ -267,7 +267,7 @@ def set_media_settings(params: SetMediaSettingsInput) -> str:
         JSON confirming the settings update.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_media_settings_impl,
             params.slide_index, params.shape_name_or_index,
             params.volume, params.muted, params.start_point, params.end_point,
@@ -301,7 +301,7 @@ def register_tools(mcp):
         an absolute Windows path. Supports embedding or linking.
         All positions and sizes are in points (72 points = 1 inch).
         """
-        return add_video(params)
+        return await add_video(params)
 
     @mcp.tool(
         name="ppt_add_audio",
@@ -320,7 +320,7 @@ def register_tools(mcp):
         to an absolute Windows path. Supports embedding or linking.
         All positions and sizes are in points (72 points = 1 inch).
         """
-        return add_audio(params)
+        return await add_audio(params)
 
     @mcp.tool(
         name="ppt_set_media_settings",
@@ -338,4 +338,4 @@ def register_tools(mcp):
         Adjust volume, mute state, fade-in/out duration, and looping.
         Identify the media shape by name or 1-based shape index.
         """
-        return set_media_settings(params)
+        return await set_media_settings(params)
@@ -0,0 +1,222 @@
+"""Offline tools for closed .pptx files.
+
+These tools never touch PowerPoint or the COM thread: they read and edit the
+OOXML parts of files on disk (utils.ooxml), spread over a process pool, so
+many decks can be processed while PowerPoint keeps serving the other tools.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+from utils import ooxml
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Pydantic input models
+# ---------------------------------------------------------------------------
+class OfflineReadInput(BaseModel):
+    """Input for reading closed .pptx files without PowerPoint."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    files: List[str] = Field(
+        ..., min_length=1,
+        description="Paths or glob patterns of .pptx/.pptm files (e.g. 'C:/reports/**/*.pptx')",
+    )
+    operation: Literal[ooxml.READ_OPERATIONS] = Field(
+        ...,
+        description=(
+            "'get_all_text' (pseudo-Markdown per slide), 'list_shapes', "
+            "'get_table_data' (all tables), 'get_chart_data' (all charts, cached values), "
+            "'list_comments'"
+        ),
+    )
+    slide_indices: Optional[List[int]] = Field(
+        default=None, description="1-based slides to read in every file. Omit for all slides.",
+    )
+    workers: Optional[int] = Field(
+        default=None, ge=1, le=64,
+        description="Worker processes (default PPT_OFFLINE_WORKERS or the CPU count)",
+    )
+    output_path: Optional[str] = Field(
+        default=None,
+        description=(
+            "Write the full JSON result to this file (UTF-8) and return only a "
+            "summary. Recommended for many files."
+        ),
+    )
+
+
+class OfflineEditInput(BaseModel):
+    """Input for editing closed .pptx files without PowerPoint."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    files: List[str] = Field(
+        ..., min_length=1, description="Paths or glob patterns of .pptx/.pptm files",
+    )
+    operations: List[dict] = Field(
+        ..., min_length=1,
+        description=(
+            "Applied in order to each file. Each is a dict with 'op': "
+            "{'op': 'replace_text', 'find': str, 'replace': str, 'match_case': bool} or "
+            "{'op': 'set_font', 'font_name': str, 'font_name_fareast': str, 'font_size': float} "
+            "(set_font needs at least one of its three fields)"
+        ),
+    )
+    slide_indices: Optional[List[int]] = Field(
+        default=None, description="1-based slides to edit in every file. Omit for all slides.",
+    )
+    include_notes: bool = Field(default=False, description="Also edit the speaker notes")
+    output_dir: Optional[str] = Field(
+        default=None,
+        description="Save edited copies here under their original names (directory must exist)",
+    )
+    in_place: bool = Field(
+        default=False, description="Overwrite the original files (required when output_dir is omitted)",
+    )
+    workers: Optional[int] = Field(
+        default=None, ge=1, le=64,
+        description="Worker processes (default PPT_OFFLINE_WORKERS or the CPU count)",
+    )
+
+    @model_validator(mode="after")
+    def validate_destination(self):
+        if self.output_dir is None and not self.in_place:
+            raise ValueError("Set output_dir for edited copies, or in_place=true to overwrite the files.")
+        if self.output_dir is not None and self.in_place:
+            raise ValueError("output_dir and in_place cannot be combined.")
+        for op in self.operations:
+            if op.get("op") not in ooxml.WRITE_OPERATIONS:
+                raise ValueError(
+                    f"Unknown operation {op.get('op')!r}. Allowed: {list(ooxml.WRITE_OPERATIONS)}"
+                )
+        return self
+
+
+# ---------------------------------------------------------------------------
+# Batch helpers (run in a worker thread; the pool runs in other processes)
+# ---------------------------------------------------------------------------
+def _summary(results: list) -> dict:
+    failed = [r for r in results if "error" in r]
+    return {
+        "files_count": len(results),
+        "succeeded": len(results) - len(failed),
+        "failed": len(failed),
+    }
+
+
+def _read_many(paths, operation, slide_indices, workers) -> list:
+    return ooxml.run_batch(
+        ooxml.read_file, paths, workers,
+        operation=operation, slide_indices=slide_indices,
+    )
+
+
+def _edit_many(paths, operations, slide_indices, include_notes, output_dir, workers) -> list:
+    if output_dir is not None:
+        names = [os.path.basename(p).lower() for p in paths]
+        duplicates = sorted({n for n in names if names.count(n) > 1})
+        if duplicates:
+            raise ValueError(f"Several files are named {duplicates[0]!r}; they would overwrite "
+                             "each other in output_dir")
+    return ooxml.run_batch(
+        ooxml.edit_file, paths, workers, operations=operations, output_dir=output_dir,
+        slide_indices=slide_indices, include_notes=include_notes,
+    )
+
+
+# ---------------------------------------------------------------------------
+# MCP tool functions
+# ---------------------------------------------------------------------------
+async def offline_read(params: OfflineReadInput) -> str:
+    """Read closed .pptx files without PowerPoint."""
+    try:
+        paths = ooxml.expand_paths(params.files)
+        if not paths:
+            return json.dumps({"error": f"No files match {params.files}"})
+        results = await asyncio.to_thread(
+            _read_many, paths, params.operation, params.slide_indices, params.workers,
+        )
+        result = {"operation": params.operation, **_summary(results)}
+        if params.output_path:
+            abs_path = os.path.abspath(params.output_path)
+            with open(abs_path, "w", encoding="utf-8") as f:
+                json.dump({**result, "results": results}, f, ensure_ascii=False, indent=1)
+            result["output_path"] = abs_path
+            result["errors"] = [r for r in results if "error" in r]
+            return json.dumps(result, ensure_ascii=False)
+        result["results"] = results
+        return json.dumps(result, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to read files: {str(e)}"})
+
+
+async def offline_edit(params: OfflineEditInput) -> str:
+    """Edit closed .pptx files without PowerPoint."""
+    try:
+        paths = ooxml.expand_paths(params.files)
+        if not paths:
+            return json.dumps({"error": f"No files match {params.files}"})
+        output_dir = os.path.abspath(params.output_dir) if params.output_dir else None
+        if output_dir is not None and not os.path.isdir(output_dir):
+            return json.dumps({"error": f"output_dir does not exist: {output_dir}"})
+        results = await asyncio.to_thread(
+            _edit_many, paths, params.operations, params.slide_indices,
+            params.include_notes, output_dir, params.workers,
+        )
+        return json.dumps({**_summary(results), "results": results}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to edit files: {str(e)}"})
+
+
+# ---------------------------------------------------------------------------
+# Tool registration
+# ---------------------------------------------------------------------------
+def register_tools(mcp):
+    """Register offline (file-based) tools with the MCP server."""
+
+    @mcp.tool(
+        name="ppt_offline_read",
+        annotations={
+            "title": "Read Closed PPTX Files",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_offline_read(params: OfflineReadInput) -> str:
+        """Read text, shapes, tables, charts or comments from closed .pptx files.
+
+        Works on files on disk without PowerPoint and in parallel worker
+        processes, so it suits bulk jobs (indexing, audits) across many decks
+        and does not wait behind other tools. For the presentation open in
+        PowerPoint, use the regular tools instead. One result per file; a
+        file that cannot be read gets an 'error' entry.
+        """
+        return await offline_read(params)
+
+    @mcp.tool(
+        name="ppt_offline_edit",
+        annotations={
+            "title": "Edit Closed PPTX Files",
+            "readOnlyHint": False,
+            "destructiveHint": True,
+            "idempotentHint": False,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_offline_edit(params: OfflineEditInput) -> str:
+        """Replace text or normalize fonts in closed .pptx files without PowerPoint.
+
+        Runs in parallel worker processes. Only the slide parts that change
+        are rewritten. Files open in PowerPoint are refused. Write copies
+        to output_dir, or set in_place=true to overwrite the originals.
+        """
+        return await offline_edit(params)
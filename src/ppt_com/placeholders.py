@@ -394,19 +394,19 @@ def _get_slide_master_info_impl(design_index) -> dict:
 # ---------------------------------------------------------------------------
 # MCP tool functions
 # ---------------------------------------------------------------------------
-def list_placeholders(params: ListPlaceholdersInput) -> str:
+async def list_placeholders(params: ListPlaceholdersInput) -> str:
     """List all placeholders on a slide."""
     try:
-        result = ppt.execute(_list_placeholders_impl, params.slide_index)
+        result = await ppt.execute_async(_list_placeholders_impl, params.slide_index)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def get_placeholder(params: GetPlaceholderInput) -> str:
+async def get_placeholder(params: GetPlaceholderInput) -> str:
     """Get placeholder content and formatting details."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_placeholder_impl,
             params.slide_index, params.placeholder_index, params.placeholder_type,
         )
@@ -415,10 +415,10 @@ def get_placeholder(params: GetPlaceholderInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def set_placeholder_text(params: SetPlaceholderTextInput) -> str:
+async def set_placeholder_text(params: SetPlaceholderTextInput) -> str:
     """Set text in a placeholder."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_placeholder_text_impl,
             params.slide_index, params.placeholder_index,
             params.placeholder_type, params.text,
@@ -428,28 +428,28 @@ def set_placeholder_text(params: SetPlaceholderTextInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def list_designs(params: ListDesignsInput) -> str:
+async def list_designs(params: ListDesignsInput) -> str:
     """List all designs (slide masters) in the presentation."""
     try:
-        result = ppt.execute(_list_designs_impl, params.include_layouts)
+        result = await ppt.execute_async(_list_designs_impl, params.include_layouts)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def list_layouts(params: ListLayoutsInput) -> str:
+async def list_layouts(params: ListLayoutsInput) -> str:
     """List available slide layouts."""
     try:
-        result = ppt.execute(_list_layouts_impl, params.design_index)
+        result = await ppt.execute_async(_list_layouts_impl, params.design_index)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def get_slide_master_info(params: GetSlideMasterInfoInput) -> str:
+async def get_slide_master_info(params: GetSlideMasterInfoInput) -> str:
     """Get slide master information including theme colors."""
     try:
-        result = ppt.execute(_get_slide_master_info_impl, params.design_index)
+        result = await ppt.execute_async(_get_slide_master_info_impl, params.design_index)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -477,7 +477,7 @@ def register_tools(mcp):
         Returns index, type, name, position, size, and text preview
         for each placeholder on the specified slide.
         """
-        return list_placeholders(params)
+        return await list_placeholders(params)
 
     @mcp.tool(
         name="ppt_get_placeholder",
@@ -496,7 +496,7 @@ def register_tools(mcp):
         (e.g. 'title', 'body', 'subtitle', or a PpPlaceholderType int).
         Returns text content, formatting, and position info.
         """
-        return get_placeholder(params)
+        return await get_placeholder(params)
 
     @mcp.tool(
         name="ppt_set_placeholder_text",
@@ -514,7 +514,7 @@ def register_tools(mcp):
         Find by placeholder_index (1-based) or placeholder_type
         (e.g. 'title', 'body', 'subtitle'). Use \\n for paragraph breaks.
         """
-        return set_placeholder_text(params)
+        return await set_placeholder_text(params)
 
     @mcp.tool(
         name="ppt_list_designs",
@@ -533,7 +533,7 @@ def register_tools(mcp):
         Use the design_index with ppt_add_slide or ppt_list_layouts
         to work with layouts from a specific design.
         """
-        return list_designs(params)
+        return await list_designs(params)
 
     @mcp.tool(
         name="ppt_list_layouts",
@@ -551,7 +551,7 @@ def register_tools(mcp):
         Returns layout name, index, and placeholder info for each
         CustomLayout in the specified design (master).
         """
-        return list_layouts(params)
+        return await list_layouts(params)
 
     @mcp.tool(
         name="ppt_get_slide_master_info",
@@ -569,4 +569,4 @@ def register_tools(mcp):
         Returns the master name, layout count, and theme color scheme
         for the specified design.
         """
-        return get_slide_master_info(params)
+        return await get_slide_master_info(params)
@@ -516,6 +516,8 @@ def _close_presentation_impl(
         pres.Saved = True
 
     pres.Close()
+    # The closed deck may be the cached target handle.
+    ppt._invalidate_handles()
     return {"success": True, "closed": name}
 
 
@@ -702,10 +704,10 @@ def _list_templates_impl(templates_dir: Optional[str]) -> dict:
 # ---------------------------------------------------------------------------
 # MCP tool functions (return JSON strings)
 # ---------------------------------------------------------------------------
-def create_presentation(params: CreatePresentationInput) -> str:
+async def create_presentation(params: CreatePresentationInput) -> str:
     """Create a new presentation, optionally from a template."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _create_presentation_impl,
             params.template_path,
             params.slide_width,
@@ -718,10 +720,10 @@ def create_presentation(params: CreatePresentationInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def open_presentation(params: OpenPresentationInput) -> str:
+async def open_presentation(params: OpenPresentationInput) -> str:
     """Open an existing presentation file."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _open_presentation_impl,
             params.file_path,
             params.read_only,
@@ -733,10 +735,10 @@ def open_presentation(params: OpenPresentationInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def save_presentation(params: SavePresentationInput) -> str:
+async def save_presentation(params: SavePresentationInput) -> str:
     """Save the active or specified presentation."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _save_presentation_impl,
             params.presentation_index,
             params.presentation_name,
@@ -746,10 +748,10 @@ def save_presentation(params: SavePresentationInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def save_presentation_as(params: SavePresentationAsInput) -> str:
+async def save_presentation_as(params: SavePresentationAsInput) -> str:
     """Save a presentation with a new name and/or format."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _save_presentation_as_impl,
             params.file_path,
             params.format,
@@ -761,10 +763,10 @@ def save_presentation_as(params: SavePresentationAsInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def close_presentation(params: ClosePresentationInput) -> str:
+async def close_presentation(params: ClosePresentationInput) -> str:
     """Close a presentation, optionally saving first."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _close_presentation_impl,
             params.save_changes,
             params.presentation_index,
@@ -775,10 +777,10 @@ def close_presentation(params: ClosePresentationInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def get_presentation_info(params: GetPresentationInfoInput) -> str:
+async def get_presentation_info(params: GetPresentationInfoInput) -> str:
     """Get detailed info about a presentation."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_presentation_info_impl,
             params.presentation_index,
             params.presentation_name,
@@ -788,10 +790,10 @@ def get_presentation_info(params: GetPresentationInfoInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def activate_presentation(params: ActivatePresentationInput) -> str:
+async def activate_presentation(params: ActivatePresentationInput) -> str:
     """Activate a presentation as the MCP session target."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _activate_presentation_impl,
             params.presentation_index,
             params.presentation_name,
@@ -842,7 +844,7 @@ def register_tools(mcp):
         clicks into another window. Pass `activate=false` to keep the
         existing target.
         """
-        return create_presentation(params)
+        return await create_presentation(params)
 
     @mcp.tool(
         name="ppt_open_presentation",
@@ -865,7 +867,7 @@ def register_tools(mcp):
         so subsequent tool calls operate on it even if the user clicks into
         another window. Pass `activate=false` to keep the existing target.
         """
-        return open_presentation(params)
+        return await open_presentation(params)
 
     @mcp.tool(
         name="ppt_save_presentation",
@@ -883,7 +885,7 @@ def register_tools(mcp):
         This overwrites the existing file. Use ppt_save_presentation_as to
         save to a new location or format.
         """
-        return save_presentation(params)
+        return await save_presentation(params)
 
     @mcp.tool(
         name="ppt_save_presentation_as",
@@ -902,7 +904,7 @@ def register_tools(mcp):
         Note: SaveAs changes the presentation's name to the new path.
         For image formats (png/jpg), a folder of individual slide images is created.
         """
-        return save_presentation_as(params)
+        return await save_presentation_as(params)
 
     @mcp.tool(
         name="ppt_close_presentation",
@@ -921,7 +923,7 @@ def register_tools(mcp):
         If save_changes=false (default), unsaved changes are discarded without
         prompting the user.
         """
-        return close_presentation(params)
+        return await close_presentation(params)
 
     @mcp.tool(
         name="ppt_get_presentation_info",
@@ -943,7 +945,7 @@ def register_tools(mcp):
         save status, template name, default fonts (title/body,
         Latin/East Asian), and accent colors (accent1–accent6).
         """
-        return get_presentation_info(params)
+        return await get_presentation_info(params)
 
     @mcp.tool(
         name="ppt_activate_presentation",
@@ -968,7 +970,7 @@ def register_tools(mcp):
 
         Returns the name, full path, and 1-based index of the activated presentation.
         """
-        return activate_presentation(params)
+        return await activate_presentation(params)
 
     @mcp.tool(
         name="ppt_list_templates",
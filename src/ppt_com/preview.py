@@ -0,0 +1,454 @@
+"""Slide preview images with a content-fingerprint cache.
+
+ppt_get_slide_preview returns one slide as an image; ppt_get_slides_preview
+returns several in one call, either as separate images or composed into a
+single contact sheet.
+
+A preview is produced in stages so the COM thread only does COM work:
+
+1. COM: resolve slide ids and fingerprint each slide's content from a shape
+   snapshot (geometry, text, fill, line, font) plus its background/layout.
+2. I/O pool: look the images up in the preview cache (utils.preview_cache).
+3. COM: Slide.Export only the slides that missed, in one hop, to unique
+   temp files.
+4. I/O pool: read the files, store them in the cache and, for a contact
+   sheet, compose the grid with GDI+.
+
+The fingerprint also covers table cell text, chart series data and SmartArt
+node text. Every write job on the COM thread (any tool outside the read-only
+and bulk lanes) drops the cached previews of the presentation it worked on,
+so the tools' own edits never show a stale image. Edits made by hand in
+PowerPoint are only seen through the fingerprint, which misses some
+properties (e.g. a color change on part of a paragraph); pass
+use_cache=false to force a fresh export.
+"""
+
+import ctypes
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import List, Literal, Optional
+
+from mcp.server.fastmcp import Image
+from pydantic import BaseModel, Field, ConfigDict
+
+from utils.com_wrapper import ppt
+from utils.http_fetch import run_io
+from utils.navigation import goto_slide
+from utils.preview_cache import preview_cache, preview_key
+from ppt_com import snapshot
+from ppt_com.text import _table_to_markdown
+
+logger = logging.getLogger(__name__)
+
+_FILTER_NAMES = {"png": "PNG", "jpg": "JPG"}
+_MAX_SLIDES_PER_CALL = 60
+_SHEET_GAP = 8  # px between contact sheet tiles
+_SHEET_BACKGROUND = 0xFFD9D9D9  # ARGB light gray
+
+
+# ---------------------------------------------------------------------------
+# Pydantic input models
+# ---------------------------------------------------------------------------
+class GetSlidePreviewInput(BaseModel):
+    """Input for previewing one slide."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    slide_index: int = Field(1, ge=1, description="1-based slide index")
+    width: Optional[int] = Field(
+        default=None, ge=160, le=4096,
+        description=(
+            "Image width in pixels (height follows the slide's aspect ratio). "
+            "Smaller images are cheaper to send; omit for PowerPoint's default size."
+        ),
+    )
+    format: Literal["png", "jpg"] = Field(
+        default="png", description="Image format: 'png' (sharp text) or 'jpg' (smaller)",
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Serve unchanged slides from the preview cache. Set false to force a fresh render.",
+    )
+
+
+class GetSlidesPreviewInput(BaseModel):
+    """Input for previewing several slides in one call."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    slide_indices: Optional[List[int]] = Field(
+        default=None,
+        max_length=_MAX_SLIDES_PER_CALL,
+        description=(
+            f"1-based slide indices to preview, in order. Omit for all slides "
+            f"(up to {_MAX_SLIDES_PER_CALL})."
+        ),
+    )
+    width: int = Field(
+        default=480, ge=160, le=1920,
+        description="Width in pixels of each slide image (height follows the aspect ratio).",
+    )
+    layout: Literal["contact_sheet", "images"] = Field(
+        default="contact_sheet",
+        description=(
+            "'contact_sheet' composes all slides into one grid image (row by row, "
+            "in slide_indices order); 'images' returns one image per slide."
+        ),
+    )
+    columns: int = Field(
+        default=3, ge=1, le=8, description="Contact sheet columns",
+    )
+    format: Literal["png", "jpg"] = Field(
+        default="png", description="Image format: 'png' (sharp text) or 'jpg' (smaller)",
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Serve unchanged slides from the preview cache. Set false to force a fresh render.",
+    )
+
+
+# ---------------------------------------------------------------------------
+# COM stage
+# ---------------------------------------------------------------------------
+def _content_records(snaps) -> list:
+    """Content the shape snapshot does not read: table cells, chart data, SmartArt text."""
+    records = []
+    for snap in snaps:
+        shape = snap.pop("com")
+        try:
+            if snap.get("has_table"):
+                records.append([snap["id"], "table", _table_to_markdown(shape)])
+            elif shape.HasChart:
+                chart = shape.Chart
+                series = chart.SeriesCollection()
+                for i in range(1, series.Count + 1):
+                    ser = chart.SeriesCollection(i)
+                    records.append([snap["id"], "chart", ser.Name, list(ser.Values), list(ser.XValues)])
+            elif shape.HasSmartArt:
+                nodes = shape.SmartArt.AllNodes
+                records.append([snap["id"], "smartart", [
+                    nodes(i).TextFrame2.TextRange.Text for i in range(1, nodes.Count + 1)
+                ]])
+        except Exception:
+            logger.debug("Cannot read the content of '%s' for its fingerprint", snap["name"],
+                         exc_info=True)
+        records += _content_records(snap.get("children", []))
+    return records
+
+
+def _slide_fingerprint(slide) -> str:
+    """Hash of everything about the slide a preview is likely to show."""
+    shapes = snapshot.snapshot_slide(slide, snapshot.FULL, include_group_items=True, keep_com=True)
+    extra = {"content": _content_records(shapes)}
+    try:
+        extra["follow_master_background"] = slide.FollowMasterBackground
+        fill = slide.Background.Fill
+        extra["background"] = [fill.Type, fill.ForeColor.RGB]
+    except Exception:
+        pass
+    try:
+        extra["layout"] = slide.CustomLayout.Name
+    except Exception:
+        pass
+    raw = json.dumps([shapes, extra], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _preview_plan_impl(slide_indices, width, fmt, use_cache, navigate):
+    """Resolve slide ids, output size and (when caching) cache keys."""
+    app = ppt._get_app_impl()
+    pres = ppt._get_pres_impl()
+    count = pres.Slides.Count
+    if slide_indices is None:
+        slide_indices = list(range(1, min(count, _MAX_SLIDES_PER_CALL) + 1))
+    for idx in slide_indices:
+        if idx < 1 or idx > count:
+            raise ValueError(f"Slide index {idx} out of range (1-{count})")
+    if navigate:
+        goto_slide(app, slide_indices[0])
+
+    height = None
+    if width is not None:
+        setup = pres.PageSetup
+        height = round(width * setup.SlideHeight / setup.SlideWidth)
+    pres_name = pres.FullName
+
+    entries = []
+    for idx in slide_indices:
+        slide = pres.Slides(idx)
+        entry = {"slide_index": idx, "slide_id": slide.SlideID, "key": None, "pres": pres_name}
+        if use_cache:
+            entry["key"] = preview_key(
+                pres_name, entry["slide_id"], _slide_fingerprint(slide), width, height, fmt,
+            )
+        entries.append(entry)
+    return {"width": width, "height": height, "entries": entries}
+
+
+def _export_slides_impl(jobs, width, height, fmt):
+    """Export (slide_id, path) pairs; ids survive slides being reordered."""
+    pres = ppt._get_pres_impl()
+    filter_name = _FILTER_NAMES[fmt]
+    for slide_id, path in jobs:
+        slide = pres.Slides.FindBySlideID(slide_id)
+        # Slide.Export positional args: FileName, FilterName, ScaleWidth, ScaleHeight
+        if width is not None:
+            slide.Export(path, filter_name, width, height)
+        else:
+            slide.Export(path, filter_name)
+
+
+# ---------------------------------------------------------------------------
+# I/O stage
+# ---------------------------------------------------------------------------
+def _lookup_cached(entries, fmt) -> None:
+    for entry in entries:
+        entry["data"] = preview_cache.get(entry["key"], fmt, entry["pres"]) if entry["key"] else None
+        entry["cached"] = entry["data"] is not None
+
+
+def _collect_exports(entries, fmt, tmp_dir) -> None:
+    try:
+        for entry in entries:
+            with open(entry["path"], "rb") as f:
+                entry["data"] = f.read()
+            if entry["key"]:
+                preview_cache.put(entry["key"], fmt, entry["data"], entry["pres"])
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+async def _render_slides(slide_indices, width, fmt, use_cache, navigate=False) -> dict:
+    """Return the plan with entry["data"] (image bytes) filled for every slide."""
+    plan = await ppt.execute_async(
+        _preview_plan_impl, slide_indices, width, fmt, use_cache, navigate,
+    )
+    entries = plan["entries"]
+    await run_io(_lookup_cached, entries, fmt)
+    misses = [e for e in entries if e["data"] is None]
+    if misses:
+        tmp_dir = tempfile.mkdtemp(prefix="ppt_preview_")
+        for e in misses:
+            e["path"] = os.path.join(tmp_dir, f"slide_{e['slide_id']}.{fmt}")
+        try:
+            await ppt.execute_async(
+                _export_slides_impl,
+                [(e["slide_id"], e["path"]) for e in misses],
+                plan["width"], plan["height"], fmt,
+            )
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        await run_io(_collect_exports, misses, fmt, tmp_dir)
+    return plan
+
+
+# ---------------------------------------------------------------------------
+# Contact sheet (GDI+, no COM)
+# ---------------------------------------------------------------------------
+_ENCODER_CLSIDS = {
+    "png": "{557CF406-1A04-11D3-9A73-0000F81EF32E}",
+    "jpg": "{557CF401-1A04-11D3-9A73-0000F81EF32E}",
+}
+_PIXEL_FORMAT_32BPP_ARGB = 0x0026200A
+_INTERPOLATION_HIGH_QUALITY_BICUBIC = 7
+
+
+def _compose_contact_sheet(paths, columns, tile_w, tile_h, out_path, fmt) -> None:
+    """Draw the images at paths into a grid and save it to out_path.
+
+    Uses GDI+ through ctypes (as export._png_to_dib does) so no imaging
+    library is required.
+    """
+    from ctypes import byref, c_int, c_uint, c_void_p
+
+    gdiplus = ctypes.windll.gdiplus
+    ole32 = ctypes.windll.ole32
+
+    class GdiplusStartupInput(ctypes.Structure):
+        _fields_ = [
+            ("GdiplusVersion", c_uint),
+            ("DebugEventCallback", c_void_p),
+            ("SuppressBackgroundThread", c_int),
+            ("SuppressExternalCodecs", c_int),
+        ]
+
+    class GUID(ctypes.Structure):
+        _fields_ = [
+            ("Data1", ctypes.c_ulong),
+            ("Data2", ctypes.c_ushort),
+            ("Data3", ctypes.c_ushort),
+            ("Data4", ctypes.c_ubyte * 8),
+        ]
+
+    def check(status, what):
+        if status != 0:
+            raise RuntimeError(f"GDI+ {what} failed: status {status}")
+
+    rows = (len(paths) + columns - 1) // columns
+    cols = min(columns, len(paths))
+    sheet_w = cols * tile_w + (cols + 1) * _SHEET_GAP
+    sheet_h = rows * tile_h + (rows + 1) * _SHEET_GAP
+
+    token = ctypes.c_ulong()
+    startup_input = GdiplusStartupInput(1, None, 0, 0)
+    check(gdiplus.GdiplusStartup(byref(token), byref(startup_input), None), "startup")
+    try:
+        sheet = c_void_p()
+        check(gdiplus.GdipCreateBitmapFromScan0(
+            sheet_w, sheet_h, 0, _PIXEL_FORMAT_32BPP_ARGB, None, byref(sheet),
+        ), "CreateBitmapFromScan0")
+        try:
+            graphics = c_void_p()
+            check(gdiplus.GdipGetImageGraphicsContext(sheet, byref(graphics)), "GetImageGraphicsContext")
+            try:
+                gdiplus.GdipGraphicsClear(graphics, c_uint(_SHEET_BACKGROUND))
+                gdiplus.GdipSetInterpolationMode(graphics, _INTERPOLATION_HIGH_QUALITY_BICUBIC)
+                for n, path in enumerate(paths):
+                    x = _SHEET_GAP + (n % columns) * (tile_w + _SHEET_GAP)
+                    y = _SHEET_GAP + (n // columns) * (tile_h + _SHEET_GAP)
+                    image = c_void_p()
+                    check(gdiplus.GdipLoadImageFromFile(ctypes.c_wchar_p(path), byref(image)),
+                          "LoadImageFromFile")
+                    try:
+                        check(gdiplus.GdipDrawImageRectI(graphics, image, x, y, tile_w, tile_h),
+                              "DrawImageRectI")
+                    finally:
+                        gdiplus.GdipDisposeImage(image)
+            finally:
+                gdiplus.GdipDeleteGraphics(graphics)
+
+            clsid = GUID()
+            ole32.CLSIDFromString(ctypes.c_wchar_p(_ENCODER_CLSIDS[fmt]), byref(clsid))
+            check(gdiplus.GdipSaveImageToFile(sheet, ctypes.c_wchar_p(out_path), byref(clsid), None),
+                  "SaveImageToFile")
+        finally:
+            gdiplus.GdipDisposeImage(sheet)
+    finally:
+        gdiplus.GdiplusShutdown(token)
+
+
+def _build_contact_sheet(entries, columns, tile_w, tile_h, fmt) -> bytes:
+    tmp_dir = tempfile.mkdtemp(prefix="ppt_sheet_")
+    try:
+        paths = []
+        for n, entry in enumerate(entries):
+            path = os.path.join(tmp_dir, f"{n}.{fmt}")
+            with open(path, "wb") as f:
+                f.write(entry["data"])
+            paths.append(path)
+        out_path = os.path.join(tmp_dir, f"sheet.{fmt}")
+        _compose_contact_sheet(paths, columns, tile_w, tile_h, out_path, fmt)
+        with open(out_path, "rb") as f:
+            return f.read()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# Tool functions
+# ---------------------------------------------------------------------------
+async def get_slide_preview(params: GetSlidePreviewInput) -> Image:
+    """Render one slide (cached by content fingerprint) and navigate to it."""
+    plan = await _render_slides(
+        [params.slide_index], params.width, params.format, params.use_cache, navigate=True,
+    )
+    return Image(data=plan["entries"][0]["data"], format=params.format)
+
+
+async def get_slides_preview(params: GetSlidesPreviewInput) -> list:
+    """Render several slides in one call; see GetSlidesPreviewInput.
+
+    Returns:
+        [JSON summary, image, ...] — one image for a contact sheet, otherwise
+        one per slide in the requested order.
+    """
+    try:
+        plan = await _render_slides(
+            params.slide_indices, params.width, params.format, params.use_cache,
+        )
+    except Exception as e:
+        return [json.dumps({"error": f"Failed to preview slides: {str(e)}"})]
+
+    entries = plan["entries"]
+    summary = {
+        "success": True,
+        "slides": [
+            {"slide_index": e["slide_index"], "slide_id": e["slide_id"], "cached": e["cached"]}
+            for e in entries
+        ],
+        "width": plan["width"],
+        "height": plan["height"],
+        "layout": params.layout,
+        "cache": preview_cache.stats(),
+    }
+    if params.layout == "contact_sheet" and entries:
+        try:
+            sheet = await run_io(
+                _build_contact_sheet, entries, params.columns,
+                plan["width"], plan["height"], params.format,
+            )
+            summary["columns"] = min(params.columns, len(entries))
+            return [json.dumps(summary), Image(data=sheet, format=params.format)]
+        except Exception as e:
+            logger.warning("Contact sheet composition failed (%s); returning separate images", e)
+            summary["layout"] = "images"
+            summary["contact_sheet_error"] = str(e)
+    return [json.dumps(summary)] + [Image(data=e["data"], format=params.format) for e in entries]
+
+
+# ---------------------------------------------------------------------------
+# Registration
+# ---------------------------------------------------------------------------
+def register_tools(mcp):
+    """Register slide preview tools with the FastMCP server."""
+
+    @mcp.tool(
+        name="ppt_get_slide_preview",
+        annotations={
+            "title": "Get Slide Preview Image",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_get_slide_preview(params: GetSlidePreviewInput) -> Image:
+        """Get a visual preview of a PowerPoint slide as an image.
+
+        This is the RECOMMENDED way to visually inspect slides for appearance, design,
+        layout, colors, text readability, and overall quality. Much more efficient
+        than exporting all slides to files.
+
+        Also navigates the PowerPoint editor window to the target slide so the user
+        can see which slide is being inspected.
+
+        Unchanged slides are served from a cache. Pass width (e.g. 640) for a
+        smaller image, or use_cache=false if a change is not reflected.
+
+        Returns:
+            Image: PNG (or JPG) image of the slide for visual inspection
+        """
+        return await get_slide_preview(params)
+
+    @mcp.tool(
+        name="ppt_get_slides_preview",
+        annotations={
+            "title": "Get Multi-Slide Preview",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": True,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_get_slides_preview(params: GetSlidesPreviewInput) -> list:
+        """Preview several slides (or the whole deck) in one call.
+
+        By default returns one contact sheet image: slides laid out row by row
+        in the requested order, plus a JSON summary listing them. Use
+        layout='images' for one image per slide. Good for reviewing overall
+        consistency; use ppt_get_slide_preview for a detailed look at one slide.
+        """
+        return await get_slides_preview(params)
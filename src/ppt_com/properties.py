@@ -104,7 +104,7 @@ def _get_properties_impl():
 # ---------------------------------------------------------------------------
 # MCP tool functions (async wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def set_properties(params: SetPropertiesInput) -> str:
+async def set_properties(params: SetPropertiesInput) -> str:
     """Set built-in document properties.
 
     Args:
@@ -114,7 +114,7 @@ def set_properties(params: SetPropertiesInput) -> str:
         JSON with count of properties set and their names.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_properties_impl,
             params.title, params.author, params.subject,
             params.keywords, params.comments, params.category,
@@ -125,14 +125,14 @@ def set_properties(params: SetPropertiesInput) -> str:
         return json.dumps({"error": f"Failed to set properties: {str(e)}"})
 
 
-def get_properties() -> str:
+async def get_properties() -> str:
     """Get built-in document properties.
 
     Returns:
         JSON with all readable document properties.
     """
     try:
-        result = ppt.execute(_get_properties_impl)
+        result = await ppt.execute_async(_get_properties_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to get properties: {str(e)}"})
@@ -160,7 +160,7 @@ def register_tools(mcp):
         Updates title, author, subject, keywords, comments, category,
         and/or company. Only provided values are changed.
         """
-        return set_properties(params)
+        return await set_properties(params)
 
     @mcp.tool(
         name="ppt_get_properties",
@@ -179,4 +179,4 @@ def register_tools(mcp):
         company, last author, creation date, and last save time.
         Properties that have never been set return null.
         """
-        return get_properties()
+        return await get_properties()
@@ -128,7 +128,7 @@ def _manage_section_impl(section_index, action, new_name, move_to_index):
 # ---------------------------------------------------------------------------
 # MCP tool functions (async wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def add_section(params: AddSectionInput) -> str:
+async def add_section(params: AddSectionInput) -> str:
     """Add a section to the presentation.
 
     Args:
@@ -138,7 +138,7 @@ def add_section(params: AddSectionInput) -> str:
         JSON with section index and name.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_section_impl,
             params.name, params.slide_index,
         )
@@ -147,20 +147,20 @@ def add_section(params: AddSectionInput) -> str:
         return json.dumps({"error": f"Failed to add section: {str(e)}"})
 
 
-def list_sections() -> str:
+async def list_sections() -> str:
     """List all sections in the active presentation.
 
     Returns:
         JSON with sections count and list of section details.
     """
     try:
-        result = ppt.execute(_list_sections_impl)
+        result = await ppt.execute_async(_list_sections_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to list sections: {str(e)}"})
 
 
-def manage_section(params: ManageSectionInput) -> str:
+async def manage_section(params: ManageSectionInput) -> str:
     """Manage a section: rename, move, or delete.
 
     Args:
@@ -170,7 +170,7 @@ def manage_section(params: ManageSectionInput) -> str:
         JSON confirming the action performed.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _manage_section_impl,
             params.section_index, params.action,
             params.new_name, params.move_to_index,
@@ -202,7 +202,7 @@ def register_tools(mcp):
         Creates a new section starting at the specified slide.
         Sections group slides for organizational purposes.
         """
-        return add_section(params)
+        return await add_section(params)
 
     @mcp.tool(
         name="ppt_list_sections",
@@ -219,7 +219,7 @@ def register_tools(mcp):
 
         Returns section name, first slide index, and slide count for each section.
         """
-        return list_sections()
+        return await list_sections()
 
     @mcp.tool(
         name="ppt_manage_section",
@@ -239,4 +239,4 @@ def register_tools(mcp):
         - 'move': Move section to a new position (requires move_to_index).
         - 'delete': Remove the section without deleting its slides.
         """
-        return manage_section(params)
+        return await manage_section(params)
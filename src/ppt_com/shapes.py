@@ -6,19 +6,18 @@ and z-order management on PowerPoint slides.
 
 import json
 import logging
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
-from utils.color import hex_to_int, int_to_hex
+from utils.color import hex_to_int
 from utils.com_wrapper import ppt
 from utils.navigation import goto_slide
 from utils.redraw import FrozenRedraw
 from utils.validation import font_size_warning
+from ppt_com import snapshot
 from ppt_com.constants import (
-    SHAPE_TYPE_NAMES,
     msoTrue, msoFalse,
-    msoGroup,
     msoTextOrientationHorizontal,
     msoBringToFront, msoSendToBack, msoBringForward, msoSendBackward,
     GRADIENT_STYLE_MAP,
@@ -335,6 +334,14 @@ class ListShapesInput(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
 
     slide_index: int = Field(..., ge=1, description="1-based slide index")
+    depth: Literal["geometry", "text", "full"] = Field(
+        default="text",
+        description=(
+            "How much to read per shape: 'geometry' (name, type, position, size — "
+            "fastest), 'text' (+ text preview, default) or 'full' (+ rotation, "
+            "fill, line, font)."
+        ),
+    )
 
 
 class ShapeIdentifierInput(BaseModel):
@@ -677,40 +684,31 @@ def _add_line_impl(slide_index, begin_x, begin_y, end_x, end_y):
     }
 
 
-def _list_shapes_impl(slide_index):
-    app = ppt._get_app_impl()
+def _shape_summary(snap):
+    """Public (JSON) form of a snapshot: rounded geometry, no COM reference."""
+    out = {k: v for k, v in snap.items() if k not in ("com", "text", "children")}
+    if out.get("index") is None:
+        out.pop("index", None)
+    for key in ("left", "top", "width", "height", "rotation"):
+        if key in out:
+            out[key] = round(out[key], 2)
+    return out
+
+
+def _list_shapes_impl(slide_index, depth=snapshot.TEXT):
     pres = ppt._get_pres_impl()
     slide = pres.Slides(slide_index)
     shapes = []
-    for i in range(1, slide.Shapes.Count + 1):
-        shape = slide.Shapes(i)
-        has_text = False
-        text_preview = ""
-        try:
-            if shape.HasTextFrame:
-                has_text = True
-                if shape.TextFrame.HasText:
-                    full_text = shape.TextFrame.TextRange.Text
-                    text_preview = full_text[:50] + ("..." if len(full_text) > 50 else "")
-        except Exception:
-            pass
-
-        shapes.append({
-            "index": i,
-            "name": shape.Name,
-            "id": shape.Id,
-            "type": shape.Type,
-            "type_name": SHAPE_TYPE_NAMES.get(shape.Type, f"Unknown({shape.Type})"),
-            "left": round(shape.Left, 2),
-            "top": round(shape.Top, 2),
-            "width": round(shape.Width, 2),
-            "height": round(shape.Height, 2),
-            "has_text": has_text,
-            "text_preview": text_preview,
-        })
+    for snap in snapshot.snapshot_slide(slide, depth):
+        info = _shape_summary(snap)
+        if depth != snapshot.GEOMETRY:
+            full_text = snap["text"] or ""
+            info["has_text"] = info.pop("has_text_frame")
+            info["text_preview"] = full_text[:50] + ("..." if len(full_text) > 50 else "")
+        shapes.append(info)
     return {
         "slide_index": slide_index,
-        "shapes_count": slide.Shapes.Count,
+        "shapes_count": len(shapes),
         "shapes": shapes,
     }
 
@@ -721,87 +719,21 @@ def _get_shape_info_impl(slide_index, shape_name, shape_index):
     slide = pres.Slides(slide_index)
     shape = _get_shape(slide, None, shape_name=shape_name, shape_index=shape_index)
 
-    info = {
-        "name": shape.Name,
-        "id": shape.Id,
-        "type": shape.Type,
-        "type_name": SHAPE_TYPE_NAMES.get(shape.Type, f"Unknown({shape.Type})"),
-        "left": round(shape.Left, 2),
-        "top": round(shape.Top, 2),
-        "width": round(shape.Width, 2),
-        "height": round(shape.Height, 2),
-        "rotation": round(shape.Rotation, 2),
-        "z_order": shape.ZOrderPosition,
-        "is_group": shape.Type == msoGroup,
-        "has_animation": False,
-        "aspect_ratio_locked": False,
-        "text": None,
-        "fill": None,
-        "line": None,
-    }
+    snap = snapshot.snapshot_shape(shape, snapshot.FULL)
+    info = _shape_summary(snap)
+    info["has_animation"] = False
+    info["text"] = snap["text"]
 
     # Animation check
     try:
         seq = slide.TimeLine.MainSequence
         for i in range(1, seq.Count + 1):
-            if seq(i).Shape.Id == shape.Id:
+            if seq(i).Shape.Id == snap["id"]:
                 info["has_animation"] = True
                 break
     except Exception:
         pass
 
-    # Aspect ratio lock
-    try:
-        info["aspect_ratio_locked"] = shape.LockAspectRatio == msoTrue
-    except Exception:
-        pass
-
-    # Text content
-    try:
-        if shape.HasTextFrame and shape.TextFrame.HasText:
-            info["text"] = shape.TextFrame.TextRange.Text
-    except Exception:
-        pass
-
-    # Fill info
-    try:
-        fill = shape.Fill
-        info["fill"] = {
-            "type": fill.Type,
-            "visible": bool(fill.Visible),
-        }
-        try:
-            info["fill"]["color_hex"] = int_to_hex(fill.ForeColor.RGB)
-        except Exception:
-            pass
-        try:
-            info["fill"]["transparency"] = round(fill.Transparency, 2)
-        except Exception:
-            pass
-    except Exception:
-        pass
-
-    # Line info
-    try:
-        line = shape.Line
-        info["line"] = {
-            "visible": bool(line.Visible),
-        }
-        try:
-            info["line"]["weight"] = round(line.Weight, 2)
-        except Exception:
-            pass
-        try:
-            info["line"]["color_hex"] = int_to_hex(line.ForeColor.RGB)
-        except Exception:
-            pass
-        try:
-            info["line"]["dash_style"] = line.DashStyle
-        except Exception:
-            pass
-    except Exception:
-        pass
-
     # Connector info
     try:
         cf = shape.ConnectorFormat
@@ -957,7 +889,7 @@ def _set_zorder_impl(slide_index, shape_name, shape_index, z_order_cmd):
 # ---------------------------------------------------------------------------
 # MCP tool functions
 # ---------------------------------------------------------------------------
-def add_shape(params: AddShapeInput) -> str:
+async def add_shape(params: AddShapeInput) -> str:
     """Add an auto shape to a slide.
 
     Supports rectangles, ovals, arrows, stars, flowchart shapes, and more.
@@ -971,7 +903,7 @@ def add_shape(params: AddShapeInput) -> str:
     """
     try:
         shape_type_int = _resolve_shape_type(params.shape_type)
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_shape_impl,
             params.slide_index, shape_type_int,
             params.left, params.top, params.width, params.height,
@@ -991,7 +923,7 @@ def add_shape(params: AddShapeInput) -> str:
         return json.dumps({"error": f"Failed to add shape: {str(e)}"})
 
 
-def add_textbox(params: AddTextboxInput) -> str:
+async def add_textbox(params: AddTextboxInput) -> str:
     """Add a text box to a slide.
 
     Creates a horizontal text box at the specified position and size.
@@ -1003,7 +935,7 @@ def add_textbox(params: AddTextboxInput) -> str:
         JSON with shape name and index of the created text box.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_textbox_impl,
             params.slide_index,
             params.left, params.top, params.width, params.height,
@@ -1020,7 +952,7 @@ def add_textbox(params: AddTextboxInput) -> str:
         return json.dumps({"error": f"Failed to add textbox: {str(e)}"})
 
 
-def add_picture(params: AddPictureInput) -> str:
+async def add_picture(params: AddPictureInput) -> str:
     """Add an image from a file path to a slide.
 
     The image is embedded in the presentation. If width/height are not
@@ -1033,7 +965,7 @@ def add_picture(params: AddPictureInput) -> str:
         JSON with shape name, index, and actual dimensions of the inserted image.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_picture_impl,
             params.slide_index, params.file_path,
             params.left, params.top, params.width, params.height,
@@ -1043,7 +975,7 @@ def add_picture(params: AddPictureInput) -> str:
         return json.dumps({"error": f"Failed to add picture: {str(e)}"})
 
 
-def add_line(params: AddLineInput) -> str:
+async def add_line(params: AddLineInput) -> str:
     """Add a line to a slide.
 
     Creates a straight line from the begin point to the end point.
@@ -1055,7 +987,7 @@ def add_line(params: AddLineInput) -> str:
         JSON with shape name and index of the created line.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_line_impl,
             params.slide_index,
             params.begin_x, params.begin_y, params.end_x, params.end_y,
@@ -1065,7 +997,7 @@ def add_line(params: AddLineInput) -> str:
         return json.dumps({"error": f"Failed to add line: {str(e)}"})
 
 
-def list_shapes(params: ListShapesInput) -> str:
+async def list_shapes(params: ListShapesInput) -> str:
     """List all shapes on a slide.
 
     Returns an array of shapes with their name, id, type, position, size,
@@ -1074,19 +1006,19 @@ def list_shapes(params: ListShapesInput) -> str:
     backmost shape, the highest index is the frontmost shape.
 
     Args:
-        params: Slide index to list shapes from.
+        params: Slide index to list shapes from and snapshot depth.
 
     Returns:
         JSON with shapes count and array of shape info objects.
     """
     try:
-        result = ppt.execute(_list_shapes_impl, params.slide_index)
+        result = await ppt.execute_async(_list_shapes_impl, params.slide_index, params.depth)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to list shapes: {str(e)}"})
 
 
-def get_shape_info(params: ShapeIdentifierInput) -> str:
+async def get_shape_info(params: ShapeIdentifierInput) -> str:
     """Get detailed information about a specific shape.
 
     Returns name, id, type, position, size, rotation, z-order, full text
@@ -1101,7 +1033,7 @@ def get_shape_info(params: ShapeIdentifierInput) -> str:
         JSON with detailed shape properties.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_shape_info_impl,
             params.slide_index, params.shape_name, params.shape_index,
         )
@@ -1110,7 +1042,7 @@ def get_shape_info(params: ShapeIdentifierInput) -> str:
         return json.dumps({"error": f"Failed to get shape info: {str(e)}"})
 
 
-def update_shape(params: UpdateShapeInput) -> str:
+async def update_shape(params: UpdateShapeInput) -> str:
     """Update properties of an existing shape.
 
     Only updates properties that are provided (not None). Can change
@@ -1127,7 +1059,7 @@ def update_shape(params: UpdateShapeInput) -> str:
         JSON with updated shape name, position/size, and adjustment values.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _update_shape_impl,
             params.slide_index, params.shape_name, params.shape_index,
             params.left, params.top, params.width, params.height,
@@ -1138,7 +1070,7 @@ def update_shape(params: UpdateShapeInput) -> str:
         return json.dumps({"error": f"Failed to update shape: {str(e)}"})
 
 
-def delete_shape(params: ShapeIdentifierInput) -> str:
+async def delete_shape(params: ShapeIdentifierInput) -> str:
     """Delete a shape from a slide.
 
     Args:
@@ -1148,7 +1080,7 @@ def delete_shape(params: ShapeIdentifierInput) -> str:
         JSON confirming the deleted shape name.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _delete_shape_impl,
             params.slide_index, params.shape_name, params.shape_index,
         )
@@ -1157,7 +1089,7 @@ def delete_shape(params: ShapeIdentifierInput) -> str:
         return json.dumps({"error": f"Failed to delete shape: {str(e)}"})
 
 
-def duplicate_shape(params: ShapeIdentifierInput) -> str:
+async def duplicate_shape(params: ShapeIdentifierInput) -> str:
     """Duplicate a shape on the same slide.
 
     The duplicate is offset 20 points right and down from the original.
@@ -1169,7 +1101,7 @@ def duplicate_shape(params: ShapeIdentifierInput) -> str:
         JSON with the new duplicated shape's name and index.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _duplicate_shape_impl,
             params.slide_index, params.shape_name, params.shape_index,
         )
@@ -1178,7 +1110,7 @@ def duplicate_shape(params: ShapeIdentifierInput) -> str:
         return json.dumps({"error": f"Failed to duplicate shape: {str(e)}"})
 
 
-def set_shape_zorder(params: SetZOrderInput) -> str:
+async def set_shape_zorder(params: SetZOrderInput) -> str:
     """Change the z-order (stacking position) of a shape.
 
     Commands: 'bring_to_front', 'send_to_back', 'bring_forward', 'send_backward'.
@@ -1196,7 +1128,7 @@ def set_shape_zorder(params: SetZOrderInput) -> str:
                 "error": f"Unknown z-order command '{params.command}'. "
                 f"Use one of: {', '.join(ZORDER_CMD_MAP.keys())}"
             })
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_zorder_impl,
             params.slide_index, params.shape_name, params.shape_index,
             ZORDER_CMD_MAP[cmd],
@@ -1244,7 +1176,7 @@ def register_tools(mcp):
         Example: text='Label', font_size=14, bold=true, fill_color='#1E3A5F',
         line_visible=false creates a fully styled shape in one step.
         """
-        return add_shape(params)
+        return await add_shape(params)
 
     @mcp.tool(
         name="ppt_add_textbox",
@@ -1274,7 +1206,7 @@ def register_tools(mcp):
         font_color='#FFFFFF', align='center', vertical_anchor='middle' creates a
         fully styled, vertically centered label in one step.
         """
-        return add_textbox(params)
+        return await add_textbox(params)
 
     @mcp.tool(
         name="ppt_add_picture",
@@ -1292,7 +1224,7 @@ def register_tools(mcp):
         The image is embedded in the presentation. If width and height are
         omitted, the original image dimensions are preserved.
         """
-        return add_picture(params)
+        return await add_picture(params)
 
     @mcp.tool(
         name="ppt_add_line",
@@ -1310,7 +1242,7 @@ def register_tools(mcp):
         Draws a line from (begin_x, begin_y) to (end_x, end_y).
         All coordinates are in points (72 points = 1 inch).
         """
-        return add_line(params)
+        return await add_line(params)
 
     @mcp.tool(
         name="ppt_list_shapes",
@@ -1326,8 +1258,10 @@ def register_tools(mcp):
         """List all shapes on a slide.
 
         Returns name, id, type, position, size, and text preview for each shape.
+        Use depth='geometry' for a faster layout-only listing, or depth='full'
+        to also get rotation, fill, line and font for every shape at once.
         """
-        return list_shapes(params)
+        return await list_shapes(params)
 
     @mcp.tool(
         name="ppt_get_shape_info",
@@ -1345,7 +1279,7 @@ def register_tools(mcp):
         Identify the shape by name (shape_name) or 1-based index (shape_index).
         Returns full text, fill info, line info, rotation, and z-order.
         """
-        return get_shape_info(params)
+        return await get_shape_info(params)
 
     @mcp.tool(
         name="ppt_update_shape",
@@ -1363,7 +1297,7 @@ def register_tools(mcp):
         Identify the shape by name or index. Only provided properties are updated.
         Can change position (left, top), size (width, height), rotation, and name.
         """
-        return update_shape(params)
+        return await update_shape(params)
 
     @mcp.tool(
         name="ppt_delete_shape",
@@ -1381,7 +1315,7 @@ def register_tools(mcp):
         Identify the shape by name (shape_name) or 1-based index (shape_index).
         This action cannot be undone via MCP (use PowerPoint's Ctrl+Z).
         """
-        return delete_shape(params)
+        return await delete_shape(params)
 
     @mcp.tool(
         name="ppt_duplicate_shape",
@@ -1399,7 +1333,7 @@ def register_tools(mcp):
         Creates a copy offset 20 points right and down from the original.
         Returns the new shape's name and index.
         """
-        return duplicate_shape(params)
+        return await duplicate_shape(params)
 
     @mcp.tool(
         name="ppt_set_shape_zorder",
@@ -1417,4 +1351,4 @@ def register_tools(mcp):
         Commands: 'bring_to_front', 'send_to_back', 'bring_forward', 'send_backward'.
         Identify the shape by name (shape_name) or 1-based index (shape_index).
         """
-        return set_shape_zorder(params)
+        return await set_shape_zorder(params)
@@ -1125,10 +1125,10 @@ def _get_slide_notes_impl(slide_index: int) -> dict:
 # ---------------------------------------------------------------------------
 # MCP tool functions (return JSON strings)
 # ---------------------------------------------------------------------------
-def add_slide(params: AddSlideInput) -> str:
+async def add_slide(params: AddSlideInput) -> str:
     """Add a new slide to the active presentation."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_slide_impl, params.position, params.layout,
             params.layout_name, params.design_index, params.count,
             params.like_slide_index,
@@ -1138,10 +1138,10 @@ def add_slide(params: AddSlideInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def delete_slide(params: DeleteSlideInput) -> str:
+async def delete_slide(params: DeleteSlideInput) -> str:
     """Delete one or more slides."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _delete_slide_impl,
             params.slide_index,
             params.slide_indices,
@@ -1153,10 +1153,10 @@ def delete_slide(params: DeleteSlideInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def duplicate_slide(params: DuplicateSlideInput) -> str:
+async def duplicate_slide(params: DuplicateSlideInput) -> str:
     """Duplicate a slide."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _duplicate_slide_impl,
             params.slide_index,
             params.insert_at,
@@ -1167,10 +1167,10 @@ def duplicate_slide(params: DuplicateSlideInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def move_slide(params: MoveSlideInput) -> str:
+async def move_slide(params: MoveSlideInput) -> str:
     """Move one or more slides to a new position."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _move_slide_impl,
             params.new_position,
             params.slide_index,
@@ -1181,10 +1181,10 @@ def move_slide(params: MoveSlideInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def copy_slide(params: CopySlideInput) -> str:
+async def copy_slide(params: CopySlideInput) -> str:
     """Copy slides, optionally into another open presentation."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _copy_slide_impl,
             params.slide_index,
             params.slide_indices,
@@ -1199,10 +1199,10 @@ def copy_slide(params: CopySlideInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def list_slides(params: ListSlidesInput) -> str:
+async def list_slides(params: ListSlidesInput) -> str:
     """List all slides in the active presentation."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _list_slides_impl,
             params.presentation_index,
             params.presentation_name,
@@ -1212,19 +1212,19 @@ def list_slides(params: ListSlidesInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def get_slide_info(params: GetSlideInfoInput) -> str:
+async def get_slide_info(params: GetSlideInfoInput) -> str:
     """Get detailed info about a specific slide."""
     try:
-        result = ppt.execute(_get_slide_info_impl, params.slide_index)
+        result = await ppt.execute_async(_get_slide_info_impl, params.slide_index)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def set_slide_notes(params: SetSlideNotesInput) -> str:
+async def set_slide_notes(params: SetSlideNotesInput) -> str:
     """Set speaker notes for a slide."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_slide_notes_impl,
             params.slide_index,
             params.notes_text,
@@ -1240,10 +1240,10 @@ def set_slide_notes(params: SetSlideNotesInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def get_slide_notes(params: GetSlideNotesInput) -> str:
+async def get_slide_notes(params: GetSlideNotesInput) -> str:
     """Get speaker notes for a slide."""
     try:
-        result = ppt.execute(_get_slide_notes_impl, params.slide_index)
+        result = await ppt.execute_async(_get_slide_notes_impl, params.slide_index)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -1274,10 +1274,10 @@ def _goto_slide_impl(slide_index: int) -> dict:
     }
 
 
-def goto_slide(params: GotoSlideInput) -> str:
+async def goto_slide(params: GotoSlideInput) -> str:
     """Navigate the active window to display a specific slide."""
     try:
-        result = ppt.execute(_goto_slide_impl, params.slide_index)
+        result = await ppt.execute_async(_goto_slide_impl, params.slide_index)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -1319,7 +1319,7 @@ def register_tools(mcp):
         If layout_name matched layouts in multiple designs, the response also
         includes layout_ambiguous=true and a warning naming the candidates.
         """
-        return add_slide(params)
+        return await add_slide(params)
 
     @mcp.tool(
         name="ppt_delete_slide",
@@ -1344,7 +1344,7 @@ def register_tools(mcp):
         no manual bookkeeping for index shifting. Deleting all slides is
         rejected (a presentation must keep at least one).
         """
-        return delete_slide(params)
+        return await delete_slide(params)
 
     @mcp.tool(
         name="ppt_duplicate_slide",
@@ -1369,7 +1369,7 @@ def register_tools(mcp):
         Returns new_slide_indices / new_slide_ids (plus new_slide_index for a
         single copy).
         """
-        return duplicate_slide(params)
+        return await duplicate_slide(params)
 
     @mcp.tool(
         name="ppt_move_slide",
@@ -1393,7 +1393,7 @@ def register_tools(mcp):
         refer to the CURRENT numbering — the move is anchored on slide IDs so
         index shifting is handled internally.
         """
-        return move_slide(params)
+        return await move_slide(params)
 
     @mcp.tool(
         name="ppt_copy_slide",
@@ -1421,7 +1421,7 @@ def register_tools(mcp):
         Both presentations must already be open (use ppt_open_presentation).
         Returns new_slide_indices and the destination presentation name.
         """
-        return copy_slide(params)
+        return await copy_slide(params)
 
     @mcp.tool(
         name="ppt_list_slides",
@@ -1439,7 +1439,7 @@ def register_tools(mcp):
         Returns each slide's index, ID, name, layout, hidden status,
         shape count, and whether it has speaker notes.
         """
-        return list_slides(params)
+        return await list_slides(params)
 
     @mcp.tool(
         name="ppt_get_slide_info",
@@ -1457,7 +1457,7 @@ def register_tools(mcp):
         Returns layout, shapes count, title text, speaker notes,
         transition settings, background info, and design name.
         """
-        return get_slide_info(params)
+        return await get_slide_info(params)
 
     @mcp.tool(
         name="ppt_set_slide_notes",
@@ -1480,7 +1480,7 @@ def register_tools(mcp):
         export only. The Notes pane and Presenter View ignore these settings
         (Presenter View has its own A+/A- zoom controls).
         """
-        return set_slide_notes(params)
+        return await set_slide_notes(params)
 
     @mcp.tool(
         name="ppt_get_slide_notes",
@@ -1497,7 +1497,7 @@ def register_tools(mcp):
 
         Returns the notes text. If no notes exist, returns an empty string.
         """
-        return get_slide_notes(params)
+        return await get_slide_notes(params)
 
     @mcp.tool(
         name="ppt_goto_slide",
@@ -1515,4 +1515,4 @@ def register_tools(mcp):
         Changes which slide is shown in the PowerPoint editor.
         Useful for jumping to a slide you want to view or edit.
         """
-        return goto_slide(params)
+        return await goto_slide(params)
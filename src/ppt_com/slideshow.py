@@ -216,10 +216,10 @@ def _slideshow_get_status_impl() -> dict:
 # ---------------------------------------------------------------------------
 # MCP tool functions (return JSON strings)
 # ---------------------------------------------------------------------------
-def slideshow_start(params: SlideShowStartInput) -> str:
+async def slideshow_start(params: SlideShowStartInput) -> str:
     """Start a slide show presentation."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _slideshow_start_impl,
             params.start_slide,
             params.end_slide,
@@ -231,46 +231,46 @@ def slideshow_start(params: SlideShowStartInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def slideshow_stop() -> str:
+async def slideshow_stop() -> str:
     """Stop the running slide show."""
     try:
-        result = ppt.execute(_slideshow_stop_impl)
+        result = await ppt.execute_async(_slideshow_stop_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def slideshow_next() -> str:
+async def slideshow_next() -> str:
     """Navigate to the next slide in the running slide show."""
     try:
-        result = ppt.execute(_slideshow_next_impl)
+        result = await ppt.execute_async(_slideshow_next_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def slideshow_previous() -> str:
+async def slideshow_previous() -> str:
     """Navigate to the previous slide in the running slide show."""
     try:
-        result = ppt.execute(_slideshow_previous_impl)
+        result = await ppt.execute_async(_slideshow_previous_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def slideshow_goto(params: SlideShowGotoInput) -> str:
+async def slideshow_goto(params: SlideShowGotoInput) -> str:
     """Go to a specific slide in the running slide show."""
     try:
-        result = ppt.execute(_slideshow_goto_impl, params.slide_index)
+        result = await ppt.execute_async(_slideshow_goto_impl, params.slide_index)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
-def slideshow_get_status() -> str:
+async def slideshow_get_status() -> str:
     """Get the current state of the running slide show."""
     try:
-        result = ppt.execute(_slideshow_get_status_impl)
+        result = await ppt.execute_async(_slideshow_get_status_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -298,7 +298,7 @@ def register_tools(mcp):
         Optionally configure start/end slides, looping, and show type
         ('speaker' for fullscreen, 'window' for windowed, 'kiosk' for kiosk mode).
         """
-        return slideshow_start(params)
+        return await slideshow_start(params)
 
     @mcp.tool(
         name="ppt_slideshow_stop",
@@ -315,7 +315,7 @@ def register_tools(mcp):
 
         If no slide show is running, returns success with an informational message.
         """
-        return slideshow_stop()
+        return await slideshow_stop()
 
     @mcp.tool(
         name="ppt_slideshow_next",
@@ -332,7 +332,7 @@ def register_tools(mcp):
 
         Returns the current slide position and show state.
         """
-        return slideshow_next()
+        return await slideshow_next()
 
     @mcp.tool(
         name="ppt_slideshow_previous",
@@ -349,7 +349,7 @@ def register_tools(mcp):
 
         Returns the current slide position and show state.
         """
-        return slideshow_previous()
+        return await slideshow_previous()
 
     @mcp.tool(
         name="ppt_slideshow_goto",
@@ -366,7 +366,7 @@ def register_tools(mcp):
 
         Jumps directly to the slide at the given 1-based index.
         """
-        return slideshow_goto(params)
+        return await slideshow_goto(params)
 
     @mcp.tool(
         name="ppt_slideshow_get_status",
@@ -384,4 +384,4 @@ def register_tools(mcp):
         Returns whether a show is running, current slide, state
         (running/paused/black_screen/white_screen/done), and pointer type.
         """
-        return slideshow_get_status()
+        return await slideshow_get_status()
@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from utils.com_wrapper import ppt
 from utils.color import hex_to_int
 from utils.navigation import goto_slide
+from utils.smartart_catalog import smartart_catalogs
 from utils.validation import font_size_warning
 from ppt_com.constants import msoSmartArt, SHAPE_TYPE_NAMES, msoTrue, msoFalse
 
@@ -143,49 +144,43 @@ _ENGLISH_NAME_TO_ID: dict[str, str] = {
     v.lower(): k for k, v in SMARTART_ENGLISH_ALIASES.items()
 }
 
+def _catalog(app):
+    """Session catalog of SmartArt layouts/colors/styles (see utils.smartart_catalog)."""
+    return smartart_catalogs.get(app, SMARTART_ENGLISH_ALIASES)
+
 
 def _resolve_layout(app, layout_name: str):
     """Resolve a SmartArt layout by name with English alias support.
 
-    Search order:
-    1. Exact match on locale-specific Name (case-insensitive, contains)
-    2. Match via English alias name -> layout Id lookup
+    Search order (against the cached catalog, no collection walk):
+    1. Exact localized name, exact English alias name, or exact layout Id
+    2. Localized Name contains the query (case-insensitive)
+    3. English alias name contains the query
 
     Returns the SmartArtLayout COM object, or raises ValueError if not found.
     """
-    name_lower = layout_name.lower()
-    layouts = app.SmartArtLayouts
-
-    # 1) Try locale-specific name (contains match, case-insensitive)
-    for j in range(1, layouts.Count + 1):
-        if name_lower in layouts(j).Name.lower():
-            return layouts(j)
-
-    # 2) Try English alias: check if the search string matches any English name
-    #    and resolve via layout Id
-    matched_ids = set()
-    for eng_name, layout_id in _ENGLISH_NAME_TO_ID.items():
-        if name_lower in eng_name:
-            matched_ids.add(layout_id)
-
-    if matched_ids:
-        found = []
-        for j in range(1, layouts.Count + 1):
-            try:
-                lid = layouts(j).Id
-            except Exception as e:
-                logger.debug("Cannot read SmartArt layout Id at index %d: %s", j, e)
-                continue
-            if lid in matched_ids:
-                found.append(layouts(j))
-        if found:
-            if len(found) > 1:
-                names = [f.Name for f in found]
-                logger.warning(
-                    "Multiple SmartArt layouts matched '%s': %s — returning first",
-                    layout_name, names,
-                )
-            return found[0]
+    for attempt in range(2):
+        catalog = _catalog(app)
+        found = catalog.find_layouts(layout_name)
+        if not found:
+            break
+        if len(found) > 1:
+            logger.warning(
+                "Multiple SmartArt layouts matched '%s': %s — returning first",
+                layout_name, [f["name"] for f in found],
+            )
+        entry = found[0]
+        layout = app.SmartArtLayouts(entry["index"])
+        try:
+            stale = entry["id"] is not None and layout.Id != entry["id"]
+        except Exception as e:
+            logger.debug("Cannot verify SmartArt layout Id at index %d: %s", entry["index"], e)
+            stale = False
+        if not stale:
+            return layout
+        # The collection changed under the same version key (e.g. an add-in
+        # installed layouts) — rebuild once.
+        smartart_catalogs.invalidate(catalog.key)
 
     raise ValueError(
         f"SmartArt layout '{layout_name}' not found. "
@@ -193,8 +188,6 @@ def _resolve_layout(app, layout_name: str):
     )
 
 
-
-
 # ---------------------------------------------------------------------------
 # Pydantic input models
 # ---------------------------------------------------------------------------
@@ -558,61 +551,31 @@ def _modify_smartart_impl(slide_index, shape_name_or_index, action,
 
 def _list_smartart_options_impl(list_type, category, keyword, include_description):
     app = ppt._get_app_impl()
+    if list_type not in ("layouts", "colors", "styles", "categories"):
+        raise ValueError(f"Unknown list_type '{list_type}'. Use: 'layouts', 'colors', 'styles', or 'categories'")
+    catalog = _catalog(app)
 
-    # --- categories: return distinct category names from SmartArtLayouts ---
+    # --- categories: distinct category names from the layouts ---
     if list_type == "categories":
-        collection = app.SmartArtLayouts
-        seen = {}
-        for i in range(1, collection.Count + 1):
-            try:
-                cat = collection(i).Category or ""
-            except Exception:
-                cat = ""
-            if cat and cat not in seen:
-                seen[cat] = 0
-            if cat:
-                seen[cat] += 1
-        categories = [{"category": k, "count": v} for k, v in seen.items()]
         return {
             "success": True,
             "list_type": "categories",
-            "total_layouts": collection.Count,
-            "categories": categories,
+            "total_layouts": len(catalog.layouts),
+            "categories": catalog.categories(),
         }
 
-    if list_type == "layouts":
-        collection = app.SmartArtLayouts
-        key = "layouts"
-    elif list_type == "colors":
-        collection = app.SmartArtColors
-        key = "colors"
-    elif list_type == "styles":
-        collection = app.SmartArtQuickStyles
-        key = "styles"
-    else:
-        raise ValueError(f"Unknown list_type '{list_type}'. Use: 'layouts', 'colors', 'styles', or 'categories'")
-
-    total = collection.Count
+    collection = catalog.items(list_type)
     cat_lower = category.lower() if category else None
     kw_lower = keyword.lower() if keyword else None
 
     items = []
-    for i in range(1, total + 1):
-        item = collection(i)
-        item_name = item.Name
-
-        # For layouts, resolve the English alias name via layout Id
-        english_name = None
-        if list_type == "layouts":
-            english_name = SMARTART_ENGLISH_ALIASES.get(item.Id)
+    for item in collection:
+        item_name = item["name"] or ""
+        english_name = item.get("english_name")
 
         # Category filter (layouts only)
         if cat_lower and list_type == "layouts":
-            try:
-                item_cat = item.Category or ""
-            except Exception:
-                item_cat = ""
-            if cat_lower not in item_cat.lower():
+            if cat_lower not in (item.get("category") or "").lower():
                 continue
 
         # Keyword filter on name — also check English alias name for layouts
@@ -622,33 +585,31 @@ def _list_smartart_options_impl(list_type, category, keyword, include_descriptio
             if not name_match and not eng_match:
                 continue
 
-        entry = {"index": i, "name": item_name}
+        entry = {"index": item["index"], "name": item_name}
         if list_type == "layouts":
             entry["english_name"] = english_name
-            try:
-                entry["category"] = item.Category
-            except Exception:
-                pass
+            if item.get("category") is not None:
+                entry["category"] = item["category"]
         if include_description:
-            entry["description"] = item.Description
+            entry["description"] = item["description"]
 
         items.append(entry)
 
     return {
         "success": True,
         "list_type": list_type,
-        "total_count": total,
+        "total_count": len(collection),
         "filtered_count": len(items),
-        key: items,
+        list_type: items,
     }
 
 
 # ---------------------------------------------------------------------------
 # MCP tool functions (sync wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def add_smartart(params: AddSmartArtInput) -> str:
+async def add_smartart(params: AddSmartArtInput) -> str:
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_smartart_impl,
             params.slide_index, params.layout_name, params.layout_index,
             params.left, params.top, params.width, params.height,
@@ -664,9 +625,9 @@ def add_smartart(params: AddSmartArtInput) -> str:
         return json.dumps({"error": f"Failed to add SmartArt: {str(e)}"})
 
 
-def modify_smartart(params: ModifySmartArtInput) -> str:
+async def modify_smartart(params: ModifySmartArtInput) -> str:
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _modify_smartart_impl,
             params.slide_index, params.shape_name_or_index,
             params.action, params.node_index, params.text,
@@ -683,9 +644,9 @@ def modify_smartart(params: ModifySmartArtInput) -> str:
         return json.dumps({"error": f"Failed to modify SmartArt: {str(e)}"})
 
 
-def list_smartart_options(params: ListSmartArtInput) -> str:
+async def list_smartart_options(params: ListSmartArtInput) -> str:
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _list_smartart_options_impl,
             params.list_type, params.category, params.keyword, params.include_description,
         )
@@ -728,7 +689,7 @@ def register_tools(mcp):
 
         All positions and sizes are in points (72 points = 1 inch).
         """
-        return add_smartart(params)
+        return await add_smartart(params)
 
     @mcp.tool(
         name="ppt_modify_smartart",
@@ -761,7 +722,7 @@ def register_tools(mcp):
         Colors: '#RRGGBB' hex strings. Use ppt_list_smartart_layouts with
         list_type='colors' or list_type='styles' to discover available indices.
         """
-        return modify_smartart(params)
+        return await modify_smartart(params)
 
     @mcp.tool(
         name="ppt_list_smartart_layouts",
@@ -793,4 +754,4 @@ def register_tools(mcp):
 
         Output is compact by default (index + name + english_name + category).
         """
-        return list_smartart_options(params)
+        return await list_smartart_options(params)
@@ -0,0 +1,205 @@
+"""One-pass shape snapshots for read tools.
+
+Every property read on a COM shape is a cross-process call. The read tools
+(ppt_list_shapes, ppt_get_shape_info, ppt_get_all_text, ppt_check_typography)
+used to walk ``slide.Shapes(i)`` themselves and re-read Name, Type, Left,
+Top, Width, Height, HasTextFrame and text one property at a time, often
+several times for the same shape. This module reads each shape once into a
+plain dict that all of them consume.
+
+Depth controls how much is read, so cheap calls stay cheap:
+
+- ``geometry``: index, name, id, type, type_name, left, top, width, height,
+  placeholder_type, is_group (7-8 COM reads per shape)
+- ``text``: + has_text_frame, has_text, text, has_table
+- ``full``: + rotation, z_order, aspect_ratio_locked, fill, line, font
+
+Positions are unrounded; callers round for output. Snapshots are only valid
+for the COM task that took them — never cache them across tool calls.
+"""
+
+import logging
+from typing import Optional
+
+from utils.color import int_to_hex
+from ppt_com.constants import (
+    msoTrue, msoTriStateMixed,
+    msoGroup, msoPlaceholder,
+    SHAPE_TYPE_NAMES,
+)
+
+logger = logging.getLogger(__name__)
+
+GEOMETRY = "geometry"
+TEXT = "text"
+FULL = "full"
+DEPTHS = (GEOMETRY, TEXT, FULL)
+_DEPTH_LEVEL = {GEOMETRY: 0, TEXT: 1, FULL: 2}
+
+
+def _tristate(value) -> Optional[bool]:
+    """msoTrue/msoFalse -> bool; mixed (or unreadable) -> None."""
+    if value == msoTriStateMixed:
+        return None
+    return value == msoTrue
+
+
+def _read_text(snap: dict, shape) -> None:
+    snap["has_text_frame"] = False
+    snap["has_text"] = False
+    snap["text"] = None
+    snap["has_table"] = False
+    try:
+        if shape.HasTable:
+            snap["has_table"] = True
+            return
+    except Exception:
+        pass
+    try:
+        if shape.HasTextFrame:
+            snap["has_text_frame"] = True
+            tf = shape.TextFrame
+            if tf.HasText:
+                snap["has_text"] = True
+                snap["text"] = tf.TextRange.Text
+    except Exception:
+        pass
+
+
+def _read_fill(shape) -> Optional[dict]:
+    try:
+        fill = shape.Fill
+        info = {"type": fill.Type, "visible": bool(fill.Visible)}
+    except Exception:
+        return None
+    try:
+        info["color_hex"] = int_to_hex(fill.ForeColor.RGB)
+    except Exception:
+        pass
+    try:
+        info["transparency"] = round(fill.Transparency, 2)
+    except Exception:
+        pass
+    return info
+
+
+def _read_line(shape) -> Optional[dict]:
+    try:
+        line = shape.Line
+        info = {"visible": bool(line.Visible)}
+    except Exception:
+        return None
+    try:
+        info["weight"] = round(line.Weight, 2)
+    except Exception:
+        pass
+    try:
+        info["color_hex"] = int_to_hex(line.ForeColor.RGB)
+    except Exception:
+        pass
+    try:
+        info["dash_style"] = line.DashStyle
+    except Exception:
+        pass
+    return info
+
+
+def _read_font(shape) -> Optional[dict]:
+    """Whole-range font of a text shape; mixed values come back as None."""
+    try:
+        font = shape.TextFrame.TextRange.Font
+        size = font.Size
+        name = font.Name
+    except Exception:
+        return None
+    info = {
+        "name": name or None,  # "" when several fonts are mixed
+        "size": round(size, 2) if size and size > 0 else None,
+    }
+    try:
+        info["bold"] = _tristate(font.Bold)
+        info["italic"] = _tristate(font.Italic)
+    except Exception:
+        pass
+    try:
+        info["color_hex"] = int_to_hex(font.Color.RGB)
+    except Exception:
+        pass
+    return info
+
+
+def snapshot_shape(shape, depth: str = TEXT, index: Optional[int] = None,
+                   include_group_items: bool = False, keep_com: bool = False) -> dict:
+    """Read one shape into a plain dict (see module docstring for keys).
+
+    Args:
+        shape: COM Shape object.
+        depth: "geometry", "text" or "full".
+        index: 1-based position in the parent collection, stored as "index".
+        include_group_items: Also snapshot a group's children into "children"
+            (child coordinates as reported by COM, not offset).
+        keep_com: Store the COM object under "com" for callers that still
+            need live access (e.g. paragraph-level formatting). Strip it
+            before serializing.
+    """
+    level = _DEPTH_LEVEL[depth]
+    shape_type = shape.Type
+    snap = {
+        "index": index,
+        "name": shape.Name,
+        "id": shape.Id,
+        "type": shape_type,
+        "type_name": SHAPE_TYPE_NAMES.get(shape_type, f"Unknown({shape_type})"),
+        "left": shape.Left,
+        "top": shape.Top,
+        "width": shape.Width,
+        "height": shape.Height,
+        "placeholder_type": None,
+        "is_group": shape_type == msoGroup,
+    }
+    if shape_type == msoPlaceholder:
+        try:
+            snap["placeholder_type"] = shape.PlaceholderFormat.Type
+        except Exception:
+            pass
+    if keep_com:
+        snap["com"] = shape
+
+    if level >= 1 and not snap["is_group"]:
+        _read_text(snap, shape)
+    elif level >= 1:
+        snap.update(has_text_frame=False, has_text=False, text=None, has_table=False)
+
+    if level >= 2:
+        snap["rotation"] = shape.Rotation
+        snap["z_order"] = shape.ZOrderPosition
+        try:
+            snap["aspect_ratio_locked"] = shape.LockAspectRatio == msoTrue
+        except Exception:
+            snap["aspect_ratio_locked"] = False
+        snap["fill"] = _read_fill(shape)
+        snap["line"] = _read_line(shape)
+        snap["font"] = _read_font(shape) if snap.get("has_text_frame") else None
+
+    if include_group_items and snap["is_group"]:
+        children = []
+        try:
+            items = shape.GroupItems
+            for gi in range(1, items.Count + 1):
+                children.append(snapshot_shape(
+                    items(gi), depth, gi, include_group_items=True, keep_com=keep_com,
+                ))
+        except Exception:
+            logger.debug("Cannot read group items of '%s'", snap["name"], exc_info=True)
+        snap["children"] = children
+    return snap
+
+
+def snapshot_slide(slide, depth: str = TEXT, include_group_items: bool = False,
+                   keep_com: bool = False) -> list:
+    """Snapshot every top-level shape on a slide, in z-order (index 1 = back)."""
+    shapes = slide.Shapes
+    return [
+        snapshot_shape(shapes(i), depth, i, include_group_items, keep_com)
+        for i in range(1, shapes.Count + 1)
+    ]
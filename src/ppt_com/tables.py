@@ -4,13 +4,17 @@ Handles creating tables, setting cell text/formatting, merging cells,
 adding/deleting rows/columns, and applying table styles.
 """
 
+import csv
+import io
 import json
 import logging
-from typing import List, Optional, Union
+import os
+from typing import List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from utils.com_wrapper import ppt
+from utils.http_fetch import run_io
 from utils.color import hex_to_int, int_to_hex
 from utils.navigation import goto_slide
 from utils.validation import font_size_warning
@@ -95,7 +99,14 @@ class GetTableDataInput(BaseModel):
     shape_name_or_index: Union[str, int] = Field(
         ..., description="Table shape name (str) or 1-based index (int). Prefer name — indices shift when shapes are added/removed"
     )
-    include_format: bool = Field(default=False, description="If True, also return a 'format' key containing a 2D array of cell formatting details (font, fill, alignment). 'data' always remains List[List[str]].")
+    include_format: bool = Field(default=False, description="If True, also return cell formatting (font, fill, alignment). With the default format_layout='styles', 'styles' lists each distinct format once and 'format' is a 2D array of indices into 'styles'; with format_layout='cells', 'format' is a 2D array of per-cell format dicts. 'data' always remains List[List[str]].")
+    format_layout: Literal["styles", "cells"] = Field(
+        default="styles",
+        description=(
+            "With include_format: 'styles' (default) returns each distinct format once in 'styles' "
+            "and 'format' as a 2D array of indices into it; 'cells' repeats the full format dict per cell."
+        ),
+    )
 
 
 class SetTableCellInput(BaseModel):
@@ -297,6 +308,47 @@ class SetTableBordersInput(BaseModel):
         return self
 
 
+class ImportTableDataInput(BaseModel):
+    """Input for importing tabular data (CSV/TSV text or file, or split-orient rows)."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    slide_index: int = Field(..., ge=1, description="1-based slide index")
+    shape_name_or_index: Optional[Union[str, int]] = Field(
+        default=None,
+        description="Existing table shape name (str) or 1-based index (int). Omit to create a new table sized to the data",
+    )
+    text: Optional[str] = Field(default=None, description="CSV or TSV text (first row is written as-is, e.g. a header)")
+    file_path: Optional[str] = Field(default=None, description="Path to a .csv / .tsv / .txt file (UTF-8, BOM allowed)")
+    columns: Optional[List[str]] = Field(
+        default=None,
+        description="Header labels for `rows` (pandas DataFrame.to_dict(orient='split') shape)",
+    )
+    rows: Optional[List[List[Union[str, float, int, bool, None]]]] = Field(
+        default=None, description="Data rows; None/NaN become empty cells",
+    )
+    delimiter: Optional[str] = Field(
+        default=None, min_length=1, max_length=1,
+        description="Field delimiter for text/file input. Omit to auto-detect (tab, comma, semicolon)",
+    )
+    bold_first_row: bool = Field(default=False, description="If True, bold the first written row")
+    resize: bool = Field(
+        default=True,
+        description="When writing into an existing table, add rows/columns so the data fits",
+    )
+    left: float = Field(default=50.0, description="Left position in points (new table only)")
+    top: float = Field(default=100.0, description="Top position in points (new table only)")
+    width: float = Field(default=600.0, description="Width in points (new table only)")
+    height: float = Field(default=300.0, description="Height in points (new table only)")
+
+    @model_validator(mode="after")
+    def _check_one_source(self) -> "ImportTableDataInput":
+        sources = [self.text is not None, self.file_path is not None,
+                   self.columns is not None or self.rows is not None]
+        if sum(sources) != 1:
+            raise ValueError("Provide exactly one of: text, file_path, or columns/rows")
+        return self
+
+
 # ---------------------------------------------------------------------------
 # Helper: find a table shape
 # ---------------------------------------------------------------------------
@@ -334,6 +386,51 @@ def _get_table_shape(slide, name_or_index: Union[str, int]):
     return shape
 
 
+# ---------------------------------------------------------------------------
+# Helper: parse imported tabular data (pure Python, off the COM thread)
+# ---------------------------------------------------------------------------
+def _cell_text(value) -> str:
+    if value is None or (isinstance(value, float) and value != value):  # NaN
+        return ""
+    return str(value)
+
+
+def _parse_delimited(text: str, delimiter: Optional[str] = None) -> list:
+    """Parse CSV/TSV text into a rectangular list of string rows."""
+    text = text.lstrip("\ufeff")
+    if delimiter is None:
+        first_line = text.split("\n", 1)[0]
+        try:
+            delimiter = csv.Sniffer().sniff(first_line, delimiters="\t,;").delimiter
+        except csv.Error:
+            delimiter = "\t" if "\t" in first_line else ","
+    rows = [row for row in csv.reader(io.StringIO(text), delimiter=delimiter)]
+    while rows and not any(cell.strip() for cell in rows[-1]):
+        rows.pop()
+    return _pad_grid(rows)
+
+
+def _grid_from_split(columns, rows) -> list:
+    """Build a grid from pandas split-orient columns/rows."""
+    grid = []
+    if columns:
+        grid.append([_cell_text(c) for c in columns])
+    grid.extend([_cell_text(v) for v in row] for row in rows or [])
+    return _pad_grid(grid)
+
+
+def _pad_grid(rows: list) -> list:
+    width = max((len(r) for r in rows), default=0)
+    if not rows or width == 0:
+        raise ValueError("No data to import")
+    return [list(r) + [""] * (width - len(r)) for r in rows]
+
+
+def _read_text_file(path: str) -> str:
+    with open(path, encoding="utf-8-sig") as f:
+        return f.read()
+
+
 # ---------------------------------------------------------------------------
 # COM implementation functions (run on COM thread via ppt.execute)
 # ---------------------------------------------------------------------------
@@ -366,14 +463,26 @@ def _add_table_impl(slide_index, rows, cols, left, top, width, height, row_heigh
 
 def _get_cell_format(cell) -> dict:
     """Extract formatting details from a table cell."""
-    tf = cell.Shape.TextFrame
-    tr = tf.TextRange
-    font = tr.Font
+    cell_shape = cell.Shape
+    tf = cell_shape.TextFrame
+    return _cell_format(cell_shape, tf, tf.TextRange)
+
+
+def _cell_format(cell_shape, tf, tr) -> dict:
+    """Formatting details from a cell's already-fetched Shape/TextFrame/TextRange.
+
+    Every intermediate object (Font, Fill, ...) is fetched once, so each
+    property below costs one COM call instead of re-walking the chain.
+    """
     result = {}
     try:
-        result["fill_color_hex"] = int_to_hex(cell.Shape.Fill.ForeColor.RGB)
+        result["fill_color_hex"] = int_to_hex(cell_shape.Fill.ForeColor.RGB)
     except Exception:
         result["fill_color_hex"] = None
+    try:
+        font = tr.Font
+    except Exception:
+        font = None
     try:
         result["font_name"] = font.Name
     except Exception:
@@ -409,8 +518,43 @@ def _get_cell_format(cell) -> dict:
     return result
 
 
-def _get_table_data_impl(slide_index, shape_name_or_index, include_format):
-    app = ppt._get_app_impl()
+def _read_cell(cell, include_format):
+    """Return (text, format dict or None) walking Shape→TextFrame→TextRange once."""
+    cell_shape = cell.Shape
+    tf = cell_shape.TextFrame
+    tr = tf.TextRange
+    text = tr.Text
+    if not include_format:
+        return text, None
+    return text, _cell_format(cell_shape, tf, tr)
+
+
+def _style_table(fmt_grid):
+    """Deduplicate a 2D grid of format dicts.
+
+    Returns (styles, index_grid): the distinct formats in first-seen order,
+    and the grid with each dict replaced by its index into styles. Real
+    tables use a handful of distinct formats, so this is much smaller than
+    repeating the full dict per cell.
+    """
+    styles = []
+    index = {}
+    grid = []
+    for row in fmt_grid:
+        out = []
+        for fmt in row:
+            key = tuple(sorted(fmt.items()))
+            i = index.get(key)
+            if i is None:
+                i = index[key] = len(styles)
+                styles.append(fmt)
+            out.append(i)
+        grid.append(out)
+    return styles, grid
+
+
+def _get_table_data_impl(slide_index, shape_name_or_index, include_format,
+                         format_layout="styles"):
     pres = ppt._get_pres_impl()
     slide = pres.Slides(slide_index)
     shape = _get_table_shape(slide, shape_name_or_index)
@@ -424,10 +568,10 @@ def _get_table_data_impl(slide_index, shape_name_or_index, include_format):
         row_data = []
         row_fmt = [] if include_format else None
         for c in range(1, cols_count + 1):
-            cell = table.Cell(r, c)
-            row_data.append(cell.Shape.TextFrame.TextRange.Text)
+            text, cell_fmt = _read_cell(table.Cell(r, c), include_format)
+            row_data.append(text)
             if include_format:
-                row_fmt.append(_get_cell_format(cell))
+                row_fmt.append(cell_fmt)
         data.append(row_data)
         if include_format:
             fmt.append(row_fmt)
@@ -440,7 +584,10 @@ def _get_table_data_impl(slide_index, shape_name_or_index, include_format):
         "data": data,
     }
     if include_format:
-        result["format"] = fmt
+        if format_layout == "styles":
+            result["styles"], result["format"] = _style_table(fmt)
+        else:
+            result["format"] = fmt
     return result
 
 
@@ -508,21 +655,19 @@ def _set_table_cell_impl(
     }
 
 
-def _set_table_data_impl(
-    slide_index, shape_name_or_index, data,
-    start_row, start_col, bold_first_row,
-):
-    app = ppt._get_app_impl()
-    goto_slide(app, slide_index)
-    pres = ppt._get_pres_impl()
-    slide = pres.Slides(slide_index)
-    shape = _get_table_shape(slide, shape_name_or_index)
-    table = shape.Table
+def _write_grid(table, data, start_row, start_col, bold_first_row):
+    """Write a 2D array of text into a table, skipping cells that already match.
 
+    Each cell's TextRange is fetched once and read before writing: a read is
+    far cheaper than a write (which forces a relayout), and re-importing a
+    mostly unchanged table then only touches the cells that differ.
+    Cells beyond the table boundary are skipped.
+    """
     rows_count = table.Rows.Count
     cols_count = table.Columns.Count
 
     cells_set = 0
+    cells_unchanged = 0
     rows_written = 0
     for r_idx, row_data in enumerate(data):
         target_row = start_row + r_idx
@@ -533,25 +678,89 @@ def _set_table_data_impl(
             target_col = start_col + c_idx
             if target_col > cols_count:
                 break
-            cell = table.Cell(target_row, target_col)
-            cell.Shape.TextFrame.TextRange.Text = str(cell_text).replace("\n", "\r")
+            tr = table.Cell(target_row, target_col).Shape.TextFrame.TextRange
+            text = str(cell_text).replace("\n", "\r")
+            if tr.Text != text:
+                tr.Text = text
+            else:
+                cells_unchanged += 1
             if bold_first_row and r_idx == 0:
-                cell.Shape.TextFrame.TextRange.Font.Bold = msoTrue
+                tr.Font.Bold = msoTrue
             cells_set += 1
             row_had_writes = True
         if row_had_writes:
             rows_written += 1
 
     return {
-        "success": True,
-        "shape_name": shape.Name,
         "cells_set": cells_set,
+        "cells_unchanged": cells_unchanged,
         "rows_written": rows_written,
         "table_rows": rows_count,
         "table_columns": cols_count,
     }
 
 
+def _set_table_data_impl(
+    slide_index, shape_name_or_index, data,
+    start_row, start_col, bold_first_row,
+):
+    app = ppt._get_app_impl()
+    goto_slide(app, slide_index)
+    pres = ppt._get_pres_impl()
+    slide = pres.Slides(slide_index)
+    shape = _get_table_shape(slide, shape_name_or_index)
+
+    return {
+        "success": True,
+        "shape_name": shape.Name,
+        **_write_grid(shape.Table, data, start_row, start_col, bold_first_row),
+    }
+
+
+def _import_table_data_impl(
+    slide_index, shape_name_or_index, grid, bold_first_row, resize,
+    left, top, width, height,
+):
+    """Write a parsed grid into an existing table (growing it) or a new one."""
+    app = ppt._get_app_impl()
+    goto_slide(app, slide_index)
+    pres = ppt._get_pres_impl()
+    slide = pres.Slides(slide_index)
+    n_rows = len(grid)
+    n_cols = max(len(row) for row in grid)
+
+    created = shape_name_or_index is None
+    if created:
+        shape = slide.Shapes.AddTable(
+            NumRows=n_rows, NumColumns=n_cols,
+            Left=left, Top=top, Width=width, Height=height,
+        )
+    else:
+        shape = _get_table_shape(slide, shape_name_or_index)
+    table = shape.Table
+
+    rows_added = cols_added = 0
+    if resize and not created:
+        while table.Rows.Count < n_rows:
+            table.Rows.Add()
+            rows_added += 1
+        while table.Columns.Count < n_cols:
+            table.Columns.Add()
+            cols_added += 1
+
+    result = {
+        "success": True,
+        "shape_name": shape.Name,
+        "created": created,
+        "rows_added": rows_added,
+        "columns_added": cols_added,
+        **_write_grid(table, grid, 1, 1, bold_first_row),
+    }
+    if created:
+        result["shape_index"] = shape.ZOrderPosition
+    return result
+
+
 def _merge_table_cells_impl(slide_index, shape_name_or_index, start_row, start_col, end_row, end_col):
     app = ppt._get_app_impl()
     goto_slide(app, slide_index)
@@ -805,7 +1014,7 @@ def _set_table_borders_impl(
 # ---------------------------------------------------------------------------
 # MCP tool functions (async wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def add_table(params: AddTableInput) -> str:
+async def add_table(params: AddTableInput) -> str:
     """Add a table to a slide.
 
     Args:
@@ -815,7 +1024,7 @@ def add_table(params: AddTableInput) -> str:
         JSON with shape name, index, and table dimensions.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_table_impl,
             params.slide_index, params.rows, params.cols,
             params.left, params.top, params.width, params.height,
@@ -826,7 +1035,7 @@ def add_table(params: AddTableInput) -> str:
         return json.dumps({"error": f"Failed to add table: {str(e)}"})
 
 
-def get_table_data(params: GetTableDataInput) -> str:
+async def get_table_data(params: GetTableDataInput) -> str:
     """Get all cell text values from a table as a 2D array.
 
     Args:
@@ -836,17 +1045,17 @@ def get_table_data(params: GetTableDataInput) -> str:
         JSON with row/column counts and 2D data array.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_table_data_impl,
             params.slide_index, params.shape_name_or_index,
-            params.include_format,
+            params.include_format, params.format_layout,
         )
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to get table data: {str(e)}"})
 
 
-def set_table_cell(params: SetTableCellInput) -> str:
+async def set_table_cell(params: SetTableCellInput) -> str:
     """Set text and/or formatting for a table cell.
 
     Args:
@@ -856,7 +1065,7 @@ def set_table_cell(params: SetTableCellInput) -> str:
         JSON confirming the cell update.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_table_cell_impl,
             params.slide_index, params.shape_name_or_index,
             params.row, params.col, params.text,
@@ -873,7 +1082,7 @@ def set_table_cell(params: SetTableCellInput) -> str:
         return json.dumps({"error": f"Failed to set table cell: {str(e)}"})
 
 
-def set_table_data(params: SetTableDataInput) -> str:
+async def set_table_data(params: SetTableDataInput) -> str:
     """Batch-set table cell text from a 2D array.
 
     Args:
@@ -883,7 +1092,7 @@ def set_table_data(params: SetTableDataInput) -> str:
         JSON confirming the number of cells set.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_table_data_impl,
             params.slide_index, params.shape_name_or_index,
             params.data, params.start_row, params.start_col,
@@ -894,7 +1103,41 @@ def set_table_data(params: SetTableDataInput) -> str:
         return json.dumps({"error": f"Failed to set table data: {str(e)}"})
 
 
-def merge_table_cells(params: MergeTableCellsInput) -> str:
+async def import_table_data(params: ImportTableDataInput) -> str:
+    """Import CSV/TSV or split-orient data into a new or existing table.
+
+    Args:
+        params: Target slide/table and exactly one data source.
+
+    Returns:
+        JSON with the table name, grid size and cells written.
+    """
+    try:
+        if params.file_path is not None:
+            path = os.path.abspath(params.file_path)
+            if not os.path.isfile(path):
+                return json.dumps({"error": f"File not found: {path}"})
+            text = await run_io(_read_text_file, path)
+            grid = _parse_delimited(text, params.delimiter)
+        elif params.text is not None:
+            grid = _parse_delimited(params.text, params.delimiter)
+        else:
+            grid = _grid_from_split(params.columns, params.rows)
+
+        result = await ppt.execute_async(
+            _import_table_data_impl,
+            params.slide_index, params.shape_name_or_index, grid,
+            params.bold_first_row, params.resize,
+            params.left, params.top, params.width, params.height,
+        )
+        result["data_rows"] = len(grid)
+        result["data_columns"] = len(grid[0])
+        return json.dumps(result)
+    except Exception as e:
+        return json.dumps({"error": f"Failed to import table data: {str(e)}"})
+
+
+async def merge_table_cells(params: MergeTableCellsInput) -> str:
     """Merge a range of table cells.
 
     Args:
@@ -904,7 +1147,7 @@ def merge_table_cells(params: MergeTableCellsInput) -> str:
         JSON confirming the merge.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _merge_table_cells_impl,
             params.slide_index, params.shape_name_or_index,
             params.start_row, params.start_col,
@@ -915,7 +1158,7 @@ def merge_table_cells(params: MergeTableCellsInput) -> str:
         return json.dumps({"error": f"Failed to merge cells: {str(e)}"})
 
 
-def add_table_row(params: TableRowInput) -> str:
+async def add_table_row(params: TableRowInput) -> str:
     """Add a row to a table.
 
     Args:
@@ -925,7 +1168,7 @@ def add_table_row(params: TableRowInput) -> str:
         JSON with updated row/column counts.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_table_row_impl,
             params.slide_index, params.shape_name_or_index,
             params.position, params.height,
@@ -935,7 +1178,7 @@ def add_table_row(params: TableRowInput) -> str:
         return json.dumps({"error": f"Failed to add table row: {str(e)}"})
 
 
-def delete_table_row(params: TableRowInput) -> str:
+async def delete_table_row(params: TableRowInput) -> str:
     """Delete a row from a table.
 
     Args:
@@ -945,7 +1188,7 @@ def delete_table_row(params: TableRowInput) -> str:
         JSON with updated row/column counts.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _delete_table_row_impl,
             params.slide_index, params.shape_name_or_index,
             params.position,
@@ -955,7 +1198,7 @@ def delete_table_row(params: TableRowInput) -> str:
         return json.dumps({"error": f"Failed to delete table row: {str(e)}"})
 
 
-def add_table_column(params: TableColumnInput) -> str:
+async def add_table_column(params: TableColumnInput) -> str:
     """Add a column to a table.
 
     Args:
@@ -965,7 +1208,7 @@ def add_table_column(params: TableColumnInput) -> str:
         JSON with updated row/column counts.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _add_table_column_impl,
             params.slide_index, params.shape_name_or_index,
             params.position, params.width,
@@ -975,7 +1218,7 @@ def add_table_column(params: TableColumnInput) -> str:
         return json.dumps({"error": f"Failed to add table column: {str(e)}"})
 
 
-def delete_table_column(params: TableColumnInput) -> str:
+async def delete_table_column(params: TableColumnInput) -> str:
     """Delete a column from a table.
 
     Args:
@@ -985,7 +1228,7 @@ def delete_table_column(params: TableColumnInput) -> str:
         JSON with updated row/column counts.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _delete_table_column_impl,
             params.slide_index, params.shape_name_or_index,
             params.position,
@@ -995,7 +1238,7 @@ def delete_table_column(params: TableColumnInput) -> str:
         return json.dumps({"error": f"Failed to delete table column: {str(e)}"})
 
 
-def set_table_style(params: SetTableStyleInput) -> str:
+async def set_table_style(params: SetTableStyleInput) -> str:
     """Apply a table style and configure banding options.
 
     Args:
@@ -1005,7 +1248,7 @@ def set_table_style(params: SetTableStyleInput) -> str:
         JSON confirming the style application.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_table_style_impl,
             params.slide_index, params.shape_name_or_index,
             params.style_id,
@@ -1018,7 +1261,7 @@ def set_table_style(params: SetTableStyleInput) -> str:
         return json.dumps({"error": f"Failed to set table style: {str(e)}"})
 
 
-def set_table_layout(params: SetTableLayoutInput) -> str:
+async def set_table_layout(params: SetTableLayoutInput) -> str:
     """Set row heights and/or column widths for an existing table.
 
     Args:
@@ -1028,7 +1271,7 @@ def set_table_layout(params: SetTableLayoutInput) -> str:
         JSON with the actual row heights and column widths after setting.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_table_layout_impl,
             params.slide_index, params.shape_name_or_index,
             params.row_heights, params.col_widths,
@@ -1038,7 +1281,7 @@ def set_table_layout(params: SetTableLayoutInput) -> str:
         return json.dumps({"error": f"Failed to set table layout: {str(e)}"})
 
 
-def split_table_cells(params: SplitTableCellsInput) -> str:
+async def split_table_cells(params: SplitTableCellsInput) -> str:
     """Split (unmerge) a merged table cell.
 
     Args:
@@ -1048,7 +1291,7 @@ def split_table_cells(params: SplitTableCellsInput) -> str:
         JSON confirming the split.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _split_table_cells_impl,
             params.slide_index, params.shape_name_or_index,
             params.row, params.col,
@@ -1059,7 +1302,7 @@ def split_table_cells(params: SplitTableCellsInput) -> str:
         return json.dumps({"error": f"Failed to split table cells: {str(e)}"})
 
 
-def set_table_borders(params: SetTableBordersInput) -> str:
+async def set_table_borders(params: SetTableBordersInput) -> str:
     """Set borders on a range of table cells.
 
     Args:
@@ -1069,7 +1312,7 @@ def set_table_borders(params: SetTableBordersInput) -> str:
         JSON with count of cells updated.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_table_borders_impl,
             params.slide_index, params.shape_name_or_index,
             params.start_row, params.start_col,
@@ -1104,7 +1347,7 @@ def register_tools(mcp):
         Creates a table with the specified number of rows and columns.
         All positions and sizes are in points (72 points = 1 inch).
         """
-        return add_table(params)
+        return await add_table(params)
 
     @mcp.tool(
         name="ppt_get_table_data",
@@ -1121,8 +1364,10 @@ def register_tools(mcp):
 
         Returns a 2D array of cell text, plus row and column counts.
         Identify the table by shape name or 1-based shape index.
+        With include_format=True, formats are deduplicated into `styles` and
+        `format` holds style indices (format_layout='cells' for per-cell dicts).
         """
-        return get_table_data(params)
+        return await get_table_data(params)
 
     @mcp.tool(
         name="ppt_set_table_cell",
@@ -1140,7 +1385,7 @@ def register_tools(mcp):
         Access cell by 1-based row and column. Optionally set font properties,
         text alignment, and cell background color.
         """
-        return set_table_cell(params)
+        return await set_table_cell(params)
 
     @mcp.tool(
         name="ppt_set_table_data",
@@ -1159,8 +1404,31 @@ def register_tools(mcp):
         sets 2 rows x 2 cols starting from (start_row, start_col).
         Cells beyond the table boundary are silently skipped.
         Use bold_first_row=True to auto-bold the header row.
+        Cells whose text already matches are not rewritten (cells_unchanged).
+        """
+        return await set_table_data(params)
+
+    @mcp.tool(
+        name="ppt_import_table_data",
+        annotations={
+            "title": "Import Table Data (CSV/TSV)",
+            "readOnlyHint": False,
+            "destructiveHint": False,
+            "idempotentHint": False,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_import_table_data(params: ImportTableDataInput) -> str:
+        """Import a large table from CSV/TSV text, a CSV/TSV file, or columns/rows.
+
+        Exactly one source: `text`, `file_path`, or `columns` + `rows`
+        (pandas DataFrame.to_dict(orient='split') shape). The delimiter is
+        auto-detected unless given. Omit shape_name_or_index to create a new
+        table sized to the data; with an existing table, resize=True (default)
+        adds rows/columns so everything fits. The whole import runs in one
+        COM round trip; unchanged cells are not rewritten.
         """
-        return set_table_data(params)
+        return await import_table_data(params)
 
     @mcp.tool(
         name="ppt_merge_table_cells",
@@ -1178,7 +1446,7 @@ def register_tools(mcp):
         Merges from (start_row, start_col) to (end_row, end_col).
         Uses Cell.Merge() which merges the entire rectangular range.
         """
-        return merge_table_cells(params)
+        return await merge_table_cells(params)
 
     @mcp.tool(
         name="ppt_add_table_row",
@@ -1196,7 +1464,7 @@ def register_tools(mcp):
         If position is provided, inserts before that row (1-based).
         If omitted, appends at the end.
         """
-        return add_table_row(params)
+        return await add_table_row(params)
 
     @mcp.tool(
         name="ppt_delete_table_row",
@@ -1214,7 +1482,7 @@ def register_tools(mcp):
         Removes the row at the specified 1-based position.
         Remaining rows re-index automatically.
         """
-        return delete_table_row(params)
+        return await delete_table_row(params)
 
     @mcp.tool(
         name="ppt_add_table_column",
@@ -1232,7 +1500,7 @@ def register_tools(mcp):
         If position is provided, inserts before that column (1-based).
         If omitted, appends at the end.
         """
-        return add_table_column(params)
+        return await add_table_column(params)
 
     @mcp.tool(
         name="ppt_delete_table_column",
@@ -1250,7 +1518,7 @@ def register_tools(mcp):
         Removes the column at the specified 1-based position.
         Remaining columns re-index automatically.
         """
-        return delete_table_column(params)
+        return await delete_table_column(params)
 
     @mcp.tool(
         name="ppt_set_table_style",
@@ -1269,7 +1537,7 @@ def register_tools(mcp):
         '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}' for Medium Style 2 - Accent 1).
         Optionally toggle header row, total row, banding rows/columns.
         """
-        return set_table_style(params)
+        return await set_table_style(params)
 
     @mcp.tool(
         name="ppt_set_table_layout",
@@ -1290,7 +1558,7 @@ def register_tools(mcp):
         are left unchanged. Returns actual values after setting (PowerPoint may clamp
         to a minimum).
         """
-        return set_table_layout(params)
+        return await set_table_layout(params)
 
     @mcp.tool(
         name="ppt_split_table_cells",
@@ -1308,7 +1576,7 @@ def register_tools(mcp):
         Use num_rows=1, num_cols=1 (default) for a simple unmerge.
         Uses Cell.Split(NumRows, NumColumns) — the inverse of ppt_merge_table_cells.
         """
-        return split_table_cells(params)
+        return await split_table_cells(params)
 
     @mcp.tool(
         name="ppt_set_table_borders",
@@ -1328,4 +1596,4 @@ def register_tools(mcp):
         'top', 'bottom', 'left', 'right', 'diagonal_down', 'diagonal_up'.
         Optionally set visible, color ('#RRGGBB'), weight (points), and dash_style.
         """
-        return set_table_borders(params)
+        return await set_table_borders(params)
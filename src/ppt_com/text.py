@@ -1,22 +1,29 @@
 """Text content, formatting, and manipulation tools for PowerPoint COM automation."""
 
+import hashlib
 import json
 import logging
 import os
 import re
+import threading
 import time
 import unicodedata
+import uuid
+from collections import OrderedDict
 from typing import List, Optional, Union
 
+from mcp.server.fastmcp import Context
 from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
 from utils.com_wrapper import ppt
 from utils.navigation import goto_slide
 from utils.color import hex_to_int, int_to_hex, int_to_rgb, get_theme_color_index
+from utils.progress import Progress, tracked
 from utils.validation import font_size_warning
+from utils import text_match
+from ppt_com import snapshot
 from ppt_com.constants import (
     msoTrue, msoFalse, msoTriStateMixed,
-    msoPlaceholder, msoGroup,
     ppAlignLeft, ppAlignCenter, ppAlignRight, ppAlignJustify, ppAlignDistribute,
     ppAutoSizeNone, ppAutoSizeShapeToFitText, ppAutoSizeTextToFitShape,
     ppBulletNone, ppBulletUnnumbered, ppBulletNumbered,
@@ -451,6 +458,62 @@ class FindReplaceTextInput(BaseModel):
         return v
 
 
+class ReplacementEntry(BaseModel):
+    """One row of a find/replace table."""
+    # No str_strip_whitespace: leading/trailing spaces are significant in
+    # both search terms and replacements.
+    model_config = ConfigDict(extra="forbid")
+
+    find: str = Field(..., min_length=1, description="Literal text, or a Python regex when regex=true")
+    replace: str = Field(
+        default="",
+        description="Replacement text. For regex entries, \\1 / \\g<name> backreferences are expanded.",
+    )
+    regex: bool = Field(default=False, description="Treat `find` as a regular expression")
+
+
+class FindReplaceManyInput(BaseModel):
+    """Input for applying a whole find/replace table in one pass."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    replacements: List[ReplacementEntry] = Field(
+        ..., min_length=1, max_length=5000,
+        description="Find/replace table, applied simultaneously (replacements never cascade)",
+    )
+    dry_run: bool = Field(
+        default=False, description="If true, report matches without writing.",
+    )
+    match_case: bool = Field(default=False, description="Case-sensitive matching for every entry.")
+    whole_words: bool = Field(default=False, description="Match whole words only.")
+    slide_indices: Optional[List[int]] = Field(
+        default=None,
+        description="1-based slide indices to process. Omit to process all slides.",
+    )
+    shape_name: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        description="Limit to a shape with this Name. Applied within each targeted slide.",
+    )
+    context_chars: int = Field(
+        default=0,
+        ge=0,
+        le=500,
+        description="Include N characters of context before/after each hit in the result.",
+    )
+
+    @field_validator("slide_indices")
+    @classmethod
+    def _validate_slide_indices(cls, v):
+        if v is None:
+            return v
+        if len(v) == 0:
+            raise ValueError("slide_indices must not be empty if provided")
+        for i in v:
+            if i < 1:
+                raise ValueError(f"slide_indices entries must be >= 1 (got {i})")
+        return v
+
+
 class SetTextframeInput(BaseModel):
     """Input for configuring text frame properties (auto-fit, margins, etc.)."""
     model_config = ConfigDict(str_strip_whitespace=True)
@@ -505,6 +568,21 @@ class GetAllTextInput(BaseModel):
             "directory. Parent directories must already exist."
         ),
     )
+    changed_since: Optional[str] = Field(
+        default=None,
+        description=(
+            "Token from the last line of a previous ppt_get_all_text result. "
+            "Only slides added or changed since that read are returned, with a "
+            "summary of unchanged and removed slides."
+        ),
+    )
+    use_cache: bool = Field(
+        default=True,
+        description=(
+            "Reuse the Markdown of slides whose content fingerprint is unchanged. "
+            "Set false to force a full re-extraction."
+        ),
+    )
 
     @model_validator(mode="after")
     def check_slide_indices(self):
@@ -554,7 +632,7 @@ _SKIP_PLACEHOLDER_TYPES = {13, 14, 15, 16}  # SlideNumber, Header, Footer, Date
 _TITLE_PLACEHOLDER_TYPES = {1, 3, 5}  # Title, CenterTitle, VerticalTitle
 _SUBTITLE_PLACEHOLDER_TYPES = {4}  # Subtitle
 
-# Max slides per COM batch — keep under the 30-second COM call timeout
+# Max slides per COM job — keep well under the execute timeout
 _GET_ALL_TEXT_BATCH_SIZE = 15
 
 
@@ -723,9 +801,14 @@ def _table_to_markdown(shape) -> str:
         return ""
 
 
-def _collect_text_shapes(slide) -> list:
+def _collect_text_shapes(slide, snaps=None) -> list:
     """Collect all text-bearing shapes from a slide with position info.
 
+    Args:
+        slide: COM slide.
+        snaps: The slide's snapshot (text depth, group items, COM objects)
+            if the caller already took one; read here otherwise.
+
     Returns a list of dicts with keys:
         shape, top, left, width, height, is_title, is_subtitle,
         has_table, is_group
@@ -733,74 +816,41 @@ def _collect_text_shapes(slide) -> list:
     """
     shapes = []
 
-    def _process_shape(shape, offset_top=0.0, offset_left=0.0):
-        """Process a single shape (may be called recursively for groups).
+    def _process(snap, offset_top=0.0, offset_left=0.0):
+        """Process one snapshot (recursing into groups).
 
         Args:
-            shape: COM shape object
+            snap: Shape snapshot (see ppt_com.snapshot)
             offset_top: Accumulated Y offset from parent groups
             offset_left: Accumulated X offset from parent groups
         """
-        # Check placeholder skip / classify in a single COM read
-        is_title = False
-        is_subtitle = False
-        if shape.Type == msoPlaceholder:
-            try:
-                ph_type = shape.PlaceholderFormat.Type
-                if ph_type in _SKIP_PLACEHOLDER_TYPES:
-                    return
-                is_title = ph_type in _TITLE_PLACEHOLDER_TYPES
-                is_subtitle = ph_type in _SUBTITLE_PLACEHOLDER_TYPES
-            except Exception:
-                pass
+        ph_type = snap["placeholder_type"]
+        if ph_type in _SKIP_PLACEHOLDER_TYPES:
+            return
 
-        # Recurse into groups early (no need to build info dict)
-        # Pass group's position as offset since child coordinates are
+        # Pass the group's position as offset since child coordinates are
         # relative to the group, not the slide.
-        if shape.Type == msoGroup:
-            try:
-                g_top = shape.Top
-                g_left = shape.Left
-                for gi in range(1, shape.GroupItems.Count + 1):
-                    _process_shape(
-                        shape.GroupItems(gi),
-                        offset_top + g_top,
-                        offset_left + g_left,
-                    )
-            except Exception:
-                pass
+        if snap["is_group"]:
+            for child in snap.get("children", ()):
+                _process(child, offset_top + snap["top"], offset_left + snap["left"])
             return
 
-        info = {
-            "shape": shape,
-            "top": shape.Top + offset_top,
-            "left": shape.Left + offset_left,
-            "width": shape.Width,
-            "height": shape.Height,
-            "is_title": is_title,
-            "is_subtitle": is_subtitle,
-            "has_table": False,
-        }
-
-        # Check for table
-        try:
-            if shape.HasTable:
-                info["has_table"] = True
-                shapes.append(info)
-                return
-        except Exception:
-            pass
-
-        # Check for text
-        try:
-            if shape.HasTextFrame:
-                if shape.TextFrame.HasText:
-                    shapes.append(info)
-        except Exception:
-            pass
+        if snap["has_table"] or snap["has_text"]:
+            shapes.append({
+                "shape": snap["com"],
+                "top": snap["top"] + offset_top,
+                "left": snap["left"] + offset_left,
+                "width": snap["width"],
+                "height": snap["height"],
+                "is_title": ph_type in _TITLE_PLACEHOLDER_TYPES,
+                "is_subtitle": ph_type in _SUBTITLE_PLACEHOLDER_TYPES,
+                "has_table": snap["has_table"],
+            })
 
-    for i in range(1, slide.Shapes.Count + 1):
-        _process_shape(slide.Shapes(i))
+    if snaps is None:
+        snaps = _text_snapshot(slide)
+    for snap in snaps:
+        _process(snap)
 
     return shapes
 
@@ -929,8 +979,26 @@ def _group_into_columns(shapes: list, threshold: float = 50.0) -> list:
     return columns
 
 
-def _slide_to_markdown(slide, slide_index: int) -> str:
-    """Convert a single slide to pseudo-Markdown.
+def _is_hidden(slide) -> bool:
+    try:
+        return bool(slide.SlideShowTransition.Hidden)
+    except Exception:
+        return False
+
+
+def _slide_header(slide_index: int, hidden: bool) -> str:
+    """'== Slide N ==' line, marked (hidden) for hidden slides."""
+    return f"== Slide {slide_index}{' (hidden)' if hidden else ''} =="
+
+
+def _slide_to_markdown(slide, slide_index: int, snaps=None) -> str:
+    """Convert a single slide to pseudo-Markdown."""
+    header = _slide_header(slide_index, _is_hidden(slide))
+    return header + "\n" + _slide_body_markdown(slide, snaps)
+
+
+def _slide_body_markdown(slide, snaps=None) -> str:
+    """Pseudo-Markdown for a slide's shapes (everything below the header).
 
     Layout algorithm:
     - Rows are processed in Y-order to preserve vertical position.
@@ -939,19 +1007,11 @@ def _slide_to_markdown(slide, slide_index: int) -> str:
       by X-position into columns so heading + body from the same
       column appear together.  All-bold shapes in columns use ###.
     """
-    # Check if slide is hidden
-    hidden = ""
-    try:
-        if slide.SlideShowTransition.Hidden:
-            hidden = " (hidden)"
-    except Exception:
-        pass
-    parts = [f"== Slide {slide_index}{hidden} =="]
+    parts = []
 
-    shape_infos = _collect_text_shapes(slide)
+    shape_infos = _collect_text_shapes(slide, snaps)
     if not shape_infos:
-        parts.append("(no text)")
-        return "\n".join(parts)
+        return "(no text)"
 
     rows = _group_into_rows(shape_infos)
     has_multi_shape_rows = any(len(row) > 1 for row in rows)
@@ -999,31 +1059,183 @@ def _slide_to_markdown(slide, slide_index: int) -> str:
     return "\n".join(parts)
 
 
-def _get_all_text_impl(slide_indices) -> str:
-    """Extract all text from the presentation as pseudo-Markdown.
+def _text_snapshot(slide) -> list:
+    """Slide snapshot as consumed by _collect_text_shapes."""
+    return snapshot.snapshot_slide(
+        slide, snapshot.TEXT, include_group_items=True, keep_com=True,
+    )
+
+
+def _text_fingerprint(snaps, hidden: bool = False) -> str:
+    """Cheap change fingerprint of what _slide_body_markdown renders.
 
-    Runs on the COM thread.
+    Covers shape identity, geometry, placeholder role and text from the
+    snapshot, plus a few whole-range formatting reads per text shape (bold,
+    italic, run count, bullets, indent) and table cell text. A formatting
+    change confined to part of already mixed-format text can go unnoticed;
+    ppt_get_all_text(use_cache=false) re-extracts everything.
     """
+    records = [hidden]
+
+    def add(snap):
+        rec = [
+            snap["name"], snap["type"], snap["placeholder_type"],
+            round(snap["left"], 1), round(snap["top"], 1),
+            round(snap["width"], 1), round(snap["height"], 1),
+            snap["text"],
+        ]
+        shape = snap["com"]
+        if snap["has_text"]:
+            try:
+                tr = shape.TextFrame.TextRange
+                font = tr.Font
+                bullet = tr.ParagraphFormat.Bullet
+                rec += [font.Bold, font.Italic, tr.Runs().Count,
+                        bullet.Visible, bullet.Type, tr.IndentLevel]
+            except Exception:
+                pass
+        elif snap["has_table"]:
+            rec.append(_table_to_markdown(shape))
+        records.append(rec)
+        for child in snap.get("children", ()):
+            add(child)
+
+    for snap in snaps:
+        add(snap)
+    raw = json.dumps(records, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class _MarkdownCache:
+    """Per-slide Markdown memo and change tokens for ppt_get_all_text.
+
+    Bodies are keyed by (presentation FullName, SlideID) and stored with the
+    fingerprint they were rendered from, so a slide is re-extracted only
+    when its fingerprint changes; the '== Slide N ==' header is rebuilt every
+    time since reordering changes N.
+
+    A token names the {slide_id: fingerprint} state returned by one call, so
+    a later call with changed_since=<token> can skip unchanged slides.
+    """
+
+    def __init__(self, max_slides: int = 2000, max_tokens: int = 32):
+        self._bodies: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._tokens: "OrderedDict[str, dict]" = OrderedDict()
+        self._max_slides = max_slides
+        self._max_tokens = max_tokens
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def body(self, pres_name, slide_id, fingerprint):
+        with self._lock:
+            entry = self._bodies.get((pres_name, slide_id))
+            if entry is None or entry[0] != fingerprint:
+                self.stats["misses"] += 1
+                return None
+            self._bodies.move_to_end((pres_name, slide_id))
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def store(self, pres_name, slide_id, fingerprint, body) -> None:
+        with self._lock:
+            self._bodies[(pres_name, slide_id)] = (fingerprint, body)
+            self._bodies.move_to_end((pres_name, slide_id))
+            while len(self._bodies) > self._max_slides:
+                self._bodies.popitem(last=False)
+
+    def new_token(self, pres_name, fingerprints: dict, slide_ids: list) -> str:
+        token = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._tokens[token] = {
+                "pres": pres_name, "fingerprints": fingerprints, "slide_ids": slide_ids,
+            }
+            while len(self._tokens) > self._max_tokens:
+                self._tokens.popitem(last=False)
+        return token
+
+    def token_state(self, token) -> Optional[dict]:
+        with self._lock:
+            return self._tokens.get(token)
+
+
+_markdown_cache = _MarkdownCache()
+
+
+def markdown_cache_stats() -> dict:
+    """Counters of the ppt_get_all_text per-slide memo."""
+    with _markdown_cache._lock:
+        return {
+            "slides": len(_markdown_cache._bodies),
+            "tokens": len(_markdown_cache._tokens),
+            **_markdown_cache.stats,
+        }
+
+
+def _all_text_context_impl(changed_since):
+    """Slide count, presentation name, slide ids and the baseline state."""
     pres = ppt._get_pres_impl()
-    total_slides = pres.Slides.Count
+    pres_name = pres.FullName
+    baseline = _markdown_cache.token_state(changed_since) if changed_since else None
+    if baseline is not None and baseline["pres"] != pres_name:
+        baseline = None
+    return {
+        "pres": pres_name,
+        "total": pres.Slides.Count,
+        "slide_ids": [pres.Slides(i).SlideID for i in range(1, pres.Slides.Count + 1)],
+        "baseline": baseline,
+    }
 
-    if slide_indices is None:
-        indices = list(range(1, total_slides + 1))
-    else:
-        indices = slide_indices
 
-    slide_parts = []
-    for idx in indices:
+def _get_all_text_impl(slide_indices, use_cache=True, known=None, progress=None) -> dict:
+    """Extract pseudo-Markdown for slide_indices. Runs on the COM thread.
+
+    Args:
+        slide_indices: 1-based indices (invalid ones produce a note).
+        use_cache: Reuse memoized bodies of unchanged slides.
+        known: {slide_id: fingerprint} of a previous read; slides that still
+            match are reported as unchanged and not rendered at all.
+        progress: Optional Progress; the read may stop before the last slide.
+
+    Returns:
+        dict with "slides": list of {index, slide_id, fingerprint, markdown,
+        unchanged}.
+    """
+    pres = ppt._get_pres_impl()
+    pres_name = pres.FullName
+    total_slides = pres.Slides.Count
+
+    slides = []
+    for idx in tracked(slide_indices, progress):
         if idx < 1 or idx > total_slides:
-            slide_parts.append(
-                f"== Slide {idx} ==\n(invalid slide index, "
-                f"presentation has {total_slides} slides)"
-            )
+            slides.append({
+                "index": idx, "slide_id": None, "fingerprint": None, "unchanged": False,
+                "markdown": (
+                    f"== Slide {idx} ==\n(invalid slide index, "
+                    f"presentation has {total_slides} slides)"
+                ),
+            })
             continue
         slide = pres.Slides(idx)
-        slide_parts.append(_slide_to_markdown(slide, idx))
+        slide_id = slide.SlideID
+        snaps = _text_snapshot(slide)
+        hidden = _is_hidden(slide)
+        fingerprint = _text_fingerprint(snaps, hidden)
+        entry = {
+            "index": idx, "slide_id": slide_id, "fingerprint": fingerprint,
+            "unchanged": False, "markdown": None,
+        }
+        if known is not None and known.get(slide_id) == fingerprint:
+            entry["unchanged"] = True
+            slides.append(entry)
+            continue
+        body = _markdown_cache.body(pres_name, slide_id, fingerprint) if use_cache else None
+        if body is None:
+            body = _slide_body_markdown(slide, snaps)
+            _markdown_cache.store(pres_name, slide_id, fingerprint, body)
+        entry["markdown"] = _slide_header(idx, hidden) + "\n" + body
+        slides.append(entry)
 
-    return "\n\n".join(slide_parts)
+    return {"slides": slides}
 
 
 # ---------------------------------------------------------------------------
@@ -1520,6 +1732,7 @@ def _find_replace_text_impl(
     slide_indices,
     shape_name,
     context_chars,
+    progress=None,
 ) -> dict:
     pres = ppt._get_pres_impl()
     find_only = replace_text is None or dry_run
@@ -1539,7 +1752,7 @@ def _find_replace_text_impl(
         slides_to_search = [pres.Slides(i) for i in range(1, pres.Slides.Count + 1)]
 
     hits = []
-    for slide in slides_to_search:
+    for slide in tracked(slides_to_search, progress):
         for si in range(1, slide.Shapes.Count + 1):
             shape = slide.Shapes(si)
             if shape_name is not None and shape.Name != shape_name:
@@ -1614,6 +1827,151 @@ def _build_context(full_text, start, length, n):
     )
 
 
+# Cap on the per-hit list returned by ppt_find_replace_many; counts are
+# always complete.
+_MAX_LISTED_MATCHES = 500
+
+
+def _run_bounds(text_range) -> list:
+    """Return [(start, end)] (1-based, end exclusive) for each run of a range."""
+    runs = text_range.Runs()
+    bounds = []
+    for i in range(1, runs.Count + 1):
+        run = text_range.Runs(i)
+        bounds.append((run.Start, run.Start + run.Length))
+    return bounds
+
+
+def _remap_runs(runs: list, new_length: int) -> list:
+    """Scale saved run boundaries onto a replacement of a different length."""
+    old_length = sum(r["length"] for r in runs)
+    if old_length == new_length or old_length == 0:
+        return runs
+    remapped = []
+    cum = 0
+    prev = 0
+    for r in runs:
+        cum += r["length"]
+        end = round(cum * new_length / old_length)
+        if end > prev:
+            remapped.append({**r, "start": prev + 1, "length": end - prev})
+            prev = end
+    return remapped
+
+
+def _replace_in_frame(tr, text: str, matches: list) -> None:
+    """Write matches back into a TextRange, touching only the matched spans.
+
+    Works right to left so earlier offsets stay valid. A span inside a single
+    run simply inherits that run's formatting; a span that crosses runs has
+    its per-run formatting saved and re-applied (scaled to the new length).
+    """
+    offsets = text_match.utf16_offsets(text)
+
+    def pos(i):
+        return offsets[i] if offsets else i
+
+    bounds = None
+    for m in reversed(matches):
+        start = pos(m.start) + 1
+        length = pos(m.end) - pos(m.start)
+        if bounds is None:
+            bounds = _run_bounds(tr)
+        single_run = any(s <= start and start + length <= e for s, e in bounds)
+        target = tr.Characters(start, length)
+        saved = None if single_run else _save_run_formatting(target)
+        target.Text = m.replacement
+        new_length = len(m.replacement.encode("utf-16-le")) // 2
+        if saved and new_length:
+            _restore_run_formatting(
+                tr.Characters(start, new_length), _remap_runs(saved, new_length)
+            )
+
+
+def _find_replace_many_impl(
+    replacements,
+    dry_run,
+    match_case,
+    whole_words,
+    slide_indices,
+    shape_name,
+    context_chars,
+) -> dict:
+    matcher = text_match.MultiMatcher(replacements, match_case, whole_words)
+    pres = ppt._get_pres_impl()
+
+    if slide_indices is not None:
+        max_index = pres.Slides.Count
+        for i in slide_indices:
+            if i > max_index:
+                raise ValueError(
+                    f"slide_indices entry {i} out of range (1-{max_index})"
+                )
+    else:
+        slide_indices = range(1, pres.Slides.Count + 1)
+
+    counts = [0] * len(replacements)
+    hits = []
+    match_count = 0
+    shapes_changed = 0
+    for slide_index in slide_indices:
+        slide = pres.Slides(slide_index)
+        for si in range(1, slide.Shapes.Count + 1):
+            shape = slide.Shapes(si)
+            if shape_name is not None and shape.Name != shape_name:
+                continue
+            if not shape.HasTextFrame:
+                continue
+            tr = shape.TextFrame.TextRange
+            text = tr.Text
+            matches = matcher.find(text)
+            if not matches:
+                continue
+
+            new_text = text if dry_run else text_match.apply_matches(text, matches)
+            if not dry_run:
+                _replace_in_frame(tr, text, matches)
+                shapes_changed += 1
+            offsets = text_match.utf16_offsets(new_text)
+
+            # Positions are reported in the text as it is now (the replaced
+            # text in replace mode), 1-based like COM Start.
+            delta = 0
+            for m in matches:
+                counts[m.rule] += 1
+                match_count += 1
+                start = m.start + delta
+                end = start + (len(m.replacement) if not dry_run else m.end - m.start)
+                if not dry_run:
+                    delta += len(m.replacement) - (m.end - m.start)
+                if len(hits) >= _MAX_LISTED_MATCHES:
+                    continue
+                hit = {
+                    "slide_index": slide_index,
+                    "shape_name": shape.Name,
+                    "entry": m.rule + 1,
+                    "start": (offsets[start] if offsets else start) + 1,
+                    "length": (offsets[end] - offsets[start]) if offsets else end - start,
+                }
+                if context_chars > 0:
+                    hit["context"] = _build_context(new_text, start + 1, end - start, context_chars)
+                hits.append(hit)
+
+    return {
+        "status": "success",
+        "mode": "find" if dry_run else "replace",
+        "match_count": match_count,
+        "shapes_changed": shapes_changed,
+        "entries": [
+            {"entry": i + 1, "find": r["find"], "count": counts[i]}
+            for i, r in enumerate(replacements) if counts[i]
+        ],
+        "unmatched_entries": sum(1 for c in counts if not c),
+        "matches": hits,
+        "matches_truncated": match_count > len(hits),
+    }
+
+
 def _set_textframe_impl(slide_index, shape_name_or_index,
                         auto_size, word_wrap,
                         margin_left, margin_right, margin_top, margin_bottom,
@@ -1681,10 +2039,10 @@ def _set_textframe_impl(slide_index, shape_name_or_index,
 # ---------------------------------------------------------------------------
 # MCP tool functions
 # ---------------------------------------------------------------------------
-def set_text(params: SetTextInput) -> str:
+async def set_text(params: SetTextInput) -> str:
     """Set the entire text content of a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_text_impl, params.slide_index, params.shape_name_or_index, params.text
         )
         return json.dumps(result)
@@ -1692,10 +2050,10 @@ def set_text(params: SetTextInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def get_text(params: GetTextInput) -> str:
+async def get_text(params: GetTextInput) -> str:
     """Get text content and formatting info from a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _get_text_impl, params.slide_index, params.shape_name_or_index
         )
         return json.dumps(result)
@@ -1703,10 +2061,10 @@ def get_text(params: GetTextInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def format_text(params: FormatTextInput) -> str:
+async def format_text(params: FormatTextInput) -> str:
     """Format all text in a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _format_text_impl,
             params.slide_index, params.shape_name_or_index,
             params.font_name, params.font_name_fareast,
@@ -1722,10 +2080,10 @@ def format_text(params: FormatTextInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def format_text_range(params: FormatTextRangeInput) -> str:
+async def format_text_range(params: FormatTextRangeInput) -> str:
     """Format a specific character range within a shape's text."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _format_text_range_impl,
             params.slide_index, params.shape_name_or_index,
             params.start, params.length,
@@ -1743,10 +2101,10 @@ def format_text_range(params: FormatTextRangeInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def set_paragraph_format(params: SetParagraphFormatInput) -> str:
+async def set_paragraph_format(params: SetParagraphFormatInput) -> str:
     """Set paragraph formatting for a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_paragraph_format_impl,
             params.slide_index, params.shape_name_or_index, params.paragraph_index,
             params.alignment, params.line_spacing, params.space_before,
@@ -1757,10 +2115,10 @@ def set_paragraph_format(params: SetParagraphFormatInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def set_bullet(params: SetBulletInput) -> str:
+async def set_bullet(params: SetBulletInput) -> str:
     """Set bullet/numbering and appearance for paragraphs in a shape."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_bullet_impl,
             params.slide_index, params.shape_name_or_index, params.paragraph_index,
             params.bullet_type, params.bullet_char, params.bullet_start_value,
@@ -1772,7 +2130,7 @@ def set_bullet(params: SetBulletInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def find_replace_text(params: FindReplaceTextInput) -> str:
+async def find_replace_text(params: FindReplaceTextInput, ctx: Optional[Context] = None) -> str:
     """Find (and optionally replace) text across slides.
 
     Modes:
@@ -1786,13 +2144,49 @@ def find_replace_text(params: FindReplaceTextInput) -> str:
     - `context_chars`: include surrounding text in the result for each hit.
     """
     try:
-        result = ppt.execute(
-            _find_replace_text_impl,
+        total = await ppt.execute_async(lambda: ppt._get_pres_impl().Slides.Count)
+        if params.slide_indices is not None:
+            for i in params.slide_indices:
+                if i > total:
+                    raise ValueError(f"slide_indices entry {i} out of range (1-{total})")
+            indices = params.slide_indices
+        else:
+            indices = list(range(1, total + 1))
+
+        progress = Progress(ctx)
+        parts = await progress.execute_chunked(
+            _find_replace_text_impl, indices,
             params.find_text,
             params.replace_text,
             params.dry_run,
             params.match_case,
             params.whole_words,
+            shape_name=params.shape_name,
+            context_chars=params.context_chars,
+        )
+        result = parts[0] if parts else {
+            "status": "success",
+            "mode": "find" if params.replace_text is None or params.dry_run else "replace",
+            "find_text": params.find_text,
+            "replace_text": params.replace_text,
+        }
+        result["matches"] = [hit for part in parts for hit in part["matches"]]
+        result["match_count"] = len(result["matches"])
+        result.update(progress.partial())
+        return json.dumps(result)
+    except Exception as e:
+        return json.dumps({"error": str(e)})
+
+
+async def find_replace_many(params: FindReplaceManyInput) -> str:
+    """Apply a whole find/replace table in one pass over the targeted text."""
+    try:
+        result = await ppt.execute_async(
+            _find_replace_many_impl,
+            [entry.model_dump() for entry in params.replacements],
+            params.dry_run,
+            params.match_case,
+            params.whole_words,
             params.slide_indices,
             params.shape_name,
             params.context_chars,
@@ -1802,10 +2196,10 @@ def find_replace_text(params: FindReplaceTextInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def set_textframe(params: SetTextframeInput) -> str:
+async def set_textframe(params: SetTextframeInput) -> str:
     """Configure text frame properties (auto-fit, word wrap, margins, orientation)."""
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_textframe_impl,
             params.slide_index, params.shape_name_or_index,
             params.auto_size, params.word_wrap,
@@ -1817,28 +2211,72 @@ def set_textframe(params: SetTextframeInput) -> str:
         return json.dumps({"error": str(e)})
 
 
-def get_all_text(params: GetAllTextInput) -> str:
+def _changes_summary(token, baseline, slides, current_ids) -> str:
+    """Header line describing a changed_since read."""
+    if baseline is None:
+        return (
+            f"== Changes since {token}: token unknown or expired "
+            f"(returning all requested slides) =="
+        )
+    known = baseline["fingerprints"]
+    changed = [s for s in slides if not s["unchanged"]]
+    added = sum(1 for s in changed if s["slide_id"] not in known)
+    removed = [sid for sid in baseline["slide_ids"] if sid not in set(current_ids)]
+    line = (
+        f"== Changes since {token}: {len(changed) - added} changed, {added} added, "
+        f"{len(slides) - len(changed)} unchanged"
+    )
+    if removed:
+        line += f", {len(removed)} removed (slide ids {removed})"
+    return line + " =="
+
+
+async def get_all_text(params: GetAllTextInput, ctx: Optional[Context] = None) -> str:
     """Extract all text from the presentation as pseudo-Markdown.
 
     Batches COM calls to avoid the 30-second timeout on large presentations.
+    Unchanged slides come from the per-slide Markdown memo; with
+    changed_since only slides that differ from that earlier read are
+    rendered. Every result ends with a token for the next changed_since.
     Optionally writes the result to a file if output_path is specified.
     """
     try:
+        info = await ppt.execute_async(_all_text_context_impl, params.changed_since)
         if params.slide_indices is not None:
             indices = params.slide_indices
         else:
-            # Get total slide count first
-            total = ppt.execute(lambda: ppt._get_pres_impl().Slides.Count)
-            indices = list(range(1, total + 1))
-
-        # Process in batches to stay under the 30s COM timeout
-        all_parts = []
-        for i in range(0, len(indices), _GET_ALL_TEXT_BATCH_SIZE):
-            batch = indices[i:i + _GET_ALL_TEXT_BATCH_SIZE]
-            part = ppt.execute(_get_all_text_impl, batch)
-            all_parts.append(part)
+            indices = list(range(1, info["total"] + 1))
+        baseline = info["baseline"]
+        known = baseline["fingerprints"] if baseline else None
+
+        # One COM job per batch, so other tools' jobs run in between
+        progress = Progress(ctx)
+        parts = await progress.execute_chunked(
+            _get_all_text_impl, indices, chunk_size=_GET_ALL_TEXT_BATCH_SIZE,
+            use_cache=params.use_cache, known=known,
+        )
+        slides = [slide for part in parts for slide in part["slides"]]
 
-        text = "\n\n".join(all_parts)
+        # The new token covers what the caller has now seen: the earlier
+        # state (for a partial read) updated with this read.
+        fingerprints = dict(known or {})
+        fingerprints.update(
+            (s["slide_id"], s["fingerprint"]) for s in slides if s["slide_id"] is not None
+        )
+        current_ids = info["slide_ids"]
+        fingerprints = {sid: fp for sid, fp in fingerprints.items() if sid in set(current_ids)}
+        token = _markdown_cache.new_token(info["pres"], fingerprints, current_ids)
+
+        parts = [s["markdown"] for s in slides if not s["unchanged"]]
+        if params.changed_since:
+            parts.insert(0, _changes_summary(params.changed_since, baseline, slides, current_ids))
+        if progress.stopped:
+            rest = indices[len(slides):]
+            parts.append(
+                f"== Stopped after {len(slides)} of {len(indices)} slides "
+                f"({progress.stopped}); the remaining slides start at slide {rest[0]} =="
+            )
+        text = "\n\n".join(parts)
 
         if params.output_path:
             abs_path = os.path.abspath(params.output_path)
@@ -1848,9 +2286,12 @@ def get_all_text(params: GetAllTextInput) -> str:
                 "status": "success",
                 "output_path": abs_path,
                 "slide_count": len(indices),
+                "changed_count": sum(1 for s in slides if not s["unchanged"]),
+                "token": token,
+                **progress.partial(),
             })
 
-        return text
+        return f"{text}\n\n<!-- changed_since token: {token} -->"
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -1932,35 +2373,37 @@ def _find_best_vbreak(prev_line_text, widow_text):
     return pos, prev_line_text[:pos], prev_line_text[pos:] + widow_text
 
 
-def _get_widows(shape, max_chars, max_words):
-    """Return list of widow issues for a single shape."""
+def _read_lines(shape) -> list:
+    """Return the text of every laid-out line of a shape (one Lines() walk).
+
+    Widow and short-break detection both work from this list, so a shape's
+    line metrics are read over COM once per layout instead of once per check.
+    """
     tr = shape.TextFrame.TextRange
-    lines_count = tr.Lines().Count
-    if lines_count < 2:
-        return []
+    count = tr.Lines().Count
+    return [tr.Lines(li).Text for li in range(1, count + 1)]
+
+
+def _is_short_line(text, max_chars, max_words) -> bool:
+    if _is_latin(text):
+        return len(text.split()) <= max_words
+    return len(text) <= max_chars
+
 
+def _widows_from_lines(lines, max_chars, max_words):
+    """Return list of widow issues for a shape's line texts."""
     widows = []
-    for li in range(2, lines_count + 1):
-        prev_line = tr.Lines(li - 1)
-        prev_text = prev_line.Text
+    for li in range(2, len(lines) + 1):
+        prev_text = lines[li - 2]
         # Explicit break (\r = paragraph, \n = soft return) — not a widow.
         if prev_text.endswith("\r") or prev_text.endswith("\n"):
             continue
 
-        cur_line = tr.Lines(li)
-        cur_text = cur_line.Text.rstrip("\r\n")
+        cur_text = lines[li - 1].rstrip("\r\n")
         if not cur_text:
             continue
 
-        is_widow = False
-        if _is_latin(cur_text):
-            if len(cur_text.split()) <= max_words:
-                is_widow = True
-        else:
-            if len(cur_text) <= max_chars:
-                is_widow = True
-
-        if is_widow:
+        if _is_short_line(cur_text, max_chars, max_words):
             widows.append({
                 "line_index": li,
                 "line_text": cur_text,
@@ -1970,41 +2413,26 @@ def _get_widows(shape, max_chars, max_words):
     return widows
 
 
-def _get_short_vbreaks(shape, max_chars, max_words):
+def _short_vbreaks_from_lines(lines, max_chars, max_words):
     """Return list of lines after an explicit \\v that are too short.
 
     These are the opposite of widows — explicit breaks that leave the
     following line unnecessarily sparse. Removing the \\v would let text
     flow naturally.
     """
-    tr = shape.TextFrame.TextRange
-    lines_count = tr.Lines().Count
-    if lines_count < 2:
-        return []
-
     short_breaks = []
-    for li in range(2, lines_count + 1):
-        prev_line = tr.Lines(li - 1)
-        prev_text = prev_line.Text
+    for li in range(2, len(lines) + 1):
+        prev_text = lines[li - 2]
         # Only flag lines after an explicit \v (shows as \n in COM).
         # Skip \r (paragraph break) — those are intentional structural breaks.
         if not prev_text.endswith("\n"):
             continue
 
-        cur_line = tr.Lines(li)
-        cur_text = cur_line.Text.rstrip("\r\n")
+        cur_text = lines[li - 1].rstrip("\r\n")
         if not cur_text:
             continue
 
-        is_short = False
-        if _is_latin(cur_text):
-            if len(cur_text.split()) <= max_words:
-                is_short = True
-        else:
-            if len(cur_text) <= max_chars:
-                is_short = True
-
-        if is_short:
+        if _is_short_line(cur_text, max_chars, max_words):
             short_breaks.append({
                 "line_index": li,
                 "line_text": cur_text,
@@ -2015,23 +2443,69 @@ def _get_short_vbreaks(shape, max_chars, max_words):
     return short_breaks
 
 
-def _right_neighbor_gap(shape, slide):
-    """Find the gap (pt) to the nearest shape on the right that vertically overlaps."""
-    s_right = shape.Left + shape.Width
-    s_top = shape.Top
-    s_bottom = shape.Top + shape.Height
+def _solve_min_width(shape, original_width, room, max_chars, max_words):
+    """Find the smallest whole-point widening (<= room) that leaves no widows.
+
+    The previous strategy widened 1 pt at a time and re-walked every line
+    after each step, costing up to `room` relayouts per shape. Line wrapping
+    only ever gets looser as a box widens, so the widow-free widths form
+    (in practice) an upper interval: probe the full budget once and, if it
+    helps, bisect down to the smallest sufficient step.
+
+    Returns (step or None, lines at the chosen width, relayout count). The
+    shape is left at the chosen width, or at original_width when no step
+    within the budget resolves the widows.
+    """
+    relayouts = 0
+
+    def probe(step):
+        nonlocal relayouts
+        relayouts += 1
+        shape.Width = original_width + step
+        lines = _read_lines(shape)
+        return lines, not _widows_from_lines(lines, max_chars, max_words)
+
+    hi = int(room)
+    if hi < 1:
+        return None, None, relayouts
+    hi_lines, ok = probe(hi)
+    if not ok:
+        shape.Width = original_width
+        return None, None, relayouts
+
+    lo = 0  # known to have widows
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        lines, ok = probe(mid)
+        if ok:
+            hi, hi_lines = mid, lines
+        else:
+            lo = mid
+    if shape.Width != original_width + hi:
+        shape.Width = original_width + hi
+    return hi, hi_lines, relayouts
+
+
+def _right_neighbor_gap(snap, snaps):
+    """Find the gap (pt) to the nearest shape on the right that vertically overlaps.
+
+    Works on the slide's geometry snapshot (ppt_com.snapshot), so checking
+    many shapes does not re-read every neighbour over COM.
+    """
+    s_right = snap["left"] + snap["width"]
+    s_top = snap["top"]
+    s_bottom = snap["top"] + snap["height"]
     min_gap = float("inf")
 
-    for j in range(1, slide.Shapes.Count + 1):
-        other = slide.Shapes(j)
-        if other.Name == shape.Name:
+    for other in snaps:
+        if other["index"] == snap["index"]:
             continue
         # Must vertically overlap
-        if other.Top + other.Height <= s_top or other.Top >= s_bottom:
+        if other["top"] + other["height"] <= s_top or other["top"] >= s_bottom:
             continue
         # Must be to the right
-        if other.Left > s_right - 1:
-            gap = other.Left - s_right
+        if other["left"] > s_right - 1:
+            gap = other["left"] - s_right
             if gap < min_gap:
                 min_gap = gap
 
@@ -2039,26 +2513,28 @@ def _right_neighbor_gap(shape, slide):
 
 
 def _check_typography_impl(slide_indices, max_chars, max_words,
-                           fix, max_expand_pt):
+                           fix, max_expand_pt, progress=None):
     """Scan shapes for widow lines; optionally fix by widening."""
     app = ppt._get_app_impl()
     pres = ppt._get_pres_impl()
     issues = []
     fixed = []
+    relayouts = 0
 
-    for si in slide_indices:
+    for si in tracked(slide_indices, progress):
         if si < 1 or si > pres.Slides.Count:
             continue
         goto_slide(app, si)
         slide = pres.Slides(si)
+        # One snapshot per slide serves the text filter and every gap check
+        # below; only the shape being fixed is re-read.
+        snaps = snapshot.snapshot_slide(slide, snapshot.TEXT, keep_com=True)
 
-        for j in range(1, slide.Shapes.Count + 1):
-            shape = slide.Shapes(j)
-            if not shape.HasTextFrame:
+        for snap in snaps:
+            if not snap["has_text_frame"] or not (snap["text"] or "").strip():
                 continue
+            shape = snap["com"]
             tr = shape.TextFrame.TextRange
-            if not tr.Text.strip():
-                continue
 
             # Detect auto-shrink — only when text is actually being
             # compressed (natural height exceeds available space).
@@ -2074,25 +2550,26 @@ def _check_typography_impl(slide_indices, max_chars, max_words,
                     if natural_h > avail_h:
                         issues.append({
                             "slide_index": si,
-                            "shape_name": shape.Name,
+                            "shape_name": snap["name"],
                             "shape_width": round(shape.Width, 2),
                             "type": "auto_shrink",
                             "fixable": False,
                         })
             except Exception:
                 logger.debug("Cannot check AutoSize for shape '%s'",
-                             shape.Name, exc_info=True)
+                             snap["name"], exc_info=True)
 
-            widows = _get_widows(shape, max_chars, max_words)
+            lines = _read_lines(shape)
+            widows = _widows_from_lines(lines, max_chars, max_words)
 
             # Detect short lines after explicit \v breaks
             # (when fix=True, we re-check after fix and report then)
             if not fix:
-                vbreak_shorts = _get_short_vbreaks(shape, max_chars, max_words)
+                vbreak_shorts = _short_vbreaks_from_lines(lines, max_chars, max_words)
                 for vb in vbreak_shorts:
                     issues.append({
                         "slide_index": si,
-                        "shape_name": shape.Name,
+                        "shape_name": snap["name"],
                         "shape_width": round(shape.Width, 2),
                         **vb,
                     })
@@ -2102,30 +2579,30 @@ def _check_typography_impl(slide_indices, max_chars, max_words,
 
             if fix:
                 # Calculate safe expansion room
-                gap = _right_neighbor_gap(shape, slide)
+                gap = _right_neighbor_gap(snap, snaps)
                 room = min(gap - 2, max_expand_pt)  # 2pt margin
                 if room < 1:
                     room = 0  # skip widen step, go straight to \v
 
                 original_width = shape.Width
-                resolved = False
-                for step in range(1, int(room) + 1):
-                    shape.Width = original_width + step
-                    remaining = _get_widows(shape, max_chars, max_words)
-                    if not remaining:
-                        fixed.append({
-                            "slide_index": si,
-                            "shape_name": shape.Name,
-                            "old_width": round(original_width, 2),
-                            "new_width": round(shape.Width, 2),
-                            "expanded_by": step,
-                        })
-                        resolved = True
-                        break
+                step, fixed_lines, probes = _solve_min_width(
+                    shape, original_width, room, max_chars, max_words,
+                )
+                relayouts += probes
+                resolved = step is not None
+                if resolved:
+                    fixed.append({
+                        "slide_index": si,
+                        "shape_name": snap["name"],
+                        "old_width": round(original_width, 2),
+                        "new_width": round(shape.Width, 2),
+                        "expanded_by": step,
+                        "relayouts": probes,
+                    })
+                    lines = fixed_lines
 
                 if not resolved:
-                    # Revert width — try soft-return insertion instead
-                    shape.Width = original_width
+                    # Width already reverted — try soft-return insertion instead
                     remaining = widows
                     # Strategy 2: insert \v at word boundary
                     # Process widows in reverse order (later positions first)
@@ -2141,7 +2618,7 @@ def _check_typography_impl(slide_indices, max_chars, max_words,
                         if brk is None:
                             issues.append({
                                 "slide_index": si,
-                                "shape_name": shape.Name,
+                                "shape_name": snap["name"],
                                 "shape_width": round(original_width, 2),
                                 "fix_status": "no_break_point",
                                 **w,
@@ -2159,7 +2636,7 @@ def _check_typography_impl(slide_indices, max_chars, max_words,
                         if idx == -1:
                             issues.append({
                                 "slide_index": si,
-                                "shape_name": shape.Name,
+                                "shape_name": snap["name"],
                                 "shape_width": round(original_width, 2),
                                 "fix_status": "text_not_found",
                                 **w,
@@ -2171,7 +2648,7 @@ def _check_typography_impl(slide_indices, max_chars, max_words,
                         vbreak_applied = True
                         fixed.append({
                             "slide_index": si,
-                            "shape_name": shape.Name,
+                            "shape_name": snap["name"],
                             "fix_method": "soft_return",
                             "before": before,
                             "after": after,
@@ -2179,13 +2656,14 @@ def _check_typography_impl(slide_indices, max_chars, max_words,
                     # After \v insertions, re-check for remaining widows
                     # and new short_after_vbreak issues
                     if vbreak_applied:
-                        still_remaining = _get_widows(
-                            shape, max_chars, max_words,
+                        lines = _read_lines(shape)
+                        still_remaining = _widows_from_lines(
+                            lines, max_chars, max_words,
                         )
                         for w in still_remaining:
                             issues.append({
                                 "slide_index": si,
-                                "shape_name": shape.Name,
+                                "shape_name": snap["name"],
                                 "shape_width": round(shape.Width, 2),
                                 "fix_status": "remaining",
                                 **w,
@@ -2193,21 +2671,24 @@ def _check_typography_impl(slide_indices, max_chars, max_words,
 
                 # Always report short_after_vbreak in fix mode
                 # (covers both width-expanded and \v-inserted shapes)
-                post_fix_vbreaks = _get_short_vbreaks(
-                    shape, max_chars, max_words,
+                post_fix_vbreaks = _short_vbreaks_from_lines(
+                    lines, max_chars, max_words,
                 )
                 for vb in post_fix_vbreaks:
                     issues.append({
                         "slide_index": si,
-                        "shape_name": shape.Name,
+                        "shape_name": snap["name"],
                         "shape_width": round(shape.Width, 2),
                         **vb,
                     })
+
+                # Keep the snapshot current for later neighbour gap checks.
+                snap["width"], snap["height"] = shape.Width, shape.Height
             else:
                 for w in widows:
                     issues.append({
                         "slide_index": si,
-                        "shape_name": shape.Name,
+                        "shape_name": snap["name"],
                         "shape_width": round(shape.Width, 2),
                         **w,
                     })
@@ -2217,23 +2698,33 @@ def _check_typography_impl(slide_indices, max_chars, max_words,
         result["fixed"] = fixed
         result["fixed_count"] = len(fixed)
         result["remaining"] = len(issues)
+        result["relayouts"] = relayouts
     return result
 
 
-def check_typography(params: CheckTypographyInput) -> str:
+async def check_typography(params: CheckTypographyInput, ctx: Optional[Context] = None) -> str:
     """Check slides for typographic widow lines."""
     try:
         if params.slide_index is not None:
             indices = [params.slide_index]
         else:
-            total = ppt.execute(lambda: ppt._get_pres_impl().Slides.Count)
+            total = await ppt.execute_async(lambda: ppt._get_pres_impl().Slides.Count)
             indices = list(range(1, total + 1))
 
-        result = ppt.execute(
+        progress = Progress(ctx)
+        parts = await progress.execute_chunked(
             _check_typography_impl, indices,
-            params.max_chars, params.max_words,
-            params.fix, params.max_expand_pt,
+            max_chars=params.max_chars, max_words=params.max_words,
+            fix=params.fix, max_expand_pt=params.max_expand_pt,
         )
+        issues = [issue for part in parts for issue in part["issues"]]
+        result = {"issues": issues, "total": len(issues)}
+        if params.fix:
+            result["fixed"] = [fix for part in parts for fix in part["fixed"]]
+            result["fixed_count"] = len(result["fixed"])
+            result["remaining"] = len(issues)
+            result["relayouts"] = sum(part["relayouts"] for part in parts)
+        result.update(progress.partial())
         return json.dumps(result, ensure_ascii=False)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -2265,7 +2756,7 @@ def register_tools(mcp):
         preserving bullet/indent. Use \\v for wrapping at natural word
         boundaries within one paragraph.
         """
-        return set_text(params)
+        return await set_text(params)
 
     @mcp.tool(
         name="ppt_get_text",
@@ -2283,7 +2774,7 @@ def register_tools(mcp):
         Returns the full text, paragraph info (alignment, indent level),
         and per-run formatting (font, size, bold, italic, color).
         """
-        return get_text(params)
+        return await get_text(params)
 
     @mcp.tool(
         name="ppt_format_text",
@@ -2301,7 +2792,7 @@ def register_tools(mcp):
         Sets font properties (name, size, bold, italic, underline, color)
         for the entire text content of the shape.
         """
-        return format_text(params)
+        return await format_text(params)
 
     @mcp.tool(
         name="ppt_format_text_range",
@@ -2322,7 +2813,7 @@ def register_tools(mcp):
         2. **search_text**: Search for the text and format the matching range.
            Use occurrence to target the Nth match (default: 1st).
         """
-        return format_text_range(params)
+        return await format_text_range(params)
 
     @mcp.tool(
         name="ppt_set_paragraph_format",
@@ -2340,7 +2831,7 @@ def register_tools(mcp):
         Applies alignment, line spacing, space before/after, indent level,
         and first-line indent. Omit paragraph_index to format all paragraphs.
         """
-        return set_paragraph_format(params)
+        return await set_paragraph_format(params)
 
     @mcp.tool(
         name="ppt_set_bullet",
@@ -2375,7 +2866,7 @@ def register_tools(mcp):
           ppt_set_bullet(..., paragraph_index=1, bullet_type='unnumbered', indent_level=1)
           ppt_set_bullet(..., paragraph_index=2, bullet_type='unnumbered', indent_level=2)
         """
-        return set_bullet(params)
+        return await set_bullet(params)
 
     @mcp.tool(
         name="ppt_find_replace_text",
@@ -2387,7 +2878,7 @@ def register_tools(mcp):
             "openWorldHint": False,
         },
     )
-    async def tool_ppt_find_replace_text(params: FindReplaceTextInput) -> str:
+    async def tool_ppt_find_replace_text(params: FindReplaceTextInput, ctx: Optional[Context] = None) -> str:
         """Find (and optionally replace) text in shapes that have a text frame.
 
         Modes:
@@ -2412,12 +2903,50 @@ def register_tools(mcp):
         Targets only shapes where `HasTextFrame` is true. Table cells, grouped
         shapes, speaker notes, and SmartArt are not searched.
 
+        Sends per-slide progress notifications. When stopped early by the
+        timeout or a cancellation, returns the matches so far with
+        `partial: true`, `stopped_reason`, `slides_done` and `slides_total`.
+
         Note: `readOnlyHint` is `False` because the tool can write. In
         find-only / dry-run mode the tool performs no writes, but the hint is
         not adjusted dynamically — clients that gate on the hint may prompt
         unnecessarily for find-only calls.
         """
-        return find_replace_text(params)
+        return await find_replace_text(params, ctx)
+
+    @mcp.tool(
+        name="ppt_find_replace_many",
+        annotations={
+            "title": "Find or Replace Many Terms",
+            "readOnlyHint": False,
+            "destructiveHint": False,
+            "idempotentHint": False,
+            "openWorldHint": False,
+        },
+    )
+    async def tool_ppt_find_replace_many(params: FindReplaceManyInput) -> str:
+        """Apply a whole find/replace table (literals and regexes) in one pass.
+
+        Use this instead of repeated ppt_find_replace_text calls for
+        localization, rebranding or terminology tables. Each text frame is
+        read once and all entries are matched together; only the matched
+        spans are rewritten, so surrounding run formatting is untouched.
+
+        - `replacements`: [{"find": "...", "replace": "...", "regex": false}, ...]
+          Regex entries use Python syntax; `\\1` / `\\g<name>` expand groups.
+        - Entries are applied simultaneously: when matches overlap, the
+          leftmost wins, then the longest, then the earlier entry. Results
+          never cascade (A→B and B→C turns A into B, not C).
+        - `dry_run=True` reports matches without writing.
+        - `match_case`, `whole_words`, `slide_indices`, `shape_name` and
+          `context_chars` behave as in ppt_find_replace_text.
+
+        Output: `match_count`, `shapes_changed`, per-entry `entries` counts,
+        `unmatched_entries`, and up to 500 `matches` (each with
+        `slide_index`, `shape_name`, 1-based `entry`, `start`, `length`,
+        and `context` when requested).
+        """
+        return await find_replace_many(params)
 
     @mcp.tool(
         name="ppt_set_textframe",
@@ -2440,7 +2969,7 @@ def register_tools(mcp):
         - vertical_anchor: 'top', 'middle', or 'bottom' — controls vertical text alignment
         Also sets inner margins (points) and text orientation.
         """
-        return set_textframe(params)
+        return await set_textframe(params)
 
     @mcp.tool(
         name="ppt_get_all_text",
@@ -2452,7 +2981,7 @@ def register_tools(mcp):
             "openWorldHint": False,
         },
     )
-    async def tool_ppt_get_all_text(params: GetAllTextInput) -> str:
+    async def tool_ppt_get_all_text(params: GetAllTextInput, ctx: Optional[Context] = None) -> str:
         """Extract all text from the presentation as pseudo-Markdown.
 
         Returns a structured overview of every slide's content:
@@ -2470,8 +2999,16 @@ def register_tools(mcp):
         returning the text directly.
 
         Omit slide_indices to get all slides.
+
+        The result ends with a `changed_since token`. After editing, pass it
+        as changed_since to get only the slides that changed since that read
+        (plus a one-line summary) instead of the whole deck again.
+
+        Sends per-slide progress notifications. If the read runs out of
+        time it returns the slides read so far and a closing line saying
+        where it stopped.
         """
-        return get_all_text(params)
+        return await get_all_text(params, ctx)
 
     @mcp.tool(
         name="ppt_check_typography",
@@ -2483,7 +3020,7 @@ def register_tools(mcp):
             "openWorldHint": False,
         },
     )
-    async def tool_ppt_check_typography(params: CheckTypographyInput) -> str:
+    async def tool_ppt_check_typography(params: CheckTypographyInput, ctx: Optional[Context] = None) -> str:
         """Detect and optionally fix typography issues on slides.
 
         Detects three issue types:
@@ -2498,6 +3035,11 @@ def register_tools(mcp):
         to auto-fix widows: first tries widening shapes (left edge
         fixed, stops at neighbors with 2pt margin), then inserts soft
         returns at word boundaries. Unfixable shapes are reported with
-        fix_status='no_break_point' or 'text_not_found'.
+        fix_status='no_break_point' or 'text_not_found'. The smallest
+        sufficient width is found by bisection; `relayouts` (total and per
+        widened shape) counts the width changes that had to be laid out.
+
+        Sends per-slide progress notifications; a check cut short by the
+        timeout returns what it found with `partial: true` and `slides_done`.
         """
-        return check_typography(params)
+        return await check_typography(params, ctx)
@@ -482,7 +482,7 @@ def _set_headers_footers_impl(
 # ---------------------------------------------------------------------------
 # MCP tool functions (sync wrappers that delegate to COM thread)
 # ---------------------------------------------------------------------------
-def apply_theme(params: ApplyThemeInput) -> str:
+async def apply_theme(params: ApplyThemeInput) -> str:
     """Apply a theme file to the active presentation.
 
     Args:
@@ -492,7 +492,7 @@ def apply_theme(params: ApplyThemeInput) -> str:
         JSON confirming the theme was applied.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _apply_theme_impl,
             params.theme_path,
         )
@@ -501,7 +501,7 @@ def apply_theme(params: ApplyThemeInput) -> str:
         return json.dumps({"error": f"Failed to apply theme: {str(e)}"})
 
 
-def get_theme_colors(params: GetThemeColorsInput) -> str:
+async def get_theme_colors(params: GetThemeColorsInput) -> str:
     """Get the current theme color scheme.
 
     Args:
@@ -511,13 +511,13 @@ def get_theme_colors(params: GetThemeColorsInput) -> str:
         JSON with the 12 theme colors (name and hex value).
     """
     try:
-        result = ppt.execute(_get_theme_colors_impl)
+        result = await ppt.execute_async(_get_theme_colors_impl)
         return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": f"Failed to get theme colors: {str(e)}"})
 
 
-def set_theme_colors(params: SetThemeColorsInput) -> str:
+async def set_theme_colors(params: SetThemeColorsInput) -> str:
     """Set individual theme colors.
 
     Args:
@@ -563,7 +563,7 @@ def set_theme_colors(params: SetThemeColorsInput) -> str:
         for name, hex_val in merged.items():
             color_map[THEME_COLOR_MAP[name]] = hex_to_int(hex_val)
 
-        result = ppt.execute(_set_theme_colors_impl, color_map)
+        result = await ppt.execute_async(_set_theme_colors_impl, color_map)
         if preset_name:
             result["preset"] = preset_name
         if params.primary is not None:
@@ -573,7 +573,7 @@ def set_theme_colors(params: SetThemeColorsInput) -> str:
         return json.dumps({"error": f"Failed to set theme colors: {str(e)}"})
 
 
-def set_headers_footers(params: SetHeadersFootersInput) -> str:
+async def set_headers_footers(params: SetHeadersFootersInput) -> str:
     """Set headers and footers across all slides.
 
     Args:
@@ -583,7 +583,7 @@ def set_headers_footers(params: SetHeadersFootersInput) -> str:
         JSON confirming how many slides were updated.
     """
     try:
-        result = ppt.execute(
+        result = await ppt.execute_async(
             _set_headers_footers_impl,
             params.footer_text, params.footer_visible,
             params.slide_number_visible, params.date_visible,
@@ -620,7 +620,7 @@ def register_tools(mcp):
         Provide the path to a .thmx theme file or a themed presentation.
         The path will be normalized to an absolute Windows path for COM.
         """
-        return apply_theme(params)
+        return await apply_theme(params)
 
     @mcp.tool(
         name="ppt_get_theme_colors",
@@ -638,7 +638,7 @@ def register_tools(mcp):
         Returns all 12 theme colors (dark1, light1, dark2, light2,
         accent1-6, hyperlink, followed_hyperlink) with their hex values.
         """
-        return get_theme_colors(params)
+        return await get_theme_colors(params)
 
     @mcp.tool(
         name="ppt_set_theme_colors",
@@ -673,7 +673,7 @@ def register_tools(mcp):
         Colors are applied to ALL slide masters. Values are #RRGGBB hex strings.
         Only specified colors are changed; omitted colors remain unchanged.
         """
-        return set_theme_colors(params)
+        return await set_theme_colors(params)
 
     @mcp.tool(
         name="ppt_set_headers_footers",
@@ -692,4 +692,4 @@ def register_tools(mcp):
         Use date_fixed_text for a fixed date string, or date_format for
         an auto-updating date (PpDateTimeFormat integer).
         """
-        return set_headers_footers(params)
+        return await set_headers_footers(params)
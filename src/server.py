@@ -3,14 +3,11 @@
 Real-time PowerPoint control via COM automation.
 """
 
+import asyncio
 import logging
-import os
 import sys
-import tempfile
 from pathlib import Path
 
-from pydantic import BaseModel, Field
-
 # When installed via PyPI (entry point: src.server:main), ensure the src/
 # directory is in sys.path so that internal imports like
 # `from utils.com_wrapper import ppt` resolve correctly.
@@ -20,7 +17,7 @@ if _src_dir not in sys.path:
 
 from contextlib import asynccontextmanager
 
-from mcp.server.fastmcp import FastMCP, Image
+from mcp.server.fastmcp import FastMCP
 
 # Configure logging to stderr (stdout is used for MCP protocol)
 logging.basicConfig(
@@ -35,6 +32,7 @@ logger = logging.getLogger("ppt-mcp")
 async def app_lifespan(server: FastMCP):
     """Manage COM lifecycle for the MCP server."""
     from utils.com_wrapper import ppt
+    from utils import perf_stats
 
     from utils.com_wrapper import AUTO_DISMISS_DIALOG
     logger.info("AUTO_DISMISS_DIALOG=%s (set PPT_AUTO_DISMISS_DIALOG=true to enable)", AUTO_DISMISS_DIALOG)
@@ -44,9 +42,18 @@ async def app_lifespan(server: FastMCP):
     # PowerPoint.exe the moment the MCP client boots, even when the user never
     # invokes a ppt_* tool. The COM connection is established lazily on the
     # first tool call instead (see PowerPointCOMWrapper._get_app_impl).
+    summary_task = None
+    if perf_stats.LOG_INTERVAL > 0:
+        summary_task = asyncio.create_task(
+            perf_stats.log_summary_periodically(perf_stats.LOG_INTERVAL)
+        )
     try:
         yield {}
     finally:
+        if summary_task is not None:
+            summary_task.cancel()
+        if perf_stats.perf_stats.total_calls():
+            logger.info("%s", perf_stats.perf_stats.summary())
         logger.info("Shutting down PowerPoint COM worker thread...")
         ppt.stop()
 
@@ -62,7 +69,7 @@ mcp = FastMCP(
 3. When adding slides, use `ppt_add_slide` with `count` to create multiple slides at once instead of calling it repeatedly.
 4. After placing text, set fonts explicitly with `ppt_batch_apply_formatting` or `ppt_set_default_fonts`. On Japanese-locale Windows, the slide master default is often 游ゴシック, which renders thin and illegible when projected. Preferred fonts: BIZ UDPゴシック (Japanese) + Segoe UI (Latin).
 5. For visual symbols, `ppt_search_icons` + `ppt_add_svg_icon` produce crisper, scalable results than emoji characters and are generally preferred in presentations.
-6. Use `ppt_get_slide_preview` to visually inspect slides as you work.
+6. Use `ppt_get_slide_preview` to visually inspect slides as you work, and `ppt_get_slides_preview` to review several slides (or the whole deck) in one contact sheet.
 
 ## Key tools
 
@@ -71,6 +78,7 @@ mcp = FastMCP(
 - `ppt_add_shape`: Supports inline text styling (`font_name`, `font_size`, `bold`, `font_color`, `align`) — no need for a separate `ppt_format_text` call.
 - `ppt_add_slide`: Accepts `count` to create multiple slides at once.
 - `ppt_set_slide_background`: Accepts `slide_indices` to set background on multiple slides in one call.
+- `ppt_execute_batch`: Run a whole script of tool calls (e.g. every shape and style on a slide) in one round trip. Later steps can reference shapes created earlier via `$<id>.shape_name`.
 
 ## Design thinking
 
@@ -93,16 +101,23 @@ Standard 16:9 slide = 960 × 540 pt. Default to light backgrounds unless the use
 """,
 )
 
+# Time every tool registered from here on (see utils/perf_stats.py).
+from utils.perf_stats import instrument_tools
+
+instrument_tools(mcp)
+
 
 # =============================================================================
 # App tools
 # =============================================================================
 from ppt_com.app import (
     ConnectInput,
+    GetPerformanceStatsInput,
     SetWindowStateInput,
     connect_to_powerpoint,
     get_app_info,
     get_active_window_info,
+    get_performance_stats,
     list_presentations,
     set_window_state,
 )
@@ -125,7 +140,7 @@ async def tool_ppt_connect(params: ConnectInput) -> str:
     If no instance is found, launches a new one.
     Set visible=false for headless mode (background operation).
     """
-    return connect_to_powerpoint(params)
+    return await connect_to_powerpoint(params)
 
 
 @mcp.tool(
@@ -144,7 +159,7 @@ async def tool_ppt_get_app_info() -> str:
     Returns version, visibility, window state, presentation count,
     and active presentation name.
     """
-    return get_app_info()
+    return await get_app_info()
 
 
 @mcp.tool(
@@ -163,7 +178,7 @@ async def tool_ppt_get_active_window() -> str:
     Returns window caption, view type, current slide index,
     and what is selected (shapes, text, or nothing).
     """
-    return get_active_window_info()
+    return await get_active_window_info()
 
 
 @mcp.tool(
@@ -181,7 +196,7 @@ async def tool_ppt_list_presentations() -> str:
 
     Returns name, path, slide count, and status for each.
     """
-    return list_presentations()
+    return await list_presentations()
 
 
 @mcp.tool(
@@ -200,7 +215,27 @@ async def tool_ppt_set_window_state(params: SetWindowStateInput) -> str:
     Controls whether the PowerPoint window is maximized, minimized, or
     restored to normal size.
     """
-    return set_window_state(params)
+    return await set_window_state(params)
+
+
+@mcp.tool(
+    name="ppt_get_performance_stats",
+    annotations={
+        "title": "Get Performance Stats",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": False,
+    },
+)
+async def tool_ppt_get_performance_stats(params: GetPerformanceStatsInput) -> str:
+    """Show which tools dominate wall-clock time.
+
+    Per tool: calls, errors, wall time, time queued for the COM thread,
+    COM execution time and busy retries, plus cache hit counters. Set
+    PPT_PERF_COUNT_COM=true to also count COM property gets/sets and calls.
+    """
+    return await get_performance_stats(params)
 
 
 # =============================================================================
@@ -264,6 +299,13 @@ try:
 except ImportError:
     logger.debug("export module not yet available")
 
+# Slide preview tools (single slide, multi-slide / contact sheet)
+try:
+    from ppt_com.preview import register_tools as register_preview_tools
+    register_preview_tools(mcp)
+except ImportError:
+    logger.debug("preview module not yet available")
+
 # SlideShow tools
 try:
     from ppt_com.slideshow import register_tools as register_slideshow_tools
@@ -390,75 +432,33 @@ try:
 except ImportError:
     logger.debug("freeform module not yet available")
 
+# Offline tools for closed .pptx files (no COM)
+try:
+    from ppt_com.offline import register_tools as register_offline_tools
+    register_offline_tools(mcp)
+except ImportError:
+    logger.debug("offline module not yet available")
 
-# =============================================================================
-# Tools: Slide Preview (Visual Inspection)
-# =============================================================================
-
-
-class GetSlidePreviewInput(BaseModel):
-    slide_index: int = Field(1, ge=1, description="1-based slide index")
-
-
-@mcp.tool(
-    name="ppt_get_slide_preview",
-    annotations={
-        "title": "Get Slide Preview Image",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": False,
-    },
-)
-async def tool_ppt_get_slide_preview(params: GetSlidePreviewInput) -> Image:
-    """Get a visual preview of a PowerPoint slide as an image.
-
-    This is the RECOMMENDED way to visually inspect slides for appearance, design,
-    layout, colors, text readability, and overall quality. Much more efficient
-    than exporting all slides to files.
-
-    Also navigates the PowerPoint editor window to the target slide so the user
-    can see which slide is being inspected.
-
-    Returns:
-        Image: PNG image of the slide for visual inspection
-    """
-    from utils.com_wrapper import ppt
-    from utils.navigation import goto_slide
-
-    def _export_slide_impl(slide_idx: int):
-        app = ppt._get_app_impl()
-        pres = ppt._get_pres_impl()
-        goto_slide(app, slide_idx)
-
-        # Validate slide
-        if slide_idx < 1 or slide_idx > pres.Slides.Count:
-            raise ValueError(
-                f"Slide index {slide_idx} out of range (1-{pres.Slides.Count})"
-            )
-
-        slide = pres.Slides(slide_idx)
-
-        # Generate temp file path
-        temp_dir = tempfile.gettempdir()
-        temp_file = os.path.join(temp_dir, f"ppt_slide_preview_{slide_idx}.png")
-
-        try:
-            # Export slide as PNG
-            slide.Export(temp_file, "PNG")
-
-            # Read binary data
-            with open(temp_file, "rb") as f:
-                image_data = f.read()
+# Batch export through PowerPoint worker threads (not the main COM thread)
+try:
+    from ppt_com.batch_export import register_tools as register_batch_export_tools
+    register_batch_export_tools(mcp)
+except ImportError:
+    logger.debug("batch_export module not yet available")
 
-            return image_data
-        finally:
-            # Cleanup
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+# Background jobs for long tool calls
+try:
+    from ppt_com.jobs import register_tools as register_jobs_tools
+    register_jobs_tools(mcp)
+except ImportError:
+    logger.debug("jobs module not yet available")
 
-    image_data = ppt.execute(_export_slide_impl, params.slide_index)
-    return Image(data=image_data, format="png")
+# Batch execution — must be registered last so it can dispatch to every tool
+try:
+    from ppt_com.batch_execute import register_tools as register_batch_execute_tools
+    register_batch_execute_tools(mcp)
+except ImportError:
+    logger.debug("batch_execute module not yet available")
 
 
 def main():
@@ -0,0 +1,304 @@
+"""Handling of PowerPoint "busy" rejections (modal dialogs, long operations).
+
+While PowerPoint shows a modal dialog or is in the middle of an operation it
+rejects incoming COM calls (RPC_E_CALL_REJECTED / RPC_E_SERVERCALL_RETRYLATER).
+Most rejections are short spikes, so they are handled in two stages:
+
+1. An IMessageFilter registered on the COM thread (through ole32, as
+   pywin32 does not wrap CoRegisterMessageFilter) answers COM's
+   RetryRejectedCall: the call is retried inside COM, after 100 ms, then
+   after as long again as it has already waited, until
+   PPT_BUSY_FILTER_MS (default 1000) has passed. A brief spike costs a
+   fraction of a second and the job never notices.
+2. If the call still fails, the worker defers the job (other jobs keep
+   running) and retries it with exponential backoff and jitter, starting at
+   PPT_BUSY_RETRY_INITIAL_MS (default 50) and capped at
+   PPT_BUSY_RETRY_MAX_DELAY_MS (default 2000), until the job has spent
+   PPT_BUSY_RETRY_TIMEOUT_S (default 15) waiting. It then fails with the
+   busy error.
+
+busy_stats counts both stages; ppt_get_performance_stats reports it, and the
+per-tool busy_retries / busy_wait_ms_total counters include both.
+"""
+
+import logging
+import os
+import random
+import threading
+import uuid
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+INITIAL_DELAY_S = _env_float("PPT_BUSY_RETRY_INITIAL_MS", 50) / 1000
+MAX_DELAY_S = _env_float("PPT_BUSY_RETRY_MAX_DELAY_MS", 2000) / 1000
+TIMEOUT_S = _env_float("PPT_BUSY_RETRY_TIMEOUT_S", 15)
+FILTER_BUDGET_MS = int(_env_float("PPT_BUSY_FILTER_MS", 1000))
+
+# IMessageFilter constants
+_SERVERCALL_ISHANDLED = 0
+_SERVERCALL_REJECTED = 1
+_PENDINGMSG_WAITDEFPROCESS = 2
+_RETRY_CANCEL = -1
+_MIN_FILTER_DELAY_MS = 100  # RetryRejectedCall: 0-99 means "retry at once"
+_IID_IUNKNOWN = uuid.UUID("00000000-0000-0000-c000-000000000046").bytes_le
+_IID_IMESSAGEFILTER = uuid.UUID("00000016-0000-0000-c000-000000000046").bytes_le
+_S_OK = 0
+_E_NOINTERFACE = -2147467262  # 0x80004002
+_E_POINTER = -2147467261  # 0x80004003
+
+
+class BusyRetryPolicy:
+    """Exponential backoff with jitter for deferred busy retries."""
+
+    def __init__(
+        self,
+        initial_s: float = INITIAL_DELAY_S,
+        max_delay_s: float = MAX_DELAY_S,
+        timeout_s: float = TIMEOUT_S,
+        jitter: float = 0.5,
+        rng: Optional[random.Random] = None,
+    ):
+        self.initial_s = initial_s
+        self.max_delay_s = max_delay_s
+        self.timeout_s = timeout_s
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+
+    def delay(self, retries: int) -> float:
+        """Seconds to wait before retry number retries + 1."""
+        base = min(self.max_delay_s, self.initial_s * (2 ** retries))
+        return base * (1 - self.jitter * self._rng.random())
+
+    def allows(self, waited_s: float, delay: float) -> bool:
+        """True while waiting delay more keeps the job within the timeout."""
+        return waited_s + delay <= self.timeout_s
+
+
+class BusyStats:
+    """Process-wide counters of time lost to busy rejections."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._c = {
+                "filter_retries": 0,
+                "filter_wait_ms": 0,
+                "filter_gave_up": 0,
+                "deferred_retries": 0,
+                "deferred_wait_ms": 0.0,
+                "episodes": 0,
+                "longest_episode_ms": 0.0,
+                "gave_up": 0,
+            }
+
+    def record_filter_retry(self, delay_ms: int) -> None:
+        with self._lock:
+            self._c["filter_retries"] += 1
+            self._c["filter_wait_ms"] += delay_ms
+
+    def record_filter_gave_up(self) -> None:
+        with self._lock:
+            self._c["filter_gave_up"] += 1
+
+    def filter_snapshot(self) -> tuple:
+        with self._lock:
+            return (self._c["filter_retries"], self._c["filter_wait_ms"])
+
+    def record_episode(self, deferred_retries: int, deferred_wait_s: float, total_wait_s: float,
+                       gave_up: bool) -> None:
+        """Record one job that hit at least one busy rejection."""
+        with self._lock:
+            c = self._c
+            c["episodes"] += 1
+            c["deferred_retries"] += deferred_retries
+            c["deferred_wait_ms"] += deferred_wait_s * 1000
+            c["longest_episode_ms"] = max(c["longest_episode_ms"], total_wait_s * 1000)
+            c["gave_up"] += int(gave_up)
+
+    def stats(self) -> dict:
+        with self._lock:
+            result = dict(self._c)
+        result["deferred_wait_ms"] = round(result["deferred_wait_ms"], 1)
+        result["longest_episode_ms"] = round(result["longest_episode_ms"], 1)
+        result["busy_wait_ms_total"] = round(result["filter_wait_ms"] + result["deferred_wait_ms"], 1)
+        result["policy"] = {
+            "filter_budget_ms": FILTER_BUDGET_MS,
+            "initial_delay_ms": round(INITIAL_DELAY_S * 1000),
+            "max_delay_ms": round(MAX_DELAY_S * 1000),
+            "timeout_s": TIMEOUT_S,
+        }
+        return result
+
+
+# Global singleton instance
+busy_stats = BusyStats()
+
+
+class MessageFilter:
+    """IMessageFilter for the COM thread: retries rejected calls inside COM.
+
+    RetryRejectedCall gets the milliseconds since the call was first made
+    (tick_count); the filter waits max(100 ms, tick_count) — doubling the
+    total wait each time — until budget_ms would be exceeded, then cancels so
+    the call fails with RPC_E_CALL_REJECTED and the worker's deferred retry
+    takes over without blocking other jobs.
+    """
+
+    _public_methods_ = ["HandleInComingCall", "RetryRejectedCall", "MessagePending"]
+
+    def __init__(self, budget_ms: int = FILTER_BUDGET_MS, stats: BusyStats = busy_stats):
+        self.budget_ms = budget_ms
+        self.stats = stats
+
+    def HandleInComingCall(self, call_type, caller_task, tick_count, interface_info):
+        return _SERVERCALL_ISHANDLED
+
+    def RetryRejectedCall(self, callee_task, tick_count, reject_type):
+        if reject_type == _SERVERCALL_REJECTED:
+            return _RETRY_CANCEL  # rejected outright: retrying in COM won't help
+        delay = max(_MIN_FILTER_DELAY_MS, tick_count)
+        if tick_count + delay > self.budget_ms:
+            self.stats.record_filter_gave_up()
+            return _RETRY_CANCEL
+        self.stats.record_filter_retry(delay)
+        return delay
+
+    def MessagePending(self, callee_task, tick_count, pending_type):
+        return _PENDINGMSG_WAITDEFPROCESS
+
+
+class _NativeMessageFilter:
+    """A MessageFilter exposed as a raw IMessageFilter COM object.
+
+    pywin32 wraps neither CoRegisterMessageFilter nor IMessageFilter, so
+    the vtable is built with ctypes and registered through ole32. COM's
+    reference count is only reported: the object lives until revoke().
+    """
+
+    def __init__(self, message_filter: MessageFilter):
+        import ctypes
+        from ctypes import POINTER, c_long, c_ulong, c_void_p
+
+        proto = ctypes.WINFUNCTYPE
+        self._refs = 1
+        self._previous = c_void_p()
+
+        def query_interface(this, riid, ppv):
+            if not ppv:
+                return _E_POINTER
+            if riid and ctypes.string_at(riid, 16) in (_IID_IUNKNOWN, _IID_IMESSAGEFILTER):
+                ppv[0] = this
+                self._refs += 1
+                return _S_OK
+            ppv[0] = None
+            return _E_NOINTERFACE
+
+        def add_ref(this):
+            self._refs += 1
+            return self._refs
+
+        def release(this):
+            self._refs = max(0, self._refs - 1)
+            return self._refs
+
+        def handle_in_coming_call(this, call_type, caller_task, tick_count, interface_info):
+            return message_filter.HandleInComingCall(
+                call_type, caller_task, tick_count, interface_info) & 0xFFFFFFFF
+
+        def retry_rejected_call(this, callee_task, tick_count, reject_type):
+            return message_filter.RetryRejectedCall(callee_task, tick_count, reject_type) & 0xFFFFFFFF
+
+        def message_pending(this, callee_task, tick_count, pending_type):
+            return message_filter.MessagePending(callee_task, tick_count, pending_type) & 0xFFFFFFFF
+
+        # Keep the callbacks referenced: the vtable only holds their addresses.
+        self._callbacks = (
+            proto(c_long, c_void_p, c_void_p, POINTER(c_void_p))(query_interface),
+            proto(c_ulong, c_void_p)(add_ref),
+            proto(c_ulong, c_void_p)(release),
+            proto(c_ulong, c_void_p, c_ulong, c_void_p, c_ulong, c_void_p)(handle_in_coming_call),
+            proto(c_ulong, c_void_p, c_void_p, c_ulong, c_ulong)(retry_rejected_call),
+            proto(c_ulong, c_void_p, c_void_p, c_ulong, c_ulong)(message_pending),
+        )
+        self._vtbl = (c_void_p * len(self._callbacks))(
+            *(ctypes.cast(cb, c_void_p) for cb in self._callbacks))
+        self._object = c_void_p(ctypes.addressof(self._vtbl))
+
+    def register(self) -> None:
+        import ctypes
+
+        ctypes.oledll.ole32.CoRegisterMessageFilter(
+            ctypes.byref(self._object), ctypes.byref(self._previous))
+
+    def revoke(self) -> None:
+        import ctypes
+        from ctypes import POINTER, c_ulong, c_void_p
+
+        ours = c_void_p()
+        ctypes.oledll.ole32.CoRegisterMessageFilter(self._previous, ctypes.byref(ours))
+        if self._previous.value:
+            # COM gave us a reference to the previous filter on register()
+            vtbl = ctypes.cast(self._previous, POINTER(POINTER(c_void_p)))[0]
+            ctypes.WINFUNCTYPE(c_ulong, c_void_p)(vtbl[2])(self._previous)
+
+
+def _pythoncom_api():
+    """pythoncom, if this pywin32 build exposes CoRegisterMessageFilter."""
+    import pythoncom
+
+    if hasattr(pythoncom, "CoRegisterMessageFilter") and hasattr(pythoncom, "IID_IMessageFilter"):
+        return pythoncom
+    return None
+
+
+def register_message_filter(budget_ms: int = FILTER_BUDGET_MS) -> tuple:
+    """Register a MessageFilter for the calling (COM) thread.
+
+    Returns (registered, restore); pass it to revoke_message_filter.
+    Nothing is registered when the budget is 0 or registration fails.
+    """
+    if budget_ms <= 0:
+        return (False, None)
+    message_filter = MessageFilter(budget_ms)
+    try:
+        pythoncom = _pythoncom_api()
+        if pythoncom is not None:
+            from win32com.server.util import wrap
+
+            previous = pythoncom.CoRegisterMessageFilter(
+                wrap(message_filter, pythoncom.IID_IMessageFilter)
+            )
+            restore = lambda: pythoncom.CoRegisterMessageFilter(previous)  # noqa: E731
+        else:
+            native = _NativeMessageFilter(message_filter)
+            native.register()
+            restore = native.revoke
+        logger.debug("COM message filter registered (budget %d ms)", budget_ms)
+        return (True, restore)
+    except Exception as exc:
+        logger.warning("Could not register the COM message filter (%s); "
+                       "busy calls are retried by the worker only", exc)
+        return (False, None)
+
+
+def revoke_message_filter(registration: tuple) -> None:
+    """Restore the filter that was in place before register_message_filter."""
+    registered, restore = registration
+    if not registered:
+        return
+    try:
+        restore()
+    except Exception as exc:
+        logger.debug("Could not restore the previous COM message filter: %s", exc)
@@ -0,0 +1,280 @@
+"""Scheduling of jobs for the single COM worker thread.
+
+PowerPoint can only be driven from one STA thread, so every tool's COM work
+is a job on one queue. A plain FIFO lets a cheap read wait behind a long
+export, so jobs are sorted into three lanes:
+
+- ``interactive``: tools registered with ``readOnlyHint: true``
+- ``write``: every other tool (and jobs queued outside a tool)
+- ``bulk``: whole-deck exports and renders (BULK_TOOLS), even when read-only
+
+The worker serves lanes in that priority order, except that a job that has
+waited longer than PPT_QUEUE_MAX_WAIT seconds (default 2) is served next
+whatever its lane, so bulk work cannot be starved by a stream of reads.
+Within a lane, tools take turns: a tool with many queued jobs does not hold
+back another tool's single job.
+
+A job from a tool that is both read-only and idempotent is coalesced with an
+identical job (same function and arguments) that is already queued or
+running, provided no write job has been queued since that job was. Both
+callers then get the one result. Jobs whose arguments are not hashable are
+never coalesced.
+
+A job can also be deferred (for busy retries): it leaves the lanes until its
+retry time so other jobs run meanwhile.
+
+Lanes come from the tool annotations seen at registration (register_tool,
+called by perf_stats.instrument_tools).
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+INTERACTIVE = "interactive"
+WRITE = "write"
+BULK = "bulk"
+LANES = (INTERACTIVE, WRITE, BULK)
+
+# Long whole-deck tools that should not hold up interactive work.
+BULK_TOOLS = frozenset({
+    "ppt_export_pdf",
+    "ppt_export_images",
+    "ppt_get_slides_preview",
+    "ppt_check_typography",
+})
+
+try:
+    MAX_WAIT: float = float(os.getenv("PPT_QUEUE_MAX_WAIT", "2"))
+except ValueError:
+    MAX_WAIT = 2.0
+
+# tool name -> (lane, read_only, coalescible)
+_tool_policies: dict = {}
+
+
+def _hint(annotations: Any, name: str) -> Optional[bool]:
+    if annotations is None:
+        return None
+    if isinstance(annotations, dict):
+        return annotations.get(name)
+    return getattr(annotations, name, None)
+
+
+def register_tool(name: str, annotations: Any) -> None:
+    """Record the lane and coalescing policy for a tool from its annotations."""
+    read_only = bool(_hint(annotations, "readOnlyHint"))
+    idempotent = bool(_hint(annotations, "idempotentHint"))
+    if name in BULK_TOOLS:
+        lane = BULK
+    elif read_only:
+        lane = INTERACTIVE
+    else:
+        lane = WRITE
+    _tool_policies[name] = (lane, read_only, read_only and idempotent)
+
+
+def policy_for(tool: Optional[str]) -> tuple:
+    """(lane, read_only, coalescible) for a tool name; unknown tools are writes."""
+    return _tool_policies.get(tool, (WRITE, False, False))
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a job argument (lists and dicts become tuples)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    hash(value)
+    return value
+
+
+class Job:
+    """One unit of COM work and the futures of every caller waiting on it."""
+
+    __slots__ = (
+        "func", "args", "kwargs", "futures", "tool", "lane", "key", "write_gen",
+        "queued_at", "started_at", "activated", "retries", "com_s", "busy_wait_s", "deferred_at",
+        "filter_retries", "filter_wait_s",
+    )
+
+    def __init__(self, func, args, kwargs, tool, lane, key, write_gen):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.futures = [Future()]
+        self.tool = tool
+        self.lane = lane
+        self.key = key
+        self.write_gen = write_gen
+        self.queued_at = time.perf_counter()
+        self.started_at = None
+        self.activated = False
+        self.retries = 0
+        self.com_s = 0.0
+        self.busy_wait_s = 0.0
+        self.deferred_at = None
+        self.filter_retries = 0
+        self.filter_wait_s = 0.0
+
+
+class JobScheduler:
+    """Thread-safe lane queue feeding the COM worker (see module docstring)."""
+
+    def __init__(self, max_wait: float = MAX_WAIT):
+        self.max_wait = max_wait
+        self._cond = threading.Condition()
+        self._lanes = {lane: OrderedDict() for lane in LANES}  # lane -> tool -> deque[Job]
+        self._deferred = []  # heap of (ready_at, seq, job)
+        self._seq = itertools.count()
+        self._inflight = {}  # coalescing key -> Job
+        self._write_gen = 0
+        self._closed = False
+        self._stats = {
+            "submitted": {lane: 0 for lane in LANES},
+            "served": {lane: 0 for lane in LANES},
+            "coalesced": 0,
+            "aged_promotions": 0,
+            "deferred": 0,
+        }
+
+    # -- producer side -----------------------------------------------------
+    def submit(self, func: Callable, args: tuple, kwargs: dict, tool: Optional[str]) -> Future:
+        """Queue func(*args, **kwargs) for tool and return the caller's Future."""
+        lane, read_only, coalescible = policy_for(tool)
+        key = None
+        if coalescible:
+            try:
+                key = (func, _freeze(args), _freeze(kwargs))
+            except TypeError:
+                key = None
+        with self._cond:
+            if key is not None:
+                existing = self._inflight.get(key)
+                if existing is not None and existing.write_gen == self._write_gen:
+                    future = Future()
+                    if existing.activated:
+                        future.set_running_or_notify_cancel()
+                    existing.futures.append(future)
+                    self._stats["coalesced"] += 1
+                    return future
+            if not read_only:
+                self._write_gen += 1
+            job = Job(func, args, kwargs, tool, lane, key, self._write_gen)
+            if key is not None:
+                self._inflight[key] = job
+            self._enqueue(job)
+            self._stats["submitted"][lane] += 1
+            self._cond.notify()
+            return job.futures[0]
+
+    def _enqueue(self, job: Job, front: bool = False) -> None:
+        per_tool = self._lanes[job.lane]
+        queue = per_tool.get(job.tool)
+        if queue is None:
+            queue = per_tool[job.tool] = deque()
+        if front:
+            queue.appendleft(job)
+        else:
+            queue.append(job)
+
+    # -- consumer side (COM thread) -----------------------------------------
+    def get(self) -> Optional[Job]:
+        """Block until a job is due and return it; None once closed."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                now = time.perf_counter()
+                while self._deferred and self._deferred[0][0] <= now:
+                    _, _, job = heapq.heappop(self._deferred)
+                    job.busy_wait_s += now - job.deferred_at
+                    self._enqueue(job, front=True)
+                job = self._pop(now)
+                if job is not None:
+                    return job
+                timeout = self._deferred[0][0] - now if self._deferred else None
+                self._cond.wait(timeout)
+
+    def _pop(self, now: float) -> Optional[Job]:
+        heads = []
+        for rank, lane in enumerate(LANES):
+            per_tool = self._lanes[lane]
+            if per_tool:
+                oldest = min(q[0].queued_at for q in per_tool.values())
+                heads.append((rank, lane, oldest))
+        if not heads:
+            return None
+        lane = heads[0][1]
+        overdue = [h for h in heads[1:] if now - h[2] > self.max_wait]
+        if overdue:
+            # Serve the longest-waiting overdue lane ahead of its priority.
+            lane = min(overdue, key=lambda h: h[2])[1]
+            self._stats["aged_promotions"] += 1
+        per_tool = self._lanes[lane]
+        tool, queue = next(iter(per_tool.items()))
+        job = queue.popleft()
+        if queue:
+            per_tool.move_to_end(tool)  # next tool's turn
+        else:
+            del per_tool[tool]
+        self._stats["served"][lane] += 1
+        return job
+
+    def activate(self, job: Job) -> bool:
+        """Mark the job's futures running; False when every caller cancelled."""
+        with self._cond:
+            if not job.activated:
+                job.activated = True
+                job.futures = [f for f in job.futures if f.set_running_or_notify_cancel()]
+                if not job.futures:
+                    self._forget(job)
+                    return False
+            if job.started_at is None:
+                job.started_at = time.perf_counter()
+            return True
+
+    def defer(self, job: Job, delay: float) -> None:
+        """Put a started job back after delay seconds (busy retry)."""
+        with self._cond:
+            job.deferred_at = time.perf_counter()
+            heapq.heappush(self._deferred, (job.deferred_at + delay, next(self._seq), job))
+            self._stats["deferred"] += 1
+            self._cond.notify()
+
+    def finish(self, job: Job) -> list:
+        """Stop coalescing onto job and return the futures to resolve."""
+        with self._cond:
+            self._forget(job)
+            return list(job.futures)
+
+    def _forget(self, job: Job) -> None:
+        if job.key is not None and self._inflight.get(job.key) is job:
+            del self._inflight[job.key]
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Wake the worker and make get() return None."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            queued = {lane: sum(len(q) for q in self._lanes[lane].values()) for lane in LANES}
+            result = {
+                "queued": queued,
+                "deferred_now": len(self._deferred),
+                "max_wait_s": self.max_wait,
+            }
+            for key, value in self._stats.items():
+                result[key] = dict(value) if isinstance(value, dict) else value
+            return result
@@ -5,28 +5,68 @@ PowerPoint supports only a single running instance, so this provides
 singleton-like access to the Application COM object.
 """
 
+import asyncio
 import gc
 import logging
 import os
 import threading
 import time
 from concurrent.futures import Future
-from queue import Queue
 from typing import Any, Callable, Optional
 
 import pythoncom
 import pywintypes
 import win32com.client
 
+from .busy_retry import BusyRetryPolicy, busy_stats, register_message_filter, revoke_message_filter
+from .com_scheduler import BULK, WRITE, JobScheduler, policy_for
+from .perf_stats import COUNT_COM_CALLS, CountingDispatch, com_calls, current_tool, perf_stats
+from .preview_cache import preview_cache
+
 logger = logging.getLogger(__name__)
 
 # HRESULTs that indicate PowerPoint is temporarily busy (e.g. modal dialog open).
 # RPC_E_CALL_REJECTED (0x80010001): server rejected the call outright.
 # RPC_E_SERVERCALL_RETRYLATER (0x8001010A): server explicitly says retry later.
 # Both mean the call was never started, so retrying is always safe.
+# Retry timing is configured in utils.busy_retry.
 _BUSY_HRESULTS = frozenset({-2147418111, -2147417846})
-_RETRY_MAX = 5       # maximum number of retries (total attempts = _RETRY_MAX + 1)
-_RETRY_INTERVAL = 3  # seconds between retries
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _parse_tool_timeouts(spec: str) -> dict:
+    """'ppt_export_pdf=600, ppt_get_all_text=90' -> {tool: seconds}."""
+    timeouts = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        try:
+            timeouts[name.strip()] = float(value)
+        except ValueError:
+            logger.warning("Ignoring PPT_TOOL_TIMEOUTS entry %r", item)
+    return timeouts
+
+
+# Seconds a caller waits for one queued COM operation. Bulk-lane tools
+# (exports, renders) get a longer budget; PPT_TOOL_TIMEOUTS overrides single
+# tools. Whole-deck tools split their work into chunks, each a job of its
+# own, so the budget applies per chunk.
+EXECUTE_TIMEOUT = _env_seconds("PPT_EXECUTE_TIMEOUT", 30.0)
+BULK_EXECUTE_TIMEOUT = _env_seconds("PPT_BULK_EXECUTE_TIMEOUT", 120.0)
+_TOOL_TIMEOUTS = _parse_tool_timeouts(os.getenv("PPT_TOOL_TIMEOUTS", ""))
+
+
+def execute_timeout(tool: Optional[str]) -> float:
+    """Seconds execute / execute_async wait for a COM job queued by tool."""
+    if tool in _TOOL_TIMEOUTS:
+        return _TOOL_TIMEOUTS[tool]
+    return BULK_EXECUTE_TIMEOUT if policy_for(tool)[0] == BULK else EXECUTE_TIMEOUT
+
 # When True, the server sends ESC to PowerPoint on the first busy rejection to
 # dismiss any blocking modal dialog automatically.
 # Opt-in: set PPT_AUTO_DISMISS_DIALOG=true in mcp.json env to enable:
@@ -73,21 +113,43 @@ class PowerPointCOMWrapper:
 
     All COM operations are routed through a dedicated STA thread to ensure
     thread safety. The MCP server (which runs async) calls methods on this
-    wrapper, which internally queues operations to the COM thread.
+    wrapper, which internally queues operations to the COM thread through a
+    JobScheduler (priority lanes, coalescing; see utils.com_scheduler).
     """
 
     def __init__(self):
         self._app = None
         self._com_thread: Optional[threading.Thread] = None
-        self._queue: Queue = Queue()
+        self._queue = JobScheduler()
+        self._busy_policy = BusyRetryPolicy()
         self._running = False
         self._target_pres_full_name: Optional[str] = None  # session-level target (FullName for uniqueness)
+        # Resolved-handle cache. _task_seq is bumped by the worker for every
+        # attempt it runs, so "validated during this task" means the cached
+        # dispatch object was already proven alive by an earlier lookup in the
+        # same COM task and can be reused without another round trip.
+        self._task_seq = 0
+        self._app_validated_seq = -1
+        self._pres = None
+        self._pres_full_name: Optional[str] = None
+        self._pres_validated_seq = -1
+        self._handle_stats = {
+            "app_validations": 0,
+            "app_validations_skipped": 0,
+            "pres_scans": 0,
+            "pres_revalidations": 0,
+            "pres_cache_hits": 0,
+            "window_activations": 0,
+            "window_activations_skipped": 0,
+        }
 
     def start(self) -> None:
         """Start the COM worker thread."""
         if self._running:
             return
         self._running = True
+        if self._queue.closed:  # restarted after stop()
+            self._queue = JobScheduler()
         self._com_thread = threading.Thread(
             target=self._com_worker, daemon=True, name="COM-Worker"
         )
@@ -99,8 +161,7 @@ class PowerPointCOMWrapper:
         if not self._running:
             return
         self._running = False
-        # Send a sentinel to unblock the worker
-        self._queue.put(None)
+        self._queue.close()  # unblocks the worker
         if self._com_thread and self._com_thread.is_alive():
             self._com_thread.join(timeout=5.0)
         logger.info("COM worker thread stopped")
@@ -108,45 +169,101 @@ class PowerPointCOMWrapper:
     def _com_worker(self) -> None:
         """Worker thread that processes COM operations in an STA apartment."""
         pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        message_filter = register_message_filter()
         try:
             while self._running:
-                item = self._queue.get()
-                if item is None:
+                job = self._queue.get()
+                if job is None:
                     break
-                func, args, kwargs, future = item
-                for attempt in range(_RETRY_MAX + 1):  # +1: initial attempt + _RETRY_MAX retries
-                    try:
-                        result = func(*args, **kwargs)
-                        future.set_result(result)
-                        break
-                    except pywintypes.com_error as e:
-                        if e.hresult in _BUSY_HRESULTS and attempt < _RETRY_MAX:
-                            logger.warning(
-                                "PowerPoint is busy (modal dialog open?). "
-                                "Retrying in %ds... (%d/%d)",
-                                _RETRY_INTERVAL, attempt + 1, _RETRY_MAX,
-                            )
-                            if attempt == 0 and AUTO_DISMISS_DIALOG:
-                                # On the very first failure, optionally dismiss
-                                # the blocking dialog via ESC so the next retry
-                                # likely succeeds immediately.
-                                _try_dismiss_ppt_dialog()
-                            time.sleep(_RETRY_INTERVAL)
-                        else:
-                            future.set_exception(e)
-                            break
-                    except Exception as e:
-                        future.set_exception(e)
-                        break
+                if not self._queue.activate(job):
+                    continue  # every caller cancelled (or timed out) while queued
+                self._run_job(job)
         finally:
             self._cleanup_com()
+            revoke_message_filter(message_filter)
             pythoncom.CoUninitialize()
 
+    def _run_job(self, job) -> None:
+        """Run one attempt of job; on a busy rejection, defer it for a retry.
+
+        Short busy spikes are absorbed inside the call by the message filter
+        (utils.busy_retry). A rejection that outlasts it defers the job with
+        exponential backoff instead of sleeping on the COM thread, so other
+        queued jobs run while PowerPoint is busy with this one.
+        """
+        self._task_seq += 1
+        attempt_start = time.perf_counter()
+        counts = com_calls.snapshot()
+        filtered = busy_stats.filter_snapshot()
+        result = error = None
+        try:
+            result = job.func(*job.args, **job.kwargs)
+        except Exception as e:
+            error = e
+        elapsed = time.perf_counter() - attempt_start
+        filter_retries, filter_wait_ms = busy_stats.filter_snapshot()
+        filter_wait = (filter_wait_ms - filtered[1]) / 1000
+        job.filter_retries += filter_retries - filtered[0]
+        job.filter_wait_s += filter_wait
+        job.com_s += max(elapsed - filter_wait, 0.0)
+
+        gave_up = False
+        if isinstance(error, pywintypes.com_error) and error.hresult in _BUSY_HRESULTS:
+            delay = self._busy_policy.delay(job.retries)
+            if self._busy_policy.allows(job.busy_wait_s + job.filter_wait_s, delay):
+                log = logger.warning if job.retries == 0 else logger.debug
+                log("PowerPoint is busy (modal dialog open?). Retrying in %.0f ms (retry %d)",
+                    delay * 1000, job.retries + 1)
+                if job.retries == 0 and AUTO_DISMISS_DIALOG:
+                    # On the very first failure, optionally dismiss the
+                    # blocking dialog via ESC so the next retry likely
+                    # succeeds immediately.
+                    _try_dismiss_ppt_dialog()
+                job.retries += 1
+                self._queue.defer(job, delay)
+                return
+            gave_up = True
+            logger.warning("PowerPoint stayed busy for %.1fs; giving up",
+                           job.busy_wait_s + job.filter_wait_s)
+
+        busy_retries = job.retries + job.filter_retries
+        busy_wait = job.busy_wait_s + job.filter_wait_s
+        if busy_retries or gave_up:
+            busy_stats.record_episode(job.retries, job.busy_wait_s, busy_wait, gave_up)
+        # Record before resolving the futures so a caller that reads the
+        # stats right after awaiting sees this job.
+        perf_stats.record_com(
+            job.tool, job.started_at - job.queued_at, job.com_s,
+            busy_retries, busy_wait, com_calls.since(counts),
+        )
+        if job.lane == WRITE:
+            # Previews of the deck may be stale now, whatever the fingerprint
+            # sees. Without a resolved target, drop every deck's previews.
+            preview_cache.drop_presentation(self._pres_full_name)
+        for future in self._queue.finish(job):
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _submit(self, func: Callable, args: tuple, kwargs: dict) -> Future:
+        """Queue func for the COM thread and return its concurrent Future.
+
+        The job carries the calling tool's name, which picks its lane and
+        coalescing policy and attributes queue wait and COM time in perf_stats.
+        """
+        return self._queue.submit(func, args, kwargs, current_tool.get())
+
+    def get_queue_stats(self) -> dict:
+        """Return COM job queue counters (per-lane queued / served, coalesced)."""
+        return self._queue.stats()
+
     def execute(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
         """Execute a function on the COM thread and return its result.
 
-        This is the main entry point for all COM operations from async code.
-        It queues the operation and blocks until completion.
+        Blocking variant for synchronous callers. Code running on the event
+        loop must use execute_async instead so the loop is not frozen while
+        PowerPoint works.
 
         Args:
             func: The function to execute on the COM thread
@@ -158,9 +275,54 @@ class PowerPointCOMWrapper:
         Raises:
             Any exception raised by func
         """
-        future: Future = Future()
-        self._queue.put((func, args, kwargs, future))
-        return future.result(timeout=30.0)
+        future = self._submit(func, args, kwargs)
+        return future.result(timeout=execute_timeout(current_tool.get()))
+
+    async def execute_async(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Execute a function on the COM thread without blocking the event loop.
+
+        This is the main entry point for all COM operations from async tool
+        code. The COM worker's Future is bridged into the running loop with
+        asyncio.wrap_future, so pings, cancellation and progress notifications
+        keep being served while a long operation (e.g. a PDF export) runs.
+
+        Args:
+            func: The function to execute on the COM thread
+            *args, **kwargs: Arguments to pass to the function
+
+        Returns:
+            The return value of func
+
+        Raises:
+            TimeoutError: If the operation does not finish within the
+                calling tool's timeout (execute_timeout)
+            Any exception raised by func
+        """
+        if threading.current_thread() is self._com_thread:
+            # Already on the COM thread (a step of ppt_execute_batch): run
+            # inline — queueing here would deadlock the worker on itself.
+            started = time.perf_counter()
+            counts = com_calls.snapshot()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                perf_stats.record_com(
+                    current_tool.get(), 0.0, time.perf_counter() - started,
+                    counts=com_calls.since(counts),
+                )
+        timeout = execute_timeout(current_tool.get())
+        future = self._submit(func, args, kwargs)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            # wait_for cancels the bridged Future: a job still waiting in the
+            # queue is dropped by the worker, one already running finishes on
+            # the COM thread on its own.
+            raise TimeoutError(
+                f"PowerPoint operation did not finish within {timeout:g}s"
+            ) from None
 
     def connect(self, visible: Optional[bool] = None, allow_launch: bool = True) -> Any:
         """Connect to PowerPoint (runs on COM thread).
@@ -189,6 +351,7 @@ class PowerPointCOMWrapper:
         if self._app is not None:
             try:
                 _ = self._app.Name
+                self._app_validated_seq = self._task_seq
                 if visible is not None:
                     self._app.Visible = visible
                 return self._app
@@ -201,6 +364,9 @@ class PowerPointCOMWrapper:
                 logger.warning("Stale COM reference, reconnecting...")
                 self._app = None
 
+        # Any cached presentation belongs to the old connection.
+        self._invalidate_handles()
+
         # Try existing instance first
         launched_new = False
         try:
@@ -227,6 +393,11 @@ class PowerPointCOMWrapper:
                     f"Failed to connect to PowerPoint. Is it installed? Error: {e2.strerror}"
                 ) from e2
 
+        if COUNT_COM_CALLS:
+            # Every object reached from the Application inherits the proxy,
+            # so all COM traffic of the tools is counted.
+            self._app = CountingDispatch(self._app)
+
         if visible is not None:
             self._app.Visible = visible
         elif launched_new and not self._app.Visible:
@@ -253,8 +424,14 @@ class PowerPointCOMWrapper:
         """
         if self._app is None:
             return self._connect_impl(allow_launch=allow_launch)
+        if self._app_validated_seq == self._task_seq:
+            # Already proven alive earlier in this COM task.
+            self._handle_stats["app_validations_skipped"] += 1
+            return self._app
         try:
             _ = self._app.Name
+            self._handle_stats["app_validations"] += 1
+            self._app_validated_seq = self._task_seq
             return self._app
         except pywintypes.com_error as e:
             if e.hresult in _BUSY_HRESULTS:
@@ -275,31 +452,111 @@ class PowerPointCOMWrapper:
         window so subsequent goto_slide / ActiveWindow calls use the right window.
         Falls back to ActivePresentation when no target is set or when the
         target was closed.
+
+        The resolved presentation is cached: within one COM task it is reused
+        with no round trips at all, and on later tasks it is revalidated with a
+        single FullName read instead of a walk over app.Presentations.  The
+        window is only re-activated when another deck has become active.
         """
+        target = self._target_pres_full_name
+        if (
+            target
+            and self._pres is not None
+            and self._pres_full_name == target
+            and self._pres_validated_seq == self._task_seq
+            and self._app_validated_seq == self._task_seq
+        ):
+            self._handle_stats["pres_cache_hits"] += 1
+            return self._pres
+
         app = self._get_app_impl()
-        if self._target_pres_full_name:
-            for i in range(1, app.Presentations.Count + 1):
-                try:
-                    p = app.Presentations(i)
-                    if p.FullName == self._target_pres_full_name:
-                        # Ensure this presentation's window is active so
-                        # goto_slide / app.ActiveWindow operate on the right deck.
-                        try:
-                            p.Windows(1).Activate()
-                        except Exception:
-                            pass
-                        return p
-                except Exception:
-                    pass
+        if target:
+            pres = self._revalidate_cached_pres(target)
+            if pres is None:
+                pres = self._scan_for_pres(app, target)
+            if pres is not None:
+                self._ensure_window_active(app, pres, target)
+                self._pres = pres
+                self._pres_full_name = target
+                self._pres_validated_seq = self._task_seq
+                return pres
             # Target was closed since last activation — clear and fall back
             logger.warning(
                 "Target presentation '%s' is no longer open; "
                 "falling back to ActivePresentation",
-                self._target_pres_full_name,
+                target,
             )
             self._target_pres_full_name = None
+            self._invalidate_handles()
         return app.ActivePresentation
 
+    def _revalidate_cached_pres(self, target: str) -> Any:
+        """Internal: return the cached presentation if it is still the target."""
+        if self._pres is None or self._pres_full_name != target:
+            return None
+        try:
+            if self._pres.FullName == target:
+                self._handle_stats["pres_revalidations"] += 1
+                return self._pres
+        except pywintypes.com_error as e:
+            if e.hresult in _BUSY_HRESULTS:
+                raise  # PowerPoint busy — let _com_worker retry loop handle it
+        except Exception:
+            pass
+        # Closed or renamed (Save As) since it was cached.
+        self._invalidate_handles()
+        return None
+
+    def _scan_for_pres(self, app: Any, target: str) -> Any:
+        """Internal: find an open presentation by FullName (full collection walk)."""
+        self._handle_stats["pres_scans"] += 1
+        for i in range(1, app.Presentations.Count + 1):
+            try:
+                p = app.Presentations(i)
+                if p.FullName == target:
+                    return p
+            except Exception:
+                pass
+        return None
+
+    def _ensure_window_active(self, app: Any, pres: Any, target: str) -> None:
+        """Internal: activate pres's window unless it is already the active deck.
+
+        Keeps goto_slide / app.ActiveWindow operating on the right deck while
+        avoiding a window switch on every tool call.
+        """
+        try:
+            if app.ActivePresentation.FullName == target:
+                self._handle_stats["window_activations_skipped"] += 1
+                return
+        except Exception:
+            pass  # no active window (e.g. all decks headless) — try Activate
+        try:
+            pres.Windows(1).Activate()
+            self._handle_stats["window_activations"] += 1
+        except Exception:
+            pass
+
+    def _invalidate_handles(self) -> None:
+        """Internal: drop the cached presentation so the next lookup rescans."""
+        self._pres = None
+        self._pres_full_name = None
+        self._pres_validated_seq = -1
+
+    def get_handle_cache_stats(self) -> dict:
+        """Return counters for the resolved app/presentation handle cache.
+
+        ``lookups_avoided`` is the number of ``app.Name`` probes and
+        ``app.Presentations`` walks that the cache made unnecessary.
+        """
+        stats = dict(self._handle_stats)
+        stats["lookups_avoided"] = (
+            stats["app_validations_skipped"]
+            + stats["pres_cache_hits"]
+            + stats["pres_revalidations"]
+        )
+        return stats
+
     def _set_target_pres_impl(self, name_or_index) -> dict:
         """Internal: set session-level target presentation on COM thread."""
         app = self._get_app_impl()
@@ -346,6 +603,9 @@ class PowerPointCOMWrapper:
         # Store FullName (includes path) to uniquely identify the presentation
         # even if another file with the same basename is later opened.
         self._target_pres_full_name = pres.FullName
+        self._pres = pres
+        self._pres_full_name = pres.FullName
+        self._pres_validated_seq = self._task_seq
         index = None
         for i in range(1, app.Presentations.Count + 1):
             if app.Presentations(i).FullName == pres.FullName:
@@ -374,6 +634,7 @@ class PowerPointCOMWrapper:
 
     def _cleanup_com(self) -> None:
         """Release COM references."""
+        self._invalidate_handles()
         if self._app is not None:
             try:
                 # Don't quit PowerPoint - the user may be using it
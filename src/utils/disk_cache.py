@@ -0,0 +1,32 @@
+"""Shared helpers for the on-disk caches (icons, slide previews).
+
+Configuration (environment variables):
+    PPT_MCP_CACHE_DIR   Cache root (default: %LOCALAPPDATA%\\ppt-mcp\\cache,
+                        or ~/.cache/ppt-mcp elsewhere)
+"""
+
+import os
+import tempfile
+
+
+def default_cache_root() -> str:
+    root = os.getenv("PPT_MCP_CACHE_DIR")
+    if root:
+        return root
+    local_app_data = os.getenv("LOCALAPPDATA")
+    if local_app_data:
+        return os.path.join(local_app_data, "ppt-mcp", "cache")
+    return os.path.join(os.path.expanduser("~"), ".cache", "ppt-mcp")
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write via a temp file + rename so a crash never leaves a torn file."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
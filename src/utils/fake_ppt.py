@@ -0,0 +1,1545 @@
+"""In-process fake of the PowerPoint COM object model ("virtual PowerPoint").
+
+The tool implementations (``ppt_com/*._impl``) only talk to PowerPoint
+through attribute reads, writes and method calls on dispatch objects, so a
+plain Python object graph with the same names can stand in for it. This
+module provides one covering the part of the surface those functions use:
+
+- Application, Presentations, Presentation, Windows / View, PageSetup,
+  Designs, SlideMaster, CustomLayouts
+- Slides, Slide (Export writes a real PNG), NotesPage, Background
+- Shapes (AddShape, AddTextbox, AddTable, AddChart2, AddPicture, AddLine),
+  Placeholders, Fill, Line, Shadow, Adjustments, Tags
+- TextFrame, TextFrame2, TextRange with Paragraphs / Runs / Lines /
+  Characters, Font, ParagraphFormat, Bullet, Find / Replace, and a simple
+  line-wrapping model so Lines() and BoundHeight react to Width changes
+- Table (Rows, Columns, Cell, Merge), Chart with ChartData workbook,
+  worksheet Range / Cells / UsedRange and SeriesCollection
+
+Every access to a CamelCase member (property get, property set, method
+call, collection indexing) is charged to a Latency model on the
+Application: it is counted, added to ``app.simulated_s`` and, unless the
+model is built with ``sleep=False``, actually slept, to mimic the cost of a
+cross-process COM call. Members not modelled raise AttributeError, as an
+unknown name on a dispatch object does.
+
+Positions are Python string indices; for text inside the Basic
+Multilingual Plane they equal COM's UTF-16 positions.
+
+Typical use::
+
+    app = FakeApplication(Latency.cross_process())
+    app.Presentations.Add()
+    attach(app)            # utils.com_wrapper.ppt now drives the fake
+
+On machines without pywin32, call install_pywin32_shims() before importing
+utils.com_wrapper or any ppt_com module.
+"""
+
+import os
+import re
+import struct
+import sys
+import time
+import types
+import zlib
+from types import MethodType
+from typing import Optional
+
+msoTrue = -1
+msoFalse = 0
+msoTriStateMixed = -2
+
+msoAutoShape = 1
+msoChart = 3
+msoLine = 9
+msoPicture = 13
+msoPlaceholder = 14
+msoTextBox = 17
+msoTable = 19
+
+ppPlaceholderTitle = 1
+ppPlaceholderBody = 2
+ppPlaceholderCenterTitle = 3
+ppPlaceholderSubtitle = 4
+
+_E_INVALIDARG = -2147024809
+_MK_E_UNAVAILABLE = -2147221021
+
+_SLIDE_WIDTH = 960.0
+_SLIDE_HEIGHT = 540.0
+
+_DEFAULT_FONT = {
+    "Name": "Calibri", "NameFarEast": "Yu Gothic", "Size": 18.0,
+    "Bold": msoFalse, "Italic": msoFalse, "Underline": msoFalse, "RGB": 0,
+}
+_DEFAULT_PARAGRAPH = {
+    "Alignment": 1, "IndentLevel": 1, "SpaceBefore": 0.0, "SpaceAfter": 0.0,
+    "SpaceWithin": 1.0, "BulletVisible": msoFalse, "BulletType": 0, "BulletCharacter": 8226,
+}
+
+# (name, ppLayout constant, [(placeholder type, name, left, top, width, height, font size)])
+_TITLE = (ppPlaceholderTitle, "Title", 66, 29, 828, 105, 44)
+_LAYOUTS = [
+    ("Title Slide", 1, [(ppPlaceholderCenterTitle, "Title", 120, 88, 720, 188, 60),
+                        (ppPlaceholderSubtitle, "Subtitle", 120, 283, 720, 130, 24)]),
+    ("Title and Content", 2, [_TITLE, (ppPlaceholderBody, "Content Placeholder", 66, 144, 828, 343, 28)]),
+    ("Section Header", 33, [(ppPlaceholderTitle, "Title", 66, 135, 828, 225, 60),
+                            (ppPlaceholderBody, "Text Placeholder", 66, 362, 828, 118, 24)]),
+    ("Two Content", 29, [_TITLE, (ppPlaceholderBody, "Content Placeholder", 66, 144, 408, 343, 28),
+                         (ppPlaceholderBody, "Content Placeholder", 486, 144, 408, 343, 28)]),
+    ("Title Only", 11, [_TITLE]),
+    ("Blank", 12, []),
+]
+_LAYOUT_ALIASES = {3: 29, 16: 2, 34: 29, 35: 2, 36: 2}
+
+_AUTOSHAPE_NAMES = {1: "Rectangle", 5: "Rectangle: Rounded Corners", 9: "Oval"}
+_EXPORT_PX_PER_PT = 4 / 3
+
+
+def _com_error(message: str, hresult: int = _E_INVALIDARG) -> Exception:
+    try:
+        import pywintypes
+        return pywintypes.com_error(hresult, message, None, None)
+    except ImportError:
+        return RuntimeError(message)
+
+
+# ---------------------------------------------------------------------------
+# Latency model and base classes
+# ---------------------------------------------------------------------------
+class Latency:
+    """Per-access cost of the fake, in seconds.
+
+    ``slow`` overrides the cost of specific members (e.g. ``{"Export": 0.05}``).
+    With ``sleep=False`` costs are only accounted in ``app.simulated_s``,
+    which keeps benchmarks deterministic.
+    """
+
+    def __init__(self, get: float = 0.0, set: float = 0.0, call: float = 0.0,
+                 slow: Optional[dict] = None, sleep: bool = True):
+        self.get = get
+        self.set = set
+        self.call = call
+        self.slow = dict(slow or {})
+        self.sleep = sleep
+
+    @classmethod
+    def cross_process(cls, sleep: bool = True) -> "Latency":
+        """Rough out-of-process costs measured against a local PowerPoint."""
+        return cls(
+            get=40e-6, set=80e-6, call=120e-6,
+            slow={"Export": 0.03, "SaveAs": 0.2, "SaveCopyAs": 0.2,
+                  "Activate": 0.002, "AddChart2": 0.15, "AddTable": 0.01},
+            sleep=sleep,
+        )
+
+
+class _Obj:
+    """Base class: charges every CamelCase member access to the Application."""
+
+    def __init__(self, app, **attrs):
+        d = self.__dict__
+        d["_app"] = app
+        d.update(attrs)
+
+    def __getattribute__(self, name):
+        value = object.__getattribute__(self, name)
+        if name[0].isupper():
+            kind = "call" if type(value) is MethodType else "get"
+            object.__getattribute__(self, "_app")._charge(kind, name)
+        return value
+
+    def __setattr__(self, name, value):
+        if name[0].isupper():
+            self.__dict__["_app"]._charge("set", name)
+        object.__setattr__(self, name, value)
+
+
+def _raw(obj, name):
+    """Read a stored member without charging latency."""
+    return obj.__dict__[name]
+
+
+class _Collection(_Obj):
+    """1-based COM collection; items can also be looked up by Name."""
+
+    def __init__(self, app, items=None):
+        super().__init__(app)
+        self.__dict__["_items"] = items if items is not None else []
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def _item(self, index):
+        items = self._items
+        if isinstance(index, str):
+            for item in items:
+                if item.__dict__.get("Name") == index:
+                    return item
+            raise _com_error(f"Item '{index}' not found in the collection.")
+        if not 1 <= index <= len(items):
+            raise _com_error(f"Index {index} out of range (1-{len(items)}).")
+        return items[index - 1]
+
+    def __call__(self, index):
+        self._app._charge("call", "Item")
+        return self._item(index)
+
+    def Item(self, index):
+        return self._item(index)
+
+    def __iter__(self):
+        for item in list(self._items):
+            self._app._charge("call", "Item")
+            yield item
+
+
+class _Bag(_Obj):
+    """Object whose members are plain stored values (format objects etc.)."""
+
+
+class _Fill(_Bag):
+    def Solid(self):
+        self.__dict__.update(Type=1, Visible=msoTrue)
+
+    def TwoColorGradient(self, Style=1, Variant=1):
+        self.__dict__.update(Type=3, Visible=msoTrue)
+
+
+class _LanguageSettings(_Bag):
+    def LanguageID(self, Type):
+        return 1033
+
+
+def _color(app, rgb=0):
+    return _Bag(app, RGB=rgb, ObjectThemeColor=0, Type=1, Brightness=0.0, TintAndShade=0.0)
+
+
+def _png(width: int, height: int, rgb: tuple) -> bytes:
+    """A flat-colour RGB PNG (stdlib only)."""
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+    row = b"\x00" + bytes(rgb) * width
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+# ---------------------------------------------------------------------------
+# Text
+# ---------------------------------------------------------------------------
+def _char_width(ch: str, size: float) -> float:
+    if ch == " ":
+        return size * 0.25
+    return size * (1.0 if ord(ch) >= 0x2E80 else 0.5)
+
+
+def _is_wide(ch: str) -> bool:
+    return ord(ch) >= 0x2E80
+
+
+class _TextBody:
+    """Characters, per-character font dicts and per-paragraph format dicts."""
+
+    def __init__(self, frame, font: dict):
+        self.frame = frame
+        self.text = ""
+        self.fmts = []
+        self.default = dict(_DEFAULT_FONT, **font)
+        self.paras = [dict(_DEFAULT_PARAGRAPH)]
+        self.version = 0
+        self._layout_key = None
+        self._layout = None
+
+    def fmt_at(self, i: int) -> dict:
+        if not self.fmts:
+            return self.default
+        return self.fmts[min(max(i, 0), len(self.fmts) - 1)]
+
+    def replace(self, start: int, length: int, new: str) -> None:
+        new = new.replace("\r\n", "\r").replace("\n", "\r")
+        old = self.text[start:start + length]
+        fmt = self.fmt_at(start if start < len(self.text) else start - 1)
+        p0 = self.text.count("\r", 0, start)
+        k_old, k_new = old.count("\r"), new.count("\r")
+        self.paras[p0 + 1:p0 + 1 + k_old] = [dict(self.paras[p0]) for _ in range(k_new)]
+        self.text = self.text[:start] + new + self.text[start + length:]
+        self.fmts[start:start + length] = [fmt] * len(new)
+        self.version += 1
+
+    def para_spans(self) -> list:
+        spans, s = [], 0
+        for i, ch in enumerate(self.text):
+            if ch == "\r":
+                spans.append((s, i + 1))
+                s = i + 1
+        spans.append((s, len(self.text)))
+        return spans
+
+    def run_spans(self) -> list:
+        spans = []
+        for ps, pe in self.para_spans():
+            s = ps
+            for i in range(ps + 1, pe):
+                if self.fmts[i] != self.fmts[s]:
+                    spans.append((s, i))
+                    s = i
+            if pe > ps:
+                spans.append((s, pe))
+        return spans
+
+    def line_spans(self) -> list:
+        frame = self.frame
+        width = frame._shape_width() - _raw(frame, "MarginLeft") - _raw(frame, "MarginRight")
+        wrap = _raw(frame, "WordWrap") == msoTrue
+        key = (self.version, width, wrap)
+        if key != self._layout_key:
+            self._layout = self._wrap(width if wrap else float("inf"))
+            self._layout_key = key
+        return self._layout
+
+    def _wrap(self, avail: float) -> list:
+        lines = []
+        text = self.text
+        for ps, pe in self.para_spans():
+            seg_start = ps
+            for i in range(ps, pe + 1):
+                if i < pe and text[i] != "\x0b":
+                    continue
+                seg_end = min(i + 1, pe)
+                self._wrap_segment(seg_start, seg_end, avail, lines)
+                seg_start = seg_end
+            if pe == ps and (not lines or lines[-1][1] != pe):
+                lines.append((ps, pe))
+        return lines
+
+    def _wrap_segment(self, s: int, e: int, avail: float, lines: list) -> None:
+        text, fmts = self.text, self.fmts
+        line_start, width, last_break = s, 0.0, None
+        for i in range(s, e):
+            ch = text[i]
+            if ch in "\r\x0b":
+                continue
+            if i > line_start and (_is_wide(ch) or _is_wide(text[i - 1]) or text[i - 1] == " "):
+                last_break = i
+            w = _char_width(ch, fmts[i]["Size"])
+            if ch != " " and width + w > avail and i > line_start:
+                brk = last_break if last_break is not None and last_break > line_start else i
+                lines.append((line_start, brk))
+                line_start, last_break = brk, None
+                width = sum(_char_width(text[j], fmts[j]["Size"]) for j in range(brk, i))
+            width += w
+        if e > line_start or not lines or lines[-1][1] != e:
+            lines.append((line_start, e))
+
+    def line_height(self, s: int, e: int) -> float:
+        sizes = [self.fmts[i]["Size"] for i in range(s, e)] or [self.fmt_at(s)["Size"]]
+        return max(sizes) * 1.2
+
+
+def _font_property(key):
+    def fget(self):
+        body, s, n = self._body, self._start, self._length
+        if n == 0:
+            return body.fmt_at(s)[key]
+        first = body.fmts[s][key]
+        for i in range(s + 1, s + n):
+            if body.fmts[i][key] != first:
+                return "" if key.startswith("Name") else (0 if key == "Size" else msoTriStateMixed)
+        return first
+
+    def fset(self, value):
+        body, s, n = self._body, self._start, self._length
+        for i in range(s, s + n):
+            if body.fmts[i][key] != value:
+                body.fmts[i] = dict(body.fmts[i], **{key: value})
+        if n:
+            body.version += 1
+        elif not body.fmts:  # empty text: sets the format new text gets
+            body.default = dict(body.default, **{key: value})
+    return property(fget, fset)
+
+
+class _Font(_Obj):
+    def __init__(self, app, body, start, length):
+        super().__init__(app, _body=body, _start=start, _length=length)
+
+    Name = _font_property("Name")
+    NameFarEast = _font_property("NameFarEast")
+    Size = _font_property("Size")
+    Bold = _font_property("Bold")
+    Italic = _font_property("Italic")
+    Underline = _font_property("Underline")
+
+    @property
+    def Color(self):
+        return _FontColor(self._app, self._body, self._start, self._length)
+
+
+class _FontColor(_Obj):
+    def __init__(self, app, body, start, length):
+        super().__init__(app, _body=body, _start=start, _length=length, ObjectThemeColor=0, Type=1)
+
+    RGB = _font_property("RGB")
+
+
+def _para_property(key):
+    def fget(self):
+        values = {self._body.paras[p][key] for p in self._paras}
+        return values.pop() if len(values) == 1 else msoTriStateMixed
+
+    def fset(self, value):
+        for p in self._paras:
+            self._body.paras[p][key] = value
+        self._body.version += 1
+    return property(fget, fset)
+
+
+class _ParagraphFormat(_Obj):
+    def __init__(self, app, body, paras):
+        super().__init__(app, _body=body, _paras=paras)
+
+    Alignment = _para_property("Alignment")
+    SpaceBefore = _para_property("SpaceBefore")
+    SpaceAfter = _para_property("SpaceAfter")
+    SpaceWithin = _para_property("SpaceWithin")
+
+    @property
+    def Bullet(self):
+        return _Bullet(self._app, self._body, self._paras)
+
+
+class _Bullet(_Obj):
+    def __init__(self, app, body, paras):
+        super().__init__(app, _body=body, _paras=paras)
+
+    Visible = _para_property("BulletVisible")
+    Type = _para_property("BulletType")
+    Character = _para_property("BulletCharacter")
+
+
+class TextRange(_Obj):
+    """A span of a text body. Unit ranges (Paragraphs() etc.) carry Count."""
+
+    def __init__(self, app, body, start, length, count=1, whole=False):
+        super().__init__(app, _body=body, _start=start, _len=length, _count=count, _whole=whole)
+
+    @property
+    def _length(self):
+        # TextFrame.TextRange keeps covering the whole text as it is edited
+        # through other ranges, as in PowerPoint.
+        return len(self._body.text) - self._start if self._whole else self._len
+
+    # -- content ---------------------------------------------------------
+    @property
+    def Text(self):
+        return self._body.text[self._start:self._start + self._length]
+
+    @Text.setter
+    def Text(self, value):
+        self._body.replace(self._start, self._length, value)
+        self.__dict__["_len"] = len(value.replace("\r\n", "\r"))
+
+    @property
+    def Length(self):
+        return self._length
+
+    @property
+    def Start(self):
+        return self._start + 1
+
+    @property
+    def Count(self):
+        return self._count
+
+    @property
+    def Font(self):
+        return _Font(self._app, self._body, self._start, self._length)
+
+    def _para_indices(self) -> list:
+        s, e = self._start, self._start + self._length
+        return [i for i, (ps, pe) in enumerate(self._body.para_spans())
+                if (ps < e and pe > s) or (ps <= s < max(pe, ps + 1))] or [0]
+
+    @property
+    def ParagraphFormat(self):
+        return _ParagraphFormat(self._app, self._body, self._para_indices())
+
+    @property
+    def IndentLevel(self):
+        levels = {self._body.paras[p]["IndentLevel"] for p in self._para_indices()}
+        return levels.pop() if len(levels) == 1 else msoTriStateMixed
+
+    @IndentLevel.setter
+    def IndentLevel(self, value):
+        for p in self._para_indices():
+            self._body.paras[p]["IndentLevel"] = value
+
+    # -- units -----------------------------------------------------------
+    def _units(self, spans, start, length):
+        s, e = self._start, self._start + self._length
+        inside = [(a, b) for a, b in spans if (a < e and b > s) or (a == b == s)]
+        inside = [(max(a, s), min(b, e)) for a, b in inside]
+        if start != -1:
+            length = 1 if length == -1 else length
+            inside = inside[start - 1:start - 1 + length]
+        if not inside:
+            return TextRange(self._app, self._body, e, 0, 0)
+        return TextRange(self._app, self._body, inside[0][0], inside[-1][1] - inside[0][0], len(inside))
+
+    def Paragraphs(self, Start=-1, Length=-1):
+        return self._units(self._body.para_spans(), Start, Length)
+
+    def Runs(self, Start=-1, Length=-1):
+        return self._units(self._body.run_spans(), Start, Length)
+
+    def Lines(self, Start=-1, Length=-1):
+        unit = self._units(self._body.line_spans(), Start, Length)
+        return _Line(self._app, self._body, unit._start, unit._length, unit._count)
+
+    def Characters(self, Start=-1, Length=-1):
+        if Start == -1:
+            return TextRange(self._app, self._body, self._start, self._length, self._length)
+        length = 1 if Length == -1 else Length
+        s = self._start + Start - 1
+        length = max(0, min(length, self._start + self._length - s))
+        return TextRange(self._app, self._body, s, length, length)
+
+    # -- editing ---------------------------------------------------------
+    def InsertBefore(self, NewText=""):
+        self._body.replace(self._start, 0, NewText)
+        self.__dict__["_start"] += len(NewText)
+        return TextRange(self._app, self._body, self._start - len(NewText), len(NewText))
+
+    def InsertAfter(self, NewText=""):
+        end = self._start + self._length
+        self._body.replace(end, 0, NewText)
+        return TextRange(self._app, self._body, end, len(NewText))
+
+    def Delete(self):
+        self._body.replace(self._start, self._length, "")
+        self.__dict__["_len"] = 0
+
+    def _find(self, what, after, match_case, whole_words):
+        text = self.Text
+        flags = 0 if match_case else re.IGNORECASE
+        pattern = re.escape(what)
+        if whole_words:
+            pattern = r"(?<!\w)" + pattern + r"(?!\w)"
+        m = re.compile(pattern, flags).search(text, max(after, 0))
+        return None if m is None else (self._start + m.start(), m.end() - m.start())
+
+    def Find(self, FindWhat, After=0, MatchCase=msoFalse, WholeWords=msoFalse):
+        hit = self._find(FindWhat, After, MatchCase == msoTrue, WholeWords == msoTrue)
+        return None if hit is None else TextRange(self._app, self._body, *hit)
+
+    def Replace(self, FindWhat, ReplaceWhat, After=0, MatchCase=msoFalse, WholeWords=msoFalse):
+        hit = self._find(FindWhat, After, MatchCase == msoTrue, WholeWords == msoTrue)
+        if hit is None:
+            return None
+        self._body.replace(hit[0], hit[1], ReplaceWhat)
+        self.__dict__["_len"] += len(ReplaceWhat) - hit[1]
+        return TextRange(self._app, self._body, hit[0], len(ReplaceWhat))
+
+    # -- metrics ---------------------------------------------------------
+    def _lines_in(self):
+        s, e = self._start, self._start + self._length
+        return [(a, b) for a, b in self._body.line_spans() if (a < e and b > s) or a == b == s]
+
+    @property
+    def BoundHeight(self):
+        return sum(self._body.line_height(a, b) for a, b in self._lines_in())
+
+    @property
+    def BoundWidth(self):
+        text, fmts = self._body.text, self._body.fmts
+        return max((sum(_char_width(text[i], fmts[i]["Size"]) for i in range(a, b) if text[i] not in "\r\x0b")
+                    for a, b in self._lines_in()), default=0.0)
+
+
+class _Line(TextRange):
+    """Lines() result: a soft line break reads back as "\\n"."""
+
+    @property
+    def Text(self):
+        return self._body.text[self._start:self._start + self._length].replace("\x0b", "\n")
+
+
+class TextFrame(_Obj):
+    def __init__(self, app, shape, font: dict):
+        super().__init__(
+            app, _shape=shape,
+            MarginLeft=7.2, MarginRight=7.2, MarginTop=3.6, MarginBottom=3.6,
+            WordWrap=msoTrue, AutoSize=0, VerticalAnchor=1, Orientation=1,
+        )
+        self.__dict__["_body"] = _TextBody(self, font)
+
+    def _shape_width(self) -> float:
+        return _raw(self._shape, "Width")
+
+    @property
+    def HasText(self):
+        return msoTrue if self._body.text else msoFalse
+
+    @property
+    def TextRange(self):
+        return TextRange(self._app, self._body, 0, len(self._body.text), whole=True)
+
+    def DeleteText(self):
+        self._body.replace(0, len(self._body.text), "")
+
+
+class TextFrame2(_Obj):
+    """The Office-drawing text frame; shares text and margins with TextFrame."""
+
+    def __init__(self, app, frame):
+        super().__init__(app, _frame=frame)
+
+    @property
+    def AutoSize(self):
+        return _raw(self._frame, "AutoSize")
+
+    @AutoSize.setter
+    def AutoSize(self, value):
+        self._frame.__dict__["AutoSize"] = value
+
+    @property
+    def MarginTop(self):
+        return _raw(self._frame, "MarginTop")
+
+    @property
+    def MarginBottom(self):
+        return _raw(self._frame, "MarginBottom")
+
+    @property
+    def WordWrap(self):
+        return _raw(self._frame, "WordWrap")
+
+    @property
+    def TextRange(self):
+        body = self._frame._body
+        return TextRange(self._app, body, 0, len(body.text), whole=True)
+
+
+# ---------------------------------------------------------------------------
+# Shapes
+# ---------------------------------------------------------------------------
+class _Tags(_Obj):
+    def __init__(self, app):
+        super().__init__(app, _tags={})
+
+    @property
+    def Count(self):
+        return len(self._tags)
+
+    def Add(self, Name, Value):
+        self._tags[Name.upper()] = Value
+
+    def Item(self, Name):
+        return self._tags.get(Name.upper(), "")
+
+    def Name(self, Index):
+        return list(self._tags)[Index - 1]
+
+    def Value(self, Index):
+        return list(self._tags.values())[Index - 1]
+
+    def Delete(self, Name):
+        self._tags.pop(Name.upper(), None)
+
+
+class _Adjustments(_Obj):
+    def __init__(self, app, values):
+        super().__init__(app, _values=values)
+
+    @property
+    def Count(self):
+        return len(self._values)
+
+    def __getitem__(self, i):
+        self._app._charge("get", "Item")
+        return self._values[i - 1]
+
+    def __setitem__(self, i, value):
+        self._app._charge("set", "Item")
+        self._values[i - 1] = value
+
+
+class Shape(_Obj):
+    """A shape on a slide (also used for table cells and placeholders)."""
+
+    def __init__(self, app, parent, shape_type, name, left, top, width, height,
+                 text_font=None, autoshape_type=-2, placeholder_type=None, shape_id=0):
+        super().__init__(
+            app, _parent=parent, _type=shape_type, _placeholder_type=placeholder_type,
+            _table=None, _chart=None, _frame=None,
+            Name=name, Id=shape_id, Left=float(left), Top=float(top),
+            Width=float(width), Height=float(height), Rotation=0.0, Visible=msoTrue,
+            LockAspectRatio=msoFalse, AutoShapeType=autoshape_type,
+            HorizontalFlip=msoFalse, VerticalFlip=msoFalse,
+        )
+        d = self.__dict__
+        if text_font is not None:
+            d["_frame"] = TextFrame(app, self, text_font)
+        d["Fill"] = _Fill(app, Type=1, Visible=msoTrue if shape_type == msoAutoShape else msoFalse,
+                          ForeColor=_color(app, 0x9C5B15), BackColor=_color(app, 0xFFFFFF), Transparency=0.0)
+        d["Line"] = _Bag(app, Visible=msoTrue if shape_type in (msoAutoShape, msoLine) else msoFalse,
+                         ForeColor=_color(app, 0x6E3E0E), Weight=0.75, DashStyle=1, Transparency=0.0)
+        d["Shadow"] = _Bag(app, Visible=msoFalse, ForeColor=_color(app, 0), Blur=0.0,
+                           OffsetX=0.0, OffsetY=0.0, Transparency=0.0, Size=100.0)
+        d["Tags"] = _Tags(app)
+        d["Adjustments"] = _Adjustments(app, [0.16667] if autoshape_type == 5 else [])
+
+    @property
+    def Type(self):
+        return self._type
+
+    @property
+    def ZOrderPosition(self):
+        return self._parent._items.index(self) + 1
+
+    @property
+    def HasTextFrame(self):
+        return msoTrue if self._frame is not None else msoFalse
+
+    @property
+    def TextFrame(self):
+        if self._frame is None:
+            raise _com_error("This shape does not have a text frame.")
+        return self._frame
+
+    @property
+    def TextFrame2(self):
+        if self._frame is None:
+            raise _com_error("This shape does not have a text frame.")
+        return TextFrame2(self._app, self._frame)
+
+    @property
+    def HasTable(self):
+        return msoTrue if self._table is not None else msoFalse
+
+    @property
+    def Table(self):
+        if self._table is None:
+            raise _com_error("This shape does not have a table.")
+        return self._table
+
+    @property
+    def HasChart(self):
+        return msoTrue if self._chart is not None else msoFalse
+
+    @property
+    def Chart(self):
+        if self._chart is None:
+            raise _com_error("This shape does not have a chart.")
+        return self._chart
+
+    @property
+    def HasSmartArt(self):
+        return msoFalse
+
+    @property
+    def PlaceholderFormat(self):
+        if self._placeholder_type is None:
+            raise _com_error("This shape is not a placeholder.")
+        return _Bag(self._app, Type=self._placeholder_type, ContainedType=msoAutoShape)
+
+    def Delete(self):
+        self._parent._items.remove(self)
+
+    def Select(self, Replace=msoTrue):
+        pass
+
+    def ZOrder(self, ZOrderCmd):
+        # msoBringToFront=0, msoSendToBack=1, msoBringForward=2, msoSendBackward=3
+        items = self._parent._items
+        index = items.index(self)
+        items.remove(self)
+        pos = {0: len(items), 1: 0, 2: min(len(items), index + 1)}.get(ZOrderCmd, max(0, index - 1))
+        items.insert(pos, self)
+
+
+class _Placeholders(_Collection):
+    def __init__(self, app, shapes):
+        super().__init__(app)
+        self.__dict__["_shapes"] = shapes
+
+    @property
+    def _items(self):
+        return [s for s in self._shapes._items if s.__dict__["_placeholder_type"] is not None]
+
+
+class Shapes(_Collection):
+    """A slide's (or master's) shape collection, back to front."""
+
+    def __init__(self, app, slide):
+        super().__init__(app)
+        self.__dict__["_slide"] = slide
+
+    def _add(self, shape_type, base, left, top, width, height, font=None, **kw):
+        slide = self._slide
+        slide.__dict__["_next_id"] += 1
+        shape_id = slide.__dict__["_next_id"]
+        shape = Shape(self._app, self, shape_type, f"{base} {shape_id - 1}", left, top, width, height,
+                      font, shape_id=shape_id, **kw)
+        self._items.append(shape)
+        return shape
+
+    @property
+    def Placeholders(self):
+        return _Placeholders(self._app, self)
+
+    def AddShape(self, Type, Left, Top, Width, Height):
+        return self._add(msoAutoShape, _AUTOSHAPE_NAMES.get(Type, "Shape"), Left, Top, Width, Height,
+                         {}, autoshape_type=Type)
+
+    def AddTextbox(self, Orientation, Left, Top, Width, Height):
+        return self._add(msoTextBox, "TextBox", Left, Top, Width, Height, {})
+
+    def AddLine(self, BeginX, BeginY, EndX, EndY):
+        return self._add(msoLine, "Straight Connector", min(BeginX, EndX), min(BeginY, EndY),
+                         abs(EndX - BeginX), abs(EndY - BeginY))
+
+    def AddPicture(self, FileName, LinkToFile=msoFalse, SaveWithDocument=msoTrue,
+                   Left=0, Top=0, Width=-1, Height=-1):
+        if not os.path.exists(FileName):
+            raise _com_error(f"The specified file wasn't found: {FileName}")
+        width = 240.0 if Width == -1 else Width
+        height = 180.0 if Height == -1 else Height
+        return self._add(msoPicture, "Picture", Left, Top, width, height)
+
+    def AddTable(self, NumRows, NumColumns, Left=0, Top=0, Width=None, Height=None):
+        width = Width or min(_SLIDE_WIDTH - 2 * Left, 100.0 * NumColumns)
+        height = Height or 37.0 * NumRows
+        shape = self._add(msoTable, "Table", Left, Top, width, height)
+        shape.__dict__["_table"] = Table(self._app, NumRows, NumColumns, width, height)
+        return shape
+
+    def AddChart2(self, Style=-1, Type=51, Left=-1, Top=-1, Width=-1, Height=-1, NewLayout=True):
+        left = 120.0 if Left == -1 else Left
+        top = 90.0 if Top == -1 else Top
+        width = 720.0 if Width == -1 else Width
+        height = 405.0 if Height == -1 else Height
+        shape = self._add(msoChart, "Chart", left, top, width, height)
+        shape.__dict__["_chart"] = Chart(self._app, Type)
+        return shape
+
+    def _add_placeholder(self, ph_type, base, left, top, width, height, size):
+        shape = self._add(msoPlaceholder, base, left, top, width, height, {"Size": float(size)},
+                          placeholder_type=ph_type)
+        _raw(shape, "Fill").__dict__["Visible"] = msoFalse
+        _raw(shape, "Line").__dict__["Visible"] = msoFalse
+        return shape
+
+
+# ---------------------------------------------------------------------------
+# Tables
+# ---------------------------------------------------------------------------
+class _Cell(_Obj):
+    def __init__(self, app, table):
+        super().__init__(app, _table=table, Selected=False)
+        self.__dict__["Shape"] = Shape(app, None, msoAutoShape, "Cell", 0, 0, 100, 37, {"Size": 18.0})
+        self.__dict__["_borders"] = {}
+
+    def Borders(self, BorderType):
+        if BorderType not in self._borders:
+            self._borders[BorderType] = _Bag(self._app, Visible=msoTrue, Weight=1.0,
+                                             ForeColor=_color(self._app, 0), DashStyle=1)
+        return self._borders[BorderType]
+
+    def Merge(self, MergeTo):
+        pass
+
+    def Split(self, NumRows, NumColumns):
+        pass
+
+
+class _Row(_Obj):
+    def __init__(self, app, table, index):
+        super().__init__(app, _table=table, _index=index)
+
+    @property
+    def Height(self):
+        return self._table._heights[self._index - 1]
+
+    @Height.setter
+    def Height(self, value):
+        self._table._heights[self._index - 1] = value
+
+    def Delete(self):
+        t = self._table
+        del t._cells[self._index - 1]
+        del t._heights[self._index - 1]
+
+
+class _Column(_Obj):
+    def __init__(self, app, table, index):
+        super().__init__(app, _table=table, _index=index)
+
+    @property
+    def Width(self):
+        return self._table._widths[self._index - 1]
+
+    @Width.setter
+    def Width(self, value):
+        self._table._widths[self._index - 1] = value
+        for row in self._table._cells:
+            _raw(row[self._index - 1], "Shape").__dict__["Width"] = value
+
+    def Delete(self):
+        t = self._table
+        for row in t._cells:
+            del row[self._index - 1]
+        del t._widths[self._index - 1]
+
+
+class _Rows(_Obj):
+    def __init__(self, app, table):
+        super().__init__(app, _table=table)
+
+    @property
+    def Count(self):
+        return len(self._table._cells)
+
+    def __call__(self, index):
+        self._app._charge("call", "Item")
+        return _Row(self._app, self._table, index)
+
+    def Add(self, BeforeRow=-1):
+        t = self._table
+        pos = len(t._cells) if BeforeRow == -1 else BeforeRow - 1
+        t._cells.insert(pos, [t._new_cell(c) for c in range(len(t._widths))])
+        t._heights.insert(pos, t._heights[-1] if t._heights else 37.0)
+        return _Row(self._app, t, pos + 1)
+
+
+class _Columns(_Obj):
+    def __init__(self, app, table):
+        super().__init__(app, _table=table)
+
+    @property
+    def Count(self):
+        return len(self._table._widths)
+
+    def __call__(self, index):
+        self._app._charge("call", "Item")
+        return _Column(self._app, self._table, index)
+
+    def Add(self, BeforeColumn=-1):
+        t = self._table
+        pos = len(t._widths) if BeforeColumn == -1 else BeforeColumn - 1
+        t._widths.insert(pos, t._widths[-1] if t._widths else 100.0)
+        for row in t._cells:
+            row.insert(pos, t._new_cell(pos))
+        return _Column(self._app, t, pos + 1)
+
+
+class Table(_Obj):
+    def __init__(self, app, rows, cols, width, height):
+        super().__init__(app, _widths=[width / cols] * cols, _heights=[height / rows] * rows,
+                         FirstRow=msoTrue, FirstCol=msoFalse, LastRow=msoFalse, LastCol=msoFalse,
+                         HorizBanding=msoTrue, VertBanding=msoFalse)
+        self.__dict__["_cells"] = [[self._new_cell(c) for c in range(cols)] for _ in range(rows)]
+        self.__dict__["Rows"] = _Rows(app, self)
+        self.__dict__["Columns"] = _Columns(app, self)
+
+    def _new_cell(self, col):
+        cell = _Cell(self._app, self)
+        _raw(cell, "Shape").__dict__["Width"] = self._widths[col] if col < len(self._widths) else 100.0
+        return cell
+
+    def Cell(self, Row, Column):
+        cells = self._cells
+        if not (1 <= Row <= len(cells) and 1 <= Column <= len(self._widths)):
+            raise _com_error(f"Cell ({Row}, {Column}) is out of range.")
+        return cells[Row - 1][Column - 1]
+
+    def ApplyStyle(self, StyleID="", SaveFormatting=False):
+        self.__dict__["_style"] = StyleID
+
+
+# ---------------------------------------------------------------------------
+# Charts
+# ---------------------------------------------------------------------------
+def _col_letters(col: int) -> str:
+    letters = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _col_number(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+_ADDRESS_RE = re.compile(r"\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?$")
+
+
+def _parse_address(address: str) -> tuple:
+    m = _ADDRESS_RE.search(address.split("!")[-1])
+    if not m:
+        raise _com_error(f"Invalid range address '{address}'.")
+    c1, r1 = _col_number(m.group(1)), int(m.group(2))
+    c2, r2 = (_col_number(m.group(3)), int(m.group(4))) if m.group(3) else (c1, r1)
+    return r1, c1, r2, c2
+
+
+class _CellRef(_Obj):
+    def __init__(self, app, sheet, row, col):
+        super().__init__(app, _sheet=sheet, _row=row, _col=col)
+
+    @property
+    def Value(self):
+        return self._sheet._cells.get((self._row, self._col))
+
+    @Value.setter
+    def Value(self, value):
+        self._sheet._set(self._row, self._col, value)
+
+
+class _Range(_Obj):
+    def __init__(self, app, sheet, r1, c1, r2, c2):
+        super().__init__(app, _sheet=sheet, _box=(r1, c1, r2, c2))
+
+    @property
+    def Address(self):
+        r1, c1, r2, c2 = self._box
+        return f"${_col_letters(c1)}${r1}:${_col_letters(c2)}${r2}"
+
+    @property
+    def Value(self):
+        r1, c1, r2, c2 = self._box
+        cells = self._sheet._cells
+        rows = tuple(tuple(cells.get((r, c)) for c in range(c1, c2 + 1)) for r in range(r1, r2 + 1))
+        return rows[0][0] if len(rows) == 1 and len(rows[0]) == 1 else rows
+
+    @Value.setter
+    def Value(self, block):
+        r1, c1, r2, c2 = self._box
+        if not isinstance(block, (list, tuple)):
+            block = [[block] * (c2 - c1 + 1)] * (r2 - r1 + 1)
+        for dr, row in enumerate(block):
+            for dc, value in enumerate(row):
+                self._sheet._set(r1 + dr, c1 + dc, value)
+
+    def ClearContents(self):
+        r1, c1, r2, c2 = self._box
+        for key in [k for k in self._sheet._cells if r1 <= k[0] <= r2 and c1 <= k[1] <= c2]:
+            del self._sheet._cells[key]
+
+
+class _Cells(_Obj):
+    def __init__(self, app, sheet):
+        super().__init__(app, _sheet=sheet)
+
+    def __call__(self, row, col):
+        self._app._charge("call", "Item")
+        return _CellRef(self._app, self._sheet, row, col)
+
+    def Clear(self):
+        self._sheet._cells.clear()
+
+
+class _Worksheet(_Obj):
+    def __init__(self, app):
+        super().__init__(app, _cells={}, Name="Sheet1")
+        self.__dict__["Cells"] = _Cells(app, self)
+
+    def _set(self, row, col, value):
+        if value is None or value == "":
+            self._cells.pop((row, col), None)
+        else:
+            self._cells[(row, col)] = value
+
+    def Range(self, Cell1, Cell2=None):
+        if isinstance(Cell1, str):
+            return _Range(self._app, self, *_parse_address(Cell1))
+        a, b = Cell1, Cell2 or Cell1
+        return _Range(self._app, self, a._row, a._col, b._row, b._col)
+
+    @property
+    def UsedRange(self):
+        if not self._cells:
+            return _Range(self._app, self, 1, 1, 1, 1)
+        rows = [r for r, _ in self._cells]
+        cols = [c for _, c in self._cells]
+        return _Range(self._app, self, 1, 1, max(rows), max(cols))
+
+
+class _Workbook(_Obj):
+    def __init__(self, app, sheet):
+        super().__init__(app, _sheet=sheet)
+
+    def Worksheets(self, index):
+        return self._sheet
+
+    def Close(self, SaveChanges=None):
+        pass
+
+
+class _ChartData(_Obj):
+    def __init__(self, app, sheet):
+        super().__init__(app, _sheet=sheet, IsLinked=False)
+
+    def Activate(self):
+        pass
+
+    @property
+    def Workbook(self):
+        return _Workbook(self._app, self._sheet)
+
+    def BreakLink(self):
+        pass
+
+
+class _Series(_Obj):
+    def __init__(self, app, chart, index):
+        super().__init__(app, _chart=chart, _index=index)
+
+    def _col(self):
+        r1, c1, r2, c2 = self._chart._source
+        return c1 + self._index
+
+    @property
+    def Name(self):
+        r1 = self._chart._source[0]
+        return str(self._chart._sheet._cells.get((r1, self._col()), f"Series {self._index}"))
+
+    @property
+    def Values(self):
+        r1, c1, r2, c2 = self._chart._source
+        cells = self._chart._sheet._cells
+        return tuple(cells.get((r, self._col())) for r in range(r1 + 1, r2 + 1))
+
+    @property
+    def XValues(self):
+        r1, c1, r2, c2 = self._chart._source
+        cells = self._chart._sheet._cells
+        return tuple(cells.get((r, c1)) for r in range(r1 + 1, r2 + 1))
+
+
+class _SeriesCollection(_Collection):
+    def __init__(self, app, chart):
+        super().__init__(app)
+        self.__dict__["_chart"] = chart
+
+    @property
+    def _items(self):
+        r1, c1, r2, c2 = self._chart._source
+        return [_Series(self._app, self._chart, i) for i in range(1, c2 - c1 + 1)]
+
+
+class _OleObj:
+    """Stands in for chart._oleobj_ (SetSourceData through InvokeTypes)."""
+
+    def __init__(self, chart):
+        self._chart = chart
+
+    def InvokeTypes(self, dispid, lcid, flags, ret_type, arg_types, *args):
+        self._chart.SetSourceData(args[0])
+
+
+class Chart(_Obj):
+    def __init__(self, app, chart_type):
+        sheet = _Worksheet(app)
+        super().__init__(app, _sheet=sheet, _source=(1, 1, 5, 4), ChartType=chart_type, ChartStyle=201,
+                         HasTitle=msoTrue, HasLegend=msoTrue,
+                         ChartTitle=_Bag(app, Text="Chart Title"), Legend=_Bag(app, Position=-4107))
+        self.__dict__["ChartData"] = _ChartData(app, sheet)
+        self.__dict__["_oleobj_"] = _OleObj(self)
+        for c, name in enumerate(["Series 1", "Series 2", "Series 3"], start=2):
+            sheet._set(1, c, name)
+        for r in range(2, 6):
+            sheet._set(r, 1, f"Category {r - 1}")
+            for c in range(2, 5):
+                sheet._set(r, c, float((r * 7 + c * 3) % 5 + 1))
+
+    def SeriesCollection(self, Index=None):
+        collection = _SeriesCollection(self._app, self)
+        return collection if Index is None else collection._item(Index)
+
+    def SetSourceData(self, Source, PlotBy=None):
+        self.__dict__["_source"] = _parse_address(Source)
+
+
+# ---------------------------------------------------------------------------
+# Slides and presentations
+# ---------------------------------------------------------------------------
+class _CustomLayout(_Obj):
+    def __init__(self, app, name, pp_layout, placeholders, design):
+        super().__init__(app, Name=name, _pp_layout=pp_layout, _placeholders=placeholders, _design=design)
+
+
+class _Design(_Obj):
+    def __init__(self, app, name):
+        super().__init__(app, Name=name)
+        layouts = [_CustomLayout(app, n, pp, ph, self) for n, pp, ph in _LAYOUTS]
+        master = _Bag(app, Name=name, CustomLayouts=_Collection(app, layouts), Width=_SLIDE_WIDTH,
+                      Height=_SLIDE_HEIGHT, _next_id=1)
+        master.__dict__["Shapes"] = Shapes(app, master)
+        self.__dict__["SlideMaster"] = master
+
+
+class Slide(_Obj):
+    def __init__(self, app, pres, layout, slide_id):
+        super().__init__(app, _pres=pres, _layout=layout, _next_id=1,
+                         SlideID=slide_id, Name=f"Slide{slide_id - 255}", FollowMasterBackground=msoTrue)
+        d = self.__dict__
+        d["Shapes"] = Shapes(app, self)
+        d["Background"] = _Bag(app, Fill=_Bag(app, Type=1, Visible=msoTrue, ForeColor=_color(app, 0xFFFFFF)))
+        d["SlideShowTransition"] = _Bag(app, Hidden=msoFalse, EntryEffect=0, Duration=0.0,
+                                        AdvanceOnClick=msoTrue, AdvanceOnTime=msoFalse, AdvanceTime=0.0)
+        d["Tags"] = _Tags(app)
+        notes = _Bag(app, _next_id=1)
+        notes.__dict__["Shapes"] = Shapes(app, notes)
+        _raw(notes, "Shapes")._add_placeholder(ppPlaceholderBody, "Notes Placeholder", 72, 405, 576, 324, 12)
+        d["NotesPage"] = notes
+        for spec in _raw(layout, "_placeholders"):
+            d["Shapes"]._add_placeholder(*spec)
+
+    @property
+    def SlideIndex(self):
+        return self._pres._slides.index(self) + 1
+
+    @property
+    def SlideNumber(self):
+        return self.SlideIndex
+
+    @property
+    def CustomLayout(self):
+        return self._layout
+
+    @CustomLayout.setter
+    def CustomLayout(self, value):
+        self.__dict__["_layout"] = value
+
+    @property
+    def Layout(self):
+        return _raw(self._layout, "_pp_layout")
+
+    @property
+    def Design(self):
+        return _raw(self._layout, "_design")
+
+    def Export(self, FileName, FilterName="PNG", ScaleWidth=0, ScaleHeight=0):
+        setup = self._pres.__dict__["PageSetup"]
+        width = ScaleWidth or round(_raw(setup, "SlideWidth") * _EXPORT_PX_PER_PT)
+        height = ScaleHeight or round(_raw(setup, "SlideHeight") * _EXPORT_PX_PER_PT)
+        digest = zlib.crc32(repr([(s.__dict__["Name"], s.__dict__["Left"], s.__dict__["Top"])
+                                  for s in _raw(self, "Shapes")._items]).encode())
+        with open(FileName, "wb") as f:
+            f.write(_png(int(width), int(height), (digest & 0xFF, (digest >> 8) & 0xFF, (digest >> 16) & 0xFF)))
+
+    def Delete(self):
+        self._pres._slides.remove(self)
+
+    def MoveTo(self, toPos):
+        slides = self._pres._slides
+        slides.remove(self)
+        slides.insert(toPos - 1, self)
+
+
+class Slides(_Collection):
+    def __init__(self, app, pres):
+        super().__init__(app, pres._slides)
+        self.__dict__["_pres"] = pres
+
+    def _insert(self, index, layout):
+        pres = self._pres
+        pres.__dict__["_next_slide_id"] += 1
+        slide = Slide(self._app, pres, layout, pres.__dict__["_next_slide_id"])
+        if not 1 <= index <= len(pres._slides) + 1:
+            raise _com_error(f"Index {index} out of range (1-{len(pres._slides) + 1}).")
+        pres._slides.insert(index - 1, slide)
+        return slide
+
+    def Add(self, Index, Layout):
+        layouts = _raw(self._pres._designs[0].__dict__["SlideMaster"], "CustomLayouts")._items
+        pp = _LAYOUT_ALIASES.get(Layout, Layout)
+        layout = next((lay for lay in layouts if _raw(lay, "_pp_layout") == pp), layouts[1])
+        return self._insert(Index, layout)
+
+    def AddSlide(self, Index, pCustomLayout):
+        return self._insert(Index, pCustomLayout)
+
+    def FindBySlideID(self, SlideID):
+        for slide in self._items:
+            if _raw(slide, "SlideID") == SlideID:
+                return slide
+        raise _com_error(f"Slide ID {SlideID} not found.")
+
+
+class _View(_Obj):
+    def __init__(self, app, pres):
+        super().__init__(app, _pres=pres, _slide_index=1, Zoom=100)
+
+    def GotoSlide(self, Index):
+        if not 1 <= Index <= len(self._pres._slides):
+            raise _com_error(f"Slide index {Index} out of range.")
+        self.__dict__["_slide_index"] = Index
+
+    @property
+    def Slide(self):
+        slides = self._pres._slides
+        if not slides:
+            raise _com_error("No slide is active.")
+        return slides[min(self._slide_index, len(slides)) - 1]
+
+
+class _Window(_Obj):
+    def __init__(self, app, pres):
+        super().__init__(app, _pres=pres, ViewType=9, WindowState=3)
+        self.__dict__["View"] = _View(app, pres)
+        self.__dict__["Selection"] = _Bag(app, Type=0)
+
+    @property
+    def Caption(self):
+        return _raw(self._pres, "Name")
+
+    def Activate(self):
+        self._app._activate(self._pres)
+
+
+class Presentation(_Obj):
+    def __init__(self, app, full_name, with_window=True, read_only=False):
+        name = os.path.basename(full_name.replace("\\", "/"))
+        path = full_name[:len(full_name) - len(name)].rstrip("\\/")
+        super().__init__(app, _slides=[], _next_slide_id=255,
+                         Name=name, FullName=full_name, Path=path, Saved=msoTrue,
+                         ReadOnly=msoTrue if read_only else msoFalse, TemplateName="")
+        d = self.__dict__
+        d["_designs"] = [_Design(app, "Office Theme")]
+        d["Designs"] = _Collection(app, d["_designs"])
+        d["Slides"] = Slides(app, self)
+        d["PageSetup"] = _Bag(app, SlideWidth=_SLIDE_WIDTH, SlideHeight=_SLIDE_HEIGHT,
+                              FirstSlideNumber=1, SlideSize=15, SlideOrientation=1)
+        d["Tags"] = _Tags(app)
+        d["Windows"] = _Collection(app, [_Window(app, self)] if with_window else [])
+
+    @property
+    def SlideMaster(self):
+        return _raw(self._designs[0], "SlideMaster")
+
+    def Save(self):
+        self.__dict__["Saved"] = msoTrue
+
+    def SaveAs(self, FileName, FileFormat=None, EmbedTrueTypeFonts=None):
+        name = os.path.basename(FileName.replace("\\", "/"))
+        self.__dict__.update(Name=name, FullName=FileName, Saved=msoTrue,
+                             Path=FileName[:len(FileName) - len(name)].rstrip("\\/"))
+
+    def SaveCopyAs(self, FileName, FileFormat=None, EmbedTrueTypeFonts=None):
+        pass
+
+    def Close(self):
+        self._app._close(self)
+
+
+class _Presentations(_Collection):
+    def __init__(self, app):
+        super().__init__(app, app._presentations)
+
+    def Add(self, WithWindow=msoTrue):
+        app = self._app
+        app.__dict__["_untitled"] += 1
+        pres = Presentation(app, f"Presentation{app.__dict__['_untitled']}", WithWindow == msoTrue)
+        app._open(pres)
+        return pres
+
+    def Open(self, FileName, ReadOnly=msoFalse, Untitled=msoFalse, WithWindow=msoTrue):
+        """Open a file by name. The file is not read: the deck starts empty."""
+        pres = Presentation(self._app, FileName, WithWindow == msoTrue, ReadOnly == msoTrue)
+        self._app._open(pres)
+        return pres
+
+
+class FakeApplication(_Obj):
+    """The PowerPoint.Application stand-in; owns counters and the latency model."""
+
+    def __init__(self, latency: Optional[Latency] = None):
+        super().__init__(
+            self, latency=latency or Latency(), counters={"get": 0, "set": 0, "call": 0},
+            simulated_s=0.0, _presentations=[], _active=None, _untitled=0,
+            Name="Microsoft PowerPoint", Version="16.0", Build="17932", Visible=msoTrue,
+            WindowState=3, Caption="PowerPoint",
+        )
+        self.__dict__["Presentations"] = _Presentations(self)
+        self.__dict__["LanguageSettings"] = _LanguageSettings(self)
+
+    def _charge(self, kind: str, name: str) -> None:
+        self.counters[kind] += 1
+        latency = self.latency
+        cost = latency.slow.get(name, getattr(latency, kind))
+        if cost:
+            self.__dict__["simulated_s"] += cost
+            if latency.sleep:
+                time.sleep(cost)
+
+    def reset_counters(self) -> None:
+        self.__dict__["counters"] = {"get": 0, "set": 0, "call": 0}
+        self.__dict__["simulated_s"] = 0.0
+
+    def _open(self, pres) -> None:
+        self._presentations.append(pres)
+        self.__dict__["_active"] = pres
+
+    def _activate(self, pres) -> None:
+        self.__dict__["_active"] = pres
+
+    def _close(self, pres) -> None:
+        self._presentations.remove(pres)
+        if self._active is pres:
+            self.__dict__["_active"] = self._presentations[-1] if self._presentations else None
+
+    @property
+    def ActivePresentation(self):
+        if self._active is None:
+            raise _com_error("No presentation is open.")
+        return self._active
+
+    @property
+    def ActiveWindow(self):
+        pres = self._active
+        windows = _raw(pres, "Windows")._items if pres is not None else []
+        if not windows:
+            raise _com_error("No window is active.")
+        return windows[0]
+
+    @property
+    def Windows(self):
+        return _Collection(self, [w for p in self._presentations for w in _raw(p, "Windows")._items])
+
+    def StartNewUndoEntry(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Wiring
+# ---------------------------------------------------------------------------
+_attached: Optional[FakeApplication] = None
+
+
+def attach(app: FakeApplication, wrapper=None) -> None:
+    """Make a PowerPointCOMWrapper (default: the global ppt) drive app."""
+    global _attached
+    if wrapper is None:
+        from .com_wrapper import ppt as wrapper
+    _attached = app
+    wrapper._app = app
+    wrapper._target_pres_full_name = None
+    wrapper._invalidate_handles()
+
+
+class _MissingDLL:
+    """Stands in for a ctypes.windll / oledll library on other platforms.
+
+    Functions accept argtypes / restype (bound at import time) and raise
+    OSError when called.
+    """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        dll = self._name
+
+        def missing(*args):
+            raise OSError(f"{dll}.{name} is not available on this platform")
+
+        missing.__name__ = name
+        setattr(self, name, missing)
+        return missing
+
+
+class _MissingDLLLoader:
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        lib = _MissingDLL(name)
+        setattr(self, name, lib)
+        return lib
+
+
+def _install_windows_stdlib_shims() -> bool:
+    """Stub ctypes.windll / oledll and winreg where Windows provides them."""
+    import ctypes
+
+    installed = False
+    for name in ("windll", "oledll"):
+        if not hasattr(ctypes, name):
+            setattr(ctypes, name, _MissingDLLLoader())
+            installed = True
+    try:
+        import winreg  # noqa: F401
+    except ImportError:
+        def no_registry(*args, **kwargs):
+            raise OSError("The Windows registry is not available on this platform")
+
+        winreg = types.ModuleType("winreg")
+        winreg.HKEY_CURRENT_USER = 0x80000001
+        winreg.KEY_READ = 0x20019
+        winreg.OpenKey = winreg.EnumKey = winreg.QueryValueEx = no_registry
+        winreg.CloseKey = lambda key: None
+        sys.modules["winreg"] = winreg
+        installed = True
+    return installed
+
+
+def install_pywin32_shims() -> bool:
+    """Register minimal pythoncom / pywintypes / win32com.client modules.
+
+    Only for machines without pywin32 (e.g. Linux CI): lets utils.com_wrapper
+    and the ppt_com modules import, and makes GetActiveObject / Dispatch
+    return the attached FakeApplication. ctypes.windll / oledll and winreg
+    are stubbed too when missing; their functions raise OSError. Returns
+    False (and changes nothing) on Windows with pywin32 installed.
+    """
+    installed = _install_windows_stdlib_shims()
+    try:
+        import pythoncom  # noqa: F401
+        import pywintypes  # noqa: F401
+        import win32com.client  # noqa: F401
+        return installed
+    except ImportError:
+        pass
+
+    class com_error(Exception):
+        def __init__(self, hresult=0, strerror=None, excepinfo=None, argerror=None):
+            super().__init__(hresult, strerror, excepinfo, argerror)
+            self.hresult, self.strerror = hresult, strerror
+            self.excepinfo, self.argerror = excepinfo, argerror
+
+    def get_active_object(prog_id):
+        if _attached is None:
+            raise com_error(_MK_E_UNAVAILABLE, "Operation unavailable", None, None)
+        return _attached
+
+    def dispatch(prog_id):
+        return _attached if _attached is not None else FakeApplication()
+
+    pywintypes = types.ModuleType("pywintypes")
+    pywintypes.com_error = com_error
+    pythoncom = types.ModuleType("pythoncom")
+    pythoncom.COINIT_APARTMENTTHREADED = 2
+    pythoncom.CoInitializeEx = pythoncom.CoInitialize = lambda *a: None
+    pythoncom.CoUninitialize = lambda: None
+    pythoncom.Empty = None
+    win32com = types.ModuleType("win32com")
+    client = types.ModuleType("win32com.client")
+    client.GetActiveObject = get_active_object
+    client.Dispatch = dispatch
+    win32com.client = client
+    sys.modules.update({"pywintypes": pywintypes, "pythoncom": pythoncom,
+                        "win32com": win32com, "win32com.client": client})
+    return True
@@ -0,0 +1,157 @@
+"""Network fetch stage that runs off the COM thread.
+
+Tools that insert remote images (ppt_add_picture_from_url, ppt_add_svg_icon)
+used to download inside their COM implementation, so a slow CDN held the one
+COM STA thread and every queued PowerPoint operation waited behind it. They now
+download first, on a small shared I/O pool, and only queue the COM step once
+the content is available locally.
+
+- ``run_io`` runs a blocking function on the shared I/O pool from async code.
+- ``fetch_url`` is a plain GET with a timeout. HTTP(S) connections are kept
+  alive per host and reused across calls (icons mostly come from one CDN), and
+  errors are raised as ``urllib.error.HTTPError`` / ``URLError`` just like
+  ``urllib.request.urlopen``. Requests that need a proxy from the environment
+  go through urllib unchanged.
+
+Configuration (environment variables):
+    PPT_IO_WORKERS      I/O pool size (default: 8)
+    PPT_HTTP_TIMEOUT    Per-request timeout in seconds (default: 15)
+"""
+
+import asyncio
+import functools
+import http.client
+import logging
+import os
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_IO_WORKERS = int(os.getenv("PPT_IO_WORKERS", "8"))
+HTTP_TIMEOUT = float(os.getenv("PPT_HTTP_TIMEOUT", "15"))
+_MAX_REDIRECTS = 5
+_MAX_IDLE_PER_HOST = 4
+_USER_AGENT = "ppt-mcp"
+
+_io_pool = ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="ppt-io")
+
+
+async def run_io(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking (non-COM) function on the shared I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_pool, functools.partial(func, *args, **kwargs))
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections keyed by (scheme, host, port)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle: dict = {}
+        self.stats = {"requests": 0, "connections_opened": 0, "connections_reused": 0}
+
+    def acquire(self, scheme: str, host: str, port: Optional[int], timeout: float):
+        key = (scheme, host, port)
+        with self._lock:
+            self.stats["requests"] += 1
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                self.stats["connections_reused"] += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return key, conn, True
+            self.stats["connections_opened"] += 1
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return key, cls(host, port, timeout=timeout), False
+
+    def release(self, key, conn) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < _MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+
+_pool = _ConnectionPool()
+
+
+def _uses_proxy(url: str) -> bool:
+    parts = urllib.parse.urlsplit(url)
+    proxies = urllib.request.getproxies()
+    return parts.scheme in proxies and not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def _request_once(url: str, timeout: float) -> Tuple[int, Any, bytes]:
+    """One GET over a pooled connection; retries once if a reused one went stale."""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    headers = {"User-Agent": _USER_AGENT, "Accept-Encoding": "identity"}
+
+    for attempt in (1, 2):
+        key, conn, reused = _pool.acquire(parts.scheme, parts.hostname, parts.port, timeout)
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if reused and attempt == 1:
+                continue  # server closed the idle connection; use a fresh one
+            raise
+        except Exception:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            _pool.release(key, conn)
+        return resp.status, resp.headers, body
+    raise AssertionError("unreachable")
+
+
+def fetch_url(url: str, timeout: Optional[float] = None) -> Tuple[bytes, str]:
+    """GET url and return (body, content_type).
+
+    Follows redirects. Meant to run on the I/O pool (see run_io), never on
+    the COM thread.
+
+    Raises:
+        urllib.error.HTTPError: For 4xx/5xx responses.
+        urllib.error.URLError: For unsupported URLs and connection failures.
+    """
+    timeout = HTTP_TIMEOUT if timeout is None else timeout
+    for _ in range(_MAX_REDIRECTS + 1):
+        scheme = urllib.parse.urlsplit(url).scheme.lower()
+        if scheme not in ("http", "https") or _uses_proxy(url):
+            # file:, data:, proxied requests: urllib handles them.
+            with urllib.request.urlopen(url, timeout=timeout) as resp:
+                return resp.read(), resp.headers.get("Content-Type", "")
+        try:
+            status, headers, body = _request_once(url, timeout)
+        except OSError as e:
+            raise urllib.error.URLError(e) from e
+        if status in (301, 302, 303, 307, 308) and headers.get("Location"):
+            url = urllib.parse.urljoin(url, headers["Location"])
+            continue
+        if status >= 400:
+            raise urllib.error.HTTPError(
+                url, status, http.client.responses.get(status, ""), headers, None
+            )
+        return body, headers.get("Content-Type", "")
+    raise urllib.error.URLError(f"Too many redirects: {url}")
+
+
+def stats() -> dict:
+    """Connection pool counters (requests, connections opened / reused)."""
+    with _pool._lock:
+        return dict(_pool.stats)
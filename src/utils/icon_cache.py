@@ -0,0 +1,309 @@
+"""Persistent on-disk cache for Material Symbols icon metadata and SVG files.
+
+ppt_search_icons needs the full Google Fonts icon metadata (a few MB of JSON)
+and ppt_add_svg_icon downloads one SVG per insertion. Both used to hit the
+network on every server start / every insertion. This module keeps them on
+disk across restarts:
+
+- **Metadata** is stored with its fetch time, ETag and Last-Modified. After
+  the TTL it is revalidated with a conditional GET (304 just refreshes the
+  timestamp). If the network is unavailable a stale copy is served.
+- **SVGs** are stored content-addressed (``svg/<sha256>.svg``) with an index
+  mapping source URL -> digest. The CDN URLs are pinned to a package version,
+  so an SVG never needs revalidation. The store is size-bounded with LRU
+  eviction by last access.
+- **Offline mode** (``PPT_ICON_OFFLINE=true``) never touches the network and
+  serves only what is cached.
+
+The layout is versioned (``icons/v1``) so a future format change can ignore
+old files instead of misreading them.
+
+Configuration (environment variables):
+    PPT_MCP_CACHE_DIR       Cache root (default: %LOCALAPPDATA%\\ppt-mcp\\cache,
+                            or ~/.cache/ppt-mcp elsewhere)
+    PPT_ICON_OFFLINE        true/1/yes to disable network access
+    PPT_ICON_CACHE_MAX_MB   SVG store size bound in MB (default: 50)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Optional
+
+from .disk_cache import atomic_write, default_cache_root
+from .http_fetch import fetch_url
+from .icon_index import IconIndex
+
+logger = logging.getLogger(__name__)
+
+ICON_METADATA_URL = "https://fonts.google.com/metadata/icons"
+METADATA_TTL = 86400  # 24 hours
+_CACHE_LAYOUT_VERSION = "v1"
+_HTTP_TIMEOUT = 15  # seconds
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").lower() in ("true", "1", "yes")
+
+
+def _parse_metadata(raw: str) -> list:
+    """Parse the Google Fonts icon metadata response into the icons list.
+
+    The first line of the response is `)]}'` (XSS protection) and must be
+    stripped before parsing as JSON.
+    """
+    first_nl = raw.index("\n")
+    data = json.loads(raw[first_nl + 1:])
+    return data.get("icons", [])
+
+
+class IconCache:
+    """Disk-backed icon metadata and SVG cache. Safe to share across threads."""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        offline: Optional[bool] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self._root = os.path.join(root or default_cache_root(), "icons", _CACHE_LAYOUT_VERSION)
+        self.offline = _env_flag("PPT_ICON_OFFLINE") if offline is None else offline
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("PPT_ICON_CACHE_MAX_MB", "50")) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._icons: Optional[list] = None
+        self._index_obj: Optional[IconIndex] = None
+        self._meta: Optional[dict] = None
+        self._svg_index: Optional[dict] = None
+        self._stats = {
+            "metadata_memory_hits": 0,
+            "metadata_disk_loads": 0,
+            "metadata_downloads": 0,
+            "metadata_revalidated": 0,
+            "metadata_stale_served": 0,
+            "svg_hits": 0,
+            "svg_downloads": 0,
+            "svg_evictions": 0,
+        }
+
+    # -- paths --------------------------------------------------------------
+    @property
+    def root(self) -> str:
+        return self._root
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self._root, *parts)
+
+    def _ensure_dirs(self) -> None:
+        os.makedirs(self._path("svg"), exist_ok=True)
+
+    # -- metadata -----------------------------------------------------------
+    def get_metadata(self) -> list:
+        """Return the icons list, from memory, disk or the network (in that order)."""
+        with self._lock:
+            now = time.time()
+            if self._icons is None:
+                self._load_metadata_from_disk()
+            fresh = self._meta is not None and (now - self._meta.get("fetched_at", 0)) < METADATA_TTL
+            if self._icons is not None and (fresh or self.offline):
+                self._stats["metadata_memory_hits"] += 1
+                return self._icons
+            if self.offline:
+                raise RuntimeError(
+                    "Icon metadata is not cached and offline mode is enabled "
+                    "(PPT_ICON_OFFLINE). Run ppt_prewarm_icons while online first."
+                )
+            try:
+                self._refresh_metadata(now)
+            except (urllib.error.URLError, OSError, ValueError) as e:
+                if self._icons is None:
+                    raise
+                self._stats["metadata_stale_served"] += 1
+                logger.warning("Icon metadata revalidation failed (%s); serving cached copy", e)
+            return self._icons
+
+    def get_index(self) -> IconIndex:
+        """Return the search index for the current metadata.
+
+        Built once per metadata load; rebuilt only when a download replaced
+        the icons list.
+        """
+        icons = self.get_metadata()
+        with self._lock:
+            if self._index_obj is None or self._index_obj.icons is not icons:
+                start = time.perf_counter()
+                self._index_obj = IconIndex(icons)
+                logger.info(
+                    "Built icon search index over %d icons in %.0f ms",
+                    len(icons), (time.perf_counter() - start) * 1000,
+                )
+            return self._index_obj
+
+    def _load_metadata_from_disk(self) -> None:
+        try:
+            with open(self._path("metadata.meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(self._path("metadata.json"), encoding="utf-8") as f:
+                icons = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._meta, self._icons = meta, icons
+        self._stats["metadata_disk_loads"] += 1
+        logger.info("Loaded %d icons from disk cache %s", len(icons), self._root)
+
+    def _refresh_metadata(self, now: float) -> None:
+        """Conditional GET of the metadata; 304 only refreshes the timestamp."""
+        req = urllib.request.Request(ICON_METADATA_URL)
+        if self._icons is not None and self._meta:
+            if self._meta.get("etag"):
+                req.add_header("If-None-Match", self._meta["etag"])
+            if self._meta.get("last_modified"):
+                req.add_header("If-Modified-Since", self._meta["last_modified"])
+        try:
+            resp = urllib.request.urlopen(req, timeout=_HTTP_TIMEOUT)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and self._icons is not None:
+                self._meta["fetched_at"] = now
+                self._write_meta()
+                self._stats["metadata_revalidated"] += 1
+                return
+            raise
+        raw = resp.read().decode("utf-8")
+        icons = _parse_metadata(raw)
+        self._icons = icons
+        self._meta = {
+            "url": ICON_METADATA_URL,
+            "fetched_at": now,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        self._stats["metadata_downloads"] += 1
+        self._ensure_dirs()
+        atomic_write(self._path("metadata.json"), json.dumps(icons).encode("utf-8"))
+        self._write_meta()
+        logger.info("Fetched %d icons from Google Fonts metadata", len(icons))
+
+    def _write_meta(self) -> None:
+        self._ensure_dirs()
+        atomic_write(self._path("metadata.meta.json"), json.dumps(self._meta).encode("utf-8"))
+
+    # -- SVG store ----------------------------------------------------------
+    def _index(self) -> dict:
+        if self._svg_index is None:
+            try:
+                with open(self._path("svg_index.json"), encoding="utf-8") as f:
+                    self._svg_index = json.load(f)
+            except (OSError, ValueError):
+                self._svg_index = {}
+        return self._svg_index
+
+    def _save_index(self) -> None:
+        self._ensure_dirs()
+        atomic_write(self._path("svg_index.json"), json.dumps(self._index()).encode("utf-8"))
+
+    def cached_svg(self, url: str) -> Optional[str]:
+        """Return the cached SVG text for url, or None if it is not cached."""
+        with self._lock:
+            entry = self._index().get(url)
+            if entry is None:
+                return None
+            try:
+                with open(self._path("svg", entry["sha256"] + ".svg"), encoding="utf-8") as f:
+                    text = f.read()
+            except OSError:
+                # File evicted or deleted behind our back — forget the entry.
+                del self._index()[url]
+                self._save_index()
+                return None
+            entry["last_access"] = time.time()
+            self._stats["svg_hits"] += 1
+            # The index is persisted on the next write; a lost access time
+            # only makes LRU eviction slightly less precise.
+            return text
+
+    def get_svg(self, url: str) -> str:
+        """Return SVG text for url, downloading and storing it on a miss.
+
+        A miss blocks on the network: call this from the I/O pool
+        (utils.http_fetch.run_io), never from the COM thread.
+
+        Raises:
+            urllib.error.HTTPError: From the CDN (e.g. 404 for an unknown icon).
+            RuntimeError: On a miss in offline mode.
+        """
+        text = self.cached_svg(url)
+        if text is not None:
+            return text
+        if self.offline:
+            raise RuntimeError(
+                f"SVG not cached and offline mode is enabled (PPT_ICON_OFFLINE): {url}"
+            )
+        data, _ = fetch_url(url, timeout=_HTTP_TIMEOUT)
+        self.store_svg(url, data)
+        return data.decode("utf-8")
+
+    def store_svg(self, url: str, data: bytes) -> None:
+        """Add downloaded SVG bytes to the content-addressed store."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self._ensure_dirs()
+            path = self._path("svg", digest + ".svg")
+            if not os.path.exists(path):
+                atomic_write(path, data)
+            self._index()[url] = {
+                "sha256": digest,
+                "size": len(data),
+                "last_access": time.time(),
+            }
+            self._stats["svg_downloads"] += 1
+            self._evict_if_needed()
+            self._save_index()
+
+    def _evict_if_needed(self) -> None:
+        """Drop least-recently-used SVGs until the store fits max_bytes."""
+        index = self._index()
+        # Several URLs may share one file (identical content); count each file once.
+        sizes = {e["sha256"]: e["size"] for e in index.values()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+        for url, entry in sorted(index.items(), key=lambda kv: kv[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            del index[url]
+            digest = entry["sha256"]
+            if any(e["sha256"] == digest for e in index.values()):
+                continue
+            total -= entry["size"]
+            try:
+                os.remove(self._path("svg", digest + ".svg"))
+            except OSError:
+                pass
+            self._stats["svg_evictions"] += 1
+
+    # -- maintenance --------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            index = self._index()
+            return {
+                "cache_dir": self._root,
+                "offline": self.offline,
+                "metadata_cached": self._icons is not None,
+                "metadata_age_s": (
+                    round(time.time() - self._meta["fetched_at"]) if self._meta else None
+                ),
+                "svg_count": len(index),
+                "svg_bytes": sum({e["sha256"]: e["size"] for e in index.values()}.values()),
+                "svg_max_bytes": self.max_bytes,
+                **self._stats,
+            }
+
+
+# Global singleton instance
+icon_cache = IconCache()
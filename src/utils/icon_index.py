@@ -0,0 +1,242 @@
+"""Precomputed search index for Material Symbols icon metadata.
+
+ppt_search_icons used to score every icon (3,000+) against every query word,
+lowercasing each icon's tag list on every call. IconIndex is built once per
+metadata load and answers the same queries from posting lists:
+
+- the distinct names, tags and categories form a vocabulary;
+- every substring of length 1-3 of each vocabulary term is indexed, so the
+  terms *containing* a query word (the original matching rule) are found by
+  an exact lookup (short words) or a trigram intersection plus verification;
+- each term maps to the icons that carry it as name / tag / category;
+- popularity bonuses are pre-normalized.
+
+Scoring is identical to the original linear scan (kept below as
+linear_search for tests and benchmarks). Words that match nothing at all can
+optionally fall back to fuzzy matching against the vocabulary.
+"""
+
+import difflib
+from collections import defaultdict
+from typing import Optional
+
+_NGRAM_MAX = 3
+_FUZZY_CUTOFF = 0.75
+_FUZZY_MAX_TERMS = 3
+_FUZZY_WEIGHT = 0.5
+
+
+def _ngrams(term: str):
+    """Yield every distinct substring of term with length 1.._NGRAM_MAX."""
+    seen = set()
+    for n in range(1, _NGRAM_MAX + 1):
+        for i in range(len(term) - n + 1):
+            g = term[i:i + n]
+            if g not in seen:
+                seen.add(g)
+                yield g
+
+
+class IconIndex:
+    """Inverted index over icon names, tags and categories."""
+
+    def __init__(self, icons: list):
+        self.icons = icons
+        self.size = len(icons)
+        # Pre-normalized popularity bonus (same formula as the scan).
+        self._bonus = [min(icon.get("popularity", 0) / 1000, 10) for icon in icons]
+        self._names = [icon.get("name", "") for icon in icons]
+
+        vocab: dict = {}           # term -> term id
+        terms: list = []           # term id -> term
+        name_post = defaultdict(list)  # term id -> icon ids with that name
+        tag_post = defaultdict(list)   # term id -> icon ids (one entry per occurrence)
+        cat_post = defaultdict(list)
+
+        def term_id(term):
+            tid = vocab.get(term)
+            if tid is None:
+                tid = vocab[term] = len(terms)
+                terms.append(term)
+            return tid
+
+        for idx, icon in enumerate(icons):
+            name_post[term_id(self._names[idx])].append(idx)
+            for tag in icon.get("tags", []):
+                tag_post[term_id(tag.lower())].append(idx)
+            for cat in icon.get("categories", []):
+                cat_post[term_id(cat.lower())].append(idx)
+
+        grams = defaultdict(set)
+        for tid, term in enumerate(terms):
+            for g in _ngrams(term):
+                grams[g].add(tid)
+
+        self._vocab = vocab
+        self._terms = terms
+        self._name_post = dict(name_post)
+        self._tag_post = dict(tag_post)
+        self._cat_post = dict(cat_post)
+        self._grams = dict(grams)
+
+    # -- term lookup --------------------------------------------------------
+    def _terms_containing(self, word: str) -> set:
+        """Term ids whose text contains word as a substring."""
+        if not word:
+            return set(range(len(self._terms)))  # "" is in every string
+        if len(word) <= _NGRAM_MAX:
+            return self._grams.get(word, set())
+        postings = []
+        for i in range(len(word) - _NGRAM_MAX + 1):
+            p = self._grams.get(word[i:i + _NGRAM_MAX])
+            if not p:
+                return set()
+            postings.append(p)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return {tid for tid in candidates if word in self._terms[tid]}
+
+    def _fuzzy_terms(self, word: str) -> list:
+        """Vocabulary terms that are close (edit-wise) to word."""
+        # Restrict the comparison to terms sharing a bigram with the word.
+        pool = set()
+        for i in range(max(len(word) - 1, 1)):
+            pool |= self._grams.get(word[i:i + 2], set())
+        candidates = [self._terms[tid] for tid in pool]
+        return difflib.get_close_matches(
+            word, candidates, n=_FUZZY_MAX_TERMS, cutoff=_FUZZY_CUTOFF
+        )
+
+    # -- scoring ------------------------------------------------------------
+    def _score_word(self, scores: dict, word: str, term_ids, weight: float = 1.0) -> set:
+        """Add the per-word contributions; return icon ids whose name matched."""
+        name_hits = set()
+        for tid in term_ids:
+            term = self._terms[tid]
+            for idx in self._name_post.get(tid, ()):
+                scores[idx] += 30 * weight
+                name_hits.add(idx)
+            tag_points = (20 if term == word else 10) * weight
+            for idx in self._tag_post.get(tid, ()):
+                scores[idx] += tag_points
+            for idx in self._cat_post.get(tid, ()):
+                scores[idx] += 5 * weight
+        return name_hits
+
+    def search(self, query: str, max_results: int = 20, fuzzy: bool = False) -> dict:
+        """Score icons for query; same semantics as linear_search.
+
+        Returns:
+            dict with "icons" (sorted result list) and "fuzzy" (word ->
+            vocabulary terms used as fallback; empty unless fuzzy matching
+            kicked in).
+        """
+        query_lower = query.lower().strip()
+        query_words = query_lower.split()
+        scores = defaultdict(float)
+
+        # Whole-query match against the icon name.
+        for tid in self._terms_containing(query_lower):
+            points = 100 if self._terms[tid] == query_lower else 50
+            for idx in self._name_post.get(tid, ()):
+                scores[idx] += points
+        if " " in query_lower:
+            tid = self._vocab.get(query_lower.replace(" ", "_"))
+            for idx in self._name_post.get(tid, ()) if tid is not None else ():
+                scores[idx] += 90
+
+        # Per-word matches; track which icon names contain every word.
+        corrections = {}
+        all_words_in_name: Optional[set] = None
+        for word in query_words:
+            term_ids = self._terms_containing(word)
+            if not term_ids and fuzzy:
+                close = self._fuzzy_terms(word)
+                if close:
+                    corrections[word] = close
+                    for term in close:
+                        self._score_word(scores, term, [self._vocab[term]], _FUZZY_WEIGHT)
+            name_hits = self._score_word(scores, word, term_ids)
+            all_words_in_name = (
+                name_hits if all_words_in_name is None else all_words_in_name & name_hits
+            )
+        if len(query_words) > 1 and all_words_in_name:
+            for idx in all_words_in_name:
+                scores[idx] += 40
+
+        ranked = [
+            (round(score + self._bonus[idx], 2), idx)
+            for idx, score in scores.items() if score > 0
+        ]
+        ranked.sort(key=lambda x: (-x[0], x[1]))
+        results = []
+        for score, idx in ranked[:max_results]:
+            icon = self.icons[idx]
+            results.append({
+                "name": self._names[idx],
+                "categories": icon.get("categories", []),
+                "tags": icon.get("tags", [])[:8],  # limit tags for readability
+                "popularity": icon.get("popularity", 0),
+                "score": score,
+            })
+        return {"icons": results, "fuzzy": corrections}
+
+
+def linear_search(icons: list, query: str, max_results: int = 20) -> list:
+    """Reference implementation: score every icon (the pre-index algorithm).
+
+    Scoring:
+    - Exact icon name match: +100
+    - Full query (multi-word) found in icon name: +50
+    - All query words found in icon name: +40
+    - Query word found in icon name: +30
+    - Exact tag match: +20
+    - Query word found in a tag: +10
+    - Query word found in a category: +5
+    - Popularity bonus (normalized to 0-10 range)
+    """
+    query_lower = query.lower().strip()
+    query_words = query_lower.split()
+
+    results = []
+    for icon in icons:
+        name = icon.get("name", "")
+        tags = [t.lower() for t in icon.get("tags", [])]
+        categories = [c.lower() for c in icon.get("categories", [])]
+        popularity = icon.get("popularity", 0)
+
+        score = 0
+        if name == query_lower:
+            score += 100
+        elif query_lower.replace(" ", "_") == name:
+            score += 90
+        elif query_lower in name:
+            score += 50
+
+        if len(query_words) > 1 and all(w in name for w in query_words):
+            score += 40
+
+        for word in query_words:
+            if word in name:
+                score += 30
+            for tag in tags:
+                if word == tag:
+                    score += 20
+                elif word in tag:
+                    score += 10
+            for cat in categories:
+                if word in cat:
+                    score += 5
+
+        if score > 0:
+            score += min(popularity / 1000, 10)
+            results.append({
+                "name": name,
+                "categories": icon.get("categories", []),
+                "tags": icon.get("tags", [])[:8],
+                "popularity": popularity,
+                "score": round(score, 2),
+            })
+
+    results.sort(key=lambda x: x["score"], reverse=True)
+    return results[:max_results]
@@ -1,9 +1,15 @@
 """Navigation helpers for PowerPoint COM automation."""
 
 import logging
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# While a coalescing block is active, the slide the window was last sent to.
+# Consecutive goto_slide calls for the same slide are then skipped.
+_coalescing = False
+_last_slide_index = None
+
 
 def goto_slide(app, slide_index: int) -> None:
     """Navigate the active window to the specified slide.
@@ -16,7 +22,29 @@ def goto_slide(app, slide_index: int) -> None:
         app: PowerPoint Application COM object.
         slide_index: 1-based slide index to navigate to.
     """
+    global _last_slide_index
+    if _coalescing and slide_index == _last_slide_index:
+        return
     try:
         app.ActiveWindow.View.GotoSlide(slide_index)
+        _last_slide_index = slide_index
     except Exception:
         pass
+
+
+@contextmanager
+def coalesce_navigation():
+    """Skip repeated goto_slide calls to the same slide within the block.
+
+    Used when many operations run back-to-back in one COM task (e.g.
+    ppt_execute_batch), where nothing else can move the window in between.
+    """
+    global _coalescing, _last_slide_index
+    outer = _coalescing
+    _coalescing = True
+    if not outer:
+        _last_slide_index = None
+    try:
+        yield
+    finally:
+        _coalescing = outer
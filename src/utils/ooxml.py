@@ -0,0 +1,1009 @@
+"""Offline access to closed .pptx files (no PowerPoint, no COM).
+
+A .pptx is a zip of XML parts. Reading text, shapes, tables, charts and
+comments straight from those parts needs no PowerPoint, runs on any OS and
+is not serialized behind the single COM thread, so pipelines that only
+extract or normalize content (search indexing, nightly report decks, font
+clean-up) can process many files at once across a process pool.
+
+Read operations (READ_OPERATIONS) mirror the COM tools' output where the
+file format allows:
+
+- ``get_all_text``: pseudo-Markdown per slide (``== Slide N ==`` headers,
+  ``#`` titles, Markdown tables, speaker notes)
+- ``list_shapes``: per-slide shape list like ppt_list_shapes
+- ``get_table_data``: every table's cell text
+- ``get_chart_data``: every chart's categories and series, from the values
+  cached in the chart part (the embedded workbook is not opened)
+- ``list_comments``: legacy and modern (threaded) comments
+
+Write operations (WRITE_OPERATIONS) edit slide XML (and optionally notes) in
+place and keep every other part byte-for-byte:
+
+- ``replace_text``: find/replace, also across runs within a paragraph (the
+  replacement takes the formatting of the run where the match starts)
+- ``set_font``: Latin / East Asian font name and size on every run
+
+Positions are in points. Placeholders without their own position inherit it
+from the slide layout or master. Paragraphs and line breaks in returned text
+are ``\\n``. Only .pptx / .pptm (OOXML) files are supported; legacy binary
+.ppt is not.
+
+extract_slides writes a copy of a file trimmed to some slides, leaving out
+the parts only the other slides use (used for slide-range PDF export).
+
+run_batch fans a list of files out over PPT_OFFLINE_WORKERS processes
+(default: CPU count). Each file is handled independently, so one bad file
+yields an error entry and does not stop the others.
+"""
+
+import glob
+import logging
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    MAX_WORKERS: int = int(os.getenv("PPT_OFFLINE_WORKERS", "0")) or (os.cpu_count() or 1)
+except ValueError:
+    MAX_WORKERS = os.cpu_count() or 1
+
+EMU_PER_POINT = 12700
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "c": "http://schemas.openxmlformats.org/drawingml/2006/chart",
+    "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
+    "p188": "http://schemas.microsoft.com/office/powerpoint/2018/8/main",
+}
+_A = "{%s}" % NS["a"]
+_P = "{%s}" % NS["p"]
+_R = "{%s}" % NS["r"]
+_C = "{%s}" % NS["c"]
+_MC = "{%s}" % NS["mc"]
+
+READ_OPERATIONS = ("get_all_text", "list_shapes", "get_table_data", "get_chart_data", "list_comments")
+WRITE_OPERATIONS = ("replace_text", "set_font")
+SUPPORTED_EXTENSIONS = (".pptx", ".pptm")
+
+# MsoShapeType / PpPlaceholderType values, as the COM tools report them
+_msoAutoShape, _msoChart, _msoFreeform, _msoGroup = 1, 3, 5, 6
+_msoEmbeddedOLEObject, _msoLine, _msoPicture, _msoPlaceholder = 7, 9, 13, 14
+_msoTextBox, _msoTable, _msoSmartArt = 17, 19, 24
+_SHAPE_TYPE_NAMES = {
+    _msoAutoShape: "AutoShape", _msoChart: "Chart", _msoFreeform: "Freeform",
+    _msoGroup: "Group", _msoEmbeddedOLEObject: "EmbeddedOLEObject", _msoLine: "Line",
+    _msoPicture: "Picture", _msoPlaceholder: "Placeholder", _msoTextBox: "TextBox",
+    _msoTable: "Table", _msoSmartArt: "SmartArt",
+}
+_PLACEHOLDER_TYPES = {
+    "title": 1, "body": 2, "ctrTitle": 3, "subTitle": 4, "obj": 7, "chart": 8,
+    "clipArt": 9, "media": 10, "dgm": 11, "tbl": 12, "sldNum": 13, "hdr": 14,
+    "ftr": 15, "dt": 16, "pic": 18,
+}
+_TITLE_PLACEHOLDERS = {"title", "ctrTitle"}
+_SKIP_PLACEHOLDERS = {"sldNum", "hdr", "ftr", "dt"}
+
+# Children of a:rPr in schema order; new font elements must respect it.
+_RPR_ORDER = [
+    "ln", "noFill", "solidFill", "gradFill", "blipFill", "pattFill", "grpFill",
+    "effectLst", "effectDag", "highlight", "uLnTx", "uLn", "uFillTx", "uFill",
+    "latin", "ea", "cs", "sym", "hlinkClick", "hlinkMouseOver", "rtl", "extLst",
+]
+
+
+class OoxmlError(ValueError):
+    """The file is not a readable .pptx or the request does not fit it."""
+
+
+def _first(el: ET.Element, *tags: str) -> Optional[ET.Element]:
+    """First child of el with one of tags (Element truthiness is unreliable)."""
+    for tag in tags:
+        found = el.find(tag)
+        if found is not None:
+            return found
+    return None
+
+
+def _placeholder(el: ET.Element) -> Optional[ET.Element]:
+    """p:ph of a shape element (its first child holds the non-visual props)."""
+    return el[0].find(f"{_P}nvPr/{_P}ph") if len(el) else None
+
+
+def _emu(value: Optional[str]) -> float:
+    return int(value) / EMU_PER_POINT if value else 0.0
+
+
+def _rel_type(rel_type: str) -> str:
+    """Last path segment of a relationship type URI ('slide', 'chart', ...)."""
+    return rel_type.rsplit("/", 1)[-1]
+
+
+# ---------------------------------------------------------------------------
+# Package access
+# ---------------------------------------------------------------------------
+class Package:
+    """A .pptx opened for reading; parts are parsed lazily and cached."""
+
+    def __init__(self, path: str):
+        if not path.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise OoxmlError(f"Not an OOXML presentation (.pptx/.pptm): {path}")
+        try:
+            self._zip = zipfile.ZipFile(path)
+        except (OSError, zipfile.BadZipFile) as e:
+            raise OoxmlError(f"Cannot open {path}: {e}") from e
+        self.path = path
+        self._names = set(self._zip.namelist())
+        self._xml = {}
+        self._rels = {}
+        self._layout_geometry = {}
+        self.modified = {}  # part name -> new bytes (write operations)
+        self._slides = None
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def has(self, part: str) -> bool:
+        return part in self._names
+
+    def xml(self, part: str) -> ET.Element:
+        root = self._xml.get(part)
+        if root is None:
+            if part not in self._names:
+                raise OoxmlError(f"Missing part {part} in {self.path}")
+            with self._zip.open(part) as f:
+                root = ET.parse(f).getroot()
+            self._xml[part] = root
+        return root
+
+    def rels(self, part: str) -> dict:
+        """rId -> (type, target part) for part (external targets skipped)."""
+        rels = self._rels.get(part)
+        if rels is None:
+            rels = {}
+            folder, name = posixpath.split(part)
+            rels_part = posixpath.join(folder, "_rels", name + ".rels")
+            if rels_part in self._names:
+                for rel in self.xml(rels_part):
+                    if rel.get("TargetMode") == "External":
+                        continue
+                    target = rel.get("Target", "")
+                    if target.startswith("/"):
+                        target = target[1:]
+                    else:
+                        target = posixpath.normpath(posixpath.join(folder, target))
+                    rels[rel.get("Id")] = (_rel_type(rel.get("Type", "")), target)
+            self._rels[part] = rels
+        return rels
+
+    def related(self, part: str, rel_type: str) -> list:
+        return [target for t, target in self.rels(part).values() if t == rel_type]
+
+    @property
+    def slides(self) -> list:
+        """Slide part names in presentation order."""
+        if self._slides is None:
+            pres = "ppt/presentation.xml"
+            rels = self.rels(pres)
+            self._slides = []
+            id_list = self.xml(pres).find(_P + "sldIdLst")
+            for sld in (id_list if id_list is not None else ()):
+                rel = rels.get(sld.get(_R + "id"))
+                if rel is not None and rel[1] in self._names:
+                    self._slides.append(rel[1])
+        return self._slides
+
+    def slide_size(self) -> tuple:
+        size = self.xml("ppt/presentation.xml").find(_P + "sldSz")
+        if size is None:
+            return (None, None)
+        return (round(_emu(size.get("cx")), 2), round(_emu(size.get("cy")), 2))
+
+    def select_slides(self, slide_indices: Optional[list]) -> list:
+        """[(1-based index, part)] for slide_indices (all slides when None)."""
+        slides = self.slides
+        if not slide_indices:
+            return list(enumerate(slides, 1))
+        bad = [i for i in slide_indices if not 1 <= i <= len(slides)]
+        if bad:
+            raise OoxmlError(f"Slide index {bad[0]} out of range (1-{len(slides)})")
+        return [(i, slides[i - 1]) for i in slide_indices]
+
+    def inherited_geometry(self, slide_part: str, ph_type: str, ph_idx: Optional[str]) -> Optional[tuple]:
+        """Position of a placeholder from the slide's layout, then master."""
+        for rel_type in ("slideLayout", "slideMaster"):
+            targets = self.related(slide_part, rel_type)
+            if not targets:
+                return None
+            part = targets[0]
+            geometry = self._placeholder_geometry(part)
+            found = geometry.get(("idx", ph_idx)) if ph_idx is not None else None
+            if found is None:
+                found = geometry.get(("type", ph_type))
+            if found is not None:
+                return found
+            slide_part = part  # layout -> master
+        return None
+
+    def _placeholder_geometry(self, part: str) -> dict:
+        geometry = self._layout_geometry.get(part)
+        if geometry is None:
+            geometry = {}
+            tree = self.xml(part).find(f"{_P}cSld/{_P}spTree")
+            for el in _iter_tree(tree if tree is not None else ()):
+                ph = _placeholder(el)
+                xfrm = _xfrm(el)
+                if ph is None or xfrm is None:
+                    continue
+                box = _xfrm_box(xfrm)
+                geometry.setdefault(("type", ph.get("type", "obj")), box)
+                if ph.get("idx") is not None:
+                    geometry.setdefault(("idx", ph.get("idx")), box)
+            self._layout_geometry[part] = geometry
+        return geometry
+
+
+# ---------------------------------------------------------------------------
+# Shapes and text
+# ---------------------------------------------------------------------------
+def _xfrm(el: ET.Element) -> Optional[ET.Element]:
+    if el.tag == _P + "graphicFrame":
+        return el.find(_P + "xfrm")
+    props = el.find(_P + ("grpSpPr" if el.tag == _P + "grpSp" else "spPr"))
+    return props.find(_A + "xfrm") if props is not None else None
+
+
+def _xfrm_box(xfrm: ET.Element) -> tuple:
+    off = xfrm.find(_A + "off")
+    ext = xfrm.find(_A + "ext")
+    return (
+        _emu(off.get("x")) if off is not None else 0.0,
+        _emu(off.get("y")) if off is not None else 0.0,
+        _emu(ext.get("cx")) if ext is not None else 0.0,
+        _emu(ext.get("cy")) if ext is not None else 0.0,
+    )
+
+
+def paragraph_text(p: ET.Element) -> str:
+    parts = []
+    for child in p:
+        if child.tag in (_A + "r", _A + "fld"):
+            t = child.find(_A + "t")
+            if t is not None and t.text:
+                parts.append(t.text)
+        elif child.tag == _A + "br":
+            parts.append("\n")
+    return "".join(parts)
+
+
+def body_paragraphs(body: Optional[ET.Element]) -> list:
+    """[(level, text)] for each a:p of a text body."""
+    if body is None:
+        return []
+    result = []
+    for p in body.findall(_A + "p"):
+        ppr = p.find(_A + "pPr")
+        level = int(ppr.get("lvl", "0")) if ppr is not None else 0
+        result.append((level, paragraph_text(p)))
+    return result
+
+
+def _body_text(body: Optional[ET.Element]) -> str:
+    return "\n".join(text for _, text in body_paragraphs(body))
+
+
+def _graphic_kind(el: ET.Element) -> str:
+    data = el.find(f"{_A}graphic/{_A}graphicData")
+    uri = data.get("uri", "") if data is not None else ""
+    return uri.rsplit("/", 1)[-1]  # table, chart, diagram, ole, ...
+
+
+def _iter_tree(tree: ET.Element):
+    """spTree children, unwrapping mc:AlternateContent (first Choice)."""
+    for el in tree:
+        if el.tag == _MC + "AlternateContent":
+            choice = el.find(_MC + "Choice")
+            if choice is None:
+                choice = el.find(_MC + "Fallback")
+            if choice is not None:
+                yield from _iter_tree(choice)
+        elif el.tag in (_P + "sp", _P + "pic", _P + "cxnSp", _P + "graphicFrame", _P + "grpSp"):
+            yield el
+
+
+def _shape(pkg: Package, slide_part: str, el: ET.Element, index: int, transform=None) -> dict:
+    """Snapshot-like dict for one shape element (see module docstring)."""
+    tag = el.tag[len(_P):]
+    c_nv = el[0].find(_P + "cNvPr") if len(el) else None
+    ph = _placeholder(el)
+    ph_type = ph.get("type", "obj") if ph is not None else None
+
+    xfrm = _xfrm(el)
+    if xfrm is not None:
+        left, top, width, height = _xfrm_box(xfrm)
+    else:
+        inherited = pkg.inherited_geometry(slide_part, ph_type, ph.get("idx")) if ph is not None else None
+        left, top, width, height = inherited or (0.0, 0.0, 0.0, 0.0)
+    if transform is not None:
+        left, top, width, height = transform(left, top, width, height)
+
+    kind = _graphic_kind(el) if tag == "graphicFrame" else None
+    if ph is not None:
+        shape_type = _msoPlaceholder
+    elif tag == "grpSp":
+        shape_type = _msoGroup
+    elif tag == "pic":
+        shape_type = _msoPicture
+    elif tag == "cxnSp":
+        shape_type = _msoLine
+    elif tag == "graphicFrame":
+        shape_type = {"table": _msoTable, "chart": _msoChart, "diagram": _msoSmartArt}.get(
+            kind, _msoEmbeddedOLEObject)
+    elif el.find(f"{_P}nvSpPr/{_P}cNvSpPr[@txBox='1']") is not None:
+        shape_type = _msoTextBox
+    elif el.find(f"{_P}spPr/{_A}custGeom") is not None:
+        shape_type = _msoFreeform
+    else:
+        shape_type = _msoAutoShape
+
+    body = el.find(_P + "txBody")
+    text = _body_text(body) if body is not None else None
+    snap = {
+        "index": index,
+        "name": c_nv.get("name", "") if c_nv is not None else "",
+        "id": int(c_nv.get("id", "0")) if c_nv is not None else 0,
+        "type": shape_type,
+        "type_name": _SHAPE_TYPE_NAMES.get(shape_type, f"Unknown({shape_type})"),
+        "left": left,
+        "top": top,
+        "width": width,
+        "height": height,
+        "placeholder_type": _PLACEHOLDER_TYPES.get(ph_type) if ph_type else None,
+        "is_group": shape_type == _msoGroup,
+        "has_text_frame": body is not None,
+        "has_text": bool(text),
+        "text": text or None,
+        "has_table": kind == "table",
+        "has_chart": kind == "chart",
+        "element": el,
+        "ph": ph_type,
+    }
+    if snap["is_group"]:
+        snap["children"] = _group_children(pkg, slide_part, el, transform)
+    return snap
+
+
+def _group_children(pkg: Package, slide_part: str, group: ET.Element, outer) -> list:
+    """Child shapes of a group, with positions mapped to slide coordinates."""
+    xfrm = _xfrm(group)
+    transform = outer
+    if xfrm is not None:
+        off_x, off_y, ext_cx, ext_cy = _xfrm_box(xfrm)
+        ch_off = xfrm.find(_A + "chOff")
+        ch_ext = xfrm.find(_A + "chExt")
+        ch_x = _emu(ch_off.get("x")) if ch_off is not None else off_x
+        ch_y = _emu(ch_off.get("y")) if ch_off is not None else off_y
+        ch_cx = _emu(ch_ext.get("cx")) if ch_ext is not None else ext_cx
+        ch_cy = _emu(ch_ext.get("cy")) if ch_ext is not None else ext_cy
+        sx = ext_cx / ch_cx if ch_cx else 1.0
+        sy = ext_cy / ch_cy if ch_cy else 1.0
+
+        def transform(left, top, width, height):
+            box = (off_x + (left - ch_x) * sx, off_y + (top - ch_y) * sy, width * sx, height * sy)
+            return outer(*box) if outer is not None else box
+
+    return [
+        _shape(pkg, slide_part, child, i, transform)
+        for i, child in enumerate(_iter_tree(group), 1)
+    ]
+
+
+def slide_shapes(pkg: Package, slide_part: str) -> list:
+    tree = pkg.xml(slide_part).find(f"{_P}cSld/{_P}spTree")
+    if tree is None:
+        return []
+    return [_shape(pkg, slide_part, el, i) for i, el in enumerate(_iter_tree(tree), 1)]
+
+
+def _walk(shapes: list):
+    for snap in shapes:
+        if snap["is_group"]:
+            yield from _walk(snap["children"])
+        else:
+            yield snap
+
+
+def _is_hidden(pkg: Package, slide_part: str) -> bool:
+    return pkg.xml(slide_part).get("show") == "0"
+
+
+def _notes_text(pkg: Package, slide_part: str) -> str:
+    notes = pkg.related(slide_part, "notesSlide")
+    if not notes or not pkg.has(notes[0]):
+        return ""
+    tree = pkg.xml(notes[0]).find(f"{_P}cSld/{_P}spTree")
+    for el in _iter_tree(tree if tree is not None else ()):
+        ph = _placeholder(el)
+        if ph is not None and ph.get("type") == "body":
+            return _body_text(el.find(_P + "txBody")).strip()
+    return ""
+
+
+def _table_rows(el: ET.Element) -> list:
+    tbl = el.find(f"{_A}graphic/{_A}graphicData/{_A}tbl")
+    if tbl is None:
+        return []
+    return [[_body_text(tc.find(_A + "txBody")) for tc in tr.findall(_A + "tc")]
+            for tr in tbl.findall(_A + "tr")]
+
+
+def _round_box(snap: dict) -> dict:
+    out = {k: v for k, v in snap.items() if k not in ("element", "ph", "text", "children", "has_chart")}
+    for key in ("left", "top", "width", "height"):
+        out[key] = round(out[key], 2)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Read operations
+# ---------------------------------------------------------------------------
+def _table_markdown(rows: list) -> str:
+    lines = []
+    for r, row in enumerate(rows):
+        cells = [c.replace("\n", " ").replace("|", "\\|").strip() for c in row]
+        lines.append("| " + " | ".join(cells) + " |")
+        if r == 0:
+            lines.append("| " + " | ".join(["---"] * len(cells)) + " |")
+    return "\n".join(lines)
+
+
+def get_all_text(pkg: Package, slide_indices: Optional[list] = None) -> dict:
+    """Pseudo-Markdown of every selected slide, in reading order."""
+    blocks = []
+    for index, part in pkg.select_slides(slide_indices):
+        lines = [f"== Slide {index}{' (hidden)' if _is_hidden(pkg, part) else ''} =="]
+        shapes = [s for s in _walk(slide_shapes(pkg, part))
+                  if s["ph"] not in _SKIP_PLACEHOLDERS and (s["has_text"] or s["has_table"])]
+        # Titles first, then top-to-bottom, left-to-right
+        shapes.sort(key=lambda s: (s["ph"] not in _TITLE_PLACEHOLDERS, round(s["top"]), s["left"]))
+        for snap in shapes:
+            if snap["has_table"]:
+                lines.append(_table_markdown(_table_rows(snap["element"])))
+                continue
+            heading = "# " if snap["ph"] in _TITLE_PLACEHOLDERS else ""
+            for level, text in body_paragraphs(snap["element"].find(_P + "txBody")):
+                if text.strip():
+                    lines.append(heading + "  " * level + text.replace("\n", " "))
+        notes = _notes_text(pkg, part)
+        if notes:
+            lines.append("[Notes] " + notes.replace("\n", " / "))
+        blocks.append("\n".join(lines))
+    return {"slides_count": len(pkg.slides), "text": "\n\n".join(blocks)}
+
+
+def list_shapes(pkg: Package, slide_indices: Optional[list] = None) -> dict:
+    slides = []
+    for index, part in pkg.select_slides(slide_indices):
+        shapes = []
+        for snap in slide_shapes(pkg, part):
+            info = _round_box(snap)
+            full_text = snap["text"] or ""
+            info["has_text"] = info.pop("has_text_frame")
+            info["text_preview"] = full_text[:50] + ("..." if len(full_text) > 50 else "")
+            shapes.append(info)
+        slides.append({"slide_index": index, "shapes_count": len(shapes), "shapes": shapes})
+    return {"slides_count": len(pkg.slides), "slides": slides}
+
+
+def get_table_data(pkg: Package, slide_indices: Optional[list] = None) -> dict:
+    tables = []
+    for index, part in pkg.select_slides(slide_indices):
+        for snap in _walk(slide_shapes(pkg, part)):
+            if snap["has_table"]:
+                data = _table_rows(snap["element"])
+                tables.append({
+                    "slide_index": index,
+                    "shape_name": snap["name"],
+                    "rows": len(data),
+                    "columns": max((len(r) for r in data), default=0),
+                    "data": data,
+                })
+    return {"slides_count": len(pkg.slides), "tables": tables}
+
+
+def _cached_points(ref: Optional[ET.Element], numeric: bool) -> list:
+    """Values of a c:cat / c:val / c:tx element's cache, None for gaps."""
+    if ref is None:
+        return []
+    cache = None
+    for name in ("numCache", "strCache", "multiLvlStrCache"):
+        cache = ref.find(f".//{_C}{name}")
+        if cache is not None:
+            break
+    if cache is None:
+        lit = _first(ref, _C + "strLit", _C + "numLit")
+        if lit is None:
+            v = ref.find(_C + "v")
+            return [v.text] if v is not None else []
+        cache = lit
+    if cache.tag == _C + "multiLvlStrCache":
+        cache = cache.find(_C + "lvl")  # innermost level
+    count_el = cache.find(_C + "ptCount")
+    count = int(count_el.get("val", "0")) if count_el is not None else 0
+    points = cache.findall(_C + "pt")
+    count = max(count, max((int(pt.get("idx", "0")) + 1 for pt in points), default=0))
+    values = [None] * count
+    for pt in points:
+        v = pt.find(_C + "v")
+        if v is None or v.text is None:
+            continue
+        value = v.text
+        if numeric:
+            try:
+                value = float(value)
+            except ValueError:
+                value = None
+        values[int(pt.get("idx", "0"))] = value
+    return values
+
+
+def chart_series(pkg: Package, chart_part: str) -> dict:
+    root = pkg.xml(chart_part)
+    categories = []
+    series = []
+    for ser in root.iter(_C + "ser"):
+        name_values = _cached_points(ser.find(_C + "tx"), numeric=False)
+        values = _cached_points(_first(ser, _C + "val", _C + "yVal"), numeric=True)
+        series.append({"name": name_values[0] if name_values else "", "values": values})
+        if not categories:
+            cats = _cached_points(_first(ser, _C + "cat", _C + "xVal"), numeric=False)
+            categories = ["" if c is None else str(c) for c in cats]
+    return {"categories": categories, "series": series}
+
+
+def get_chart_data(pkg: Package, slide_indices: Optional[list] = None) -> dict:
+    charts = []
+    for index, part in pkg.select_slides(slide_indices):
+        rels = pkg.rels(part)
+        for snap in _walk(slide_shapes(pkg, part)):
+            if not snap["has_chart"]:
+                continue
+            ref = snap["element"].find(f".//{_C}chart")
+            rel = rels.get(ref.get(_R + "id")) if ref is not None else None
+            entry = {"slide_index": index, "shape_name": snap["name"]}
+            if rel is None or not pkg.has(rel[1]):
+                entry["error"] = "Chart part not found"
+            else:
+                entry.update(chart_series(pkg, rel[1]))
+            charts.append(entry)
+    return {"slides_count": len(pkg.slides), "charts": charts}
+
+
+def _authors(pkg: Package, part: str, tag: str) -> dict:
+    if not pkg.has(part):
+        return {}
+    return {a.get("id"): (a.get("name", ""), a.get("initials", "")) for a in pkg.xml(part).iter(tag)}
+
+
+def list_comments(pkg: Package, slide_indices: Optional[list] = None) -> dict:
+    legacy_authors = _authors(pkg, "ppt/commentAuthors.xml", _P + "cmAuthor")
+    p188 = "{%s}" % NS["p188"]
+    modern_authors = _authors(pkg, "ppt/authors.xml", p188 + "author")
+    slides = []
+    for index, part in pkg.select_slides(slide_indices):
+        comments = []
+        for rel_type, target in pkg.rels(part).values():
+            if rel_type != "comments" or not pkg.has(target):
+                continue
+            root = pkg.xml(target)
+            for cm in root.iter(_P + "cm"):  # legacy
+                name, initials = legacy_authors.get(cm.get("authorId"), ("", ""))
+                text = cm.find(_P + "text")
+                comments.append({
+                    "author": name, "author_initials": initials,
+                    "text": (text.text or "") if text is not None else "",
+                    "datetime": cm.get("dt", ""),
+                })
+            for cm in root.iter(p188 + "cm"):  # modern; replies follow their comment
+                parent = len(comments) + 1
+                for item in [cm] + cm.findall(f"{p188}replyLst/{p188}reply"):
+                    name, initials = modern_authors.get(item.get("authorId"), ("", ""))
+                    comment = {
+                        "author": name, "author_initials": initials,
+                        "text": _body_text(item.find(p188 + "txBody")),
+                        "datetime": item.get("created", ""),
+                    }
+                    if item is not cm:
+                        comment["reply_to"] = parent
+                    comments.append(comment)
+        for i, comment in enumerate(comments, 1):
+            comment["index"] = i
+        slides.append({"slide_index": index, "comments_count": len(comments), "comments": comments})
+    return {"slides_count": len(pkg.slides), "slides": slides}
+
+
+_READERS = {
+    "get_all_text": get_all_text,
+    "list_shapes": list_shapes,
+    "get_table_data": get_table_data,
+    "get_chart_data": get_chart_data,
+    "list_comments": list_comments,
+}
+
+
+def read_file(path: str, operation: str, slide_indices: Optional[list] = None) -> dict:
+    """Run one read operation on one file."""
+    reader = _READERS.get(operation)
+    if reader is None:
+        raise OoxmlError(f"Unknown read operation {operation!r}. Allowed: {list(READ_OPERATIONS)}")
+    with Package(path) as pkg:
+        return reader(pkg, slide_indices)
+
+
+# ---------------------------------------------------------------------------
+# Write operations
+# ---------------------------------------------------------------------------
+def _text_bodies(root: ET.Element):
+    """Every DrawingML text body in a part (shapes and table cells)."""
+    for tag in (_P + "txBody", _A + "txBody"):
+        yield from root.iter(tag)
+
+
+def _replace_in_paragraph(p: ET.Element, pattern: re.Pattern, replace: str) -> int:
+    """Replace pattern in p's runs; a match spanning runs is merged into its first run."""
+    runs = [t for r in p.findall(_A + "r") for t in [r.find(_A + "t")] if t is not None]
+    texts = [t.text or "" for t in runs]
+    matches = [m.span() for m in pattern.finditer("".join(texts))]
+    if not matches:
+        return 0
+    starts = []  # offset of each run in the original paragraph text
+    pos = 0
+    for text in texts:
+        starts.append(pos)
+        pos += len(text)
+    ends = [start + len(text) for start, text in zip(starts, texts)]
+    # Right to left, so earlier offsets stay valid while texts change.
+    for start, end in reversed(matches):
+        for i in range(len(runs)):
+            if ends[i] <= start or starts[i] >= end:
+                continue
+            lo, hi = max(start, starts[i]) - starts[i], min(end, ends[i]) - starts[i]
+            insert = replace if starts[i] <= start else ""
+            texts[i] = texts[i][:lo] + insert + texts[i][hi:]
+    for t, text in zip(runs, texts):
+        t.text = text
+    return len(matches)
+
+
+def _replace_text(root: ET.Element, op: dict) -> int:
+    find = op.get("find") or ""
+    if not find:
+        raise OoxmlError("replace_text needs a non-empty 'find'")
+    flags = 0 if op.get("match_case", True) else re.IGNORECASE
+    pattern = re.compile(re.escape(find), flags)
+    replace = op.get("replace", "")
+    return sum(
+        _replace_in_paragraph(p, pattern, replace)
+        for body in _text_bodies(root) for p in body.findall(_A + "p")
+    )
+
+
+def _set_typeface(rpr: ET.Element, name: str, typeface: str) -> bool:
+    """Set a:latin / a:ea typeface on rpr in schema order; True if it changed."""
+    el = rpr.find(_A + name)
+    if el is None:
+        el = ET.Element(_A + name)
+        rank = _RPR_ORDER.index(name)
+        pos = len(rpr)
+        for i, child in enumerate(rpr):
+            local = child.tag[len(_A):] if child.tag.startswith(_A) else ""
+            if local in _RPR_ORDER and _RPR_ORDER.index(local) > rank:
+                pos = i
+                break
+        rpr.insert(pos, el)
+    elif el.get("typeface") == typeface:
+        return False
+    el.set("typeface", typeface)
+    return True
+
+
+def _set_font(root: ET.Element, op: dict) -> int:
+    """Set fonts on every run (and paragraph end mark); returns runs changed."""
+    latin, east_asian, size = op.get("font_name"), op.get("font_name_fareast"), op.get("font_size")
+    if not (latin or east_asian or size):
+        raise OoxmlError("set_font needs font_name, font_name_fareast or font_size")
+    sz = str(int(round(float(size) * 100))) if size else None
+    changed = 0
+    for body in _text_bodies(root):
+        for p in body.findall(_A + "p"):
+            targets = []
+            for r in p.findall(_A + "r"):
+                rpr = r.find(_A + "rPr")
+                if rpr is None:
+                    rpr = ET.Element(_A + "rPr")
+                    r.insert(0, rpr)
+                targets.append((rpr, True))
+            end = p.find(_A + "endParaRPr")
+            if end is not None:
+                targets.append((end, False))
+            for rpr, is_run in targets:
+                hit = False
+                if latin:
+                    hit |= _set_typeface(rpr, "latin", latin)
+                if east_asian:
+                    hit |= _set_typeface(rpr, "ea", east_asian)
+                if sz and rpr.get("sz") != sz:
+                    rpr.set("sz", sz)
+                    hit = True
+                changed += hit and is_run
+    return changed
+
+
+_WRITERS = {"replace_text": _replace_text, "set_font": _set_font}
+
+
+def _namespaces(pkg: Package, part: str) -> list:
+    with pkg._zip.open(part) as f:
+        return [ns for _, ns in ET.iterparse(f, events=("start-ns",))]
+
+
+_DEFAULT_PREFIX = "ooxmldefault"
+
+
+def _serialize(root: ET.Element, namespaces: list) -> bytes:
+    """XML bytes keeping the part's original prefixes and declarations.
+
+    ElementTree drops namespace declarations that no element uses, but
+    mc:Ignorable refers to prefixes by name, so those are added back.
+    """
+    default = False
+    for prefix, uri in namespaces:
+        if not prefix:
+            # ElementTree's default_namespace rejects unqualified attributes
+            # (Id, Type, ...), so serialize with a placeholder prefix instead.
+            ET.register_namespace(_DEFAULT_PREFIX, uri)
+            default = True
+        elif not re.match(r"ns\d+$", prefix):
+            ET.register_namespace(prefix, uri)
+    body = ET.tostring(root, encoding="unicode")
+    if default:
+        body = re.sub(f"(</?){_DEFAULT_PREFIX}:", r"\1", body)
+        body = body.replace(f"xmlns:{_DEFAULT_PREFIX}=", "xmlns=", 1)
+    head_end = body.index(">")
+    head = body[:head_end]
+    missing = "".join(
+        f' xmlns:{prefix}="{uri}"' for prefix, uri in namespaces
+        if prefix and f"xmlns:{prefix}=" not in head
+    )
+    if head.endswith("/"):
+        head = head[:-1] + missing + "/"
+    else:
+        head += missing
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n'
+            + head + body[head_end:]).encode("utf-8")
+
+
+def _write_package(pkg: Package, path: str, drop: frozenset = frozenset()) -> None:
+    """Write pkg to path with pkg.modified applied and drop left out.
+
+    Unchanged parts are streamed, so large media is never held in memory.
+    """
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as out:
+        for info in pkg._zip.infolist():
+            if info.filename in drop:
+                continue
+            data = pkg.modified.get(info.filename)
+            if data is not None:
+                out.writestr(info, data)
+                continue
+            with pkg._zip.open(info) as src, out.open(info, "w", force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def _owner_file(path: str) -> str:
+    folder, name = os.path.split(path)
+    return os.path.join(folder, "~$" + name)
+
+
+def edit_file(path: str, operations: list, output_path: Optional[str] = None,
+              slide_indices: Optional[list] = None, include_notes: bool = False,
+              output_dir: Optional[str] = None) -> dict:
+    """Apply write operations to one file and save it (in place by default).
+
+    output_dir saves under the file's own name there (for batches).
+    Only parts an operation actually changed are re-serialized; the file is
+    written to a temporary file and swapped in, so a failure leaves the
+    original untouched. An unchanged file is not rewritten in place.
+    """
+    if output_dir is not None:
+        output_path = os.path.join(output_dir, os.path.basename(path))
+    for op in operations:
+        if op.get("op") not in _WRITERS:
+            raise OoxmlError(f"Unknown write operation {op.get('op')!r}. Allowed: {list(WRITE_OPERATIONS)}")
+    if os.path.exists(_owner_file(path)):
+        raise OoxmlError(f"{path} is open in PowerPoint; close it or use the COM tools")
+    target = os.path.abspath(output_path or path)
+    counts = {op["op"]: 0 for op in operations}
+    tmp = None
+    with Package(path) as pkg:
+        parts = [part for _, part in pkg.select_slides(slide_indices)]
+        if include_notes:
+            parts += [n for part in parts for n in pkg.related(part, "notesSlide") if pkg.has(n)]
+        for part in parts:
+            root = pkg.xml(part)
+            changed = 0
+            for op in operations:
+                n = _WRITERS[op["op"]](root, op)
+                counts[op["op"]] += n
+                changed += n
+            if changed:
+                pkg.modified[part] = _serialize(root, _namespaces(pkg, part))
+
+        if pkg.modified or target != os.path.abspath(path):
+            fd, tmp = tempfile.mkstemp(suffix=".pptx", dir=os.path.dirname(target))
+            os.close(fd)
+            try:
+                _write_package(pkg, tmp)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+    if tmp is not None:
+        os.replace(tmp, target)
+    return {
+        "output_path": target,
+        "saved": tmp is not None,
+        "parts_changed": len(pkg.modified),
+        "changes": counts,
+    }
+
+
+def _rels_part(part: str) -> str:
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+def _reachable(pkg: Package, skip: frozenset = frozenset()) -> set:
+    """Parts reachable from the package root, not following into skip."""
+    seen = {"ppt/presentation.xml"}
+    stack = ["", "ppt/presentation.xml"]
+    while stack:
+        part = stack.pop()
+        for _, target in pkg.rels(part).values():
+            if target not in seen and target not in skip and pkg.has(target):
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+def _strip_references(root: ET.Element, rel_ids: set) -> int:
+    """Remove elements whose r:* attribute names one of rel_ids."""
+    removed = 0
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if any(k.startswith(_R) and v in rel_ids for k, v in child.attrib.items()):
+                parent.remove(child)
+                removed += 1
+    return removed
+
+
+def extract_slides(src: str, dst: str, slide_indices: list) -> dict:
+    """Write a copy of src that contains only slide_indices (1-based).
+
+    Works on the package instead of deleting slides in PowerPoint: the other
+    slides and every part only they use (notes, charts, media, comments) are
+    left out of the new zip; everything else is streamed over unchanged.
+    References from the kept slides to removed ones (e.g. hyperlinks) are
+    dropped, and section and custom-show lists are updated to match.
+    """
+    with Package(src) as pkg:
+        keep = [part for _, part in pkg.select_slides(sorted(set(slide_indices)))]
+        removed_slides = frozenset(pkg.slides) - set(keep)
+        before = _reachable(pkg)
+        after = _reachable(pkg, removed_slides)
+        drop = before - after
+        drop |= {_rels_part(part) for part in drop if pkg.has(_rels_part(part))}
+
+        # Relationships from kept parts into removed parts
+        for part in sorted(after | {""}):
+            stale = {rid for rid, (_, target) in pkg.rels(part).items() if target in drop}
+            if not stale:
+                continue
+            rels_part = _rels_part(part)
+            rels_root = pkg.xml(rels_part)
+            for rel in list(rels_root):
+                if rel.get("Id") in stale:
+                    rels_root.remove(rel)
+            pkg.modified[rels_part] = _serialize(rels_root, _namespaces(pkg, rels_part))
+            if part and part.endswith(".xml"):
+                root = pkg.xml(part)
+                _strip_references(root, stale)
+                if part == "ppt/presentation.xml":
+                    _prune_sections(root)
+                pkg.modified[part] = _serialize(root, _namespaces(pkg, part))
+
+        types = "[Content_Types].xml"
+        if pkg.has(types):
+            root = pkg.xml(types)
+            for override in list(root):
+                if override.get("PartName", "").lstrip("/") in drop:
+                    root.remove(override)
+            pkg.modified[types] = _serialize(root, _namespaces(pkg, types))
+
+        _write_package(pkg, dst, frozenset(drop))
+    return {"output_path": dst, "slides": len(keep), "parts_dropped": len(drop)}
+
+
+def _prune_sections(pres: ET.Element) -> None:
+    """Drop section entries for slide IDs no longer in p:sldIdLst."""
+    id_list = pres.find(_P + "sldIdLst")
+    kept = {sld.get("id") for sld in (id_list if id_list is not None else ())}
+    p14 = "{http://schemas.microsoft.com/office/powerpoint/2010/main}"
+    for ids in pres.iter(p14 + "sldIdLst"):
+        for sld in list(ids):
+            if sld.get("id") not in kept:
+                ids.remove(sld)
+
+
+# ---------------------------------------------------------------------------
+# Many files
+# ---------------------------------------------------------------------------
+def expand_paths(patterns: list) -> list:
+    """Files matching patterns (plain paths or globs), skipping owner files."""
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            full = os.path.abspath(match)
+            if os.path.basename(full).startswith("~$") or full in seen:
+                continue
+            seen.add(full)
+            paths.append(full)
+    return paths
+
+
+def _run_task(func, path: str, kwargs: dict) -> dict:
+    try:
+        return {"path": path, **func(path, **kwargs)}
+    except Exception as e:
+        return {"path": path, "error": str(e)}
+
+
+def run_batch(func, paths: list, workers: Optional[int] = None, **kwargs) -> list:
+    """func(path, **kwargs) for every path, in a process pool; results in order.
+
+    A file that fails produces {"path", "error"} instead of stopping the batch.
+    """
+    workers = max(1, min(workers or MAX_WORKERS, len(paths)))
+    if workers == 1:
+        return [_run_task(func, path, kwargs) for path in paths]
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_task, func, path, kwargs) for path in paths]
+            for path, future in zip(paths, futures):
+                try:
+                    results.append(future.result())
+                except BrokenProcessPool as e:
+                    results.append({"path": path, "error": f"Worker process died: {e}"})
+    except OSError as e:
+        logger.info("Process pool unavailable (%s); running in-process", e)
+        return [_run_task(func, path, kwargs) for path in paths]
+    return results
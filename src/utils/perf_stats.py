@@ -0,0 +1,363 @@
+"""Per-tool latency and COM call-count instrumentation.
+
+Every registered tool is wrapped (see instrument_tools) so its wall-clock
+time is recorded under the tool name, and the name is kept in the
+``current_tool`` context variable while the tool runs. PowerPointCOMWrapper
+reads that variable when a job is queued and records, per tool:
+
+- queue wait: time between queueing and the COM thread picking the job up;
+- COM time: time the job ran on the COM thread, busy-retry sleeps excluded;
+- busy retries and the time spent sleeping between them.
+
+COM time is inclusive: the steps of ppt_execute_batch are recorded under
+their own tool names as well as under ppt_execute_batch.
+
+Optionally (PPT_PERF_COUNT_COM=true) the Application object is wrapped in a
+CountingDispatch proxy that counts property gets, property sets and method
+calls made through it. Counting costs a Python-level indirection on every
+COM access, so it is meant for profiling sessions, not everyday use.
+
+Counters are exposed by ppt_get_performance_stats, and a summary of the
+slowest tools is logged to stderr every PPT_PERF_LOG_INTERVAL seconds
+(default 300; 0 disables) whenever new calls were recorded.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .com_scheduler import register_tool
+
+logger = logging.getLogger(__name__)
+
+COUNT_COM_CALLS: bool = os.getenv("PPT_PERF_COUNT_COM", "false").lower() in ("true", "1", "yes")
+try:
+    LOG_INTERVAL: float = float(os.getenv("PPT_PERF_LOG_INTERVAL", "300"))
+except ValueError:
+    LOG_INTERVAL = 300.0
+
+UNATTRIBUTED = "(unattributed)"
+SORT_KEYS = ("wall_ms_total", "com_ms_total", "queue_wait_ms_total", "calls", "busy_retries", "com_round_trips")
+
+current_tool: contextvars.ContextVar = contextvars.ContextVar("ppt_current_tool", default=None)
+
+
+# ---------------------------------------------------------------------------
+# COM call counting
+# ---------------------------------------------------------------------------
+class ComCallCounter:
+    """Running totals of COM accesses made through CountingDispatch.
+
+    Only the COM thread increments these, so no lock is needed; per-job
+    counts are the difference between two snapshots.
+    """
+
+    __slots__ = ("gets", "sets", "calls")
+
+    def __init__(self):
+        self.gets = self.sets = self.calls = 0
+
+    def snapshot(self) -> tuple:
+        return (self.gets, self.sets, self.calls)
+
+    def since(self, snapshot: tuple) -> tuple:
+        return (self.gets - snapshot[0], self.sets - snapshot[1], self.calls - snapshot[2])
+
+
+com_calls = ComCallCounter()
+
+
+def _wrap(value: Any) -> Any:
+    if getattr(value, "_oleobj_", None) is not None and not isinstance(value, CountingDispatch):
+        return CountingDispatch(value)
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    return value._obj if isinstance(value, CountingDispatch) else value
+
+
+def _unwrap_args(args: tuple, kwargs: dict) -> tuple:
+    return tuple(_unwrap(a) for a in args), {k: _unwrap(v) for k, v in kwargs.items()}
+
+
+class _CountingMethod:
+    """A bound COM method; calling it counts one method call."""
+
+    __slots__ = ("_method",)
+
+    def __init__(self, method):
+        self._method = method
+
+    def __call__(self, *args, **kwargs):
+        com_calls.calls += 1
+        args, kwargs = _unwrap_args(args, kwargs)
+        return _wrap(self._method(*args, **kwargs))
+
+
+class CountingDispatch:
+    """Proxy over a COM dispatch object that counts gets, sets and calls.
+
+    Attribute reads count as property gets (method lookups do not; calling
+    the method counts as a call). Calling the object itself or indexing it
+    (``app.Presentations(1)``) counts as a call. COM objects returned from
+    any of these are wrapped too, and proxies passed back as arguments are
+    unwrapped, so PowerPoint only ever sees the real objects. ``_oleobj_`` is
+    passed through uncounted for code that calls InvokeTypes directly.
+    """
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        object.__setattr__(self, "_obj", obj)
+
+    def __getattr__(self, name):
+        value = getattr(self._obj, name)
+        if name == "_oleobj_":
+            return value
+        if inspect.ismethod(value):
+            return _CountingMethod(value)
+        com_calls.gets += 1
+        return _wrap(value)
+
+    def __setattr__(self, name, value):
+        com_calls.sets += 1
+        setattr(self._obj, name, _unwrap(value))
+
+    def __call__(self, *args, **kwargs):
+        com_calls.calls += 1
+        args, kwargs = _unwrap_args(args, kwargs)
+        return _wrap(self._obj(*args, **kwargs))
+
+    def __getitem__(self, key):
+        com_calls.calls += 1
+        return _wrap(self._obj[_unwrap(key)])
+
+    def __iter__(self):
+        for item in self._obj:
+            com_calls.calls += 1
+            yield _wrap(item)
+
+    def __len__(self):
+        return len(self._obj)
+
+    def __bool__(self):
+        return bool(self._obj)
+
+    def __eq__(self, other):
+        return self._obj == _unwrap(other)
+
+    def __hash__(self):
+        return hash(self._obj)
+
+    def __str__(self):
+        return str(self._obj)
+
+    def __int__(self):
+        return int(self._obj)
+
+    def __repr__(self):
+        return f"<CountingDispatch {self._obj!r}>"
+
+
+# ---------------------------------------------------------------------------
+# Per-tool registry
+# ---------------------------------------------------------------------------
+def _new_entry() -> dict:
+    return {
+        "calls": 0, "errors": 0, "wall_ms_total": 0.0, "wall_ms_max": 0.0,
+        "com_tasks": 0, "queue_wait_ms_total": 0.0, "queue_wait_ms_max": 0.0,
+        "com_ms_total": 0.0, "com_ms_max": 0.0,
+        "busy_retries": 0, "busy_wait_ms_total": 0.0,
+        "com_gets": 0, "com_sets": 0, "com_calls": 0,
+    }
+
+
+class PerfStats:
+    """Thread-safe per-tool counters. Times are stored in milliseconds."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools = {}
+        self._since = time.time()
+
+    def _entry(self, tool: Optional[str]) -> dict:
+        key = tool or UNATTRIBUTED
+        entry = self._tools.get(key)
+        if entry is None:
+            entry = self._tools[key] = _new_entry()
+        return entry
+
+    def record_call(self, tool: str, wall_s: float, error: bool) -> None:
+        """Record one tool invocation (wall-clock time seen by the caller)."""
+        ms = wall_s * 1000
+        with self._lock:
+            e = self._entry(tool)
+            e["calls"] += 1
+            e["errors"] += int(error)
+            e["wall_ms_total"] += ms
+            e["wall_ms_max"] = max(e["wall_ms_max"], ms)
+
+    def record_com(
+        self,
+        tool: Optional[str],
+        queue_wait_s: float,
+        com_s: float,
+        busy_retries: int = 0,
+        busy_wait_s: float = 0.0,
+        counts: tuple = (0, 0, 0),
+    ) -> None:
+        """Record one job run on the COM thread."""
+        wait_ms, com_ms = queue_wait_s * 1000, com_s * 1000
+        with self._lock:
+            e = self._entry(tool)
+            e["com_tasks"] += 1
+            e["queue_wait_ms_total"] += wait_ms
+            e["queue_wait_ms_max"] = max(e["queue_wait_ms_max"], wait_ms)
+            e["com_ms_total"] += com_ms
+            e["com_ms_max"] = max(e["com_ms_max"], com_ms)
+            e["busy_retries"] += busy_retries
+            e["busy_wait_ms_total"] += busy_wait_s * 1000
+            e["com_gets"] += counts[0]
+            e["com_sets"] += counts[1]
+            e["com_calls"] += counts[2]
+
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(e["calls"] for e in self._tools.values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+            self._since = time.time()
+
+    def snapshot(self, sort_by: str = "wall_ms_total", top: Optional[int] = None) -> dict:
+        """Per-tool rows sorted descending by sort_by, plus overall totals."""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {list(SORT_KEYS)}")
+        with self._lock:
+            rows = [dict(e, tool=name) for name, e in self._tools.items()]
+            since = self._since
+        totals = _new_entry()
+        for row in rows:
+            for key in totals:
+                if key.endswith("_max"):
+                    totals[key] = max(totals[key], row[key])
+                else:
+                    totals[key] += row[key]
+            row["com_round_trips"] = row["com_gets"] + row["com_sets"] + row["com_calls"]
+            row["wall_ms_avg"] = row["wall_ms_total"] / row["calls"] if row["calls"] else None
+            if row["com_tasks"]:
+                row["queue_wait_ms_avg"] = row["queue_wait_ms_total"] / row["com_tasks"]
+                row["com_ms_avg"] = row["com_ms_total"] / row["com_tasks"]
+            for key, value in row.items():
+                if isinstance(value, float):
+                    row[key] = round(value, 2)
+        rows.sort(key=lambda r: (r[sort_by], r["calls"]), reverse=True)
+        if top is not None:
+            rows = rows[:top]
+        for key, value in totals.items():
+            if isinstance(value, float):
+                totals[key] = round(value, 2)
+        return {
+            "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(since)),
+            "elapsed_s": round(time.time() - since, 1),
+            "com_call_counting": COUNT_COM_CALLS,
+            "totals": totals,
+            "tools": rows,
+        }
+
+    def summary(self, top: int = 10) -> str:
+        """A few lines naming the tools that used the most wall-clock time."""
+        snap = self.snapshot(top=top)
+        t = snap["totals"]
+        lines = [
+            f"Performance since {snap['since']}: {t['calls']} tool calls, "
+            f"{t['wall_ms_total'] / 1000:.1f}s wall, {t['com_ms_total'] / 1000:.1f}s COM, "
+            f"{t['queue_wait_ms_total'] / 1000:.1f}s queued, {t['busy_retries']} busy retries"
+        ]
+        for row in snap["tools"]:
+            line = (
+                f"  {row['tool']}: {row['calls']} calls, {row['wall_ms_total']:.0f} ms wall, "
+                f"{row['com_ms_total']:.0f} ms COM, {row['queue_wait_ms_total']:.0f} ms queued"
+            )
+            if row["busy_retries"]:
+                line += f", {row['busy_retries']} busy retries"
+            if COUNT_COM_CALLS:
+                line += f", {row['com_round_trips']} COM round trips"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+# Global singleton instance
+perf_stats = PerfStats()
+
+
+# ---------------------------------------------------------------------------
+# Tool instrumentation
+# ---------------------------------------------------------------------------
+def instrument(fn: Callable, name: str) -> Callable:
+    """Wrap an async tool so its calls are timed and attributed to name.
+
+    A tool counts as failed when it raises or returns a ``{"error": ...}``
+    JSON string, the convention every tool module follows.
+    """
+    if not inspect.iscoroutinefunction(fn):
+        return fn
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        token = current_tool.set(name)
+        t0 = time.perf_counter()
+        error = True
+        try:
+            result = await fn(*args, **kwargs)
+            error = isinstance(result, str) and result.startswith('{"error"')
+            return result
+        finally:
+            current_tool.reset(token)
+            perf_stats.record_call(name, time.perf_counter() - t0, error)
+
+    return wrapper
+
+
+def instrument_tools(mcp) -> None:
+    """Make every later ``@mcp.tool(...)`` registration record statistics.
+
+    Must run before any tool is registered. The decorator still returns the
+    undecorated function, so module-level names are unchanged. The tool's
+    annotations are also handed to the COM scheduler, which picks the tool's
+    queue lane from them (see utils.com_scheduler).
+    """
+    register = mcp.tool
+
+    def tool(*args, **kwargs):
+        decorator = register(*args, **kwargs)
+        name = kwargs.get("name") or (args[0] if args and isinstance(args[0], str) else None)
+
+        def apply(fn):
+            tool_name = name or fn.__name__
+            register_tool(tool_name, kwargs.get("annotations"))
+            decorator(instrument(fn, tool_name))
+            return fn
+
+        return apply
+
+    mcp.tool = tool
+
+
+async def log_summary_periodically(interval: float) -> None:
+    """Log perf_stats.summary() every interval seconds while calls come in."""
+    logged_calls = 0
+    while True:
+        await asyncio.sleep(interval)
+        calls = perf_stats.total_calls()
+        if calls != logged_calls:
+            logged_calls = calls
+            logger.info("%s", perf_stats.summary())
@@ -0,0 +1,178 @@
+"""Slide preview image cache (memory + disk).
+
+Agents call ppt_get_slide_preview over and over while iterating on a deck,
+mostly on slides that did not change since the last look. Each export costs
+a Slide.Export round trip on the COM thread. This cache keys rendered images
+by the presentation, the slide's SlideID and a content fingerprint computed
+from a shape snapshot (see ppt_com.preview), plus the output size and format,
+so an unchanged slide is served without exporting it again.
+
+- **Memory**: LRU bounded by total bytes.
+- **Disk**: ``previews/v1/<key>.<ext>`` under the shared cache root, bounded
+  by total bytes with LRU eviction by modification time (touched on hit).
+
+The fingerprint cannot see every edit, so the COM worker calls
+drop_presentation() after each write job: the entries stored or served for
+that presentation in this process are removed from memory and disk.
+
+Configuration (environment variables):
+    PPT_PREVIEW_CACHE_MB        Memory bound in MB (default: 64)
+    PPT_PREVIEW_DISK_CACHE_MB   Disk bound in MB (default: 256, 0 disables disk)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from .disk_cache import atomic_write, default_cache_root
+
+logger = logging.getLogger(__name__)
+
+_CACHE_LAYOUT_VERSION = "v1"
+
+
+def preview_key(pres_name: str, slide_id: int, fingerprint: str,
+                width: Optional[int], height: Optional[int], fmt: str) -> str:
+    """Cache key for one rendered slide image."""
+    raw = f"{pres_name}\0{slide_id}\0{fingerprint}\0{width}x{height}\0{fmt}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class PreviewCache:
+    """Two-level LRU of rendered slide images. Safe to share across threads."""
+
+    def __init__(self, root: Optional[str] = None,
+                 max_memory_bytes: Optional[int] = None,
+                 max_disk_bytes: Optional[int] = None):
+        self._root = os.path.join(root or default_cache_root(), "previews", _CACHE_LAYOUT_VERSION)
+        if max_memory_bytes is None:
+            max_memory_bytes = int(float(os.getenv("PPT_PREVIEW_CACHE_MB", "64")) * 1024 * 1024)
+        if max_disk_bytes is None:
+            max_disk_bytes = int(float(os.getenv("PPT_PREVIEW_DISK_CACHE_MB", "256")) * 1024 * 1024)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._mem: "OrderedDict[str, bytes]" = OrderedDict()
+        self._mem_bytes = 0
+        self._by_pres: dict = {}  # pres_name -> {(key, fmt)} seen in this process
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stored": 0,
+                       "disk_evictions": 0, "dropped": 0}
+
+    def _path(self, key: str, fmt: str) -> str:
+        return os.path.join(self._root, f"{key}.{fmt}")
+
+    def _track(self, pres_name: Optional[str], key: str, fmt: str) -> None:
+        if pres_name is not None:
+            self._by_pres.setdefault(pres_name, set()).add((key, fmt))
+
+    def get(self, key: str, fmt: str, pres_name: Optional[str] = None) -> Optional[bytes]:
+        """Return cached image bytes, or None."""
+        with self._lock:
+            data = self._mem.get(key)
+            if data is not None:
+                self._mem.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                self._track(pres_name, key, fmt)
+                return data
+        if self.max_disk_bytes > 0:
+            path = self._path(key, fmt)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)  # LRU touch
+            except OSError:
+                data = None
+            if data is not None:
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                    self._remember(key, data)
+                    self._track(pres_name, key, fmt)
+                return data
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key: str, fmt: str, data: bytes, pres_name: Optional[str] = None) -> None:
+        """Store image bytes in memory and (if enabled) on disk."""
+        with self._lock:
+            self._stats["stored"] += 1
+            self._remember(key, data)
+            self._track(pres_name, key, fmt)
+        if self.max_disk_bytes > 0:
+            try:
+                os.makedirs(self._root, exist_ok=True)
+                atomic_write(self._path(key, fmt), data)
+                self._evict_disk()
+            except OSError:
+                logger.debug("Cannot write preview cache entry", exc_info=True)
+
+    def drop_presentation(self, pres_name: Optional[str] = None) -> int:
+        """Remove the entries of pres_name (None: every presentation).
+
+        Returns the number of entries dropped.
+        """
+        with self._lock:
+            if pres_name is None:
+                entries = set().union(*self._by_pres.values()) if self._by_pres else set()
+                self._by_pres.clear()
+            else:
+                entries = self._by_pres.pop(pres_name, set())
+            for key, _ in entries:
+                old = self._mem.pop(key, None)
+                if old is not None:
+                    self._mem_bytes -= len(old)
+            self._stats["dropped"] += len(entries)
+        if self.max_disk_bytes > 0:
+            for key, fmt in entries:
+                try:
+                    os.remove(self._path(key, fmt))
+                except OSError:
+                    pass
+        return len(entries)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self._mem_bytes -= len(old)
+        self._mem[key] = data
+        self._mem_bytes += len(data)
+        while self._mem_bytes > self.max_memory_bytes and len(self._mem) > 1:
+            _, dropped = self._mem.popitem(last=False)
+            self._mem_bytes -= len(dropped)
+
+    def _evict_disk(self) -> None:
+        entries = []
+        with os.scandir(self._root) as it:
+            for e in it:
+                if e.is_file() and not e.name.endswith(".tmp"):
+                    st = e.stat()
+                    entries.append((st.st_mtime, st.st_size, e.path))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_disk_bytes:
+            return
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                with self._lock:
+                    self._stats["disk_evictions"] += 1
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "cache_dir": self._root,
+                "memory_entries": len(self._mem),
+                "memory_bytes": self._mem_bytes,
+                **self._stats,
+            }
+
+
+# Global singleton instance
+preview_cache = PreviewCache()
@@ -0,0 +1,171 @@
+"""Progress notifications and cooperative cancellation for whole-deck tools.
+
+A tool that walks every slide creates a Progress for the call and passes it
+to its COM implementation, which iterates with ``tracked(items, progress)``.
+Between items the COM thread:
+
+- sends an MCP progress notification (throttled, and only when the client
+  asked for progress) through the event loop the tool runs on;
+- stops early when the client cancelled the call, or when the job is about
+  to exceed the execute timeout. The implementation then returns what it
+  has, and the tool marks the result with ``progress.partial()``.
+
+``Progress.execute_chunked`` splits the work into COM jobs of CHUNK_SIZE
+slides (PPT_COM_CHUNK_SLIDES, default 10). Each chunk gets the full execute
+timeout, and jobs queued by other tools run between chunks, so one huge
+operation cannot hold the COM thread for minutes.
+
+Without a Progress (e.g. internal callers) ``tracked`` is a plain iteration.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from .com_wrapper import execute_timeout, ppt
+from .perf_stats import current_tool
+
+logger = logging.getLogger(__name__)
+
+REPORT_INTERVAL_S = 0.25  # minimum gap between two progress notifications
+# Stop this long before the caller's timeout so the partial result still
+# reaches it.
+_DEADLINE_MARGIN_S = 2.0
+
+try:
+    CHUNK_SIZE = max(1, int(os.getenv("PPT_COM_CHUNK_SLIDES", "10")))
+except ValueError:
+    CHUNK_SIZE = 10
+
+
+class Progress:
+    """Progress reporter and stop flag shared by a tool call and its COM job."""
+
+    def __init__(self, ctx=None, total: Optional[int] = None, label: str = "slide"):
+        self._ctx = ctx
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self.total = total
+        self.label = label
+        self.done = 0
+        self.stopped: Optional[str] = None  # "cancelled" or "timeout"
+        self._cancelled = threading.Event()
+        self._deadline: Optional[float] = None
+        self._last_report = 0.0
+
+    # -- tool side ------------------------------------------------------------
+    async def execute(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """ppt.execute_async(func, ...) with this job's deadline armed.
+
+        If the caller is cancelled or times out, the COM job is told to stop
+        at the next item instead of running on for nobody.
+        """
+        timeout = execute_timeout(current_tool.get())
+        self._deadline = time.monotonic() + timeout - min(_DEADLINE_MARGIN_S, timeout / 2)
+        try:
+            return await ppt.execute_async(func, *args, **kwargs)
+        except BaseException:
+            self.cancel()
+            raise
+
+    async def execute_chunked(self, func: Callable, slide_indices: list, *args: Any,
+                              chunk_size: Optional[int] = None, **kwargs: Any) -> List[Any]:
+        """func(*args, slide_indices=chunk, progress=self, **kwargs) per chunk.
+
+        Each chunk is a COM job of its own.
+
+        Returns the chunk results in order; stops after the chunk in which
+        the work was cancelled or ran out of time.
+        """
+        slide_indices = list(slide_indices)
+        if self.total is None:
+            self.total = len(slide_indices)
+        size = chunk_size or CHUNK_SIZE
+        results = []
+        for start in range(0, len(slide_indices), size):
+            chunk = slide_indices[start:start + size]
+            results.append(await self.execute(
+                func, *args, slide_indices=chunk, progress=self, **kwargs,
+            ))
+            if self.stopped:
+                break
+        return results
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def partial(self) -> dict:
+        """Fields that mark a result cut short; empty when it is complete."""
+        if self.stopped is None:
+            return {}
+        return {
+            "partial": True,
+            "stopped_reason": self.stopped,
+            f"{self.label}s_done": self.done,
+            f"{self.label}s_total": self.total,
+        }
+
+    # -- COM side ------------------------------------------------------------
+    def should_stop(self) -> bool:
+        if self.stopped is None:
+            if self._cancelled.is_set():
+                self.stopped = "cancelled"
+            elif self._deadline is not None and time.monotonic() >= self._deadline:
+                self.stopped = "timeout"
+            if self.stopped is not None:
+                logger.info("Stopping after %d of %s %ss (%s)",
+                            self.done, self.total, self.label, self.stopped)
+        return self.stopped is not None
+
+    def advance(self, count: int = 1) -> None:
+        self.done += count
+        now = time.monotonic()
+        if now - self._last_report >= REPORT_INTERVAL_S or self.done == self.total:
+            self._last_report = now
+            self._report()
+
+    def _report(self) -> None:
+        if self._ctx is None or self._loop is None or self._loop.is_closed():
+            return
+        message = f"{self.done}/{self.total} {self.label}s" if self.total else None
+        coro = self._send(self.done, self.total, message)
+        try:
+            if _on_loop(self._loop):  # run inline by ppt_execute_batch
+                self._loop.create_task(coro)
+            else:
+                asyncio.run_coroutine_threadsafe(coro, self._loop)
+        except RuntimeError:
+            coro.close()
+
+    async def _send(self, done, total, message) -> None:
+        try:
+            await self._ctx.report_progress(done, total, message)
+        except Exception:
+            logger.debug("Progress notification failed", exc_info=True)
+
+
+def _on_loop(loop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def tracked(items: Iterable, progress: Optional[Progress]) -> Iterator:
+    """Iterate items, reporting progress and stopping early when asked to."""
+    if progress is None:
+        yield from items
+        return
+    items = list(items)
+    if progress.total is None:
+        progress.total = len(items)
+    for item in items:
+        if progress.should_stop():
+            return
+        yield item
+        progress.advance()
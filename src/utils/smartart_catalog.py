@@ -0,0 +1,210 @@
+"""Persistent catalog of SmartArt layouts, color schemes and quick styles.
+
+ppt_add_smartart / ppt_modify_smartart resolve a layout by name, and
+ppt_list_smartart_layouts filters the collections, by walking
+app.SmartArtLayouts (hundreds of entries) and reading Name / Id / Category /
+Description over COM on every call. The collections only change with the
+Office build and UI language, so this module reads them once and keeps:
+
+- an in-memory catalog per (PowerPoint version, build, UI language) with
+  dict indexes for exact name / English alias / Id lookups;
+- a JSON copy under ``smartart/v1/`` in the shared cache root, so a new
+  server process does not re-read the collections either.
+
+Entries record their 1-based collection index, so fetching the COM object
+for a resolved layout is a single ``app.SmartArtLayouts(index)`` call. The
+caller verifies the Id of that object and calls ``invalidate`` on mismatch.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from typing import Optional
+
+from .disk_cache import atomic_write, default_cache_root
+
+logger = logging.getLogger(__name__)
+
+_CACHE_LAYOUT_VERSION = "v1"
+_msoLanguageIDUI = 2
+
+
+def _read(item, attr):
+    """Read a scalar COM property; anything else (or an error) becomes None."""
+    try:
+        value = getattr(item, attr)
+    except Exception:
+        return None
+    return value if isinstance(value, (str, int, float)) else None
+
+
+def _read_collection(collection, fields) -> list:
+    entries = []
+    for i in range(1, collection.Count + 1):
+        item = collection(i)
+        entry = {"index": i}
+        for field, attr in fields:
+            entry[field] = _read(item, attr)
+        entries.append(entry)
+    return entries
+
+
+def catalog_key(app) -> Optional[str]:
+    """Identify the SmartArt collections of a PowerPoint install.
+
+    Returns None when the version cannot be read; such a catalog is never
+    reused, since there is no way to tell whether it still applies.
+    """
+    version = _read(app, "Version")
+    if version is None:
+        return None
+    build = _read(app, "Build") or "?"
+    try:
+        lang = int(app.LanguageSettings.LanguageID(_msoLanguageIDUI))
+    except Exception:
+        lang = "?"
+    return f"{version}-{build}-{lang}"
+
+
+class SmartArtCatalog:
+    """Snapshot of the three SmartArt collections with lookup indexes."""
+
+    def __init__(self, key: str, layouts: list, colors: list, styles: list):
+        self.key = key
+        self.layouts = layouts
+        self.colors = colors
+        self.styles = styles
+        self._by_name = {}
+        self._by_english = {}
+        self._by_id = {}
+        for entry in layouts:
+            self._by_name.setdefault((entry["name"] or "").lower(), entry)
+            if entry.get("english_name"):
+                self._by_english.setdefault(entry["english_name"].lower(), entry)
+            if entry.get("id"):
+                self._by_id.setdefault(entry["id"], entry)
+
+    @classmethod
+    def from_app(cls, app, english_aliases: dict, key: Optional[str] = None) -> "SmartArtCatalog":
+        """Read every layout, color scheme and quick style over COM."""
+        fields = [("name", "Name"), ("id", "Id"), ("description", "Description")]
+        layouts = _read_collection(app.SmartArtLayouts, fields + [("category", "Category")])
+        for entry in layouts:
+            entry["english_name"] = english_aliases.get(entry["id"])
+        colors = _read_collection(app.SmartArtColors, fields)
+        styles = _read_collection(app.SmartArtQuickStyles, fields)
+        return cls(catalog_key(app) if key is None else key, layouts, colors, styles)
+
+    def to_dict(self) -> dict:
+        return {"key": self.key, "layouts": self.layouts,
+                "colors": self.colors, "styles": self.styles}
+
+    @classmethod
+    def from_dict(cls, data: dict, english_aliases: dict) -> "SmartArtCatalog":
+        # English aliases live in code, so re-apply them instead of trusting
+        # whatever alias table was current when the file was written.
+        layouts = data["layouts"]
+        for entry in layouts:
+            entry["english_name"] = english_aliases.get(entry["id"])
+        return cls(data["key"], layouts, data["colors"], data["styles"])
+
+    def items(self, list_type: str) -> list:
+        return {"layouts": self.layouts, "colors": self.colors, "styles": self.styles}[list_type]
+
+    def find_layouts(self, query: str) -> list:
+        """Layouts matching a name, best match first.
+
+        Order: exact localized name, exact English alias, exact Id, then
+        layouts whose localized name contains the query, then layouts whose
+        English alias contains it (each in collection order).
+        """
+        q = query.lower()
+        for index in (self._by_name, self._by_english):
+            if q in index:
+                return [index[q]]
+        if query in self._by_id:
+            return [self._by_id[query]]
+        by_name = [e for e in self.layouts if q in (e["name"] or "").lower()]
+        if by_name:
+            return by_name
+        return [e for e in self.layouts if e.get("english_name") and q in e["english_name"].lower()]
+
+    def categories(self) -> list:
+        counts = {}
+        for e in self.layouts:
+            if e.get("category"):
+                counts[e["category"]] = counts.get(e["category"], 0) + 1
+        return [{"category": k, "count": v} for k, v in counts.items()]
+
+
+class SmartArtCatalogStore:
+    """Memory + disk store of catalogs keyed by catalog_key. Thread-safe."""
+
+    def __init__(self, root: Optional[str] = None):
+        self._root = os.path.join(root or default_cache_root(), "smartart", _CACHE_LAYOUT_VERSION)
+        self._lock = threading.Lock()
+        self._catalogs = {}
+        self._stats = {"memory_hits": 0, "disk_loads": 0, "builds": 0, "invalidations": 0}
+
+    def _path(self, key: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9.\-]", "_", key)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self._root, f"{safe}-{digest}.json")
+
+    def get(self, app, english_aliases: dict) -> SmartArtCatalog:
+        """Return the catalog for this PowerPoint, loading or building it once."""
+        key = catalog_key(app)
+        if key is None:
+            return SmartArtCatalog.from_app(app, english_aliases, "")
+        with self._lock:
+            catalog = self._catalogs.get(key)
+            if catalog is not None:
+                self._stats["memory_hits"] += 1
+                return catalog
+            catalog = self._load(key, english_aliases)
+            if catalog is None:
+                catalog = SmartArtCatalog.from_app(app, english_aliases, key)
+                self._stats["builds"] += 1
+                self._save(catalog)
+            self._catalogs[key] = catalog
+            return catalog
+
+    def invalidate(self, key: str) -> None:
+        """Drop a catalog that no longer matches PowerPoint's collections."""
+        with self._lock:
+            self._catalogs.pop(key, None)
+            self._stats["invalidations"] += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def _load(self, key: str, english_aliases: dict) -> Optional[SmartArtCatalog]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                catalog = SmartArtCatalog.from_dict(json.load(f), english_aliases)
+        except (OSError, ValueError, KeyError):
+            return None
+        if catalog.key != key:
+            return None
+        self._stats["disk_loads"] += 1
+        return catalog
+
+    def _save(self, catalog: SmartArtCatalog) -> None:
+        try:
+            os.makedirs(self._root, exist_ok=True)
+            data = json.dumps(catalog.to_dict(), ensure_ascii=False).encode("utf-8")
+            atomic_write(self._path(catalog.key), data)
+        except OSError:
+            logger.debug("Cannot write SmartArt catalog", exc_info=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"cache_dir": self._root, "catalogs": len(self._catalogs), **self._stats}
+
+
+# Global singleton instance
+smartart_catalogs = SmartArtCatalogStore()
@@ -0,0 +1,188 @@
+"""Multi-pattern text matching for batch find/replace.
+
+ppt_find_replace_text runs one COM Find/Replace loop per term, so a
+localization table with hundreds of entries costs hundreds of passes over
+every text frame. MultiMatcher instead compiles the whole table once and
+finds every match in a frame's text in Python:
+
+- literal entries go into a single Aho–Corasick automaton (one scan of the
+  text regardless of how many literals there are);
+- regex entries are run with ``re.finditer`` each.
+
+Matches from all entries are then resolved into a non-overlapping set:
+leftmost start wins, then the longest match, then the earlier table entry.
+Replacements are computed against the original text, so they never cascade
+(with ``A→B`` and ``B→C``, an ``A`` becomes ``B``, not ``C``).
+"""
+
+import re
+from collections import deque
+from typing import List, NamedTuple, Optional
+
+
+class Match(NamedTuple):
+    """One resolved match. ``start``/``end`` are 0-based Python offsets."""
+    start: int
+    end: int
+    rule: int
+    replacement: str
+
+
+def _fold(text: str) -> str:
+    """Lowercase without changing the string length (offsets must line up)."""
+    out = []
+    for c in text:
+        low = c.lower()
+        out.append(low if len(low) == 1 else c)
+    return "".join(out)
+
+
+class AhoCorasick:
+    """Aho–Corasick automaton over a list of literal patterns."""
+
+    def __init__(self, patterns: List[str]):
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._lengths = [len(p) for p in patterns]
+        for pid, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            node = 0
+            for c in pattern:
+                nxt = self._goto[node].get(c)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][c] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(pid)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for c, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and c not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(c, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str):
+        """Yield ``(start, end, pattern_id)`` for every (overlapping) occurrence."""
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        node = 0
+        for i, c in enumerate(text):
+            while node and c not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(c, 0)
+            for pid in out[node]:
+                yield i + 1 - lengths[pid], i + 1, pid
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+class MultiMatcher:
+    """Compiled find/replace table.
+
+    Args:
+        rules: ``[{"find": str, "replace": str, "regex": bool}, ...]``.
+            Regex replacements may use ``\\1`` / ``\\g<name>`` backreferences.
+        match_case: Case-sensitive matching for every entry.
+        whole_words: Only accept matches bounded by non-word characters.
+
+    Raises:
+        ValueError: If a regex entry does not compile.
+    """
+
+    def __init__(self, rules: List[dict], match_case: bool = False,
+                 whole_words: bool = False):
+        self.rules = rules
+        self.match_case = match_case
+        self.whole_words = whole_words
+
+        self._literal_ids: List[int] = []
+        literals = []
+        self._regexes = []
+        flags = 0 if match_case else re.IGNORECASE
+        for rid, rule in enumerate(rules):
+            if rule.get("regex"):
+                try:
+                    self._regexes.append((rid, re.compile(rule["find"], flags)))
+                except re.error as e:
+                    raise ValueError(f"Invalid regex in entry {rid + 1} ({rule['find']!r}): {e}")
+            else:
+                self._literal_ids.append(rid)
+                literals.append(rule["find"] if match_case else _fold(rule["find"]))
+        self._automaton = AhoCorasick(literals) if literals else None
+
+    def _candidates(self, text: str):
+        if self._automaton is not None:
+            haystack = text if self.match_case else _fold(text)
+            for start, end, pid in self._automaton.iter_matches(haystack):
+                rid = self._literal_ids[pid]
+                yield start, end, rid, self.rules[rid]["replace"]
+        for rid, regex in self._regexes:
+            replace = self.rules[rid]["replace"]
+            for m in regex.finditer(text):
+                if m.end() == m.start():
+                    continue  # empty matches would insert at every position
+                yield m.start(), m.end(), rid, m.expand(replace)
+
+    def _on_word_boundary(self, text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+            return False
+        if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+            return False
+        return True
+
+    def find(self, text: str) -> List[Match]:
+        """Return the resolved, non-overlapping matches in text order."""
+        if not text:
+            return []
+        candidates = [
+            c for c in self._candidates(text)
+            if not self.whole_words or self._on_word_boundary(text, c[0], c[1])
+        ]
+        # Leftmost, then longest, then earliest table entry.
+        candidates.sort(key=lambda c: (c[0], -(c[1] - c[0]), c[2]))
+        matches: List[Match] = []
+        pos = 0
+        for start, end, rid, replacement in candidates:
+            if start < pos:
+                continue
+            matches.append(Match(start, end, rid, replacement))
+            pos = end
+        return matches
+
+
+def apply_matches(text: str, matches: List[Match]) -> str:
+    """Return text with every match replaced."""
+    parts = []
+    pos = 0
+    for m in matches:
+        parts.append(text[pos:m.start])
+        parts.append(m.replacement)
+        pos = m.end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def utf16_offsets(text: str) -> Optional[List[int]]:
+    """Map Python offsets to UTF-16 offsets, or None when they are identical.
+
+    PowerPoint's TextRange.Characters counts UTF-16 code units, so characters
+    outside the BMP (emoji, some CJK extensions) take two positions.
+    """
+    if all(ord(c) < 0x10000 for c in text):
+        return None
+    offsets = [0]
+    for c in text:
+        offsets.append(offsets[-1] + (2 if ord(c) >= 0x10000 else 1))
+    return offsets
@@ -2,6 +2,265 @@
 
 import os
 import sys
+import zipfile
+from pathlib import Path
+
+import pytest
 
 # Allow tests to import from src/ without installing the package.
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Without pywin32 (e.g. on Linux), stand-ins for pythoncom, pywintypes,
+# win32com.client, ctypes.windll and winreg let the src modules import.
+from utils.fake_ppt import install_pywin32_shims  # noqa: E402
+
+install_pywin32_shims()
+
+
+# ---------------------------------------------------------------------------
+# A small .pptx assembled from XML strings (offline OOXML and export tests)
+# ---------------------------------------------------------------------------
+_NS = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+)
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+
+
+def _rels(*rels):
+    body = "".join(f'<Relationship Id="{i}" Type="{_REL}{t}" Target="{target}"/>' for i, t, target in rels)
+    return ('<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f"{body}</Relationships>")
+
+
+def _sp(id_, name, body, xfrm=True, ph=None, extra=""):
+    ph_xml = f'<p:ph type="{ph}"/>' if ph else ""
+    xfrm_xml = ('<a:xfrm><a:off x="127000" y="254000"/><a:ext cx="1270000" cy="635000"/></a:xfrm>'
+                if xfrm else "")
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{id_}" name="{name}"/><p:cNvSpPr {extra}/>'
+            f"<p:nvPr>{ph_xml}</p:nvPr></p:nvSpPr><p:spPr>{xfrm_xml}</p:spPr>"
+            f"<p:txBody><a:bodyPr/>{body}</p:txBody></p:sp>")
+
+
+def _cell(text):
+    return f"<a:tc><a:txBody><a:bodyPr/><a:p><a:r><a:t>{text}</a:t></a:r></a:p></a:txBody></a:tc>"
+
+
+SLIDE1 = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n'
+    f'<p:sld {_NS} xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main" mc:Ignorable="p14">'
+    "<p:cSld><p:spTree>"
+    + _sp(2, "Title 1", "<a:p><a:r><a:t>Quarterly Review</a:t></a:r></a:p>", xfrm=False, ph="title")
+    + _sp(3, "TextBox 2",
+          '<a:p><a:r><a:rPr lang="en-US"><a:solidFill><a:srgbClr val="FF0000"/></a:solidFill>'
+          "<a:cs typeface=\"Arial\"/></a:rPr><a:t>Hello Wor</a:t></a:r>"
+          "<a:r><a:t>ld and world</a:t></a:r></a:p>"
+          '<a:p><a:pPr lvl="1"/><a:r><a:t>Second</a:t></a:r><a:br/><a:r><a:t>line</a:t></a:r>'
+          '<a:endParaRPr lang="en-US"/></a:p>',
+          extra='txBox="1"')
+    + '<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="4" name="Table 3"/><p:cNvGraphicFramePr/>'
+      '<p:nvPr/></p:nvGraphicFramePr><p:xfrm><a:off x="0" y="1270000"/><a:ext cx="2540000" cy="1270000"/>'
+      '</p:xfrm><a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+      "<a:tbl><a:tr>" + _cell("Region") + _cell("Q1") + "</a:tr><a:tr>" + _cell("EMEA") + _cell("12")
+    + "</a:tr></a:tbl></a:graphicData></a:graphic></p:graphicFrame>"
+    + '<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="5" name="Chart 4"/><p:cNvGraphicFramePr/>'
+      '<p:nvPr/></p:nvGraphicFramePr><p:xfrm><a:off x="0" y="2540000"/><a:ext cx="2540000" cy="1270000"/>'
+      '</p:xfrm><a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/chart">'
+      '<c:chart xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" r:id="rId3"/>'
+      "</a:graphicData></a:graphic></p:graphicFrame>"
+    + '<p:grpSp><p:nvGrpSpPr><p:cNvPr id="6" name="Group 5"/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+      '<p:grpSpPr><a:xfrm><a:off x="1270000" y="0"/><a:ext cx="1270000" cy="1270000"/>'
+      '<a:chOff x="0" y="0"/><a:chExt cx="2540000" cy="2540000"/></a:xfrm></p:grpSpPr>'
+    + _sp(7, "Inner", "<a:p><a:r><a:t>Grouped</a:t></a:r></a:p>")
+    + "</p:grpSp></p:spTree></p:cSld></p:sld>"
+)
+
+SLIDE2 = (f'<p:sld {_NS} show="0"><p:cSld><p:spTree>'
+          + _sp(2, "Body", '<a:p><a:r><a:rPr><a:hlinkClick r:id="rId1"/></a:rPr>'
+                           "<a:t>Backup slide</a:t></a:r></a:p>")
+          + "</p:spTree></p:cSld></p:sld>")
+
+LAYOUT = (f"<p:sldLayout {_NS}><p:cSld><p:spTree>"
+          '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title"/><p:cNvSpPr/><p:nvPr><p:ph type="title"/></p:nvPr>'
+          '</p:nvSpPr><p:spPr><a:xfrm><a:off x="635000" y="381000"/><a:ext cx="10160000" cy="1270000"/>'
+          "</a:xfrm></p:spPr></p:sp></p:spTree></p:cSld></p:sldLayout>")
+
+NOTES = (f"<p:notes {_NS}><p:cSld><p:spTree>"
+         + _sp(2, "Notes", "<a:p><a:r><a:t>Mention the EMEA dip</a:t></a:r></a:p>", ph="body")
+         + "</p:spTree></p:cSld></p:notes>")
+
+CHART = (
+    '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart"><c:chart><c:plotArea>'
+    "<c:barChart><c:ser><c:tx><c:strRef><c:strCache><c:ptCount val=\"1\"/><c:pt idx=\"0\"><c:v>Revenue</c:v>"
+    "</c:pt></c:strCache></c:strRef></c:tx>"
+    '<c:cat><c:strRef><c:strCache><c:ptCount val="2"/><c:pt idx="0"><c:v>Q1</c:v></c:pt>'
+    '<c:pt idx="1"><c:v>Q2</c:v></c:pt></c:strCache></c:strRef></c:cat>'
+    '<c:val><c:numRef><c:numCache><c:ptCount val="2"/><c:pt idx="1"><c:v>12.5</c:v></c:pt>'
+    "</c:numCache></c:numRef></c:val></c:ser></c:barChart></c:plotArea></c:chart></c:chartSpace>"
+)
+
+COMMENTS = (f'<p:cmLst {_NS}><p:cm authorId="0" dt="2026-01-05T10:00:00"><p:pos x="10" y="10"/>'
+            "<p:text>Check these numbers</p:text></p:cm></p:cmLst>")
+AUTHORS = f'<p:cmAuthorLst {_NS}><p:cmAuthor id="0" name="Ana Ruiz" initials="AR"/></p:cmAuthorLst>'
+
+
+def _make_pptx(path: Path) -> Path:
+    parts = {
+        "[Content_Types].xml": (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Override PartName="/ppt/slides/slide1.xml" ContentType="slide"/>'
+            '<Override PartName="/ppt/slides/slide2.xml" ContentType="slide"/>'
+            '<Override PartName="/ppt/charts/chart1.xml" ContentType="chart"/></Types>'
+        ),
+        "_rels/.rels": _rels(("rId1", "officeDocument", "ppt/presentation.xml")),
+        "ppt/presentation.xml": (
+            f'<p:presentation {_NS}><p:sldIdLst><p:sldId id="256" r:id="rId2"/>'
+            '<p:sldId id="257" r:id="rId3"/></p:sldIdLst><p:sldSz cx="12192000" cy="6858000"/>'
+            '<p:extLst><p:ext uri="{521415D9-36F7-43E2-AB2F-B90AF26B5E84}">'
+            '<p14:sectionLst xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main">'
+            '<p14:section name="Intro" id="{1}"><p14:sldIdLst><p14:sldId id="256"/></p14:sldIdLst></p14:section>'
+            '<p14:section name="Backup" id="{2}"><p14:sldIdLst><p14:sldId id="257"/></p14:sldIdLst></p14:section>'
+            "</p14:sectionLst></p:ext></p:extLst></p:presentation>"
+        ),
+        "ppt/_rels/presentation.xml.rels": _rels(
+            ("rId2", "slide", "slides/slide1.xml"), ("rId3", "slide", "slides/slide2.xml"),
+            ("rId4", "commentAuthors", "commentAuthors.xml"),
+        ),
+        "ppt/slides/slide1.xml": SLIDE1,
+        "ppt/slides/_rels/slide1.xml.rels": _rels(
+            ("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+            ("rId2", "notesSlide", "../notesSlides/notesSlide1.xml"),
+            ("rId3", "chart", "../charts/chart1.xml"),
+            ("rId4", "comments", "../comments/comment1.xml"),
+        ),
+        "ppt/slides/slide2.xml": SLIDE2,
+        "ppt/slides/_rels/slide2.xml.rels": _rels(("rId1", "slide", "slide1.xml")),
+        "ppt/slideLayouts/slideLayout1.xml": LAYOUT,
+        "ppt/notesSlides/notesSlide1.xml": NOTES,
+        "ppt/charts/chart1.xml": CHART,
+        "ppt/comments/comment1.xml": COMMENTS,
+        "ppt/commentAuthors.xml": AUTHORS,
+    }
+    with zipfile.ZipFile(path, "w") as z:
+        for name, xml in parts.items():
+            z.writestr(name, xml)
+    return path
+
+
+@pytest.fixture
+def make_pptx():
+    """Writes the two-slide test deck to a path and returns it."""
+    return _make_pptx
+
+
+# ---------------------------------------------------------------------------
+# A fake text object model for ppt_get_all_text
+# ---------------------------------------------------------------------------
+class _Coll:
+    def __init__(self, items):
+        self._items = items
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def __call__(self, i):
+        return self._items[i - 1]
+
+
+class _Font:
+    Bold = 0
+    Italic = 0
+
+
+class _Bullet:
+    Visible = 0
+    Type = 0
+
+
+class _ParagraphFormat:
+    Bullet = _Bullet()
+
+
+class _Range:
+    """A text range that is its own single paragraph and run."""
+
+    def __init__(self, shape):
+        self._shape = shape
+        self.Font = _Font()
+        self.ParagraphFormat = _ParagraphFormat()
+        self.IndentLevel = 1
+
+    @property
+    def Text(self):
+        return self._shape.text
+
+    def Paragraphs(self, i=None):
+        return _Coll([self]) if i is None else self
+
+    def Runs(self, i=None):
+        return _Coll([self]) if i is None else self
+
+
+class _TextFrame:
+    def __init__(self, shape):
+        self.TextRange = _Range(shape)
+
+    @property
+    def HasText(self):
+        return bool(self.TextRange.Text)
+
+
+class _Shape:
+    Type = 17  # msoTextBox
+    HasTable = False
+    HasTextFrame = True
+
+    def __init__(self, name, top, text):
+        self.Name = name
+        self.Id = abs(hash(name)) % 1000
+        self.Left, self.Top, self.Width, self.Height = 10.0, top, 300.0, 40.0
+        self.text = text
+        self.TextFrame = _TextFrame(self)
+
+
+class _Transition:
+    Hidden = 0
+
+
+class _Slide:
+    def __init__(self, slide_id, texts):
+        self.SlideID = slide_id
+        self.SlideShowTransition = _Transition()
+        self.Shapes = _Coll([
+            _Shape(f"S{slide_id}-{n}", 50.0 * n, t) for n, t in enumerate(texts)
+        ])
+
+
+class _Pres:
+    FullName = "C:/deck.pptx"
+
+    def __init__(self):
+        self.Slides = _Coll([
+            _Slide(256, ["Intro", "Hello"]),
+            _Slide(257, ["Plan"]),
+            _Slide(258, ["Budget"]),
+        ])
+
+
+@pytest.fixture
+def deck(monkeypatch):
+    """Three text slides behind ppt_get_all_text, with a fresh markdown cache."""
+    from ppt_com import text as text_mod
+
+    pres = _Pres()
+
+    async def inline(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(text_mod.ppt, "execute_async", inline)
+    monkeypatch.setattr(text_mod.ppt, "_get_pres_impl", lambda: pres)
+    monkeypatch.setattr(text_mod, "_markdown_cache", text_mod._MarkdownCache())
+    return pres
@@ -0,0 +1,69 @@
+"""Tests for incremental ppt_get_all_text (per-slide memo + changed_since).
+
+Pure Python tests — the deck fixture (conftest.py) is a small fake text
+object model standing in for PowerPoint, and execute_async runs inline.
+"""
+
+import asyncio
+import re
+import sys
+from pathlib import Path
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import text as text_mod  # noqa: E402
+from ppt_com.text import GetAllTextInput, get_all_text  # noqa: E402
+
+
+def _run(**kwargs):
+    return asyncio.run(get_all_text(GetAllTextInput(**kwargs)))
+
+
+def _token(result):
+    return re.search(r"changed_since token: (\w+)", result).group(1)
+
+
+def test_full_read_includes_all_slides_and_token(deck):
+    result = _run()
+    assert "== Slide 1 ==" in result and "Budget" in result
+    assert _token(result)
+
+
+def test_unchanged_slides_come_from_memo(deck):
+    _run()
+    stats_before = dict(text_mod._markdown_cache.stats)
+    second = _run()
+    assert "== Slide 3 ==\nBudget" in second
+    assert text_mod._markdown_cache.stats["hits"] - stats_before["hits"] == 3
+
+
+def test_changed_since_returns_only_changed_slides(deck):
+    pres = deck
+    token = _token(_run())
+
+    pres.Slides(2).Shapes(1).text = "Revised plan"
+    result = _run(changed_since=token)
+
+    assert "1 changed, 0 added, 2 unchanged" in result
+    assert "Revised plan" in result
+    assert "Budget" not in result
+
+    # The new token already includes the edit.
+    again = _run(changed_since=_token(result))
+    assert "0 changed, 0 added, 3 unchanged" in again
+
+
+def test_changed_since_reports_removed_slides(deck):
+    pres = deck
+    token = _token(_run())
+    del pres.Slides._items[2]
+    result = _run(changed_since=token)
+    assert "removed (slide ids [258])" in result
+
+
+def test_unknown_token_returns_everything(deck):
+    result = _run(changed_since="nope")
+    assert "token unknown or expired" in result
+    assert "Budget" in result
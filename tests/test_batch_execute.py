@@ -0,0 +1,125 @@
+"""Tests for ppt_execute_batch dispatch logic (src/ppt_com/batch_execute.py).
+
+The tool registry is replaced with small async fakes so the batch engine can
+be exercised without PowerPoint or a running FastMCP server.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import batch_execute  # noqa: E402
+from ppt_com.batch_execute import (  # noqa: E402
+    ExecuteBatchInput,
+    _execute_batch_impl,
+    _normalize_tool_name,
+    _resolve_refs,
+)
+
+
+class _ShapeInput(BaseModel):
+    slide_index: int
+    shape_name_or_index: str = ""
+
+
+@pytest.fixture
+def fake_registry(monkeypatch):
+    calls = []
+
+    async def add_shape(params):
+        calls.append(("add_shape", params.slide_index))
+        return json.dumps({"success": True, "shape_name": f"Rect {len(calls)}"})
+
+    async def set_fill(params):
+        calls.append(("set_fill", params.shape_name_or_index))
+        return json.dumps({"success": True})
+
+    async def broken(params):
+        return json.dumps({"error": "shape not found"})
+
+    registry = {
+        "ppt_add_shape": (add_shape, _ShapeInput),
+        "ppt_set_fill": (set_fill, _ShapeInput),
+        "ppt_broken": (broken, _ShapeInput),
+    }
+    monkeypatch.setattr(batch_execute, "_registry", registry)
+    monkeypatch.setattr(batch_execute.ppt, "_get_app_impl", lambda: MagicMock())
+    return calls
+
+
+def _step(tool, params, step_id=None):
+    return {"tool": tool, "params": params, "id": step_id}
+
+
+def test_normalize_tool_name():
+    assert _normalize_tool_name("add_shape") == "ppt_add_shape"
+    assert _normalize_tool_name("ppt_add_shape") == "ppt_add_shape"
+
+
+def test_resolve_refs_nested_and_passthrough():
+    outputs = {"card": {"shape_name": "Card 1", "pos": {"left": 10}}}
+    resolved = _resolve_refs(
+        {"a": "$card.shape_name", "b": ["$card.pos.left", "plain"], "c": 3},
+        outputs,
+    )
+    assert resolved == {"a": "Card 1", "b": [10, "plain"], "c": 3}
+
+
+def test_resolve_refs_unknown_step_raises():
+    with pytest.raises(ValueError, match="no earlier step"):
+        _resolve_refs("$missing.shape_name", {})
+
+
+def test_batch_runs_steps_and_resolves_references(fake_registry):
+    result = _execute_batch_impl(
+        [
+            _step("ppt_add_shape", {"slide_index": 2}, "card"),
+            _step("ppt_set_fill", {"slide_index": 2, "shape_name_or_index": "$card.shape_name"}),
+        ],
+        stop_on_error=True, single_undo_entry=True,
+    )
+    assert result["success"] is True
+    assert result["steps_run"] == 2
+    assert fake_registry == [("add_shape", 2), ("set_fill", "Rect 1")]
+    assert all("elapsed_ms" in r for r in result["results"])
+
+
+def test_batch_stops_on_error(fake_registry):
+    result = _execute_batch_impl(
+        [
+            _step("ppt_broken", {"slide_index": 1}),
+            _step("ppt_add_shape", {"slide_index": 1}),
+        ],
+        stop_on_error=True, single_undo_entry=False,
+    )
+    assert result["success"] is False
+    assert result["steps_run"] == 1
+    assert result["stopped_at_step"] == 1
+    assert result["results"][0]["error"] == "shape not found"
+    assert fake_registry == []
+
+
+def test_batch_continues_when_requested(fake_registry):
+    result = _execute_batch_impl(
+        [
+            _step("ppt_add_shape", {"slide_index": "not-an-int"}),
+            _step("ppt_add_shape", {"slide_index": 1}),
+        ],
+        stop_on_error=False, single_undo_entry=False,
+    )
+    assert result["steps_run"] == 2
+    assert result["steps_failed"] == 1
+    assert result["results"][1]["status"] == "success"
+
+
+def test_input_rejects_empty_operations():
+    with pytest.raises(Exception):
+        ExecuteBatchInput(operations=[])
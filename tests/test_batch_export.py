@@ -0,0 +1,151 @@
+"""Tests for batch export through PowerPoint worker threads (ppt_com/batch_export.py).
+
+Pure Python tests — a fake application writes placeholder files, so the
+job queue, per-file failure isolation and the manifest can be checked
+without PowerPoint.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import batch_export  # noqa: E402
+from utils import progress as progress_mod  # noqa: E402
+
+
+class _Slide:
+    def Export(self, path, filter_name, *size):
+        Path(path).write_text(f"{filter_name} {size}")
+
+
+class _Slides:
+    Count = 2
+
+    def __call__(self, i):
+        return _Slide()
+
+
+class _Pres:
+    def __init__(self, app, path):
+        self._app = app
+        self.FullName = path
+        self.Slides = _Slides()
+
+    def SaveAs(self, path, fmt):
+        Path(path).write_text("pdf")
+
+    def Close(self):
+        self._app.closed.append(self.FullName)
+
+
+class _Presentations:
+    def __init__(self, app):
+        self._app = app
+        self.open = []
+
+    @property
+    def Count(self):
+        return len(self.open)
+
+    def __call__(self, i):
+        return self.open[i - 1]
+
+    def Open(self, path, ReadOnly, Untitled, WithWindow):
+        assert ReadOnly and not WithWindow
+        if "broken" in path:
+            raise RuntimeError("PowerPoint can't read broken.pptx")
+        return _Pres(self._app, path)
+
+
+class _App:
+    def __init__(self):
+        self.closed = []
+        self.Presentations = _Presentations(self)
+
+
+@pytest.fixture
+def decks(tmp_path):
+    paths = []
+    for name in ("a.pptx", "broken.pptx", "c.pptx"):
+        (tmp_path / name).write_bytes(b"")
+        paths.append(str(tmp_path / name))
+    return paths
+
+
+def test_failures_are_isolated_per_file(decks, tmp_path):
+    app = _App()
+    pool = batch_export.ExportPool(app_factory=lambda: app)
+    out = tmp_path / "out"
+    job = pool.submit(decks, str(out), ["pdf", "png"], workers=2, width=320)
+    assert job.wait(5)
+
+    result = job.snapshot()
+    assert (result["status"], result["done"], result["failed"]) == ("finished", 2, 1)
+    by_name = {Path(f["path"]).name: f for f in result["files"]}
+    assert by_name["broken.pptx"]["status"] == "failed"
+    assert "can't read" in by_name["broken.pptx"]["error"]
+    assert by_name["a.pptx"]["outputs"] == [
+        str(out / "a.pdf"), str(out / "a" / "Slide1.png"), str(out / "a" / "Slide2.png"),
+    ]
+    assert (out / "c" / "Slide2.png").read_text() == "PNG (320,)"
+    assert sorted(Path(p).name for p in app.closed) == ["a.pptx", "c.pptx"]
+
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["status"] == "finished"
+    assert [f["status"] for f in manifest["files"]] == ["done", "failed", "done"]
+
+
+def test_open_deck_is_exported_and_left_open(decks, tmp_path):
+    app = _App()
+    already = _Pres(app, decks[0])
+    app.Presentations.open.append(already)
+    job = batch_export.ExportPool(app_factory=lambda: app).submit(
+        decks[:1], str(tmp_path / "out"), ["pdf"], workers=4,
+    )
+    assert job.wait(5)
+    assert job.workers == 1  # never more workers than files
+    assert job.snapshot()["done"] == 1
+    assert app.closed == []
+
+
+def test_submit_validation(decks, tmp_path):
+    pool = batch_export.ExportPool(app_factory=_App)
+    with pytest.raises(ValueError, match="named 'a'"):
+        pool.submit([decks[0], str(tmp_path / "sub" / "A.pptx")], str(tmp_path), ["pdf"])
+    with pytest.raises(ValueError, match="Unknown formats"):
+        pool.submit(decks, str(tmp_path), ["gif"])
+    with pytest.raises(ValueError, match="Unknown export job"):
+        pool.get("export-99")
+
+
+class _Ctx:
+    def __init__(self):
+        self.reports = []
+
+    async def report_progress(self, progress, total, message):
+        self.reports.append((progress, total, message))
+
+
+def test_wait_reports_progress_per_file(decks, tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_export, "export_pool",
+                        batch_export.ExportPool(app_factory=_App))
+    monkeypatch.setattr(progress_mod, "REPORT_INTERVAL_S", 0)
+    ctx = _Ctx()
+    params = batch_export.BatchExportInput(files=decks, output_dir=str(tmp_path / "out"),
+                                           workers=1, wait=True)
+    result = json.loads(asyncio.run(batch_export.batch_export(params, ctx)))
+    assert (result["status"], result["done"], result["failed"]) == ("finished", 2, 1)
+    assert ctx.reports == [(1, 3, "1/3 files"), (2, 3, "2/3 files"), (3, 3, "3/3 files")]
+
+    ctx = _Ctx()
+    params = batch_export.BatchExportInput(files=decks[:1], output_dir=str(tmp_path / "bg"))
+    job_id = json.loads(asyncio.run(batch_export.batch_export(params, ctx)))["job_id"]
+    assert batch_export.export_pool.get(job_id).wait(5)
+    assert ctx.reports == []  # the call has returned; nobody to notify
@@ -0,0 +1,147 @@
+"""Tests for busy-rejection handling (utils/busy_retry.py).
+
+Pure Python tests — the message filter is called directly with the arguments
+COM would pass, and the worker runs plain callables that raise the busy
+HRESULT, so backoff and give-up can be checked without COM.
+"""
+
+import asyncio
+import ctypes
+import logging
+import random
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+import pywintypes  # noqa: E402
+
+from utils import busy_retry, com_wrapper  # noqa: E402
+from utils.busy_retry import BusyRetryPolicy, BusyStats, MessageFilter  # noqa: E402
+
+_BUSY = -2147418111  # RPC_E_CALL_REJECTED
+
+
+def test_backoff_doubles_up_to_the_cap():
+    policy = BusyRetryPolicy(initial_s=0.05, max_delay_s=0.3, jitter=0)
+    assert [policy.delay(n) for n in range(5)] == [0.05, 0.1, 0.2, 0.3, 0.3]
+
+
+def test_jitter_only_shortens_the_delay():
+    policy = BusyRetryPolicy(initial_s=0.1, max_delay_s=1, jitter=0.5, rng=random.Random(7))
+    delays = [policy.delay(2) for _ in range(50)]
+    assert all(0.2 <= d <= 0.4 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_timeout_limits_total_wait():
+    policy = BusyRetryPolicy(timeout_s=1)
+    assert policy.allows(0.5, 0.5)
+    assert not policy.allows(0.9, 0.2)
+
+
+def test_message_filter_retries_within_budget():
+    stats = BusyStats()
+    mf = MessageFilter(budget_ms=1000, stats=stats)
+    assert mf.RetryRejectedCall(0, 0, 2) == 100
+    assert mf.RetryRejectedCall(0, 100, 2) == 100
+    assert mf.RetryRejectedCall(0, 200, 2) == 200
+    assert mf.RetryRejectedCall(0, 400, 2) == 400
+    assert mf.RetryRejectedCall(0, 800, 2) == -1
+    assert stats.filter_snapshot() == (4, 800)
+    assert stats.stats()["filter_gave_up"] == 1
+
+
+def test_message_filter_cancels_outright_rejections():
+    mf = MessageFilter(budget_ms=1000, stats=BusyStats())
+    assert mf.RetryRejectedCall(0, 0, 1) == -1
+
+
+def test_worker_gives_up_after_timeout(monkeypatch):
+    stats = BusyStats()
+    monkeypatch.setattr(com_wrapper, "busy_stats", stats)
+    wrapper = com_wrapper.PowerPointCOMWrapper()
+    monkeypatch.setattr(wrapper, "_busy_policy",
+                        BusyRetryPolicy(initial_s=0.02, max_delay_s=0.04, timeout_s=0.13, jitter=0))
+    attempts = []
+
+    def always_busy():
+        attempts.append(1)
+        raise pywintypes.com_error(_BUSY, "Call was rejected by callee.")
+
+    wrapper.start()
+    try:
+        with pytest.raises(pywintypes.com_error):
+            asyncio.run(wrapper.execute_async(always_busy))
+    finally:
+        wrapper.stop()
+    # 0.02 + 0.04 + 0.04 fit in 0.13 s; the next 0.04 would not.
+    assert len(attempts) == 4
+    result = stats.stats()
+    assert result["episodes"] == 1
+    assert result["gave_up"] == 1
+    assert result["deferred_retries"] == 3
+
+
+def _stub_pythoncom(monkeypatch, calls):
+    def co_register_message_filter(new):
+        calls.append(new)
+        return "previous filter"
+
+    pythoncom = types.SimpleNamespace(CoRegisterMessageFilter=co_register_message_filter,
+                                      IID_IMessageFilter="IID_IMessageFilter")
+    util = types.SimpleNamespace(wrap=lambda obj, iid: (obj, iid))
+    monkeypatch.setitem(sys.modules, "pythoncom", pythoncom)
+    monkeypatch.setitem(sys.modules, "win32com.server", types.SimpleNamespace(util=util))
+    monkeypatch.setitem(sys.modules, "win32com.server.util", util)
+
+
+def test_message_filter_is_registered_and_revoked(monkeypatch):
+    calls = []
+    _stub_pythoncom(monkeypatch, calls)
+    registration = busy_retry.register_message_filter(500)
+    assert registration[0] is True
+    wrapped, iid = calls[0]
+    assert isinstance(wrapped, MessageFilter) and wrapped.budget_ms == 500
+    assert iid == "IID_IMessageFilter"
+    busy_retry.revoke_message_filter(registration)
+    assert calls[1] == "previous filter"
+
+
+def test_failed_registration_is_a_warning(monkeypatch, caplog):
+    monkeypatch.setitem(sys.modules, "pythoncom", types.SimpleNamespace())
+
+    def fail(self):
+        raise OSError("CoRegisterMessageFilter failed")
+
+    monkeypatch.setattr(busy_retry._NativeMessageFilter, "register", fail)
+    monkeypatch.setattr(ctypes, "WINFUNCTYPE", ctypes.CFUNCTYPE, raising=False)
+    with caplog.at_level(logging.WARNING, logger="utils.busy_retry"):
+        assert busy_retry.register_message_filter(500) == (False, None)
+    assert "Could not register the COM message filter" in caplog.text
+
+
+def test_native_filter_vtable_dispatches_to_the_filter(monkeypatch):
+    monkeypatch.setattr(ctypes, "WINFUNCTYPE", ctypes.CFUNCTYPE, raising=False)
+    stats = BusyStats()
+    native = busy_retry._NativeMessageFilter(MessageFilter(budget_ms=1000, stats=stats))
+    this = ctypes.addressof(native._object)
+    vtbl = ctypes.cast(this, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p)))[0]
+    proto = ctypes.CFUNCTYPE(ctypes.c_ulong, ctypes.c_void_p, ctypes.c_void_p,
+                             ctypes.c_ulong, ctypes.c_ulong)
+    retry = proto(vtbl[4])
+    assert retry(this, None, 200, 2) == 200
+    assert retry(this, None, 800, 2) == 0xFFFFFFFF  # cancel
+    assert stats.filter_snapshot() == (1, 200)
+
+    query = ctypes.CFUNCTYPE(ctypes.c_long, ctypes.c_void_p, ctypes.c_char_p,
+                             ctypes.POINTER(ctypes.c_void_p))(vtbl[0])
+    out = ctypes.c_void_p()
+    assert query(this, busy_retry._IID_IMESSAGEFILTER, ctypes.byref(out)) == 0
+    assert out.value == this
+    assert query(this, b"\x01" * 16, ctypes.byref(out)) == busy_retry._E_NOINTERFACE
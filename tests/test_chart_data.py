@@ -0,0 +1,208 @@
+"""Tests for block chart data writes (ppt_com/charts.py).
+
+Pure Python tests — a fake embedded workbook records every cross-process
+write so the number of COM calls per chart can be checked.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import charts  # noqa: E402
+from ppt_com.charts import SetChartsDataInput  # noqa: E402
+
+
+class _Cell:
+    def __init__(self, r, c):
+        self.r, self.c = r, c
+
+
+class _Range:
+    def __init__(self, sheet, a, b):
+        self._sheet, self._a, self._b = sheet, a, b
+        self.Address = f"$A$1:R{b.r}C{b.c}"
+
+    @property
+    def Value(self):
+        rows = []
+        for r in range(self._a.r, self._b.r + 1):
+            rows.append(tuple(self._sheet.cells.get((r, c)) for c in range(self._a.c, self._b.c + 1)))
+        return tuple(rows)
+
+    @Value.setter
+    def Value(self, block):
+        self._sheet.writes += 1
+        assert len(block) == self._b.r - self._a.r + 1
+        for dr, row in enumerate(block):
+            assert len(row) == self._b.c - self._a.c + 1
+            for dc, v in enumerate(row):
+                self._sheet.cells[(self._a.r + dr, self._a.c + dc)] = v
+
+
+class _Sheet:
+    def __init__(self):
+        self.cells = {}
+        self.writes = 0
+        outer = self
+
+        class _Cells:
+            def __call__(self, r, c):
+                return _Cell(r, c)
+
+            def Clear(self):
+                outer.cells.clear()
+
+        self.Cells = _Cells()
+
+    def Range(self, a, b):
+        return _Range(self, a, b)
+
+    @property
+    def UsedRange(self):
+        max_r = max(r for r, _ in self.cells)
+        max_c = max(c for _, c in self.cells)
+        return _Range(self, _Cell(1, 1), _Cell(max_r, max_c))
+
+
+class _Workbook:
+    def __init__(self, chart):
+        self._chart = chart
+        self.sheet = _Sheet()
+
+    def Worksheets(self, i):
+        return self.sheet
+
+    def Close(self, save):
+        self._chart.closes += 1
+
+
+class _OleObj:
+    def __init__(self, chart):
+        self._chart = chart
+
+    def InvokeTypes(self, *args):
+        self._chart.source = args[-2]
+
+
+class _ChartData:
+    def __init__(self, chart):
+        self._chart = chart
+        self.Workbook = _Workbook(chart)
+
+    def Activate(self):
+        self._chart.opens += 1
+
+
+class _Chart:
+    def __init__(self):
+        self.opens = self.closes = 0
+        self.source = None
+        self.ChartData = _ChartData(self)
+        self._oleobj_ = _OleObj(self)
+
+
+class _Shape:
+    HasChart = True
+
+    def __init__(self, name):
+        self.Name = name
+        self.Chart = _Chart()
+
+
+class _Coll:
+    def __init__(self, items):
+        self._items = items
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def __call__(self, i):
+        return self._items[i - 1]
+
+
+class _Slide:
+    def __init__(self, names):
+        self.Shapes = _Coll([_Shape(n) for n in names])
+
+
+@pytest.fixture
+def deck(monkeypatch):
+    class _Pres:
+        Slides = _Coll([_Slide(["Revenue"]), _Slide(["Costs", "Margin"])])
+
+    pres = _Pres()
+    monkeypatch.setattr(charts.ppt, "_get_app_impl", lambda: None)
+    monkeypatch.setattr(charts.ppt, "_get_pres_impl", lambda: pres)
+    monkeypatch.setattr(charts, "goto_slide", lambda app, i: None)
+    monkeypatch.setattr(charts.pythoncom, "Empty", None, raising=False)
+    return pres
+
+
+def _chart(pres, slide, shape):
+    return pres.Slides(slide).Shapes(shape).Chart
+
+
+def test_block_layout_pads_ragged_series():
+    block = charts._chart_data_block(["Q1", "Q2"], [
+        {"name": "A", "values": [1, 2]},
+        {"name": "B", "values": [3]},
+    ])
+    assert block == [(None, "A", "B"), ("Q1", 1, 3), ("Q2", 2, None)]
+
+
+def test_set_chart_data_is_one_block_write(deck):
+    months = [f"M{i}" for i in range(1, 13)]
+    series = [{"name": f"S{s}", "values": list(range(12))} for s in range(8)]
+    charts._set_chart_data_impl(1, "Revenue", months, series)
+    chart = _chart(deck, 1, 1)
+    sheet = chart.ChartData.Workbook.sheet
+    assert sheet.writes == 1
+    assert sheet.cells[(13, 9)] == 11
+    assert chart.source.endswith("R13C9")
+    assert chart.opens == chart.closes == 1
+
+
+def test_large_series_is_chunked(deck, monkeypatch):
+    monkeypatch.setattr(charts, "_WRITE_CHUNK_ROWS", 1000)
+    values = list(range(2500))
+    charts._set_chart_data_impl(1, 1, [str(v) for v in values], [{"name": "S", "values": values}])
+    sheet = _chart(deck, 1, 1).ChartData.Workbook.sheet
+    assert sheet.writes == 3
+    assert sheet.cells[(2501, 2)] == 2499
+
+
+def test_sheet_read_round_trips(deck):
+    charts._set_chart_data_impl(1, 1, ["Q1", "Q2"], [{"name": "A", "values": [1.5, 2.5]}])
+    result = charts._get_chart_data_impl(1, 1, source="sheet")
+    assert result["categories"] == ["Q1", "Q2"]
+    assert result["series"] == [{"name": "A", "values": [1.5, 2.5]}]
+
+
+def test_multi_chart_update_reports_failures_per_chart(deck):
+    params = SetChartsDataInput(charts=[
+        {"slide_index": 2, "shape_name_or_index": "Margin", "categories": ["a"],
+         "series": [{"name": "m", "values": [1]}]},
+        {"slide_index": 1, "shape_name_or_index": "Missing", "categories": ["a"],
+         "series": [{"name": "x", "values": [1]}]},
+        {"slide_index": 2, "shape_name_or_index": "Costs", "categories": ["a"],
+         "series": [{"name": "c", "values": [2]}]},
+    ])
+    result = charts._set_charts_data_impl([c.model_dump() for c in params.charts])
+    assert [c["success"] for c in result["charts"]] == [True, False, True]
+    assert result["updated"] == 2 and result["failed"] == 1
+    assert "not found" in result["charts"][1]["error"]
+    for name in (1, 2):
+        chart = _chart(deck, 2, name)
+        assert chart.opens == chart.closes == 1
+
+
+def test_duplicate_charts_rejected():
+    entry = {"slide_index": 1, "shape_name_or_index": "Revenue", "categories": [], "series": []}
+    with pytest.raises(ValueError, match="more than once"):
+        SetChartsDataInput(charts=[entry, entry])
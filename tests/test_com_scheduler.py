@@ -0,0 +1,128 @@
+"""Tests for the COM job scheduler (utils/com_scheduler.py).
+
+Pure Python tests — jobs are plain callables, so lanes, fairness, aging and
+coalescing can be checked without COM.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+import pywintypes  # noqa: E402
+
+from utils import com_scheduler, com_wrapper  # noqa: E402
+from utils.busy_retry import BusyRetryPolicy  # noqa: E402
+from utils.com_scheduler import JobScheduler, register_tool  # noqa: E402
+from utils.perf_stats import current_tool  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def tools(monkeypatch):
+    monkeypatch.setattr(com_scheduler, "_tool_policies", {})
+    register_tool("ppt_read", {"readOnlyHint": True, "idempotentHint": True})
+    register_tool("ppt_read_other", {"readOnlyHint": True, "idempotentHint": True})
+    register_tool("ppt_write", {"readOnlyHint": False})
+    register_tool("ppt_export_pdf", {"readOnlyHint": False})
+
+
+def _drain(scheduler):
+    order = []
+    while True:
+        with scheduler._cond:
+            if not any(scheduler._lanes.values()):
+                return order
+        job = scheduler.get()
+        scheduler.activate(job)
+        order.append(job.args[0])
+        for f in scheduler.finish(job):
+            f.set_result(job.args[0])
+
+
+def test_lane_policy_from_annotations():
+    assert com_scheduler.policy_for("ppt_read") == ("interactive", True, True)
+    assert com_scheduler.policy_for("ppt_write") == ("write", False, False)
+    assert com_scheduler.policy_for("ppt_export_pdf")[0] == "bulk"
+    assert com_scheduler.policy_for(None) == ("write", False, False)
+
+
+def test_reads_jump_ahead_of_writes_and_bulk():
+    s = JobScheduler(max_wait=60)
+    s.submit(str, ("export",), {}, "ppt_export_pdf")
+    s.submit(str, ("write",), {}, "ppt_write")
+    s.submit(str, ("read",), {}, "ppt_read")
+    assert _drain(s) == ["read", "write", "export"]
+
+
+def test_tools_take_turns_within_a_lane():
+    s = JobScheduler(max_wait=60)
+    for i in range(3):
+        s.submit(str, (f"a{i}",), {}, "ppt_read")
+    s.submit(str, ("b0",), {}, "ppt_read_other")
+    assert _drain(s) == ["a0", "b0", "a1", "a2"]
+
+
+def test_overdue_lower_lane_is_served_first():
+    s = JobScheduler(max_wait=0.01)
+    s.submit(str, ("export",), {}, "ppt_export_pdf")
+    time.sleep(0.02)
+    s.submit(str, ("read",), {}, "ppt_read")
+    assert _drain(s) == ["export", "read"]
+    assert s.stats()["aged_promotions"] == 1
+
+
+def test_identical_reads_coalesce_until_a_write_is_queued():
+    s = JobScheduler()
+    f1 = s.submit(str, ([1, 2],), {}, "ppt_read")
+    f2 = s.submit(str, ([1, 2],), {}, "ppt_read")
+    s.submit(str, ("w",), {}, "ppt_write")
+    f3 = s.submit(str, ([1, 2],), {}, "ppt_read")
+    assert s.stats()["coalesced"] == 1
+    _drain(s)
+    assert f1.result() == f2.result() == f3.result() == [1, 2]
+    assert s.stats()["served"]["interactive"] == 2
+
+
+def test_busy_job_is_deferred_so_others_run(monkeypatch):
+    wrapper = com_wrapper.PowerPointCOMWrapper()
+    monkeypatch.setattr(wrapper, "_busy_policy", BusyRetryPolicy(initial_s=0.2, jitter=0))
+    wrapper.start()
+    finished = []
+    attempts = []
+
+    def busy_write():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise pywintypes.com_error(-2147418111, "Call was rejected by callee.")
+        finished.append("write")
+
+    async def main():
+        write = asyncio.ensure_future(wrapper.execute_async(busy_write))
+        await asyncio.sleep(0.05)
+        token = current_tool.set("ppt_read")
+        try:
+            await wrapper.execute_async(lambda: finished.append("read"))
+        finally:
+            current_tool.reset(token)
+        await write
+
+    try:
+        asyncio.run(main())
+    finally:
+        wrapper.stop()
+    assert finished == ["read", "write"]
+    assert wrapper.get_queue_stats()["deferred"] == 1
+
+
+def test_stop_unblocks_an_idle_worker():
+    wrapper = com_wrapper.PowerPointCOMWrapper()
+    wrapper.start()
+    thread = wrapper._com_thread
+    wrapper.stop()
+    assert not thread.is_alive()
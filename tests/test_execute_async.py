@@ -0,0 +1,80 @@
+"""Tests for PowerPointCOMWrapper.execute_async.
+
+The COM worker thread runs plain Python callables here, so no PowerPoint is
+needed. The point under test is that awaiting a COM operation yields to the
+event loop instead of blocking it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from utils.com_wrapper import PowerPointCOMWrapper  # noqa: E402
+
+
+@pytest.fixture
+def wrapper():
+    w = PowerPointCOMWrapper()
+    w.start()
+    yield w
+    w.stop()
+
+
+def test_returns_result_from_com_thread(wrapper):
+    result = asyncio.run(wrapper.execute_async(threading.current_thread))
+    assert result.name == "COM-Worker"
+
+
+def test_propagates_exceptions(wrapper):
+    def boom():
+        raise ValueError("bad slide")
+
+    with pytest.raises(ValueError, match="bad slide"):
+        asyncio.run(wrapper.execute_async(boom))
+
+
+def test_event_loop_keeps_running_during_com_work(wrapper):
+    ticks = []
+
+    async def ticker(stop: asyncio.Event):
+        while not stop.is_set():
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        stop = asyncio.Event()
+        task = asyncio.create_task(ticker(stop))
+        await wrapper.execute_async(time.sleep, 0.3)
+        stop.set()
+        await task
+
+    asyncio.run(main())
+    # A blocking call would have allowed at most one tick.
+    assert len(ticks) > 5
+
+
+def test_cancelled_queued_job_is_skipped(wrapper):
+    ran = []
+
+    async def main():
+        blocker = asyncio.create_task(wrapper.execute_async(time.sleep, 0.2))
+        await asyncio.sleep(0.05)  # blocker is now running on the COM thread
+        queued = asyncio.create_task(wrapper.execute_async(ran.append, "x"))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        await blocker
+        # A later job proves the worker moved past the cancelled one.
+        await wrapper.execute_async(lambda: None)
+
+    asyncio.run(main())
+    assert ran == []
@@ -0,0 +1,149 @@
+"""Tests for slide-range PDF export (ppt_com/export.py).
+
+Pure Python tests — a fake application "exports" a trimmed copy by recording
+which slides it contains, so range parsing, file naming and the file-level
+trimming can be checked without PowerPoint.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import export  # noqa: E402
+from utils import ooxml  # noqa: E402
+
+
+class _Sections:
+    def __init__(self, sections):
+        self._sections = sections  # [(name, first, count)]
+        self.Count = len(sections)
+
+    def Name(self, i):
+        return self._sections[i - 1][0]
+
+    def FirstSlide(self, i):
+        return self._sections[i - 1][1]
+
+    def SlidesCount(self, i):
+        return self._sections[i - 1][2]
+
+
+class _Slides:
+    Count = 2
+
+
+class _Pres:
+    def __init__(self, path, saved=True):
+        self.FullName = str(path)
+        self.Saved = saved
+        self.Slides = _Slides()
+        self.SectionProperties = _Sections([("Intro", 1, 1), ("Empty", 2, 0), ("Q&A: backup", 2, 1)])
+        self.copies = 0
+        self.copy_formats = []
+
+    def SaveCopyAs(self, path, fmt):
+        self.copies += 1
+        self.copy_formats.append((Path(path).suffix, fmt))
+        shutil.copy(self.FullName, path)
+
+
+class _Opened:
+    def __init__(self, path, exported):
+        self._path = path
+        self._exported = exported
+
+    def SaveAs(self, path, fmt):
+        with ooxml.Package(self._path) as pkg:
+            texts = [ooxml.slide_shapes(pkg, part)[0]["text"] for part in pkg.slides]
+        self._exported[path] = texts
+
+    def Close(self):
+        pass
+
+
+class _Presentations:
+    Count = 1
+
+    def __init__(self):
+        self.exported = {}
+        self.opened = []
+
+    def Open(self, path, ReadOnly, WithWindow):
+        assert ReadOnly and not WithWindow
+        self.opened.append(path)
+        return _Opened(path, self.exported)
+
+
+class _App:
+    def __init__(self):
+        self.Presentations = _Presentations()
+
+
+@pytest.fixture
+def fake(tmp_path, monkeypatch, make_pptx):
+    deck = make_pptx(tmp_path / "deck.pptx")
+    app, pres = _App(), _Pres(deck)
+    monkeypatch.setattr(export.ppt, "_get_app_impl", lambda: app)
+    monkeypatch.setattr(export.ppt, "_get_pres_impl", lambda: pres)
+    return app, pres, tmp_path
+
+
+def test_parse_slide_ranges():
+    assert export._parse_slide_ranges(["2-4", " 7 "], 9) == [("2-4", [2, 3, 4]), ("7", [7])]
+    with pytest.raises(ValueError, match="out of range"):
+        export._parse_slide_ranges(["3-10"], 9)
+    with pytest.raises(ValueError, match="Invalid"):
+        export._parse_slide_ranges(["2..4"], 9)
+
+
+def test_single_range_reads_saved_file_without_copy(fake):
+    app, pres, tmp_path = fake
+    out = str(tmp_path / "out.pdf")
+    result = export._export_pdf_impl(out, 2, 2)
+    assert app.Presentations.exported == {out: ["Backup slide"]}
+    assert result["files"] == [{"file_path": out, "slides": "2-2", "slide_count": 1}]
+    assert pres.copies == 0
+
+
+def test_unsaved_deck_is_copied_once_for_several_ranges(fake):
+    app, pres, tmp_path = fake
+    pres.Saved = False
+    result = export._export_pdf_impl(str(tmp_path / "out.pdf"), None, None, ["1", "2"])
+    assert pres.copies == 1
+    assert [f["file_path"] for f in result["files"]] == [
+        str(tmp_path / "out_slides_1.pdf"), str(tmp_path / "out_slides_2.pdf"),
+    ]
+    assert app.Presentations.exported[str(tmp_path / "out_slides_2.pdf")] == ["Backup slide"]
+
+
+def test_macro_enabled_copies_keep_pptm_extension(fake, monkeypatch, make_pptx):
+    app, _, tmp_path = fake
+    pres = _Pres(make_pptx(tmp_path / "macros.pptm"))
+    monkeypatch.setattr(export.ppt, "_get_pres_impl", lambda: pres)
+    export._export_pdf_impl(str(tmp_path / "a.pdf"), 1, 1)
+    pres.Saved = False
+    export._export_pdf_impl(str(tmp_path / "b.pdf"), 2, 2)
+    assert [Path(p).suffix for p in app.Presentations.opened] == [".pptm", ".pptm"]
+    assert pres.copy_formats == [(".pptm", export.ppSaveAsOpenXMLPresentationMacroEnabled)]
+    assert app.Presentations.exported[str(tmp_path / "b.pdf")] == ["Backup slide"]
+
+
+def test_per_section_skips_empty_sections(fake):
+    app, pres, tmp_path = fake
+    result = export._export_pdf_impl(str(tmp_path / "deck.pdf"), None, None, per_section=True)
+    names = [Path(f["file_path"]).name for f in result["files"]]
+    assert names == ["deck_01_Intro.pdf", "deck_02_Q&A_backup.pdf"]
+
+
+def test_range_options_are_exclusive():
+    with pytest.raises(ValueError):
+        export.ExportPDFInput(file_path="a.pdf", slide_range_start=1, slide_range_end=2,
+                              per_section=True)
+    with pytest.raises(ValueError):
+        export.ExportPDFInput(file_path="a.pdf", combine=True)
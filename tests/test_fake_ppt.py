@@ -0,0 +1,117 @@
+"""Tests for the in-process PowerPoint fake (utils/fake_ppt.py).
+
+The tool implementations run unchanged against the fake, so these double as
+end-to-end checks of slides, shapes, text, tables and charts without COM.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from utils.com_wrapper import ppt  # noqa: E402
+from utils.fake_ppt import FakeApplication, Latency, attach  # noqa: E402
+from ppt_com import batch_apply, charts, shapes, slides, tables, text  # noqa: E402
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(ppt, "_app", None)
+    monkeypatch.setattr(ppt, "_target_pres_full_name", None)
+    fake = FakeApplication(Latency(sleep=False))
+    fake.Presentations.Add()
+    attach(fake)
+    yield fake
+    ppt._invalidate_handles()
+
+
+def test_slides_shapes_and_text_round_trip(app):
+    slides._add_slide_impl(None, None, "title_only", count=2)
+    text._set_text_impl(1, 1, "Quarterly review")
+    shapes._add_textbox_impl(2, 60, 150, 300, 60, "First\nSecond", None, 20, True, None, None, None, None)
+
+    result = text._get_all_text_impl([1, 2])
+    assert [s["slide_id"] for s in result["slides"]] == [256, 257]
+    assert "Quarterly review" in result["slides"][0]["markdown"]
+
+    info = text._get_text_impl(2, "TextBox 2")
+    assert info["paragraph_count"] == 2
+    assert info["runs"][0]["bold"] is True and info["runs"][0]["font_size"] == 20
+
+
+def test_text_range_units_find_and_soft_breaks(app):
+    slide = app.ActivePresentation.Slides.Add(1, 12)
+    tr = slide.Shapes.AddTextbox(1, 0, 0, 400, 50).TextFrame.TextRange
+    tr.Text = "alpha beta\ngamma"
+    assert tr.Paragraphs().Count == 2
+    assert tr.Paragraphs(2).Text == "gamma"
+    tr.Characters(5, 0).InsertBefore("\v")
+    assert tr.Paragraphs(1).Lines(1).Text == "alph\n"
+    tr.Paragraphs(1).Characters(1, 4).Font.Bold = -1
+    assert tr.Runs().Count == 3
+    assert tr.Font.Bold == -2
+    assert tr.Replace("gamma", "delta").Text == "delta"
+    assert tr.Find("missing") is None
+
+
+def test_line_wrap_follows_width(app):
+    shape = app.ActivePresentation.Slides.Add(1, 12).Shapes.AddTextbox(1, 0, 0, 600, 50)
+    tr = shape.TextFrame.TextRange
+    tr.Text = "one two three four five six seven"
+    assert tr.Lines().Count == 1
+    shape.Width = 100
+    assert tr.Lines().Count > 1
+    assert tr.BoundHeight > 18 * 1.2
+
+
+def test_typography_fix_widens_widow_box(app):
+    slides._add_slide_impl(None, None, "blank")
+    shapes._add_textbox_impl(1, 10, 10, 150, 60, "A fairly long sentence that wraps across lines to",
+                             None, 24, None, None, None, None, None)
+    result = text._check_typography_impl([1], 10, 1, True, 100)
+    assert result["fixed_count"] == 1 and result["remaining"] == 0
+    assert result["fixed"][0]["new_width"] > 150
+
+
+def test_table_and_chart_data(app):
+    slides._add_slide_impl(None, None, "title_only", count=2)
+    tables._add_table_impl(1, 3, 2, 50, 150, 400, 120, None, None)
+    tables._set_table_data_impl(1, "Table 2", [["Name", "Score"], ["A", "1"]], 1, 1, True)
+    data = tables._get_table_data_impl(1, "Table 2", False)
+    assert data["data"][:2] == [["Name", "Score"], ["A", "1"]]
+    styled = tables._get_table_data_impl(1, "Table 2", True)
+    assert [len(row) for row in styled["format"]] == [2, 2, 2]
+    assert all(isinstance(i, int) and i < len(styled["styles"]) for row in styled["format"] for i in row)
+
+    charts._add_chart_impl(2, "column", 50, 50, 400, 300)
+    charts._set_chart_data_impl(2, "Chart 2", ["Q1", "Q2"], [{"name": "Rev", "values": [3, 4]}])
+    got = charts._get_chart_data_impl(2, "Chart 2")
+    assert got["categories"] == ["Q1", "Q2"]
+    assert got["series"] == [{"name": "Rev", "values": [3, 4]}]
+
+
+def test_latency_model_counts_and_accumulates():
+    fake = FakeApplication(Latency(get=0.001, set=0.002, call=0.003, slow={"Export": 0.5}, sleep=False))
+    pres = fake.Presentations.Add()
+    fake.reset_counters()
+    slide = pres.Slides.Add(1, 12)       # get Slides, call Add
+    slide.FollowMasterBackground = 0     # set
+    assert fake.counters == {"get": 1, "set": 1, "call": 1}
+    assert fake.simulated_s == pytest.approx(0.006)
+    slide.Export  # member lookup of a slow method
+    assert fake.simulated_s == pytest.approx(0.506)
+
+
+def test_batch_apply_format_text(app):
+    slides._add_slide_impl(None, None, "blank")
+    shapes._add_textbox_impl(1, 10, 10, 300, 60, "Restyle me", None, 20, None, None, None, None, None)
+    result = batch_apply._batch_apply_impl(1, ["TextBox 1"], [
+        {"tool": "format_text", "params": {"font_name": "Segoe UI", "color": "#1F2937"}},
+    ])
+    assert result["results"][0]["operations"] == [{"tool": "format_text", "status": "success"}]
+    font = app.ActivePresentation.Slides(1).Shapes("TextBox 1").TextFrame.TextRange.Font
+    assert font.Name == "Segoe UI"
@@ -0,0 +1,239 @@
+"""Tests for multi-pattern find/replace (utils/text_match.py, ppt_find_replace_many).
+
+Pure Python tests — a fake rich-text TextRange keeps per-character
+formatting so run preservation can be checked without PowerPoint.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import text as text_mod  # noqa: E402
+from utils.text_match import AhoCorasick, MultiMatcher, apply_matches, utf16_offsets  # noqa: E402
+
+
+def _rules(*pairs, regex=False):
+    return [{"find": f, "replace": r, "regex": regex} for f, r in pairs]
+
+
+# --- Matcher -----------------------------------------------------------------
+
+def test_aho_corasick_finds_overlapping_occurrences():
+    ac = AhoCorasick(["he", "she", "hers"])
+    found = sorted(ac.iter_matches("ushers"))
+    assert found == [(1, 4, 1), (2, 4, 0), (2, 6, 2)]
+
+
+def test_leftmost_longest_and_no_cascade():
+    m = MultiMatcher(_rules(("Acme", "Globex"), ("Acme Corp", "Globex Inc"), ("Globex", "Initech")))
+    text = "Acme Corp and Acme and Globex"
+    assert apply_matches(text, m.find(text)) == "Globex Inc and Globex and Initech"
+
+
+def test_case_and_whole_words():
+    m = MultiMatcher(_rules(("cat", "dog")), whole_words=True)
+    assert apply_matches("Cat catalog cat.", m.find("Cat catalog cat.")) == "dog catalog dog."
+    strict = MultiMatcher(_rules(("cat", "dog")), match_case=True)
+    assert apply_matches("Cat cat", strict.find("Cat cat")) == "Cat dog"
+
+
+def test_regex_entries_expand_groups():
+    m = MultiMatcher(_rules((r"(\d+)%", r"\1 percent"), regex=True)
+                     + _rules(("FY", "fiscal year")))
+    text = "FY growth 12% vs 8%"
+    assert apply_matches(text, m.find(text)) == "fiscal year growth 12 percent vs 8 percent"
+
+
+def test_invalid_regex_raises_value_error():
+    with pytest.raises(ValueError, match="entry 1"):
+        MultiMatcher(_rules(("(", "x"), regex=True))
+
+
+def test_utf16_offsets_for_astral_characters():
+    assert utf16_offsets("abc") is None
+    assert utf16_offsets("a😀b") == [0, 1, 3, 4]
+
+
+# --- COM write-back ----------------------------------------------------------
+
+class _Color:
+    def __init__(self, chars):
+        self._chars = chars
+
+    @property
+    def RGB(self):
+        return self._chars[0]["color"]
+
+    @RGB.setter
+    def RGB(self, value):
+        for c in self._chars:
+            c["color"] = value
+
+
+class _Font:
+    def __init__(self, chars):
+        self.__dict__["_chars"] = chars
+        self.__dict__["Color"] = _Color(chars)
+
+    _ATTRS = {"Bold": "bold", "Italic": "italic", "Underline": "underline",
+              "Size": "size", "Name": "name"}
+
+    def __getattr__(self, attr):
+        if attr == "NameFarEast":
+            raise AttributeError(attr)
+        return self._chars[0][self._ATTRS[attr]]
+
+    def __setattr__(self, attr, value):
+        for c in self._chars:
+            c[self._ATTRS[attr]] = value
+
+
+class _Range:
+    """Characters(start, length) view over a list of formatted characters."""
+
+    def __init__(self, frame, start=1, length=None):
+        self._frame = frame
+        self.Start = start
+        self._length = length
+
+    @property
+    def Length(self):
+        if self._length is None:
+            return len(self._frame.chars) - self.Start + 1
+        return self._length
+
+    @property
+    def _chars(self):
+        return self._frame.chars[self.Start - 1:self.Start - 1 + self.Length]
+
+    @property
+    def Text(self):
+        return "".join(c["ch"] for c in self._chars)
+
+    @Text.setter
+    def Text(self, value):
+        chars = self._frame.chars
+        i = self.Start - 1
+        template = dict(chars[i]) if i < len(chars) else dict(chars[-1])
+        new = [{**template, "ch": ch} for ch in value]
+        chars[i:i + self.Length] = new
+        self._frame.writes += 1
+
+    @property
+    def Font(self):
+        return _Font(self._chars)
+
+    def Characters(self, start, length):
+        return _Range(self._frame, self.Start + start - 1, length)
+
+    def _run_list(self):
+        runs, start = [], 1
+        chars = self._frame.chars
+        for i in range(1, len(chars) + 1):
+            if i == len(chars) or {k: v for k, v in chars[i].items() if k != "ch"} != \
+                    {k: v for k, v in chars[i - 1].items() if k != "ch"}:
+                runs.append(_Range(self._frame, start, i - start + 1))
+                start = i + 1
+        return runs
+
+    def Runs(self, i=None):
+        runs = self._run_list()
+        if i is None:
+            return type("Runs", (), {"Count": len(runs)})()
+        return runs[i - 1]
+
+
+class _Frame:
+    def __init__(self, segments):
+        self.chars = []
+        for seg_text, bold in segments:
+            for ch in seg_text:
+                self.chars.append({"ch": ch, "bold": bold, "italic": 0, "underline": 0,
+                                   "size": 18, "color": 0, "name": "Arial"})
+        self.writes = 0
+
+    @property
+    def TextRange(self):
+        return _Range(self)
+
+
+class _Shape:
+    HasTextFrame = True
+
+    def __init__(self, name, segments):
+        self.Name = name
+        self.TextFrame = _Frame(segments)
+
+
+class _Coll:
+    def __init__(self, items):
+        self._items = items
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def __call__(self, i):
+        return self._items[i - 1]
+
+
+class _Slide:
+    def __init__(self, shapes):
+        self.Shapes = _Coll(shapes)
+
+
+class _Pres:
+    def __init__(self, slides):
+        self.Slides = _Coll(slides)
+
+
+@pytest.fixture
+def deck(monkeypatch):
+    pres = _Pres([
+        _Slide([_Shape("Title", [("Acme ", 0), ("Corp", -1), (" report", 0)])]),
+        _Slide([_Shape("Body", [("No terms here", 0)])]),
+    ])
+    monkeypatch.setattr(text_mod.ppt, "_get_pres_impl", lambda: pres)
+    return pres
+
+
+def _frame(pres, slide):
+    return pres.Slides(slide).Shapes(1).TextFrame
+
+
+def test_replace_preserves_surrounding_runs(deck):
+    result = text_mod._find_replace_many_impl(
+        _rules(("report", "summary")), False, False, False, None, None, 5,
+    )
+    frame = _frame(deck, 1)
+    assert frame.TextRange.Text == "Acme Corp summary"
+    assert [c["bold"] for c in frame.chars[5:9]] == [-1] * 4
+    assert result["match_count"] == 1 and result["shapes_changed"] == 1
+    assert result["matches"][0]["start"] == 11
+    assert result["matches"][0]["context"] == "Corp [summary]"
+    assert _frame(deck, 2).writes == 0
+
+
+def test_cross_run_match_keeps_formatting_proportionally(deck):
+    text_mod._find_replace_many_impl(
+        _rules(("Acme Corp", "Globex Incorporated")), False, False, False, None, None, 0,
+    )
+    frame = _frame(deck, 1)
+    assert frame.TextRange.Text == "Globex Incorporated report"
+    bold = [c["bold"] for c in frame.chars[:19]]
+    assert bold[0] == 0 and bold[-1] == -1
+
+
+def test_dry_run_writes_nothing(deck):
+    result = text_mod._find_replace_many_impl(
+        _rules(("acme", "x"), ("missing", "y")), True, False, False, [1], None, 0,
+    )
+    assert result["mode"] == "find"
+    assert result["entries"] == [{"entry": 1, "find": "acme", "count": 1}]
+    assert result["unmatched_entries"] == 1
+    assert _frame(deck, 1).writes == 0
@@ -0,0 +1,138 @@
+"""Tests for minimal-write font normalization (ppt_com/font_normalize.py).
+
+Runs the ppt_set_default_fonts tool function against the in-process fake
+PowerPoint, whose COM counters show how many property writes were made.
+execute_async runs inline, one call per COM job (theme, masters, each
+chunk of slides).
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from utils import progress as progress_mod  # noqa: E402
+from utils.com_wrapper import ppt  # noqa: E402
+from utils.fake_ppt import FakeApplication, Latency, attach  # noqa: E402
+from ppt_com import shapes, slides, tables  # noqa: E402
+from ppt_com.advanced_ops import SetDefaultFontsInput, set_default_fonts  # noqa: E402
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(ppt, "_app", None)
+    monkeypatch.setattr(ppt, "_target_pres_full_name", None)
+    fake = FakeApplication(Latency(sleep=False))
+    fake.Presentations.Add()
+    attach(fake)
+    slides._add_slide_impl(None, None, "blank", count=2)
+    shapes._add_textbox_impl(1, 10, 10, 300, 60, "Mixed fonts here", None, 20,
+                             None, None, None, None, None)
+    tables._add_table_impl(2, 2, 2, 50, 150, 400, 120, None, None)
+    tables._set_table_data_impl(2, "Table 1", [["A", "B"], ["C", "D"]], 1, 1, False)
+    pres = fake.ActivePresentation
+    pres.Slides(1).NotesPage.Shapes(1).TextFrame.TextRange.Text = "Speaker notes"
+    pres.SlideMaster.Shapes.AddTextbox(1, 10, 500, 200, 20).TextFrame.TextRange.Text = "Footer"
+
+    fake.jobs = []
+
+    async def inline(func, *args, **kwargs):
+        fake.jobs.append(func.__name__)
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(ppt, "execute_async", inline)
+    monkeypatch.setattr(progress_mod, "CHUNK_SIZE", 1)  # one COM job per slide
+    yield fake
+    ppt._invalidate_handles()
+
+
+def _run(app, **params):
+    """Call the tool; returns (result, property sets made)."""
+    app.reset_counters()
+    result = json.loads(asyncio.run(set_default_fonts(SetDefaultFontsInput(**params))))
+    return result, app.counters["set"]
+
+
+def test_only_differing_runs_are_written_and_rerun_is_free(app):
+    pres = app.ActivePresentation
+    box = pres.Slides(1).Shapes("TextBox 1").TextFrame.TextRange
+    box.Characters(1, 5).Font.Name = "Segoe UI"
+
+    result, sets = _run(app, latin="Segoe UI")
+    assert app.jobs.count("_apply_fonts_to_slides_impl") == 2  # chunks merged below
+    assert result["slides_processed"] == 2
+    assert result["fonts_before"]["latin"]["Segoe UI"] == 1  # the mixed box, per run
+    assert result["fonts_after"]["latin"] == {"Segoe UI": result["text_ranges_checked"] + 1}
+    assert result["changed_by_location"]["tables"] == 4
+    assert result["changed_by_location"]["notes"] >= 1
+    assert result["changed_by_location"]["masters"] == 1
+    assert sets == result["property_writes"] == result["shapes_updated"]
+    assert box.Font.Name == "Segoe UI"
+    assert pres.Slides(2).Shapes("Table 1").Table.Cell(2, 2).Shape.TextFrame.TextRange.Font.Name == "Segoe UI"
+
+    again, sets = _run(app, latin="Segoe UI")
+    assert (again["shapes_updated"], again["property_writes"], sets) == (0, 0, 0)
+    assert again["already_correct"] == again["text_ranges_checked"] == result["text_ranges_checked"]
+
+
+def test_only_the_differing_property_is_written(app):
+    first, _ = _run(app, latin="Segoe UI", east_asian="Meiryo")
+    assert first["property_writes"] == 2 * first["shapes_updated"]
+
+    result, sets = _run(app, latin="Segoe UI", east_asian="Yu Gothic")
+    assert result["property_writes"] == result["shapes_updated"] == sets
+    assert result["fonts_before"]["east_asian"] == {"Meiryo": result["text_ranges_checked"]}
+
+
+def test_notes_and_masters_can_be_left_out(app):
+    result, _ = _run(app, latin="Segoe UI", include_notes=False, include_masters=False)
+    assert "_normalize_master_fonts_impl" not in app.jobs
+    assert set(result["changed_by_location"]) == {"slides", "tables"}
+    notes = app.ActivePresentation.Slides(1).NotesPage.Shapes(1).TextFrame.TextRange
+    assert notes.Font.Name != "Segoe UI"
+
+
+def test_dry_run_writes_nothing(app):
+    result, sets = _run(app, latin="Segoe UI", dry_run=True)
+    assert result["dry_run"] is True and result["shapes_updated"] > 0
+    assert sets == 0
+    assert _run(app, latin="Segoe UI")[0]["shapes_updated"] == result["shapes_updated"]
+
+
+class _ThemeFonts:
+    """ThemeFontScheme stand-in (the fake has no themes)."""
+
+    def __init__(self, major, minor):
+        self._fonts = {("major", 1): SimpleNamespace(Name=major),
+                       ("minor", 1): SimpleNamespace(Name=minor),
+                       ("major", 3): SimpleNamespace(Name=""),
+                       ("minor", 3): SimpleNamespace(Name="")}
+
+    def MajorFont(self, script):
+        return self._fonts["major", script]
+
+    def MinorFont(self, script):
+        return self._fonts["minor", script]
+
+
+def test_dry_run_does_not_count_text_that_follows_the_theme(app):
+    scheme = _ThemeFonts("Calibri Light", "Calibri")
+    master = app.ActivePresentation.Designs(1).SlideMaster
+    master.__dict__["Theme"] = SimpleNamespace(ThemeFontScheme=scheme)
+
+    result, sets = _run(app, latin="Segoe UI", dry_run=True)
+    assert sets == 0 and scheme.MinorFont(1).Name == "Calibri"
+    assert result["theme_fonts_replaced"] == {"latin": ["Calibri", "Calibri Light"]}
+    # Every range is in the theme's minor font, so a real run writes none of them.
+    assert (result["shapes_updated"], result["property_writes"]) == (0, 0)
+    assert result["fonts_after"]["latin"] == {"Segoe UI": result["text_ranges_checked"]}
+
+    both, _ = _run(app, latin="Segoe UI", east_asian="Meiryo", dry_run=True)
+    assert both["property_writes"] == both["shapes_updated"] == both["text_ranges_checked"]
@@ -0,0 +1,134 @@
+"""Tests for the resolved app/presentation handle cache in PowerPointCOMWrapper.
+
+The wrapper caches the target presentation's dispatch object so that
+_get_pres_impl() does not walk app.Presentations or re-activate the window on
+every tool call. These tests use MagicMock stand-ins for the COM objects.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock
+
+import pywintypes
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from utils.com_wrapper import PowerPointCOMWrapper  # noqa: E402
+
+
+def _make_app(full_names, active=None):
+    """Build a fake Application with presentations named by FullName."""
+    app = MagicMock()
+    app.Name = "Microsoft PowerPoint"
+    pres_list = []
+    for name in full_names:
+        p = MagicMock()
+        p.FullName = name
+        pres_list.append(p)
+    app.Presentations.Count = len(pres_list)
+    app.Presentations.side_effect = lambda i: pres_list[i - 1]
+    app.ActivePresentation.FullName = active or full_names[0]
+    return app, pres_list
+
+
+def _wrapper_with(app, target):
+    w = PowerPointCOMWrapper()
+    w._app = app
+    w._target_pres_full_name = target
+    return w
+
+
+def test_same_task_lookup_makes_no_com_calls():
+    app, pres_list = _make_app(["C:\\a.pptx", "C:\\b.pptx"], active="C:\\b.pptx")
+    w = _wrapper_with(app, "C:\\b.pptx")
+    w._task_seq = 1
+
+    first = w._get_pres_impl()
+    assert first is pres_list[1]
+    app.Presentations.reset_mock()
+
+    second = w._get_pres_impl()
+    assert second is first
+    app.Presentations.assert_not_called()
+    assert w.get_handle_cache_stats()["pres_cache_hits"] == 1
+
+
+def test_new_task_revalidates_without_scanning():
+    app, pres_list = _make_app(["C:\\a.pptx", "C:\\b.pptx"], active="C:\\b.pptx")
+    w = _wrapper_with(app, "C:\\b.pptx")
+    w._task_seq = 1
+    w._get_pres_impl()
+
+    w._task_seq = 2
+    app.Presentations.reset_mock()
+    assert w._get_pres_impl() is pres_list[1]
+    app.Presentations.assert_not_called()
+
+    stats = w.get_handle_cache_stats()
+    assert stats["pres_scans"] == 1
+    assert stats["pres_revalidations"] == 1
+    assert stats["lookups_avoided"] >= 1
+
+
+def test_window_only_activated_when_another_deck_is_active():
+    app, pres_list = _make_app(["C:\\a.pptx", "C:\\b.pptx"], active="C:\\b.pptx")
+    w = _wrapper_with(app, "C:\\b.pptx")
+    w._task_seq = 1
+    w._get_pres_impl()
+    pres_list[1].Windows.assert_not_called()
+
+    # The user switched to another deck in the UI.
+    app.ActivePresentation.FullName = "C:\\a.pptx"
+    w._task_seq = 2
+    w._get_pres_impl()
+    pres_list[1].Windows.return_value.Activate.assert_called_once()
+
+    stats = w.get_handle_cache_stats()
+    assert stats["window_activations"] == 1
+    assert stats["window_activations_skipped"] == 1
+
+
+def test_closed_target_falls_back_to_active_presentation():
+    app, pres_list = _make_app(["C:\\a.pptx", "C:\\b.pptx"], active="C:\\b.pptx")
+    w = _wrapper_with(app, "C:\\b.pptx")
+    w._task_seq = 1
+    w._get_pres_impl()
+
+    # Target closed: the cached dispatch is now dead.
+    type(pres_list[1]).FullName = PropertyMock(
+        side_effect=pywintypes.com_error(-2147023174, "RPC server unavailable", None, None)
+    )
+    app.Presentations.side_effect = lambda i: pres_list[0]
+    app.Presentations.Count = 1
+    w._task_seq = 2
+
+    assert w._get_pres_impl() is app.ActivePresentation
+    assert w._target_pres_full_name is None
+    assert w._pres is None
+
+
+def test_target_change_bypasses_cache():
+    app, pres_list = _make_app(["C:\\a.pptx", "C:\\b.pptx"], active="C:\\a.pptx")
+    w = _wrapper_with(app, "C:\\a.pptx")
+    w._task_seq = 1
+    assert w._get_pres_impl() is pres_list[0]
+
+    # Tools like ppt_open_presentation set the target attribute directly.
+    w._target_pres_full_name = "C:\\b.pptx"
+    assert w._get_pres_impl() is pres_list[1]
+
+
+def test_app_probe_skipped_within_a_task():
+    app, _ = _make_app(["C:\\a.pptx"])
+    w = _wrapper_with(app, None)
+    w._task_seq = 1
+    w._get_app_impl()
+    w._get_app_impl()
+    w._get_app_impl()
+    stats = w.get_handle_cache_stats()
+    assert stats["app_validations"] == 1
+    assert stats["app_validations_skipped"] == 2
@@ -0,0 +1,95 @@
+"""Tests for src/utils/http_fetch.py against a local HTTP server (no internet)."""
+
+import asyncio
+import sys
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+import utils.http_fetch as http_fetch  # noqa: E402
+
+_SVG = b'<svg xmlns="http://www.w3.org/2000/svg"><path d="M0"/></svg>'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    connections = set()
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        if self.path == "/icon.svg":
+            self._send(200, _SVG, "image/svg+xml")
+        elif self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/icon.svg")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._send(404, b"nope", "text/plain")
+
+    def _send(self, code, body, ctype):
+        self.send_response(code)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    for var in ("http_proxy", "HTTP_PROXY", "https_proxy", "HTTPS_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+    _Handler.connections = set()
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_fetch_returns_body_and_content_type(server):
+    body, ctype = http_fetch.fetch_url(server + "/icon.svg")
+    assert body == _SVG
+    assert ctype == "image/svg+xml"
+
+
+def test_connections_are_reused(server):
+    for _ in range(5):
+        http_fetch.fetch_url(server + "/icon.svg")
+    assert len(_Handler.connections) == 1
+
+
+def test_redirect_is_followed(server):
+    body, _ = http_fetch.fetch_url(server + "/moved")
+    assert body == _SVG
+
+
+def test_http_error_is_raised_like_urlopen(server):
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        http_fetch.fetch_url(server + "/missing.svg")
+    assert exc.value.code == 404
+
+
+def test_connection_failure_is_urlerror():
+    with pytest.raises(urllib.error.URLError):
+        http_fetch.fetch_url("http://127.0.0.1:9/x", timeout=2)
+
+
+def test_run_io_runs_off_the_event_loop_thread():
+    async def main():
+        return await http_fetch.run_io(threading.current_thread)
+
+    worker = asyncio.run(main())
+    assert worker is not threading.current_thread()
+    assert worker.name.startswith("ppt-io")
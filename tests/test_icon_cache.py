@@ -0,0 +1,150 @@
+"""Tests for src/utils/icon_cache.py.
+
+Pure Python tests — no COM or network. urllib.request.urlopen (metadata) and
+fetch_url (SVGs) are replaced with a fake that records requests and serves
+canned responses.
+"""
+
+import io
+import json
+import os
+import sys
+import time
+import urllib.error
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+import utils.icon_cache as icon_cache_mod  # noqa: E402
+from utils.icon_cache import ICON_METADATA_URL, IconCache  # noqa: E402
+
+_METADATA_BODY = ")]}'\n" + json.dumps({
+    "icons": [
+        {"name": "home", "tags": ["house"], "categories": ["action"], "popularity": 900},
+        {"name": "bolt", "tags": ["energy"], "categories": ["toggle"], "popularity": 500},
+    ]
+})
+
+
+class _Resp(io.BytesIO):
+    def __init__(self, body: bytes, headers=None):
+        super().__init__(body)
+        self.headers = headers or {}
+
+
+class _FakeNet:
+    """Stand-in for urlopen: counts requests, supports ETag / 304."""
+
+    def __init__(self):
+        self.requests = []
+        self.etag = '"v1"'
+        self.svgs = {}
+
+    def urlopen(self, req, timeout=None):
+        url = req if isinstance(req, str) else req.full_url
+        headers = {} if isinstance(req, str) else dict(req.header_items())
+        self.requests.append((url, headers))
+        if url == ICON_METADATA_URL:
+            if headers.get("If-none-match") == self.etag:
+                raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+            return _Resp(_METADATA_BODY.encode("utf-8"), {"ETag": self.etag})
+        if url in self.svgs:
+            return _Resp(self.svgs[url])
+        raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+
+    def fetch_url(self, url, timeout=None):
+        resp = self.urlopen(url, timeout)
+        return resp.read(), resp.headers.get("Content-Type", "")
+
+
+@pytest.fixture
+def net(monkeypatch):
+    fake = _FakeNet()
+    monkeypatch.setattr(icon_cache_mod.urllib.request, "urlopen", fake.urlopen)
+    monkeypatch.setattr(icon_cache_mod, "fetch_url", fake.fetch_url)
+    return fake
+
+
+def _svg(n: int) -> bytes:
+    return (f'<svg xmlns="http://www.w3.org/2000/svg"><path d="M{n}"/></svg>').encode()
+
+
+def test_metadata_persists_across_instances(tmp_path, net):
+    IconCache(root=str(tmp_path)).get_metadata()
+    assert len(net.requests) == 1
+
+    icons = IconCache(root=str(tmp_path)).get_metadata()
+    assert [i["name"] for i in icons] == ["home", "bolt"]
+    assert len(net.requests) == 1  # second instance read the disk copy
+
+
+def test_expired_metadata_is_revalidated_with_etag(tmp_path, net):
+    cache = IconCache(root=str(tmp_path))
+    cache.get_metadata()
+    cache._meta["fetched_at"] = time.time() - icon_cache_mod.METADATA_TTL - 1
+
+    cache.get_metadata()
+    url, headers = net.requests[-1]
+    assert headers.get("If-none-match") == '"v1"'
+    assert cache.stats()["metadata_revalidated"] == 1
+
+
+def test_stale_metadata_served_when_network_fails(tmp_path, net, monkeypatch):
+    cache = IconCache(root=str(tmp_path))
+    cache.get_metadata()
+    cache._meta["fetched_at"] = 0
+
+    def down(*args, **kwargs):
+        raise urllib.error.URLError("offline")
+
+    monkeypatch.setattr(icon_cache_mod.urllib.request, "urlopen", down)
+    assert len(cache.get_metadata()) == 2
+    assert cache.stats()["metadata_stale_served"] == 1
+
+
+def test_svg_downloaded_once_then_served_from_disk(tmp_path, net):
+    url = "https://cdn.example/outlined/home.svg"
+    net.svgs[url] = _svg(1)
+
+    first = IconCache(root=str(tmp_path)).get_svg(url)
+    second = IconCache(root=str(tmp_path)).get_svg(url)
+    assert first == second
+    assert [u for u, _ in net.requests] == [url]
+
+
+def test_svg_404_propagates(tmp_path, net):
+    with pytest.raises(urllib.error.HTTPError):
+        IconCache(root=str(tmp_path)).get_svg("https://cdn.example/outlined/nope.svg")
+
+
+def test_offline_mode_never_hits_network(tmp_path, net):
+    cache = IconCache(root=str(tmp_path), offline=True)
+    with pytest.raises(RuntimeError, match="offline"):
+        cache.get_svg("https://cdn.example/outlined/home.svg")
+    with pytest.raises(RuntimeError, match="offline"):
+        cache.get_metadata()
+    assert net.requests == []
+
+
+def test_lru_eviction_keeps_store_bounded(tmp_path, net):
+    size = len(_svg(1))
+    cache = IconCache(root=str(tmp_path), max_bytes=size * 2)
+    urls = [f"https://cdn.example/outlined/i{n}.svg" for n in range(3)]
+    for n, url in enumerate(urls):
+        net.svgs[url] = _svg(n)
+
+    cache.get_svg(urls[0])
+    cache.get_svg(urls[1])
+    cache.get_svg(urls[0])  # touch 0 so 1 becomes least recently used
+    cache.get_svg(urls[2])
+
+    assert cache.cached_svg(urls[1]) is None
+    assert cache.cached_svg(urls[0]) is not None
+    stats = cache.stats()
+    assert stats["svg_count"] == 2
+    assert stats["svg_evictions"] == 1
+    assert len(os.listdir(tmp_path / "icons" / "v1" / "svg")) == 2
@@ -0,0 +1,83 @@
+"""Tests for src/utils/icon_index.py.
+
+The index must rank icons exactly like the original linear scan
+(linear_search), so most tests compare both on the same metadata.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from utils.icon_index import IconIndex, linear_search  # noqa: E402
+
+_WORDS = [
+    "arrow", "forward", "back", "home", "house", "chart", "graph", "bar",
+    "settings", "gear", "check", "circle", "calendar", "month", "bolt",
+    "energy", "person", "group", "cloud", "upload", "download", "star", "a",
+]
+_CATEGORIES = ["Action", "Navigation", "Toggle", "Social", "File", "Editor"]
+
+
+def _synthetic_icons(n=400, seed=7):
+    rng = random.Random(seed)
+    icons = []
+    for _ in range(n):
+        name = "_".join(rng.sample(_WORDS, rng.randint(1, 3)))
+        icons.append({
+            "name": name,
+            # Mixed case and duplicates on purpose: the scan lowercases and
+            # counts every occurrence.
+            "tags": [rng.choice(_WORDS).title() for _ in range(rng.randint(0, 5))],
+            "categories": rng.sample(_CATEGORIES, rng.randint(0, 2)),
+            "popularity": rng.randint(0, 20000),
+        })
+    return icons
+
+
+@pytest.fixture(scope="module")
+def icons():
+    return _synthetic_icons()
+
+
+@pytest.fixture(scope="module")
+def index(icons):
+    return IconIndex(icons)
+
+
+@pytest.mark.parametrize("query", [
+    "home", "arrow forward", "arrow_forward", "ar", "a", "chart graph",
+    "GEAR", "  check  ", "nav", "energy bolt", "home home", "zzz", "",
+    "circle check star",
+])
+def test_matches_linear_scan(icons, index, query):
+    expected = linear_search(icons, query, max_results=50)
+    got = index.search(query, max_results=50)["icons"]
+    assert got == expected
+
+
+def test_random_queries_match_linear_scan(icons, index):
+    rng = random.Random(11)
+    for _ in range(200):
+        words = [rng.choice(_WORDS)[: rng.randint(1, 6)] for _ in range(rng.randint(1, 3))]
+        query = " ".join(words)
+        assert index.search(query, 30)["icons"] == linear_search(icons, query, 30), query
+
+
+def test_fuzzy_only_when_a_word_matches_nothing(index):
+    exact = index.search("calendar", 10, fuzzy=True)
+    assert exact["fuzzy"] == {}
+
+    typo = index.search("calender", 10, fuzzy=True)
+    assert "calender" in typo["fuzzy"]
+    assert "calendar" in typo["fuzzy"]["calender"]
+    assert any("calendar" in i["name"] for i in typo["icons"])
+
+
+def test_fuzzy_disabled_returns_nothing_for_typo(index):
+    assert index.search("calender", 10, fuzzy=False)["icons"] == []
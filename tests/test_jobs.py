@@ -0,0 +1,98 @@
+"""Tests for execute timeouts, chunked COM jobs and background job handles.
+
+Pure Python tests — the tool registry is replaced by small async tools and
+execute_async runs inline.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import batch_execute, jobs  # noqa: E402
+from utils import com_scheduler, com_wrapper, progress as progress_mod  # noqa: E402
+from utils.progress import Progress, tracked  # noqa: E402
+
+
+def test_execute_timeout_per_lane_and_tool(monkeypatch):
+    com_scheduler.register_tool("ppt_export_images", {"readOnlyHint": False})
+    monkeypatch.setattr(com_wrapper, "_TOOL_TIMEOUTS", {"ppt_get_all_text": 90.0})
+    assert com_wrapper.execute_timeout("ppt_export_images") == com_wrapper.BULK_EXECUTE_TIMEOUT
+    assert com_wrapper.execute_timeout("ppt_get_all_text") == 90.0
+    assert com_wrapper.execute_timeout(None) == com_wrapper.EXECUTE_TIMEOUT
+    assert com_wrapper._parse_tool_timeouts("a=5, b=x ,") == {"a": 5.0}
+
+
+def test_chunks_are_separate_com_jobs(monkeypatch):
+    jobs_run = []
+
+    async def inline(func, *args, **kwargs):
+        jobs_run.append(kwargs["slide_indices"])
+        return func(*args, **kwargs)
+
+    def impl(offset, slide_indices, progress=None):
+        return [offset + i for i in tracked(slide_indices, progress)]
+
+    monkeypatch.setattr(progress_mod.ppt, "execute_async", inline)
+    progress = Progress()
+    parts = asyncio.run(progress.execute_chunked(impl, [1, 2, 3, 4, 5], 10, chunk_size=2))
+    assert jobs_run == [[1, 2], [3, 4], [5]]
+    assert parts == [[11, 12], [13, 14], [15]]
+    assert (progress.done, progress.total, progress.partial()) == (5, 5, {})
+
+
+class _SlowInput(BaseModel):
+    slides: int
+
+
+def _install_tool(monkeypatch, release: asyncio.Event):
+    async def tool_slow(params: _SlowInput, ctx: Optional[object] = None) -> str:
+        for i in range(1, params.slides + 1):
+            await ctx.report_progress(i, params.slides)
+            await release.wait()
+        return json.dumps({"success": True, "slides": params.slides})
+
+    monkeypatch.setattr(batch_execute, "_registry", {"ppt_slow": (tool_slow, _SlowInput)})
+    monkeypatch.setattr(jobs, "_jobs", {})
+
+
+def test_job_runs_in_background_and_is_polled(monkeypatch):
+    async def main():
+        release = asyncio.Event()
+        _install_tool(monkeypatch, release)
+        started = json.loads(await jobs.start_job(jobs.StartJobInput(tool="slow", params={"slides": 3})))
+        assert started["status"] == "running"
+        await asyncio.sleep(0)
+        polled = json.loads(await jobs.get_job(jobs.GetJobInput(job_id=started["job_id"])))
+        assert polled["status"] == "running"
+        assert polled["progress"] == {"done": 1, "total": 3, "message": None}
+        release.set()
+        done = json.loads(await jobs.get_job(jobs.GetJobInput(job_id=started["job_id"], wait_s=1)))
+        return done
+
+    done = asyncio.run(main())
+    assert done["status"] == "done"
+    assert done["result"] == {"success": True, "slides": 3}
+
+
+def test_job_cancel_and_bad_input(monkeypatch):
+    async def main():
+        _install_tool(monkeypatch, asyncio.Event())
+        bad = json.loads(await jobs.start_job(jobs.StartJobInput(tool="slow", params={})))
+        unknown = json.loads(await jobs.start_job(jobs.StartJobInput(tool="nope")))
+        started = json.loads(await jobs.start_job(jobs.StartJobInput(tool="slow", params={"slides": 2})))
+        await asyncio.sleep(0)
+        cancelled = json.loads(await jobs.cancel_job(jobs.CancelJobInput(job_id=started["job_id"])))
+        return bad, unknown, cancelled
+
+    bad, unknown, cancelled = asyncio.run(main())
+    assert "slides" in bad["error"]
+    assert "Unknown tool" in unknown["error"]
+    assert cancelled["status"] == "cancelled"
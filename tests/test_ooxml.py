@@ -0,0 +1,144 @@
+"""Tests for the offline OOXML backend (utils/ooxml.py).
+
+Pure Python tests — a small .pptx is assembled from XML strings (the
+make_pptx fixture in conftest.py), so reading, editing and the process pool
+can be checked without PowerPoint.
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from utils import ooxml  # noqa: E402
+
+@pytest.fixture
+def deck(tmp_path, make_pptx):
+    return make_pptx(tmp_path / "deck.pptx")
+
+
+def test_get_all_text_reads_titles_tables_and_notes(deck):
+    result = ooxml.read_file(str(deck), "get_all_text")
+    text = result["text"]
+    assert result["slides_count"] == 2
+    assert text.startswith("== Slide 1 ==\n# Quarterly Review\n")
+    assert "Hello World and world" in text
+    assert "  Second line" in text
+    assert "| Region | Q1 |\n| --- | --- |\n| EMEA | 12 |" in text
+    assert "Grouped" in text
+    assert "[Notes] Mention the EMEA dip" in text
+    assert "== Slide 2 (hidden) ==\nBackup slide" in text
+
+
+def test_list_shapes_inherits_placeholder_geometry(deck):
+    shapes = ooxml.read_file(str(deck), "list_shapes", [1])["slides"][0]["shapes"]
+    by_name = {s["name"]: s for s in shapes}
+    assert [s["type_name"] for s in shapes] == ["Placeholder", "TextBox", "Table", "Chart", "Group"]
+    title = by_name["Title 1"]
+    assert (title["left"], title["top"], title["width"]) == (50.0, 30.0, 800.0)
+    assert title["placeholder_type"] == 1
+    assert by_name["TextBox 2"]["text_preview"] == "Hello World and world\nSecond\nline"
+    assert by_name["Table 3"]["has_table"] is True
+
+
+def test_group_children_are_mapped_to_slide_coordinates(deck):
+    with ooxml.Package(str(deck)) as pkg:
+        group = ooxml.slide_shapes(pkg, pkg.slides[0])[-1]
+    inner = group["children"][0]
+    # child space is scaled by 0.5 and offset by 100 pt
+    assert (inner["left"], inner["top"], inner["width"]) == (105.0, 10.0, 50.0)
+
+
+def test_tables_charts_and_comments(deck):
+    tables = ooxml.read_file(str(deck), "get_table_data")["tables"]
+    assert tables == [{"slide_index": 1, "shape_name": "Table 3", "rows": 2, "columns": 2,
+                       "data": [["Region", "Q1"], ["EMEA", "12"]]}]
+    chart = ooxml.read_file(str(deck), "get_chart_data")["charts"][0]
+    assert chart["categories"] == ["Q1", "Q2"]
+    assert chart["series"] == [{"name": "Revenue", "values": [None, 12.5]}]
+    comments = ooxml.read_file(str(deck), "list_comments")["slides"]
+    assert comments[0]["comments"] == [{
+        "author": "Ana Ruiz", "author_initials": "AR", "text": "Check these numbers",
+        "datetime": "2026-01-05T10:00:00", "index": 1,
+    }]
+    assert comments[1]["comments_count"] == 0
+
+
+def test_slide_index_out_of_range(deck):
+    with pytest.raises(ooxml.OoxmlError, match="out of range"):
+        ooxml.read_file(str(deck), "list_shapes", [3])
+
+
+def test_replace_text_across_runs_keeps_other_parts(deck, tmp_path):
+    out = tmp_path / "out.pptx"
+    result = ooxml.edit_file(str(deck), [{"op": "replace_text", "find": "world", "replace": "team",
+                                          "match_case": False}], output_path=str(out))
+    assert result["changes"] == {"replace_text": 2}
+    assert result["parts_changed"] == 1
+    text = ooxml.read_file(str(out), "get_all_text")["text"]
+    assert "Hello team and team" in text
+    with zipfile.ZipFile(deck) as before, zipfile.ZipFile(out) as after:
+        assert before.namelist() == after.namelist()
+        assert before.read("ppt/charts/chart1.xml") == after.read("ppt/charts/chart1.xml")
+        slide = after.read("ppt/slides/slide1.xml").decode()
+    # mc:Ignorable names p14, so its declaration must survive re-serialization
+    assert 'xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main"' in slide
+    # the spanning match lands in its first run; the second run keeps the rest
+    assert "<a:t>Hello team</a:t>" in slide and "<a:t> and team</a:t>" in slide
+
+
+def test_set_font_inserts_elements_in_schema_order(deck):
+    ops = [{"op": "set_font", "font_name": "Segoe UI", "font_name_fareast": "Meiryo"}]
+    first = ooxml.edit_file(str(deck), ops)
+    assert first["saved"] and first["changes"]["set_font"] > 0
+    with zipfile.ZipFile(deck) as z:
+        slide = z.read("ppt/slides/slide1.xml").decode()
+    assert ('<a:solidFill><a:srgbClr val="FF0000" /></a:solidFill><a:latin typeface="Segoe UI" />'
+            '<a:ea typeface="Meiryo" /><a:cs typeface="Arial" />') in slide
+    again = ooxml.edit_file(str(deck), ops)
+    assert again["saved"] is False and again["changes"]["set_font"] == 0
+
+
+def test_edit_refuses_files_open_in_powerpoint(deck):
+    (deck.parent / ("~$" + deck.name)).write_bytes(b"")
+    with pytest.raises(ooxml.OoxmlError, match="open in PowerPoint"):
+        ooxml.edit_file(str(deck), [{"op": "replace_text", "find": "a", "replace": "b"}])
+
+
+def test_run_batch_isolates_failures_across_processes(tmp_path, make_pptx):
+    good = [str(make_pptx(tmp_path / f"d{i}.pptx")) for i in range(3)]
+    bad = tmp_path / "broken.pptx"
+    bad.write_bytes(b"not a zip")
+    (tmp_path / "~$d0.pptx").write_bytes(b"")
+    paths = ooxml.expand_paths([str(tmp_path / "*.pptx")])
+    assert len(paths) == 4
+    results = ooxml.run_batch(ooxml.read_file, paths, workers=2, operation="get_table_data")
+    assert [r["path"] for r in results] == paths
+    errors = [r for r in results if "error" in r]
+    assert len(errors) == 1 and errors[0]["path"] == str(bad)
+    assert all(r["tables"][0]["rows"] == 2 for r in results if r["path"] in good)
+
+
+def test_extract_slides_drops_parts_only_other_slides_use(deck, tmp_path):
+    out = tmp_path / "slide2.pptx"
+    result = ooxml.extract_slides(str(deck), str(out), [2])
+    assert result["slides"] == 1
+    with zipfile.ZipFile(out) as z:
+        names = set(z.namelist())
+        types = z.read("[Content_Types].xml").decode()
+        pres = z.read("ppt/presentation.xml").decode()
+        slide = z.read("ppt/slides/slide2.xml").decode()
+    for gone in ("ppt/slides/slide1.xml", "ppt/charts/chart1.xml", "ppt/notesSlides/notesSlide1.xml",
+                 "ppt/comments/comment1.xml", "ppt/slides/_rels/slide1.xml.rels"):
+        assert gone not in names
+    assert "ppt/commentAuthors.xml" in names
+    assert "slide1.xml" not in types and "chart1.xml" not in types
+    assert '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">' in types
+    assert 'r:id="rId2"' not in pres and '<p14:sldId id="256"' not in pres
+    assert "hlinkClick" not in slide  # the link pointed at the removed slide
+    assert ooxml.read_file(str(out), "get_all_text")["text"] == "== Slide 1 (hidden) ==\nBackup slide"
@@ -0,0 +1,141 @@
+"""Tests for per-tool performance instrumentation (utils/perf_stats.py).
+
+Pure Python tests — the COM worker runs plain callables and a fake dispatch
+object stands in for PowerPoint, so attribution and counting can be checked
+without COM.
+"""
+
+import asyncio
+import inspect
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+import pywintypes  # noqa: E402
+
+from utils import com_wrapper, perf_stats as perf_mod  # noqa: E402
+from utils.busy_retry import BusyRetryPolicy  # noqa: E402
+from utils.perf_stats import CountingDispatch, PerfStats, com_calls, instrument  # noqa: E402
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    fresh = PerfStats()
+    monkeypatch.setattr(com_wrapper, "perf_stats", fresh)
+    monkeypatch.setattr(perf_mod, "perf_stats", fresh)
+    return fresh
+
+
+@pytest.fixture
+def wrapper():
+    w = com_wrapper.PowerPointCOMWrapper()
+    w.start()
+    yield w
+    w.stop()
+
+
+def _row(stats, tool):
+    return next(r for r in stats.snapshot()["tools"] if r["tool"] == tool)
+
+
+def test_com_time_is_attributed_to_the_calling_tool(stats, wrapper):
+    async def tool():
+        await wrapper.execute_async(lambda: None)
+        await wrapper.execute_async(lambda: None)
+        return json.dumps({"success": True})
+
+    asyncio.run(instrument(tool, "ppt_demo")())
+    row = _row(stats, "ppt_demo")
+    assert row["calls"] == 1 and row["errors"] == 0
+    assert row["com_tasks"] == 2
+    assert row["wall_ms_total"] >= row["com_ms_total"]
+
+
+def test_error_results_are_counted(stats):
+    async def tool():
+        return json.dumps({"error": "Slide 9 not found"})
+
+    asyncio.run(instrument(tool, "ppt_demo")())
+    assert _row(stats, "ppt_demo")["errors"] == 1
+
+
+def test_busy_retries_are_recorded(stats, wrapper, monkeypatch):
+    monkeypatch.setattr(wrapper, "_busy_policy", BusyRetryPolicy(initial_s=0, jitter=0))
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise pywintypes.com_error(-2147418111, "Call was rejected by callee.")
+        return "ok"
+
+    async def tool():
+        return await wrapper.execute_async(flaky)
+
+    assert asyncio.run(instrument(tool, "ppt_demo")()) == "ok"
+    assert _row(stats, "ppt_demo")["busy_retries"] == 2
+
+
+def test_instrument_keeps_signature_for_registration():
+    async def tool(params: dict) -> str:
+        """Doc."""
+        return "{}"
+
+    wrapped = instrument(tool, "ppt_demo")
+    assert inspect.iscoroutinefunction(wrapped)
+    assert inspect.signature(wrapped) == inspect.signature(tool)
+    assert wrapped.__doc__ == "Doc."
+
+
+def test_snapshot_sorts_limits_and_resets(stats):
+    stats.record_call("ppt_a", 0.010, False)
+    stats.record_call("ppt_b", 0.200, False)
+    stats.record_com("ppt_a", 0.5, 0.001)
+    assert [r["tool"] for r in stats.snapshot()["tools"]] == ["ppt_b", "ppt_a"]
+    top = stats.snapshot(sort_by="queue_wait_ms_total", top=1)
+    assert [r["tool"] for r in top["tools"]] == ["ppt_a"]
+    assert top["totals"]["calls"] == 2
+    stats.reset()
+    assert stats.snapshot()["tools"] == []
+    with pytest.raises(ValueError):
+        stats.snapshot(sort_by="nonsense")
+
+
+class _Fake:
+    """Stands in for a COM dispatch object."""
+    _oleobj_ = object()
+
+    def __init__(self):
+        self.Name = "Deck"
+        self.received = None
+
+    @property
+    def Slides(self):
+        return _Fake()
+
+    def __call__(self, i):
+        return _Fake()
+
+    def Range(self, a, b):
+        self.received = (a, b)
+        return _Fake()
+
+
+def test_counting_dispatch_counts_and_unwraps():
+    fake = _Fake()
+    app = CountingDispatch(fake)
+    before = com_calls.snapshot()
+    slide = app.Slides(1)
+    assert isinstance(slide, CountingDispatch)
+    assert app.Name == "Deck"
+    app.Name = "Other"
+    app.Range(slide, 2)
+    assert com_calls.since(before) == (2, 1, 2)  # gets, sets, calls
+    assert fake.Name == "Other"
+    assert isinstance(fake.received[0], _Fake)
@@ -0,0 +1,201 @@
+"""Tests for the slide preview cache (utils/preview_cache.py, ppt_com/preview.py).
+
+Pure Python tests — a fake presentation records Slide.Export calls and
+execute_async runs inline, so the cache flow is checked without PowerPoint.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import preview, slides, tables  # noqa: E402
+from utils import com_scheduler, com_wrapper  # noqa: E402
+from utils.fake_ppt import FakeApplication, Latency, attach  # noqa: E402
+from utils.perf_stats import current_tool  # noqa: E402
+from utils.preview_cache import PreviewCache, preview_key  # noqa: E402
+
+
+# --- PreviewCache ------------------------------------------------------------
+
+def test_key_depends_on_fingerprint_and_size():
+    base = preview_key("C:/deck.pptx", 256, "abc", 640, 360, "png")
+    assert base == preview_key("C:/deck.pptx", 256, "abc", 640, 360, "png")
+    assert base != preview_key("C:/deck.pptx", 256, "abd", 640, 360, "png")
+    assert base != preview_key("C:/deck.pptx", 256, "abc", 320, 180, "png")
+
+
+def test_disk_entry_survives_new_instance(tmp_path):
+    PreviewCache(root=str(tmp_path)).put("k1", "png", b"img")
+    cache = PreviewCache(root=str(tmp_path))
+    assert cache.get("k1", "png") == b"img"
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_memory_lru_is_bounded(tmp_path):
+    cache = PreviewCache(root=str(tmp_path), max_memory_bytes=10, max_disk_bytes=0)
+    cache.put("a", "png", b"12345")
+    cache.put("b", "png", b"12345")
+    cache.get("a", "png")  # a becomes most recent
+    cache.put("c", "png", b"12345")
+    assert cache.get("b", "png") is None
+    assert cache.get("a", "png") == b"12345"
+
+
+def test_disk_store_is_bounded(tmp_path):
+    cache = PreviewCache(root=str(tmp_path), max_memory_bytes=0, max_disk_bytes=10)
+    for key in ("a", "b", "c"):
+        cache.put(key, "png", b"12345")
+    files = list((tmp_path / "previews" / "v1").iterdir())
+    assert len(files) == 2
+
+
+def test_drop_presentation_removes_memory_and_disk_entries(tmp_path):
+    cache = PreviewCache(root=str(tmp_path))
+    cache.put("a", "png", b"1", "C:/one.pptx")
+    cache.put("b", "png", b"2", "C:/two.pptx")
+    assert cache.drop_presentation("C:/one.pptx") == 1
+    assert cache.get("a", "png") is None
+    assert cache.get("b", "png") == b"2"
+    cache.get("b", "png", "C:/two.pptx")
+    assert cache.drop_presentation() == 1
+    assert list((tmp_path / "previews" / "v1").iterdir()) == []
+
+
+def test_write_jobs_drop_cached_previews(monkeypatch, tmp_path):
+    cache = PreviewCache(root=str(tmp_path))
+    monkeypatch.setattr(com_wrapper, "preview_cache", cache)
+    com_scheduler.register_tool("ppt_get_slide_preview", {"readOnlyHint": True})
+    wrapper = com_wrapper.PowerPointCOMWrapper()
+    wrapper.start()
+    try:
+        cache.put("k", "png", b"img", "C:/deck.pptx")
+        token = current_tool.set("ppt_get_slide_preview")
+        try:
+            asyncio.run(wrapper.execute_async(lambda: None))
+        finally:
+            current_tool.reset(token)
+        assert cache.get("k", "png") == b"img"
+        asyncio.run(wrapper.execute_async(lambda: None))  # no tool: write lane
+        assert cache.get("k", "png") is None
+    finally:
+        wrapper.stop()
+
+
+def test_fingerprint_sees_table_cell_edits(monkeypatch):
+    monkeypatch.setattr(preview.ppt, "_app", None)
+    monkeypatch.setattr(preview.ppt, "_target_pres_full_name", None)
+    app = FakeApplication(Latency(sleep=False))
+    app.Presentations.Add()
+    attach(app)
+    try:
+        slides._add_slide_impl(None, None, "blank")
+        tables._add_table_impl(1, 2, 2, 50, 150, 400, 120, None, None)
+        slide = app.ActivePresentation.Slides(1)
+        before = preview._slide_fingerprint(slide)
+        tables._set_table_data_impl(1, "Table 1", [["A", "B"]], 1, 1, False)
+        assert preview._slide_fingerprint(slide) != before
+    finally:
+        preview.ppt._invalidate_handles()
+
+
+# --- Render flow -------------------------------------------------------------
+
+class _FakeCollection:
+    def __init__(self, items):
+        self._items = items
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def __call__(self, i):
+        return self._items[i - 1]
+
+
+class _FakeShape:
+    Type = 1
+    Id = 2
+    Left = Top = 10.0
+    Width = Height = 100.0
+    HasTable = False
+    HasTextFrame = False
+    Rotation = 0.0
+    ZOrderPosition = 1
+    LockAspectRatio = 0
+
+    def __init__(self, name):
+        self.Name = name
+
+
+class _FakeSlide:
+    def __init__(self, slide_id, exports):
+        self.SlideID = slide_id
+        self.Shapes = _FakeCollection([_FakeShape("Title")])
+        self._exports = exports
+
+    def Export(self, path, filter_name, width=None, height=None):
+        self._exports.append((self.SlideID, width, height))
+        with open(path, "wb") as f:
+            f.write(f"slide{self.SlideID}".encode())
+
+
+class _FakePres:
+    FullName = "C:/deck.pptx"
+
+    def __init__(self, exports):
+        self.Slides = _FakeCollection([_FakeSlide(256 + i, exports) for i in range(3)])
+        self.Slides.FindBySlideID = lambda sid: self.Slides(sid - 255)
+
+        class _Setup:
+            SlideWidth, SlideHeight = 960.0, 540.0
+        self.PageSetup = _Setup()
+
+
+@pytest.fixture
+def fake_deck(monkeypatch, tmp_path):
+    exports = []
+    pres = _FakePres(exports)
+
+    async def inline(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(preview.ppt, "execute_async", inline)
+    monkeypatch.setattr(preview.ppt, "_get_app_impl", lambda: None)
+    monkeypatch.setattr(preview.ppt, "_get_pres_impl", lambda: pres)
+    monkeypatch.setattr(preview, "preview_cache", PreviewCache(root=str(tmp_path)))
+    return pres, exports
+
+
+def test_unchanged_slides_are_served_from_cache(fake_deck):
+    pres, exports = fake_deck
+    plan = asyncio.run(preview._render_slides([1, 3], 640, "png", True))
+    assert [e["data"] for e in plan["entries"]] == [b"slide256", b"slide258"]
+    assert exports == [(256, 640, 360), (258, 640, 360)]
+
+    plan = asyncio.run(preview._render_slides([1, 3], 640, "png", True))
+    assert all(e["cached"] for e in plan["entries"])
+    assert len(exports) == 2
+
+    # Editing slide 3 changes its fingerprint, so only it is exported again.
+    pres.Slides(3).Shapes(1).Left = 50.0
+    plan = asyncio.run(preview._render_slides([1, 3], 640, "png", True))
+    assert [e["cached"] for e in plan["entries"]] == [True, False]
+    assert exports[-1] == (258, 640, 360)
+
+
+def test_use_cache_false_always_exports(fake_deck):
+    _, exports = fake_deck
+    asyncio.run(preview._render_slides([2], None, "png", False))
+    asyncio.run(preview._render_slides([2], None, "png", False))
+    assert exports == [(257, None, None), (257, None, None)]
+
+
+def test_out_of_range_slide_raises(fake_deck):
+    with pytest.raises(ValueError, match="out of range"):
+        asyncio.run(preview._render_slides([9], None, "png", True))
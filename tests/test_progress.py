@@ -0,0 +1,106 @@
+"""Tests for progress notifications and cooperative cancellation (utils/progress.py).
+
+Pure Python tests — a recording context stands in for the MCP request
+context, and a worker thread plays the COM thread.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from utils import progress as progress_mod  # noqa: E402
+from utils.progress import Progress, tracked  # noqa: E402
+from ppt_com.text import GetAllTextInput, get_all_text  # noqa: E402
+
+
+class _Ctx:
+    def __init__(self):
+        self.reports = []
+
+    async def report_progress(self, progress, total=None, message=None):
+        self.reports.append((progress, total, message))
+
+
+def test_progress_is_reported_from_the_com_thread(monkeypatch):
+    monkeypatch.setattr(progress_mod, "REPORT_INTERVAL_S", 0.0)
+    ctx = _Ctx()
+
+    async def main():
+        progress = Progress(ctx)
+        items = await asyncio.to_thread(lambda: list(tracked(range(3), progress)))
+        await asyncio.sleep(0.05)  # let the scheduled notifications run
+        return items, progress
+
+    items, progress = asyncio.run(main())
+    assert items == [0, 1, 2]
+    assert ctx.reports == [(1, 3, "1/3 slides"), (2, 3, "2/3 slides"), (3, 3, "3/3 slides")]
+    assert progress.partial() == {}
+
+
+def test_throttled_reports_still_send_the_last_one():
+    ctx = _Ctx()
+
+    async def main():
+        progress = Progress(ctx)
+        list(tracked(range(50), progress))
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert ctx.reports[0][0] == 1 and ctx.reports[-1][0] == 50
+    assert len(ctx.reports) < 50
+
+
+def test_cancel_stops_between_items():
+    progress = Progress(total=None)
+    seen = []
+    for item in tracked("abcd", progress):
+        seen.append(item)
+        if item == "b":
+            progress.cancel()
+    assert seen == ["a", "b"]
+    assert progress.partial() == {
+        "partial": True, "stopped_reason": "cancelled", "slides_done": 2, "slides_total": 4,
+    }
+
+
+def test_caller_timeout_cancels_the_com_loop(monkeypatch):
+    async def timed_out(func, *args, **kwargs):
+        raise TimeoutError("PowerPoint operation did not finish within 30s")
+
+    monkeypatch.setattr(progress_mod.ppt, "execute_async", timed_out)
+    progress = Progress()
+    with pytest.raises(TimeoutError):
+        asyncio.run(progress.execute(lambda: None))
+    assert list(tracked([1, 2], progress)) == []
+    assert progress.stopped == "cancelled"
+
+
+def test_get_all_text_returns_partial_read(deck, monkeypatch):
+    advance = Progress.advance
+
+    def stop_after_first(self, count=1):
+        advance(self, count)
+        self.cancel()
+
+    monkeypatch.setattr(Progress, "advance", stop_after_first)
+    result = asyncio.run(get_all_text(GetAllTextInput()))
+    assert "== Slide 1 ==" in result and "Budget" not in result
+    assert "== Stopped after 1 of 3 slides (cancelled); the remaining slides start at slide 2 ==" in result
+
+
+def test_get_all_text_reports_progress_to_the_request_context(deck):
+    ctx = _Ctx()
+
+    async def main():
+        result = await get_all_text(GetAllTextInput(), ctx=ctx)
+        await asyncio.sleep(0)  # let the scheduled notifications run
+        return result
+
+    assert "Budget" in asyncio.run(main())
+    assert ctx.reports and ctx.reports[-1] == (3, 3, "3/3 slides")
@@ -0,0 +1,114 @@
+"""Tests for the SmartArt catalog (utils/smartart_catalog.py, ppt_com/smartart.py).
+
+Pure Python tests — a fake Application exposes SmartArt collections and
+counts item reads, so the build-once behaviour is checked without PowerPoint.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import smartart  # noqa: E402
+from utils.smartart_catalog import SmartArtCatalogStore  # noqa: E402
+
+_URN = "urn:microsoft.com/office/officeart/2005/8/layout/"
+
+
+class _Item:
+    def __init__(self, reads, name, item_id, category=None):
+        self._reads = reads
+        self._name, self.Id, self.Category = name, item_id, category
+        self.Description = f"{name} description"
+
+    @property
+    def Name(self):
+        self._reads.append(self._name)
+        return self._name
+
+
+class _Collection:
+    def __init__(self, items):
+        self.items = items
+
+    @property
+    def Count(self):
+        return len(self.items)
+
+    def __call__(self, i):
+        return self.items[i - 1]
+
+
+class _LanguageSettings:
+    def LanguageID(self, kind):
+        return 1041
+
+
+class _App:
+    Version = "16.0"
+    Build = "17932"
+    LanguageSettings = _LanguageSettings()
+
+    def __init__(self):
+        self.reads = []
+        self.SmartArtLayouts = _Collection([
+            _Item(self.reads, "基本リスト", _URN + "default", "リスト"),
+            _Item(self.reads, "基本ステップ", _URN + "process1", "手順"),
+            _Item(self.reads, "基本ステップ (縦)", _URN + "vProcess5", "手順"),
+        ])
+        self.SmartArtColors = _Collection([_Item(self.reads, "カラフル", "c1")])
+        self.SmartArtQuickStyles = _Collection([_Item(self.reads, "シンプル", "s1")])
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    app = _App()
+    monkeypatch.setattr(smartart.ppt, "_get_app_impl", lambda: app)
+    monkeypatch.setattr(smartart, "smartart_catalogs", SmartArtCatalogStore(root=str(tmp_path)))
+    return app
+
+
+def test_resolve_by_english_alias_and_localized_name(app):
+    assert smartart._resolve_layout(app, "Basic Process").Id == _URN + "process1"
+    # Exact localized name wins over the earlier partial match.
+    assert smartart._resolve_layout(app, "基本ステップ (縦)").Id == _URN + "vProcess5"
+    with pytest.raises(ValueError, match="not found"):
+        smartart._resolve_layout(app, "Nonexistent")
+
+
+def test_catalog_is_built_once(app):
+    smartart._list_smartart_options_impl("layouts", None, None, False)
+    reads_after_build = len(app.reads)
+    smartart._list_smartart_options_impl("layouts", "手順", "process", True)
+    smartart._resolve_layout(app, "Basic List")
+    assert len(app.reads) == reads_after_build
+    assert smartart.smartart_catalogs.stats()["builds"] == 1
+
+
+def test_list_filters_in_memory(app):
+    result = smartart._list_smartart_options_impl("layouts", "手順", "vertical", False)
+    assert result["filtered_count"] == 0
+    result = smartart._list_smartart_options_impl("layouts", "手順", "process", True)
+    assert [e["english_name"] for e in result["layouts"]] == ["Basic Process", "Descending Process"]
+    assert result["layouts"][0]["description"] == "基本ステップ description"
+    cats = smartart._list_smartart_options_impl("categories", None, None, False)
+    assert cats["categories"] == [{"category": "リスト", "count": 1}, {"category": "手順", "count": 2}]
+
+
+def test_catalog_persists_across_stores(app, tmp_path):
+    SmartArtCatalogStore(root=str(tmp_path)).get(app, smartart.SMARTART_ENGLISH_ALIASES)
+    fresh = SmartArtCatalogStore(root=str(tmp_path))
+    catalog = fresh.get(app, smartart.SMARTART_ENGLISH_ALIASES)
+    assert fresh.stats()["disk_loads"] == 1 and fresh.stats()["builds"] == 0
+    assert catalog.find_layouts("basic list")[0]["index"] == 1
+
+
+def test_stale_catalog_is_rebuilt(app):
+    smartart._catalog(app)
+    app.SmartArtLayouts.items.append(app.SmartArtLayouts.items.pop(0))  # same key, new order
+    assert smartart._resolve_layout(app, "Basic Process").Id == _URN + "process1"
+    assert smartart.smartart_catalogs.stats()["invalidations"] == 1
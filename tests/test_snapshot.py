@@ -0,0 +1,120 @@
+"""Tests for the one-pass shape snapshot layer (ppt_com/snapshot.py).
+
+Pure Python tests — fake COM shapes record which properties are read, so the
+depth levels can be checked without PowerPoint.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+from ppt_com import snapshot
+from ppt_com.constants import msoGroup, msoPlaceholder
+from ppt_com.text import _collect_text_shapes, _right_neighbor_gap
+
+
+# --- Fake COM object graph -------------------------------------------------
+
+class _FakeCollection:
+    """1-based collection callable like a COM collection: coll(i)."""
+
+    def __init__(self, items):
+        self._items = items
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def __call__(self, i):
+        return self._items[i - 1]
+
+
+class _Recorder:
+    """Records every attribute read in the shared `reads` list."""
+
+    def __init__(self, reads, **attrs):
+        object.__setattr__(self, "_reads", reads)
+        object.__setattr__(self, "_attrs", attrs)
+
+    def __getattr__(self, name):
+        attrs = object.__getattribute__(self, "_attrs")
+        if name not in attrs:
+            raise AttributeError(name)
+        object.__getattribute__(self, "_reads").append(name)
+        return attrs[name]
+
+
+def _shape(reads, name, left, top, width=100, height=20, text=None,
+           shape_type=1, ph_type=None, children=None):
+    attrs = dict(
+        Name=name, Id=hash(name) & 0xFFFF, Type=shape_type,
+        Left=left, Top=top, Width=width, Height=height,
+        HasTable=False, HasTextFrame=text is not None,
+    )
+    if text is not None:
+        attrs["TextFrame"] = _Recorder(
+            reads, HasText=bool(text), TextRange=_Recorder(reads, Text=text),
+        )
+    if ph_type is not None:
+        attrs["PlaceholderFormat"] = _Recorder(reads, Type=ph_type)
+    if children is not None:
+        attrs["GroupItems"] = _FakeCollection(children)
+        attrs["HasTextFrame"] = False
+    return _Recorder(reads, **attrs)
+
+
+class _FakeSlide:
+    def __init__(self, shapes):
+        self.Shapes = _FakeCollection(shapes)
+
+
+# --- Tests -------------------------------------------------------------------
+
+def test_geometry_depth_reads_no_text():
+    reads = []
+    slide = _FakeSlide([_shape(reads, "Body", 10, 20, text="hello")])
+    snaps = snapshot.snapshot_slide(slide, snapshot.GEOMETRY)
+
+    assert snaps[0]["name"] == "Body"
+    assert snaps[0]["index"] == 1
+    assert "text" not in snaps[0]
+    assert not {"HasTextFrame", "TextFrame", "Text"} & set(reads)
+
+
+def test_text_depth_reads_each_property_once():
+    reads = []
+    slide = _FakeSlide([_shape(reads, "Body", 10, 20, text="hello")])
+    snap = snapshot.snapshot_slide(slide, snapshot.TEXT)[0]
+
+    assert snap["has_text"] and snap["text"] == "hello"
+    assert reads.count("Left") == 1
+    assert reads.count("Text") == 1
+
+
+def test_collect_text_shapes_offsets_groups_and_skips_footers():
+    reads = []
+    child = _shape(reads, "Child", 5, 7, text="in group")
+    group = _shape(reads, "Group", 100, 200, shape_type=msoGroup, children=[child])
+    title = _shape(reads, "Title", 0, 0, text="Title", shape_type=msoPlaceholder, ph_type=1)
+    footer = _shape(reads, "Footer", 0, 500, text="p. 1", shape_type=msoPlaceholder, ph_type=15)
+    empty = _shape(reads, "Empty", 0, 300, text="")
+
+    infos = _collect_text_shapes(_FakeSlide([group, title, footer, empty]))
+
+    assert [i["shape"].Name for i in infos] == ["Child", "Title"]
+    assert (infos[0]["left"], infos[0]["top"]) == (105, 207)
+    assert infos[1]["is_title"] and not infos[1]["is_subtitle"]
+
+
+def test_right_neighbor_gap_uses_snapshot():
+    reads = []
+    slide = _FakeSlide([
+        _shape(reads, "A", 0, 0, width=100),
+        _shape(reads, "B", 130, 5, width=50),    # overlaps vertically, 30pt right
+        _shape(reads, "C", 110, 100, width=50),  # below — ignored
+    ])
+    snaps = snapshot.snapshot_slide(slide, snapshot.GEOMETRY)
+    reads.clear()
+
+    assert _right_neighbor_gap(snaps[0], snaps) == 30
+    assert reads == []
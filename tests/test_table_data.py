@@ -0,0 +1,145 @@
+"""Tests for bulk table read/write and import (ppt_com/tables.py).
+
+Pure Python tests — a fake table records text writes so the write-skipping
+and resize paths can be checked without PowerPoint.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com import tables  # noqa: E402
+from ppt_com.tables import ImportTableDataInput  # noqa: E402
+
+
+# --- Parsing -----------------------------------------------------------------
+
+def test_parse_detects_tab_and_comma():
+    assert tables._parse_delimited("a\tb\n1\t2\n") == [["a", "b"], ["1", "2"]]
+    assert tables._parse_delimited('name,note\n"Smith, J","line1\nline2"\n') == [
+        ["name", "note"], ["Smith, J", "line1\nline2"],
+    ]
+
+
+def test_parse_pads_ragged_rows_and_strips_bom():
+    assert tables._parse_delimited("\ufeffa;b;c\n1;2\n\n") == [["a", "b", "c"], ["1", "2", ""]]
+
+
+def test_split_orient_handles_none_and_nan():
+    grid = tables._grid_from_split(["Region", "Sales"], [["East", 1.5], ["West", float("nan")], [None, 3]])
+    assert grid == [["Region", "Sales"], ["East", "1.5"], ["West", ""], ["", "3"]]
+
+
+def test_import_input_requires_exactly_one_source():
+    with pytest.raises(ValueError, match="exactly one"):
+        ImportTableDataInput(slide_index=1, text="a,b", columns=["a"])
+    with pytest.raises(ValueError, match="exactly one"):
+        ImportTableDataInput(slide_index=1)
+
+
+def test_style_table_deduplicates_formats():
+    bold = {"bold": True, "font_size": 12}
+    plain = {"bold": False, "font_size": 12}
+    styles, grid = tables._style_table([[bold, bold], [plain, dict(plain)]])
+    assert styles == [bold, plain]
+    assert grid == [[0, 0], [1, 1]]
+
+
+# --- COM write paths ---------------------------------------------------------
+
+class _Font:
+    Bold = 0
+
+
+class _TextRange:
+    def __init__(self, table):
+        self._table = table
+        self._text = ""
+        self.Font = _Font()
+
+    @property
+    def Text(self):
+        return self._text
+
+    @Text.setter
+    def Text(self, value):
+        self._table.writes += 1
+        self._text = value
+
+
+class _Cell:
+    def __init__(self, table):
+        tr = _TextRange(table)
+        self.Shape = type("S", (), {"TextFrame": type("TF", (), {"TextRange": tr})()})()
+
+
+class _Dim:
+    def __init__(self, table, axis):
+        self._table, self._axis = table, axis
+
+    @property
+    def Count(self):
+        return self._table.n[self._axis]
+
+    def Add(self):
+        self._table.n[self._axis] += 1
+
+
+class _Table:
+    def __init__(self, rows, cols):
+        self.n = [rows, cols]
+        self.writes = 0
+        self.cells = {}
+        self.Rows = _Dim(self, 0)
+        self.Columns = _Dim(self, 1)
+
+    def Cell(self, r, c):
+        assert r <= self.n[0] and c <= self.n[1]
+        return self.cells.setdefault((r, c), _Cell(self))
+
+    def text(self, r, c):
+        return self.Cell(r, c).Shape.TextFrame.TextRange.Text
+
+
+def test_write_grid_skips_unchanged_cells():
+    table = _Table(2, 2)
+    first = tables._write_grid(table, [["a", "b"], ["c", "d"]], 1, 1, False)
+    assert first["cells_set"] == 4 and table.writes == 4
+    second = tables._write_grid(table, [["a", "b"], ["c", "x"]], 1, 1, False)
+    assert second["cells_unchanged"] == 3 and table.writes == 5
+    assert table.text(2, 2) == "x"
+
+
+def test_import_grows_existing_table(monkeypatch):
+    table = _Table(2, 2)
+
+    class _Shape:
+        Name = "Data"
+        HasTable = True
+        Table = table
+
+    class _Shapes:
+        Count = 1
+
+        def __call__(self, i):
+            return _Shape()
+
+    class _Pres:
+        class Slides:
+            def __new__(cls, i):
+                return type("Slide", (), {"Shapes": _Shapes()})()
+
+    monkeypatch.setattr(tables.ppt, "_get_app_impl", lambda: None)
+    monkeypatch.setattr(tables.ppt, "_get_pres_impl", lambda: _Pres())
+    monkeypatch.setattr(tables, "goto_slide", lambda app, i: None)
+
+    grid = tables._parse_delimited("h1,h2,h3\n1,2,3\n4,5,6\n")
+    result = tables._import_table_data_impl(1, "Data", grid, True, True, 0, 0, 0, 0)
+    assert result["rows_added"] == 1 and result["columns_added"] == 1
+    assert table.text(3, 3) == "6"
+    assert table.Cell(1, 1).Shape.TextFrame.TextRange.Font.Bold == tables.msoTrue
@@ -0,0 +1,95 @@
+"""Tests for the ppt_check_typography width solver (ppt_com/text.py).
+
+Pure Python tests — a fake shape wraps its text greedily at a fixed
+character width, standing in for PowerPoint's line layout.
+"""
+
+import sys
+from pathlib import Path
+
+_src_dir = str(Path(__file__).resolve().parents[1] / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from ppt_com.text import _solve_min_width, _widows_from_lines  # noqa: E402
+
+_CHAR_PT = 5.0
+
+
+class _Lines:
+    def __init__(self, lines):
+        self.Count = len(lines)
+
+
+class _Line:
+    def __init__(self, text):
+        self.Text = text
+
+
+class _TextRange:
+    def __init__(self, shape):
+        self._shape = shape
+
+    def Lines(self, i=None):
+        lines = self._shape.layout()
+        return _Lines(lines) if i is None else _Line(lines[i - 1])
+
+
+class _TextFrame:
+    def __init__(self, shape):
+        self.TextRange = _TextRange(shape)
+
+
+class _Shape:
+    def __init__(self, text, width):
+        self.text = text
+        self.Width = width
+        self.layouts = 0
+        self.TextFrame = _TextFrame(self)
+
+    def layout(self):
+        """Greedy word wrap at Width / _CHAR_PT characters per line."""
+        self.layouts += 1
+        per_line = int(self.Width // _CHAR_PT)
+        lines, cur = [], ""
+        for word in self.text.split(" "):
+            candidate = f"{cur} {word}" if cur else word
+            if len(candidate) <= per_line or not cur:
+                cur = candidate
+            else:
+                lines.append(cur + " ")
+                cur = word
+        lines.append(cur)
+        return lines
+
+
+def _linear_min_step(text, width, room):
+    for step in range(1, room + 1):
+        shape = _Shape(text, width + step)
+        lines = [shape.TextFrame.TextRange.Lines(i).Text
+                 for i in range(1, shape.TextFrame.TextRange.Lines().Count + 1)]
+        if not _widows_from_lines(lines, 3, 2):
+            return step
+    return None
+
+
+TEXT = "the quick brown fox jumps over the lazy dog ok"
+
+
+def test_bisection_matches_linear_scan_with_fewer_relayouts():
+    width = 100.0  # 20 chars/line leaves "ok" as a widow
+    shape = _Shape(TEXT, width)
+    step, lines, relayouts = _solve_min_width(shape, width, 40, 3, 2)
+    assert step == _linear_min_step(TEXT, width, 40)
+    assert shape.Width == width + step
+    assert not _widows_from_lines(lines, 3, 2)
+    assert relayouts <= 7  # 1 + ceil(log2(40))
+
+
+def test_unsolvable_budget_costs_one_relayout_and_reverts():
+    width = 100.0
+    shape = _Shape(TEXT, width)
+    step, lines, relayouts = _solve_min_width(shape, width, 2, 3, 2)
+    assert step is None and lines is None
+    assert relayouts == 1
+    assert shape.Width == width